@@ -0,0 +1,232 @@
+# Licensed to the Apache Software Foundation (ASF) under one
+# or more contributor license agreements.  See the NOTICE file
+# distributed with this work for additional information
+# regarding copyright ownership.  The ASF licenses this file
+# to you under the Apache License, Version 2.0 (the
+# "License"); you may not use this file except in compliance
+# with the License.  You may obtain a copy of the License at
+#
+#   http://www.apache.org/licenses/LICENSE-2.0
+#
+# Unless required by applicable law or agreed to in writing,
+# software distributed under the License is distributed on an
+# "AS IS" BASIS, WITHOUT WARRANTIES OR CONDITIONS OF ANY
+# KIND, either express or implied.  See the License for the
+# specific language governing permissions and limitations
+# under the License.
+"""Caching of the Dags users are authorized to access, and their translation to SQL filters."""
+
+from __future__ import annotations
+
+import threading
+import time
+from collections import OrderedDict
+from collections.abc import Iterable, Mapping
+from functools import cache
+from typing import TYPE_CHECKING, Any
+
+from sqlalchemy import func, or_, select
+
+from airflow._shared.observability.metrics.stats import Stats
+from airflow.configuration import conf
+from airflow.models.dag import DagModel
+from airflow.models.dagbundle import DagBundleModel
+from airflow.models.team import dag_bundle_team_association_table
+
+if TYPE_CHECKING:
+    from collections.abc import Hashable
+
+    from sqlalchemy.orm import Session
+    from sqlalchemy.sql import ColumnElement, Select
+
+
+class AuthorizedDagIds(set[str]):
+    """
+    Set of the Dag ids a user is authorized to access.
+
+    Besides the Dag ids, it records the teams for which the user is authorized to access every Dag (``None``
+    standing for the Dags of bundles without team), so that SQL statements can be filtered by team instead of
+    by a list of thousands of Dag ids. The teams must only be recorded for auth managers granting access per
+    team, since the Dags added to these teams later are selected too (see
+    ``BaseAuthManager.grants_dag_access_per_team``).
+
+    :param dag_ids: the Dag ids the user is authorized to access
+    :param complete_teams: the teams the user is authorized to access every Dag of
+    :param all_dags: whether the user is authorized to access every Dag
+    :param partial_dag_ids: the Dag ids which are not in ``complete_teams``, all of them by default
+    """
+
+    def __init__(
+        self,
+        dag_ids: Iterable[str] = (),
+        *,
+        complete_teams: Iterable[str | None] = (),
+        all_dags: bool = False,
+        partial_dag_ids: Iterable[str] | None = None,
+    ) -> None:
+        super().__init__(dag_ids)
+        self.complete_teams = frozenset(complete_teams)
+        self.all_dags = all_dags
+        self._partial_dag_ids = frozenset(self if partial_dag_ids is None else partial_dag_ids)
+
+    @classmethod
+    def from_teams(
+        cls, authorized: Mapping[str | None, set[str]], dags_by_team: Mapping[str | None, set[str]]
+    ) -> AuthorizedDagIds:
+        """
+        Create the set from the Dag ids authorized in each team.
+
+        :param authorized: the Dag ids the user is authorized to access, by team
+        :param dags_by_team: all the Dag ids, by team
+        """
+        complete_teams = {
+            team for team, dag_ids in dags_by_team.items() if dag_ids and authorized.get(team) == dag_ids
+        }
+        return cls(
+            (dag_id for dag_ids in authorized.values() for dag_id in dag_ids),
+            complete_teams=complete_teams,
+            all_dags=complete_teams == dags_by_team.keys(),
+            partial_dag_ids=(
+                dag_id
+                for team, dag_ids in authorized.items()
+                if team not in complete_teams
+                for dag_id in dag_ids
+            ),
+        )
+
+    def copy(self) -> AuthorizedDagIds:
+        return AuthorizedDagIds(
+            self,
+            complete_teams=self.complete_teams,
+            all_dags=self.all_dags,
+            partial_dag_ids=self._partial_dag_ids,
+        )
+
+    def dag_id_clause(self, column: Any) -> ColumnElement[bool]:
+        """
+        Return a clause restricting ``column`` to the authorized Dag ids.
+
+        The Dags of the teams the user can access every Dag of are selected by a subquery on the team, so the
+        statement does not list them, and does not need to list any Dag id when the user can access them all.
+        Without such teams, only the authorized Dag ids are selected.
+        """
+        if self.all_dags:
+            return column.in_(select(DagModel.dag_id))
+        if not self.complete_teams:
+            return column.in_(self)
+        team_name = dag_bundle_team_association_table.c.team_name
+        team_clauses = []
+        if teams := [team for team in self.complete_teams if team is not None]:
+            team_clauses.append(team_name.in_(teams))
+        if None in self.complete_teams:
+            team_clauses.append(team_name.is_(None))
+        clauses = [column.in_(dags_with_team().with_only_columns(DagModel.dag_id).where(or_(*team_clauses)))]
+        if self._partial_dag_ids:
+            clauses.append(column.in_(self._partial_dag_ids))
+        return or_(*clauses)
+
+
+def dags_with_team() -> Select:
+    """Select the Dag ids, with the team of their bundle."""
+    return (
+        select(DagModel.dag_id, dag_bundle_team_association_table.c.team_name)
+        .join(DagBundleModel, DagModel.bundle_name == DagBundleModel.name)
+        .join(
+            dag_bundle_team_association_table,
+            DagBundleModel.name == dag_bundle_team_association_table.c.dag_bundle_name,
+            isouter=True,
+        )
+    )
+
+
+def dags_fingerprint(session: Session) -> tuple[tuple[Any, ...], ...]:
+    """
+    Return a summary of the Dags and of the teams of their bundles, which changes with them.
+
+    It has, for each bundle and team, the number of Dags and the first and last Dag ids. A Dag added, deleted,
+    moved to another bundle, or a bundle moved to another team changes it, except for a Dag replaced by
+    another one in the same bundle between its first and last Dags; such changes are only seen when the cached
+    permissions expire.
+    """
+    team_name = dag_bundle_team_association_table.c.team_name
+    rows = session.execute(
+        select(
+            DagModel.bundle_name,
+            team_name,
+            func.count(DagModel.dag_id),
+            func.min(DagModel.dag_id),
+            func.max(DagModel.dag_id),
+        )
+        .join(
+            dag_bundle_team_association_table,
+            DagModel.bundle_name == dag_bundle_team_association_table.c.dag_bundle_name,
+            isouter=True,
+        )
+        .group_by(DagModel.bundle_name, team_name)
+    )
+    return tuple(sorted((tuple(row) for row in rows), key=repr))
+
+
+class AuthorizedDagIdsCache:
+    """
+    Thread-safe LRU cache of the Dag ids users are authorized to access, expiring after ``ttl`` seconds.
+
+    Entries are stored with the fingerprint of the Dags they were computed from (see ``dags_fingerprint``),
+    and are only used while the Dags have the same fingerprint. The permissions of users changed in the
+    meantime are only used once the entries expire.
+
+    :param ttl: seconds entries are used for, ``0`` disables the cache
+    :param max_entries: maximum number of entries kept
+    """
+
+    def __init__(self, ttl: float, max_entries: int) -> None:
+        self.ttl = ttl
+        self.max_entries = max_entries
+        self._items: OrderedDict[Hashable, tuple[float, Any, AuthorizedDagIds]] = OrderedDict()
+        self._lock = threading.Lock()
+
+    @property
+    def enabled(self) -> bool:
+        return self.ttl > 0 and self.max_entries > 0
+
+    def __len__(self) -> int:
+        return len(self._items)
+
+    def get(self, key: Hashable, fingerprint: Any) -> AuthorizedDagIds | None:
+        """Get a copy of the Dag ids cached for ``key``, unless they expired or the Dags changed."""
+        with self._lock:
+            entry = self._items.get(key)
+            if entry is not None:
+                expires_at, cached_fingerprint, dag_ids = entry
+                if expires_at > time.monotonic() and cached_fingerprint == fingerprint:
+                    self._items.move_to_end(key)
+                else:
+                    del self._items[key]
+                    entry = None
+        if entry is None:
+            Stats.incr("api.authorized_dag_ids_cache.misses")
+            return None
+        Stats.incr("api.authorized_dag_ids_cache.hits")
+        return dag_ids.copy()
+
+    def put(self, key: Hashable, fingerprint: Any, dag_ids: AuthorizedDagIds) -> None:
+        """Cache a copy of the Dag ids, evicting the least recently used entries if there are too many."""
+        if not self.enabled:
+            return
+        with self._lock:
+            self._items[key] = (time.monotonic() + self.ttl, fingerprint, dag_ids.copy())
+            self._items.move_to_end(key)
+            while len(self._items) > self.max_entries:
+                self._items.popitem(last=False)
+
+    def clear(self) -> None:
+        with self._lock:
+            self._items.clear()
+
+
+@cache
+def get_authorized_dag_ids_cache() -> AuthorizedDagIdsCache:
+    return AuthorizedDagIdsCache(
+        ttl=conf.getfloat("api", "authorized_dag_ids_cache_ttl", fallback=0),
+        max_entries=conf.getint("api", "authorized_dag_ids_cache_max_entries", fallback=1000),
+    )
@@ -27,6 +27,12 @@ from typing import TYPE_CHECKING, Any, Generic, Literal, TypeVar
 from jwt import InvalidTokenError
 from sqlalchemy import select
 
+from airflow.api_fastapi.auth.managers.authorized_dags import (
+    AuthorizedDagIds,
+    dags_fingerprint,
+    dags_with_team,
+    get_authorized_dag_ids_cache,
+)
 from airflow.api_fastapi.auth.managers.models.base_user import BaseUser
 from airflow.api_fastapi.auth.managers.models.resource_details import (
     ConnectionDetails,
@@ -44,15 +50,14 @@ from airflow.api_fastapi.auth.tokens import (
 from airflow.api_fastapi.common.types import ExtraMenuItem, MenuItem
 from airflow.configuration import conf
 from airflow.models import Connection, DagModel, Pool, Variable
-from airflow.models.dagbundle import DagBundleModel
 from airflow.models.revoked_token import RevokedToken
-from airflow.models.team import Team, dag_bundle_team_association_table
+from airflow.models.team import Team
 from airflow.typing_compat import Unpack
 from airflow.utils.log.logging_mixin import LoggingMixin
 from airflow.utils.session import NEW_SESSION, provide_session
 
 if TYPE_CHECKING:
-    from collections.abc import Sequence
+    from collections.abc import Hashable, Sequence
 
     from fastapi import FastAPI
     from sqlalchemy import Row
@@ -553,35 +558,65 @@ class BaseAuthManager(Generic[T], LoggingMixin, metaclass=ABCMeta):
         """
         Get DAGs the user has access to.
 
+        The DAG ids are cached for the user (see ``get_authorized_dag_ids_cache_key``) for
+        ``[api] authorized_dag_ids_cache_ttl`` seconds, as long as no DAG, bundle or team of a bundle changes.
+
         :param user: the user
         :param method: the method to filter on
         :param session: the session
         """
-        stmt = (
-            select(DagModel.dag_id, dag_bundle_team_association_table.c.team_name)
-            .join(DagBundleModel, DagModel.bundle_name == DagBundleModel.name)
-            .join(
-                dag_bundle_team_association_table,
-                DagBundleModel.name == dag_bundle_team_association_table.c.dag_bundle_name,
-                isouter=True,
-            )
-        )
+        dag_ids_cache = get_authorized_dag_ids_cache()
+        user_key = self.get_authorized_dag_ids_cache_key(user) if dag_ids_cache.enabled else None
+        if user_key is not None:
+            key = (type(self).__qualname__, user_key, method)
+            fingerprint = dags_fingerprint(session)
+            if (cached := dag_ids_cache.get(key, fingerprint)) is not None:
+                return cached
+
+        stmt = dags_with_team()
         # The below type annotation is acceptable on SQLA2.1, but not on 2.0
         rows: Sequence[Row[Unpack[tuple[str, str]]]] = session.execute(stmt).all()  # type: ignore[type-arg]
-        dags_by_team: dict[str, set[str]] = defaultdict(set)
+        dags_by_team: dict[str | None, set[str]] = defaultdict(set)
         for dag_id, team_name in rows:
             dags_by_team[team_name].add(dag_id)
 
-        dag_ids: set[str] = set()
-        for team_name, team_dag_ids in dags_by_team.items():
-            dag_ids.update(
-                self.filter_authorized_dag_ids(
-                    dag_ids=team_dag_ids, user=user, method=method, team_name=team_name
-                )
+        authorized_by_team = {
+            team_name: self.filter_authorized_dag_ids(
+                dag_ids=team_dag_ids, user=user, method=method, team_name=team_name
             )
-
+            for team_name, team_dag_ids in dags_by_team.items()
+        }
+        if self.grants_dag_access_per_team():
+            dag_ids = AuthorizedDagIds.from_teams(authorized_by_team, dags_by_team)
+        else:
+            dag_ids = AuthorizedDagIds(
+                dag_id for team_dag_ids in authorized_by_team.values() for dag_id in team_dag_ids
+            )
+        if user_key is not None:
+            dag_ids_cache.put(key, fingerprint, dag_ids)
         return dag_ids
 
+    def get_authorized_dag_ids_cache_key(self, user: T) -> Hashable | None:
+        """
+        Return the key the DAGs a user has access to are cached under, or ``None`` not to cache them.
+
+        By default, the DAGs are cached per user id. Auth managers granting permissions to roles can return
+        the roles of the user instead, so that the users with the same roles share the cached DAGs.
+
+        :param user: the user
+        """
+        return user.get_id()
+
+    def grants_dag_access_per_team(self) -> bool:
+        """
+        Return whether the access to DAGs is granted per team (or for every DAG), and never per DAG.
+
+        When it is, a user authorized to access every DAG of a team is also authorized to access the DAGs
+        added to it later, so the DAGs the user has access to are filtered by team instead of by DAG id. By
+        default, access may be granted per DAG and the DAGs are filtered by their ids.
+        """
+        return False
+
     def filter_authorized_dag_ids(
         self,
         *,
@@ -216,6 +216,9 @@ class SimpleAuthManager(BaseAuthManager[SimpleAuthManagerUser]):
             team_name=details.team_name if details else None,
         )
 
+    def grants_dag_access_per_team(self) -> bool:
+        return True
+
     def is_authorized_asset(
         self,
         *,
@@ -16,14 +16,18 @@
 # under the License.
 from __future__ import annotations
 
-from typing import TYPE_CHECKING, Annotated
+from typing import TYPE_CHECKING, Annotated, NoReturn
 
 from fastapi import Depends, HTTPException, Request, status
 from sqlalchemy.orm import Session
+from starlette.concurrency import run_in_threadpool
 
 from airflow.models.dagbag import DBDagBag
+from airflow.models.serialized_dag import SerializedDagModel
 
 if TYPE_CHECKING:
+    from sqlalchemy.ext.asyncio import AsyncSession
+
     from airflow.models.dagrun import DagRun
     from airflow.serialization.definitions.dag import SerializedDAG
 
@@ -48,15 +52,16 @@ def get_latest_version_of_dag(
 ) -> SerializedDAG:
     dag = dag_bag.get_latest_version_of_dag(dag_id, session=session)
     if not dag:
-        if include_reason:
-            raise HTTPException(
-                status.HTTP_404_NOT_FOUND,
-                detail={
-                    "reason": "not_found",
-                    "message": f"The Dag with ID: `{dag_id}` was not found",
-                },
-            )
-        raise HTTPException(status.HTTP_404_NOT_FOUND, f"The Dag with ID: `{dag_id}` was not found")
+        _raise_dag_not_found(dag_id, include_reason)
+    return dag
+
+
+async def get_latest_version_of_dag_async(
+    dag_bag: DBDagBag, dag_id: str, session: AsyncSession, include_reason: bool = False
+) -> SerializedDAG:
+    serdag = await session.run_sync(lambda sync_session: SerializedDagModel.get(dag_id, session=sync_session))
+    if not (dag := await _read_dag_async(dag_bag, serdag)):
+        _raise_dag_not_found(dag_id, include_reason)
     return dag
 
 
@@ -80,4 +85,47 @@ def get_dag_for_run_or_latest_version(
     return dag
 
 
+async def get_dag_for_run_or_latest_version_async(
+    dag_bag: DBDagBag, dag_run: DagRun | None, dag_id: str | None, session: AsyncSession
+) -> SerializedDAG:
+    """
+    Get the dag of a run, or the latest version of a dag, from an async session.
+
+    The dag bag reads the database through a sync session, so it is called with the sync session the async
+    session proxies, in a greenlet which awaits its queries. Dags not cached by the dag bag yet are then
+    deserialized in the threadpool, not to block the event loop.
+    """
+
+    def find_dag(sync_session: Session) -> SerializedDAG | SerializedDagModel | None:
+        if dag_run:
+            return dag_bag.find_dag_for_run(dag_run, session=sync_session)
+        if dag_id:
+            return SerializedDagModel.get(dag_id, session=sync_session)
+        return None
+
+    if not (dag := await _read_dag_async(dag_bag, await session.run_sync(find_dag))):
+        raise HTTPException(status.HTTP_404_NOT_FOUND, f"The Dag with ID: `{dag_id}` was not found")
+    return dag
+
+
+async def _read_dag_async(
+    dag_bag: DBDagBag, found: SerializedDAG | SerializedDagModel | None
+) -> SerializedDAG | None:
+    if isinstance(found, SerializedDagModel):
+        return await run_in_threadpool(dag_bag.read_dag, found)
+    return found
+
+
+def _raise_dag_not_found(dag_id: str, include_reason: bool) -> NoReturn:
+    if include_reason:
+        raise HTTPException(
+            status.HTTP_404_NOT_FOUND,
+            detail={
+                "reason": "not_found",
+                "message": f"The Dag with ID: `{dag_id}` was not found",
+            },
+        )
+    raise HTTPException(status.HTTP_404_NOT_FOUND, f"The Dag with ID: `{dag_id}` was not found")
+
+
 DagBagDep = Annotated[DBDagBag, Depends(dag_bag_from_app)]
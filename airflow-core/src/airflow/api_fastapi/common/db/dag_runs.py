@@ -50,9 +50,13 @@ def eager_load_dag_run_for_validation() -> tuple[LoaderOption, ...]:
     to just the identity columns and dag_version_id, avoiding large intermediate
     result sets caused by loading heavyweight columns (executor_config, etc.) for
     every task instance across every DAG run returned by the query.
+
+    Every relationship the response reads is loaded, so that it can also be built from the results of an
+    async session, which cannot lazy load.
     """
     return (
         joinedload(DagRun.dag_model),
+        joinedload(DagRun.created_dag_version).joinedload(DagVersion.bundle),
         selectinload(DagRun.task_instances)
         .load_only(TaskInstance.dag_version_id)
         .joinedload(TaskInstance.dag_version)
@@ -24,6 +24,7 @@ from airflow.models import Base
 from airflow.models.dag_version import DagVersion
 from airflow.models.dagrun import DagRun
 from airflow.models.taskinstance import TaskInstance
+from airflow.models.trigger import Trigger
 
 
 def eager_load_TI_and_TIH_for_validation(orm_model: Base | None = None) -> tuple[LoaderOption, ...]:
@@ -36,5 +37,8 @@ def eager_load_TI_and_TIH_for_validation(orm_model: Base | None = None) -> tuple
         joinedload(orm_model.dag_run).options(joinedload(DagRun.dag_model)),
     )
     if orm_model is TaskInstance:
-        options += (joinedload(orm_model.task_instance_note),)
+        options += (
+            joinedload(orm_model.task_instance_note),
+            joinedload(orm_model.trigger).joinedload(Trigger.triggerer_job),
+        )
     return options
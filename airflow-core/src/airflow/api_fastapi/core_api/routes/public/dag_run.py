@@ -34,8 +34,18 @@ from airflow.api.common.mark_tasks import (
     set_dag_run_state_to_success,
 )
 from airflow.api_fastapi.auth.managers.models.resource_details import DagAccessEntity
-from airflow.api_fastapi.common.dagbag import DagBagDep, get_dag_for_run, get_latest_version_of_dag
-from airflow.api_fastapi.common.db.common import SessionDep, paginated_select
+from airflow.api_fastapi.common.dagbag import (
+    DagBagDep,
+    get_dag_for_run,
+    get_latest_version_of_dag,
+    get_latest_version_of_dag_async,
+)
+from airflow.api_fastapi.common.db.common import (
+    AsyncSessionDep,
+    SessionDep,
+    paginated_select,
+    paginated_select_async,
+)
 from airflow.api_fastapi.common.db.dag_runs import eager_load_dag_run_for_validation
 from airflow.api_fastapi.common.parameters import (
     FilterOptionEnum,
@@ -103,9 +113,11 @@ dag_run_router = AirflowRouter(tags=["DagRun"], prefix="/dags/{dag_id}/dagRuns")
     ),
     dependencies=[Depends(requires_access_dag(method="GET", access_entity=DagAccessEntity.RUN))],
 )
-def get_dag_run(dag_id: str, dag_run_id: str, session: SessionDep) -> DAGRunResponse:
-    dag_run = session.scalar(
-        select(DagRun).filter_by(dag_id=dag_id, run_id=dag_run_id).options(joinedload(DagRun.dag_model))
+async def get_dag_run(dag_id: str, dag_run_id: str, session: AsyncSessionDep) -> DAGRunResponse:
+    dag_run = await session.scalar(
+        select(DagRun)
+        .filter_by(dag_id=dag_id, run_id=dag_run_id)
+        .options(*eager_load_dag_run_for_validation())
     )
     if dag_run is None:
         raise HTTPException(
@@ -329,7 +341,7 @@ def clear_dag_run(
     responses=create_openapi_http_exception_doc([status.HTTP_404_NOT_FOUND]),
     dependencies=[Depends(requires_access_dag(method="GET", access_entity=DagAccessEntity.RUN))],
 )
-def get_dag_runs(
+async def get_dag_runs(
     dag_id: str,
     limit: QueryLimit,
     offset: QueryOffset,
@@ -369,7 +381,7 @@ def get_dag_runs(
         ),
     ],
     readable_dag_runs_filter: ReadableDagRunsFilterDep,
-    session: SessionDep,
+    session: AsyncSessionDep,
     dag_bag: DagBagDep,
     run_id_pattern: Annotated[_SearchParam, Depends(search_param_factory(DagRun.run_id, "run_id_pattern"))],
     triggering_user_name_pattern: Annotated[
@@ -387,14 +399,14 @@ def get_dag_runs(
     query = select(DagRun).options(*eager_load_dag_run_for_validation())
 
     if dag_id != "~":
-        get_latest_version_of_dag(dag_bag, dag_id, session)  # Check if the DAG exists.
+        await get_latest_version_of_dag_async(dag_bag, dag_id, session)  # Check if the DAG exists.
         query = query.filter(DagRun.dag_id == dag_id).options()
 
     # Add join with DagVersion if dag_version filter is active
     if dag_version.value:
         query = query.join(DagVersion, DagRun.created_dag_version_id == DagVersion.id)
 
-    dag_run_select, total_entries = paginated_select(
+    dag_run_select, total_entries = await paginated_select_async(
         statement=query,
         filters=[
             run_after,
@@ -418,7 +430,7 @@ def get_dag_runs(
         limit=limit,
         session=session,
     )
-    dag_runs = session.scalars(dag_run_select)
+    dag_runs = await session.scalars(dag_run_select)
 
     return DAGRunCollectionResponse(
         dag_runs=dag_runs,
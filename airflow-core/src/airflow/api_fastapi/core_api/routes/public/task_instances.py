@@ -30,9 +30,15 @@ from airflow.api_fastapi.common.dagbag import (
     DagBagDep,
     get_dag_for_run,
     get_dag_for_run_or_latest_version,
+    get_dag_for_run_or_latest_version_async,
     get_latest_version_of_dag,
 )
-from airflow.api_fastapi.common.db.common import SessionDep, paginated_select
+from airflow.api_fastapi.common.db.common import (
+    AsyncSessionDep,
+    SessionDep,
+    paginated_select,
+    paginated_select_async,
+)
 from airflow.api_fastapi.common.db.task_instances import eager_load_TI_and_TIH_for_validation
 from airflow.api_fastapi.common.parameters import (
     FilterOptionEnum,
@@ -107,21 +113,20 @@ task_instances_prefix = "/dagRuns/{dag_run_id}/taskInstances"
     responses=create_openapi_http_exception_doc([status.HTTP_404_NOT_FOUND]),
     dependencies=[Depends(requires_access_dag(method="GET", access_entity=DagAccessEntity.TASK_INSTANCE))],
 )
-def get_task_instance(
+async def get_task_instance(
     dag_id: str,
     dag_run_id: str,
     task_id: str,
-    session: SessionDep,
+    session: AsyncSessionDep,
 ) -> TaskInstanceResponse:
     """Get task instance."""
     query = (
         select(TI)
         .where(TI.dag_id == dag_id, TI.run_id == dag_run_id, TI.task_id == task_id)
         .options(joinedload(TI.rendered_task_instance_fields))
-        .options(joinedload(TI.dag_version))
-        .options(joinedload(TI.dag_run).options(joinedload(DagRun.dag_model)))
+        .options(*eager_load_TI_and_TIH_for_validation())
     )
-    task_instance = session.scalar(query)
+    task_instance = await session.scalar(query)
 
     if task_instance is None:
         raise HTTPException(
@@ -413,7 +418,7 @@ def get_mapped_task_instance(
     responses=create_openapi_http_exception_doc([status.HTTP_400_BAD_REQUEST, status.HTTP_404_NOT_FOUND]),
     dependencies=[Depends(requires_access_dag(method="GET", access_entity=DagAccessEntity.TASK_INSTANCE))],
 )
-def get_task_instances(
+async def get_task_instances(
     dag_id: str,
     dag_run_id: str,
     dag_bag: DagBagDep,
@@ -471,7 +476,7 @@ def get_task_instances(
         ),
     ],
     readable_ti_filter: ReadableTIFilterDep,
-    session: SessionDep,
+    session: AsyncSessionDep,
 ) -> TaskInstanceCollectionResponse:
     """
     Get list of task instances.
@@ -489,7 +494,9 @@ def get_task_instances(
                 status.HTTP_400_BAD_REQUEST,
                 "dag_id is required when dag_run_id is specified",
             )
-        dag_run = session.scalar(select(DagRun).where(DagRun.dag_id == dag_id, DagRun.run_id == dag_run_id))
+        dag_run = await session.scalar(
+            select(DagRun).where(DagRun.dag_id == dag_id, DagRun.run_id == dag_run_id)
+        )
         if not dag_run:
             raise HTTPException(
                 status.HTTP_404_NOT_FOUND,
@@ -497,12 +504,12 @@ def get_task_instances(
             )
         query = query.where(TI.run_id == dag_run_id)
     if dag_id != "~":
-        dag = get_dag_for_run_or_latest_version(dag_bag, dag_run, dag_id, session)
+        dag = await get_dag_for_run_or_latest_version_async(dag_bag, dag_run, dag_id, session)
         query = query.where(TI.dag_id == dag_id)
         if dag:
             task_group_id.dag = dag
 
-    task_instance_select, total_entries = paginated_select(
+    task_instance_select, total_entries = await paginated_select_async(
         statement=query,
         filters=[
             run_after_range,
@@ -535,7 +542,7 @@ def get_task_instances(
         session=session,
     )
 
-    task_instances = session.scalars(task_instance_select)
+    task_instances = await session.scalars(task_instance_select)
     return TaskInstanceCollectionResponse(
         task_instances=task_instances,
         total_entries=total_entries,
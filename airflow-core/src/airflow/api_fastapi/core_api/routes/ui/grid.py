@@ -21,11 +21,12 @@ import collections
 from typing import TYPE_CHECKING, Annotated, Any
 
 import structlog
-from fastapi import Depends, HTTPException, status
-from sqlalchemy import exists, select
+from fastapi import Depends, HTTPException, Request, Response, status
+from sqlalchemy import exists, func, select
 from sqlalchemy.orm import joinedload, load_only, selectinload
 
 from airflow.api_fastapi.auth.managers.models.resource_details import DagAccessEntity
+from airflow.api_fastapi.common.dagbag import DagBagDep
 from airflow.api_fastapi.common.db.common import SessionDep, paginated_select
 from airflow.api_fastapi.common.parameters import (
     QueryDagRunRunTypesFilter,
@@ -54,6 +55,13 @@ from airflow.api_fastapi.core_api.services.ui.grid import (
     _get_aggs_for_node,
     _merge_node_dicts,
 )
+from airflow.api_fastapi.core_api.services.ui.grid_cache import (
+    GridResponseCache,
+    GridResponseCacheDep,
+    check_not_modified,
+    etag_for,
+    request_params_key,
+)
 from airflow.api_fastapi.core_api.services.ui.task_group import (
     get_task_group_children_getter,
     task_group_to_dict_grid,
@@ -66,6 +74,9 @@ from airflow.models.serialized_dag import SerializedDagModel
 from airflow.models.taskinstance import TaskInstance
 from airflow.models.taskinstancehistory import TaskInstanceHistory
 
+if TYPE_CHECKING:
+    from collections.abc import Callable
+
 log = structlog.get_logger(logger_name=__name__)
 grid_router = AirflowRouter(prefix="/grid", tags=["Grid"])
 
@@ -116,6 +127,17 @@ def _get_serdag(dag_id, dag_version_id, session) -> SerializedDagModel | None:
     return serdag
 
 
+def _get_run_ordering(
+    serdag_id: int, serdag_hash: str, read_dag: Callable[[], Any], grid_cache: GridResponseCache
+) -> list[str]:
+    """Return the run ordering of the timetable of a serialized dag, only deserializing it if not cached."""
+    cache_key = ("run_ordering", serdag_id, serdag_hash)
+    if (ordering := grid_cache.get(cache_key)) is None:
+        ordering = list(read_dag().timetable.run_ordering)
+        grid_cache.put(cache_key, ordering)
+    return ordering
+
+
 @grid_router.get(
     "/structure/{dag_id}",
     responses=create_openapi_http_exception_doc([status.HTTP_400_BAD_REQUEST, status.HTTP_404_NOT_FOUND]),
@@ -127,7 +149,11 @@ def _get_serdag(dag_id, dag_version_id, session) -> SerializedDagModel | None:
 )
 def get_dag_structure(
     dag_id: str,
+    request: Request,
+    response: Response,
     session: SessionDep,
+    dag_bag: DagBagDep,
+    grid_cache: GridResponseCacheDep,
     offset: QueryOffset,
     limit: QueryLimit,
     order_by: Annotated[
@@ -145,24 +171,16 @@ def get_dag_structure(
 ) -> list[GridNodeResponse]:
     """Return dag structure for grid view."""
     latest_serdag = _get_latest_serdag(dag_id, session)
-    latest_dag = latest_serdag.dag
     latest_serdag_id = latest_serdag.id
-    session.expunge(latest_serdag)  # allow GC of serdag; only latest_dag is needed from here
-
-    # Apply filtering if root task is specified
-    if root:
-        latest_dag = latest_dag.partial_subset(
-            task_ids=root,
-            include_upstream=include_upstream,
-            include_downstream=include_downstream,
-            depth=depth,
-        )
+    latest_serdag_hash = latest_serdag.dag_hash
 
     # Retrieve, sort the previous DAG Runs
     base_query = select(DagRun.id).where(DagRun.dag_id == dag_id)
     # This comparison is to fall back to DAG timetable when no order_by is provided
     if order_by.value == [order_by.get_primary_key_string()]:
-        ordering = list(latest_dag.timetable.run_ordering)
+        ordering = _get_run_ordering(
+            latest_serdag_id, latest_serdag_hash, lambda: dag_bag.read_dag(latest_serdag), grid_cache
+        )
         order_by = SortParam(
             allowed_attrs=ordering,
             model=DagRun,
@@ -173,13 +191,67 @@ def get_dag_structure(
         offset=offset,
         filters=[run_after, run_type, state, triggering_user],
         limit=limit,
+        return_total_entries=False,
     )
     run_ids = list(session.scalars(dag_runs_select_filter))
 
+    # The other versions of the dag the runs were run with. Only their hashes are loaded here, so that
+    # the structure is only merged again if it changed.
+    serdags_filter = (
+        # Even though dag_id is filtered in base_query,
+        # adding this line here can improve the performance of this endpoint
+        SerializedDagModel.dag_id == dag_id,
+        SerializedDagModel.id != latest_serdag_id,
+        SerializedDagModel.dag_version_id.in_(
+            select(TaskInstance.dag_version_id)
+            .join(TaskInstance.dag_run)
+            .where(
+                DagRun.id.in_(run_ids),
+            )
+            .distinct()
+        ),
+    )
+    serdag_versions: list[tuple[Any, ...]] = []
+    if run_ids:
+        serdag_versions = sorted(
+            tuple(row)
+            for row in session.execute(
+                select(SerializedDagModel.id, SerializedDagModel.dag_hash).where(*serdags_filter)
+            )
+        )
+    cache_key = (
+        "structure",
+        dag_id,
+        latest_serdag_id,
+        latest_serdag_hash,
+        tuple(serdag_versions),
+        root,
+        include_upstream,
+        include_downstream,
+        depth,
+    )
+    check_not_modified(request, response, etag_for(cache_key))
+    if (cached := grid_cache.get(cache_key)) is not None:
+        return cached
+
+    latest_dag = dag_bag.read_dag(latest_serdag)
+    session.expunge(latest_serdag)  # allow GC of serdag; only latest_dag is needed from here
+
+    # Apply filtering if root task is specified
+    if root:
+        latest_dag = latest_dag.partial_subset(
+            task_ids=root,
+            include_upstream=include_upstream,
+            include_downstream=include_downstream,
+            depth=depth,
+        )
+
     task_group_sort = get_task_group_children_getter()
     if not run_ids:
         nodes = [task_group_to_dict_grid(x) for x in task_group_sort(latest_dag.task_group)]
-        return [GridNodeResponse(**n) for n in nodes]
+        structure = [GridNodeResponse(**n) for n in nodes]
+        grid_cache.put(cache_key, structure)
+        return structure
 
     # Process and merge the latest serdag first
     merged_nodes: list[dict[str, Any]] = []
@@ -192,25 +264,12 @@ def get_dag_structure(
     # to allow garbage collection and prevent memory buildup in the session identity map.
     serdags_query = (
         select(SerializedDagModel)
-        .where(
-            # Even though dag_id is filtered in base_query,
-            # adding this line here can improve the performance of this endpoint
-            SerializedDagModel.dag_id == dag_id,
-            SerializedDagModel.id != latest_serdag_id,
-            SerializedDagModel.dag_version_id.in_(
-                select(TaskInstance.dag_version_id)
-                .join(TaskInstance.dag_run)
-                .where(
-                    DagRun.id.in_(run_ids),
-                )
-                .distinct()
-            ),
-        )
+        .where(*serdags_filter)
         .execution_options(yield_per=5)  # balance between peak memory usage and round trips
     )
 
     for serdag in session.scalars(serdags_query):
-        filtered_dag = serdag.dag
+        filtered_dag = dag_bag.read_dag(serdag)
         # Apply the same filtering to historical DAG versions
         if root:
             filtered_dag = filtered_dag.partial_subset(
@@ -225,7 +284,9 @@ def get_dag_structure(
 
         session.expunge(serdag)  # to allow garbage collection
 
-    return [GridNodeResponse(**n) for n in merged_nodes]
+    structure = [GridNodeResponse(**n) for n in merged_nodes]
+    grid_cache.put(cache_key, structure)
+    return structure
 
 
 @grid_router.get(
@@ -254,7 +315,11 @@ def get_dag_structure(
 )
 def get_grid_runs(
     dag_id: str,
+    request: Request,
+    response: Response,
     session: SessionDep,
+    dag_bag: DagBagDep,
+    grid_cache: GridResponseCacheDep,
     offset: QueryOffset,
     limit: QueryLimit,
     order_by: Annotated[
@@ -277,6 +342,45 @@ def get_grid_runs(
     triggering_user: QueryDagRunTriggeringUserSearch,
 ) -> list[GridRunsResponse]:
     """Get info about a run for the grid."""
+    # Any change to a run of the dag, or to its deadlines, changes the key
+    latest_serdag = (
+        select(SerializedDagModel.id, SerializedDagModel.dag_hash)
+        .where(SerializedDagModel.dag_id == dag_id)
+        .order_by(SerializedDagModel.id.desc())
+        .limit(1)
+        .subquery()
+    )
+    latest_serdag_id, latest_serdag_hash, run_count, runs_updated_at, missed_deadlines = session.execute(
+        select(
+            select(latest_serdag.c.id).scalar_subquery(),
+            select(latest_serdag.c.dag_hash).scalar_subquery(),
+            select(func.count(DagRun.id)).where(DagRun.dag_id == dag_id).scalar_subquery(),
+            select(func.max(DagRun.updated_at)).where(DagRun.dag_id == dag_id).scalar_subquery(),
+            select(func.count(Deadline.id))
+            .join(DagRun, Deadline.dagrun_id == DagRun.id)
+            .where(DagRun.dag_id == dag_id, Deadline.missed.is_(True))
+            .scalar_subquery(),
+        )
+    ).one()
+    if latest_serdag_id is None:
+        raise HTTPException(
+            status.HTTP_404_NOT_FOUND,
+            f"Dag with id {dag_id} was not found",
+        )
+    cache_key = (
+        "runs",
+        dag_id,
+        request_params_key(request),
+        latest_serdag_id,
+        latest_serdag_hash,
+        run_count,
+        runs_updated_at,
+        missed_deadlines,
+    )
+    if (cached := grid_cache.get(cache_key)) is not None:
+        _check_runs_not_modified(request, response, cache_key, cached)
+        return cached
+
     # Retrieve, sort the previous DAG Runs
     has_missed_deadline = (
         exists()
@@ -314,9 +418,12 @@ def get_grid_runs(
 
     # This comparison is to fall back to DAG timetable when no order_by is provided
     if order_by.value == [order_by.get_primary_key_string()]:
-        latest_serdag = _get_latest_serdag(dag_id, session)
-        latest_dag = latest_serdag.dag
-        ordering = list(latest_dag.timetable.run_ordering)
+        ordering = _get_run_ordering(
+            latest_serdag_id,
+            latest_serdag_hash,
+            lambda: dag_bag.read_dag(session.get(SerializedDagModel, latest_serdag_id)),
+            grid_cache,
+        )
         order_by = SortParam(
             allowed_attrs=ordering,
             model=DagRun,
@@ -334,9 +441,20 @@ def get_grid_runs(
     for run, has_missed in results:
         run.has_missed_deadline = has_missed
         grid_runs.append(GridRunsResponse.model_validate(run, from_attributes=True))
+    # The duration of unfinished runs is computed when serializing the response, not when caching it
+    grid_cache.put(cache_key, grid_runs)
+    _check_runs_not_modified(request, response, cache_key, grid_runs)
     return grid_runs
 
 
+def _check_runs_not_modified(
+    request: Request, response: Response, cache_key: tuple[Any, ...], grid_runs: list[GridRunsResponse]
+) -> None:
+    # The duration of an unfinished run grows with time, so it is never answered as not modified
+    if all(run.end_date or not run.start_date for run in grid_runs):
+        check_not_modified(request, response, etag_for(cache_key))
+
+
 @grid_router.get(
     "/ti_summaries/{dag_id}/{run_id}",
     responses=create_openapi_http_exception_doc(
@@ -363,7 +481,11 @@ def get_grid_runs(
 def get_grid_ti_summaries(
     dag_id: str,
     run_id: str,
+    request: Request,
+    response: Response,
     session: SessionDep,
+    dag_bag: DagBagDep,
+    grid_cache: GridResponseCacheDep,
 ) -> GridTISummaries:
     """
     Get states for TIs / "groups" of TIs.
@@ -378,7 +500,26 @@ def get_grid_ti_summaries(
     And for task groups, we add a "task" for that which is not really a task but is just
     an entry that represents the group (so that we can show a filled in box when the group
     is not expanded) and its state is an agg of those within it.
+
+    The summaries are cached, keyed by the number of task instances of the run in each state and the time
+    the last one was updated.
     """
+    ti_watermark = tuple(
+        sorted(
+            (str(state), count, updated_at)
+            for state, count, updated_at in session.execute(
+                select(TaskInstance.state, func.count(TaskInstance.id), func.max(TaskInstance.updated_at))
+                .where(TaskInstance.dag_id == dag_id, TaskInstance.run_id == run_id)
+                .group_by(TaskInstance.state)
+            )
+        )
+    )
+    cache_key = ("ti_summaries", dag_id, run_id, ti_watermark)
+    if ti_watermark:
+        check_not_modified(request, response, etag_for(cache_key))
+        if (cached := grid_cache.get(cache_key)) is not None:
+            return cached
+
     tis_of_dag_runs, _ = paginated_select(
         statement=(
             select(
@@ -422,13 +563,14 @@ def get_grid_ti_summaries(
     )
     if TYPE_CHECKING:
         assert serdag
+    dag = dag_bag.read_dag(serdag)
 
     def get_node_sumaries():
         yielded_task_ids: set[str] = set()
 
         # Yield all nodes discoverable from the serialized DAG structure
         for node in _find_aggregates(
-            node=serdag.dag.task_group,
+            node=dag.task_group,
             parent_node=None,
             ti_details=ti_details,
         ):
@@ -460,8 +602,10 @@ def get_grid_ti_summaries(
     group_ids = {n.get("task_id") for n in task_instances if n.get("type") == "group"}
     filtered = [n for n in task_instances if not (n.get("type") == "task" and n.get("task_id") in group_ids)]
 
-    return {  # type: ignore[return-value]
+    summaries = {
         "run_id": run_id,
         "dag_id": dag_id,
         "task_instances": filtered,
     }
+    grid_cache.put(cache_key, summaries)
+    return summaries  # type: ignore[return-value]
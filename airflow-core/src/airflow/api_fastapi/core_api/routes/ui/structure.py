@@ -21,6 +21,7 @@ from sqlalchemy import select
 from sqlalchemy.orm import joinedload
 
 from airflow.api_fastapi.auth.managers.models.resource_details import DagAccessEntity
+from airflow.api_fastapi.common.dagbag import DagBagDep
 from airflow.api_fastapi.common.db.common import SessionDep
 from airflow.api_fastapi.common.parameters import QueryIncludeDownstream, QueryIncludeUpstream
 from airflow.api_fastapi.common.router import AirflowRouter
@@ -51,6 +52,7 @@ structure_router = AirflowRouter(tags=["Structure"], prefix="/structure")
 )
 def structure_data(
     session: SessionDep,
+    dag_bag: DagBagDep,
     dag_id: str,
     include_upstream: QueryIncludeUpstream = False,
     include_downstream: QueryIncludeDownstream = False,
@@ -80,7 +82,7 @@ def structure_data(
             status.HTTP_404_NOT_FOUND,
             f"Dag with id {dag_id} and version number {version_number} was not found",
         )
-    dag = serialized_dag.dag
+    dag = dag_bag.read_dag(serialized_dag)
 
     if root:
         dag = dag.partial_subset(
@@ -30,6 +30,7 @@ from sqlalchemy import or_, select
 from sqlalchemy.orm import Session
 
 from airflow.api_fastapi.app import get_auth_manager
+from airflow.api_fastapi.auth.managers.authorized_dags import AuthorizedDagIds
 from airflow.api_fastapi.auth.managers.base_auth_manager import (
     COOKIE_NAME_JWT_TOKEN,
     BaseAuthManager,
@@ -76,7 +77,7 @@ from airflow.models.team import Team
 from airflow.models.xcom import XComModel
 
 if TYPE_CHECKING:
-    from sqlalchemy.sql import Select
+    from sqlalchemy.sql import ColumnElement, Select
 
     from airflow.api_fastapi.auth.managers.base_auth_manager import ResourceMethod
 
@@ -183,22 +184,28 @@ class PermittedDagFilter(OrmClause[set[str]]):
     """A parameter that filters the permitted dags for the user."""
 
     def to_orm(self, select: Select) -> Select:
+        return select.where(self.dag_id_clause(DagModel.dag_id))
+
+    def dag_id_clause(self, dag_id_column: Any) -> ColumnElement[bool]:
+        """Restrict ``dag_id_column`` to the permitted dags, by team when the auth manager tells which."""
+        if isinstance(self.value, AuthorizedDagIds):
+            return self.value.dag_id_clause(dag_id_column)
         # self.value may be None (OrmClause holds Optional), ensure we pass an Iterable to in_
-        return select.where(DagModel.dag_id.in_(self.value or set()))
+        return dag_id_column.in_(self.value or set())
 
 
 class PermittedDagRunFilter(PermittedDagFilter):
     """A parameter that filters the permitted dag runs for the user."""
 
     def to_orm(self, select: Select) -> Select:
-        return select.where(DagRun.dag_id.in_(self.value or set()))
+        return select.where(self.dag_id_clause(DagRun.dag_id))
 
 
 class PermittedDagWarningFilter(PermittedDagFilter):
     """A parameter that filters the permitted dag warnings for the user."""
 
     def to_orm(self, select: Select) -> Select:
-        return select.where(DagWarning.dag_id.in_(self.value or set()))
+        return select.where(self.dag_id_clause(DagWarning.dag_id))
 
 
 class PermittedEventLogFilter(PermittedDagFilter):
@@ -207,35 +214,35 @@ class PermittedEventLogFilter(PermittedDagFilter):
     def to_orm(self, select: Select) -> Select:
         # Event Logs not related to Dags have dag_id as None and are always returned.
         # return select.where(Log.dag_id.in_(self.value or set()) or Log.dag_id.is_(None))
-        return select.where(or_(Log.dag_id.in_(self.value or set()), Log.dag_id.is_(None)))
+        return select.where(or_(self.dag_id_clause(Log.dag_id), Log.dag_id.is_(None)))
 
 
 class PermittedTIFilter(PermittedDagFilter):
     """A parameter that filters the permitted task instances for the user."""
 
     def to_orm(self, select: Select) -> Select:
-        return select.where(TI.dag_id.in_(self.value or set()))
+        return select.where(self.dag_id_clause(TI.dag_id))
 
 
 class PermittedXComFilter(PermittedDagFilter):
     """A parameter that filters the permitted XComs for the user."""
 
     def to_orm(self, select: Select) -> Select:
-        return select.where(XComModel.dag_id.in_(self.value or set()))
+        return select.where(self.dag_id_clause(XComModel.dag_id))
 
 
 class PermittedTagFilter(PermittedDagFilter):
     """A parameter that filters the permitted dag tags for the user."""
 
     def to_orm(self, select: Select) -> Select:
-        return select.where(DagTag.dag_id.in_(self.value or set()))
+        return select.where(self.dag_id_clause(DagTag.dag_id))
 
 
 class PermittedDagVersionFilter(PermittedDagFilter):
     """A parameter that filters the permitted dag versions for the user."""
 
     def to_orm(self, select: Select) -> Select:
-        return select.where(DagVersion.dag_id.in_(self.value or set()))
+        return select.where(self.dag_id_clause(DagVersion.dag_id))
 
 
 def permitted_dag_filter_factory(
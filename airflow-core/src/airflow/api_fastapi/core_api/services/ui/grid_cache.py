@@ -0,0 +1,124 @@
+# Licensed to the Apache Software Foundation (ASF) under one
+# or more contributor license agreements.  See the NOTICE file
+# distributed with this work for additional information
+# regarding copyright ownership.  The ASF licenses this file
+# to you under the Apache License, Version 2.0 (the
+# "License"); you may not use this file except in compliance
+# with the License.  You may obtain a copy of the License at
+#
+#   http://www.apache.org/licenses/LICENSE-2.0
+#
+# Unless required by applicable law or agreed to in writing,
+# software distributed under the License is distributed on an
+# "AS IS" BASIS, WITHOUT WARRANTIES OR CONDITIONS OF ANY
+# KIND, either express or implied.  See the License for the
+# specific language governing permissions and limitations
+# under the License.
+"""Caching and conditional requests of the grid view endpoints."""
+
+from __future__ import annotations
+
+import hashlib
+import threading
+from collections import OrderedDict
+from functools import cache
+from typing import TYPE_CHECKING, Annotated, Any
+
+from fastapi import Depends, HTTPException, status
+
+from airflow._shared.observability.metrics.stats import Stats
+from airflow.configuration import conf
+
+if TYPE_CHECKING:
+    from collections.abc import Hashable
+
+    from fastapi import Request, Response
+
+
+class GridResponseCache:
+    """
+    Thread-safe LRU cache of grid view responses.
+
+    Responses are keyed by everything they are computed from: the request parameters, the versions of the
+    serialized dag and a watermark of the rows read (counts and latest ``updated_at``). A changed row gives a
+    new key, so entries never need to be invalidated; stale ones are evicted as least recently used.
+
+    :param max_entries: maximum number of responses kept, ``0`` disables the cache
+    """
+
+    def __init__(self, max_entries: int) -> None:
+        self.max_entries = max_entries
+        self._items: OrderedDict[Hashable, Any] = OrderedDict()
+        self._lock = threading.Lock()
+
+    def __len__(self) -> int:
+        return len(self._items)
+
+    def get(self, key: tuple[Hashable, ...]) -> Any | None:
+        """Get a cached response and mark it as most recently used."""
+        if not self.max_entries:
+            return None
+        with self._lock:
+            value = self._items.get(key)
+            if value is not None:
+                self._items.move_to_end(key)
+        endpoint = key[0]
+        if value is None:
+            Stats.incr("api.grid_cache.misses", tags={"endpoint": endpoint})
+            return None
+        Stats.incr("api.grid_cache.hits", tags={"endpoint": endpoint})
+        return value
+
+    def put(self, key: tuple[Hashable, ...], value: Any) -> None:
+        """Cache a response, evicting the least recently used ones if there are too many."""
+        if not self.max_entries:
+            return
+        with self._lock:
+            self._items[key] = value
+            self._items.move_to_end(key)
+            while len(self._items) > self.max_entries:
+                self._items.popitem(last=False)
+
+    def clear(self) -> None:
+        with self._lock:
+            self._items.clear()
+
+
+@cache
+def get_grid_response_cache() -> GridResponseCache:
+    return GridResponseCache(max_entries=conf.getint("api", "grid_cache_max_entries", fallback=1000))
+
+
+GridResponseCacheDep = Annotated[GridResponseCache, Depends(get_grid_response_cache)]
+
+
+def request_params_key(request: Request) -> tuple[tuple[str, str], ...]:
+    """Return the query parameters of a request, in a form usable in a cache key."""
+    return tuple(sorted(request.query_params.multi_items()))
+
+
+def etag_for(key: tuple[Hashable, ...]) -> str:
+    """
+    Return the entity tag of the response cached under ``key``.
+
+    Keys only contain values with a stable ``repr`` (strings, numbers, datetimes, UUIDs and sorted tuples of
+    them), so all the API server processes give the same response the same tag.
+    """
+    return f'"{hashlib.sha256(repr(key).encode()).hexdigest()[:32]}"'
+
+
+def check_not_modified(request: Request, response: Response, etag: str) -> None:
+    """
+    Tag the response with ``etag``, and answer ``304 Not Modified`` if the client already has it.
+
+    Responses are also marked to be revalidated on every use, so browsers send ``If-None-Match`` by
+    themselves when the UI polls the endpoint again.
+    """
+    headers = {"ETag": etag, "Cache-Control": "no-cache"}
+    if_none_match = request.headers.get("if-none-match")
+    if if_none_match and (
+        if_none_match.strip() == "*"
+        or etag in (tag.strip().removeprefix("W/") for tag in if_none_match.split(","))
+    ):
+        raise HTTPException(status.HTTP_304_NOT_MODIFIED, headers=headers)
+    response.headers.update(headers)
@@ -97,8 +97,16 @@ async def lifespan(app: FastAPI, registry: svcs.Registry):
     # Create an app scoped validator, so that we don't have to fetch it every time
     registry.register_value(JWTValidator, _jwt_validator(), ping=JWTValidator.status)
 
+    from airflow.api_fastapi.execution_api.heartbeats import get_heartbeat_buffer
+
+    if heartbeat_buffer := get_heartbeat_buffer():
+        heartbeat_buffer.start()
+
     yield
 
+    if heartbeat_buffer:
+        heartbeat_buffer.stop()
+
 
 class CorrelationIdMiddleware(BaseHTTPMiddleware):
     """
@@ -232,6 +232,26 @@ TIStateUpdate = Annotated[
 ]
 
 
+class TIFinalXCom(StrictBaseModel):
+    """Schema for an XCom pushed by a TaskInstance, sent along with its final state."""
+
+    key: Annotated[str, Field(min_length=1)]
+    value: JsonValue
+    mapped_length: int | None = None
+
+
+class TIFinalizePayload(StrictBaseModel):
+    """
+    Schema for recording the final state of a TaskInstance with the results it pushed last.
+
+    The XComs, rendered fields and state are all stored in one transaction.
+    """
+
+    state_update: TIStateUpdate
+    rendered_fields: dict[str, JsonValue] | None = None
+    xcoms: Annotated[list[TIFinalXCom], Field(default_factory=list)]
+
+
 class TIHeartbeatInfo(StrictBaseModel):
     """Schema for TaskInstance heartbeat endpoint."""
 
@@ -0,0 +1,177 @@
+# Licensed to the Apache Software Foundation (ASF) under one
+# or more contributor license agreements.  See the NOTICE file
+# distributed with this work for additional information
+# regarding copyright ownership.  The ASF licenses this file
+# to you under the Apache License, Version 2.0 (the
+# "License"); you may not use this file except in compliance
+# with the License.  You may obtain a copy of the License at
+#
+#   http://www.apache.org/licenses/LICENSE-2.0
+#
+# Unless required by applicable law or agreed to in writing,
+# software distributed under the License is distributed on an
+# "AS IS" BASIS, WITHOUT WARRANTIES OR CONDITIONS OF ANY
+# KIND, either express or implied.  See the License for the
+# specific language governing permissions and limitations
+# under the License.
+"""Write-behind buffering of task instance heartbeats."""
+
+from __future__ import annotations
+
+import threading
+import time
+from functools import cache
+from typing import TYPE_CHECKING, NamedTuple
+
+import structlog
+from sqlalchemy import bindparam, select, update
+
+from airflow._shared.observability.metrics.stats import Stats
+from airflow.configuration import conf
+from airflow.models.taskinstance import TaskInstance as TI
+from airflow.utils.session import create_session
+from airflow.utils.state import TaskInstanceState
+
+if TYPE_CHECKING:
+    from datetime import datetime
+    from uuid import UUID
+
+    from sqlalchemy.orm import Session
+
+log = structlog.get_logger(logger_name=__name__)
+
+
+class HeartbeatOwner(NamedTuple):
+    """State, hostname and pid of a running task instance, as last read from the database."""
+
+    state: str | None
+    hostname: str | None
+    pid: int | None
+
+
+class HeartbeatBuffer:
+    """
+    Validate heartbeats against recently read task instance rows and write them in bulk.
+
+    A task instance that was found running on the heartbeating host and pid is trusted for
+    ``flush_interval`` seconds, during which its heartbeats are neither locked nor read from the database.
+    Their ``last_heartbeat_at`` values are kept in memory and written with a single bulk ``UPDATE``, by the
+    first heartbeat handled once ``flush_interval`` has passed since the previous write, or by a background
+    thread every ``flush_interval`` seconds and when the server stops.
+
+    The buffer is local to the API server process. Only the state changes made through the ``run`` and
+    ``state`` endpoints of the Execution API of the same process evict a task instance right away. Changes
+    made anywhere else, including through the core API and the UI, are noticed by the next write, which
+    reads the state of the trusted task instances and evicts those no longer running. Until then, for up to
+    ``flush_interval`` seconds, heartbeats are answered from the previously read row: they keep succeeding
+    for a task instance which was stopped, or are rejected for one which was moved to another host or pid.
+    """
+
+    def __init__(self, flush_interval: float):
+        self.flush_interval = flush_interval
+        self._owners: dict[UUID, tuple[HeartbeatOwner, float]] = {}
+        self._pending: dict[UUID, datetime] = {}
+        self._last_flush = time.monotonic()
+        self._lock = threading.Lock()
+        self._stopped = threading.Event()
+        self._thread: threading.Thread | None = None
+
+    def get_owner(self, ti_id: UUID) -> HeartbeatOwner | None:
+        """Return the cached owner of a task instance, if it was read recently enough."""
+        with self._lock:
+            if (entry := self._owners.get(ti_id)) is None:
+                return None
+            owner, expires_at = entry
+            if expires_at < time.monotonic():
+                del self._owners[ti_id]
+                return None
+            return owner
+
+    def set_owner(self, ti_id: UUID, owner: HeartbeatOwner) -> None:
+        with self._lock:
+            self._owners[ti_id] = (owner, time.monotonic() + self.flush_interval)
+
+    def forget(self, ti_id: UUID) -> None:
+        """Drop the cached owner and the pending heartbeat of a task instance whose row was changed."""
+        with self._lock:
+            self._owners.pop(ti_id, None)
+            self._pending.pop(ti_id, None)
+
+    def add(self, ti_id: UUID, heartbeat_at: datetime, session: Session) -> None:
+        """Record a heartbeat, and write all the pending ones if they are due."""
+        with self._lock:
+            self._pending[ti_id] = heartbeat_at
+            if time.monotonic() - self._last_flush < self.flush_interval:
+                return
+        self.flush(session)
+
+    def flush(self, session: Session) -> None:
+        """Evict the trusted task instances which are no longer running, and write the pending heartbeats."""
+        with self._lock:
+            pending, self._pending = self._pending, {}
+            trusted = set(self._owners)
+            self._last_flush = time.monotonic()
+        try:
+            if ti_ids := trusted | pending.keys():
+                running = set(
+                    session.scalars(
+                        select(TI.id).where(TI.id.in_(ti_ids), TI.state == TaskInstanceState.RUNNING)
+                    )
+                )
+                Stats.incr("ti.heartbeat.db_statements")
+                if stopped := ti_ids - running:
+                    with self._lock:
+                        for ti_id in stopped:
+                            self._owners.pop(ti_id, None)
+                    pending = {ti_id: ts for ti_id, ts in pending.items() if ti_id in running}
+            write_heartbeats(pending, session)
+        except Exception:
+            with self._lock:
+                # Keep the heartbeats for the next flush, unless newer ones came in meanwhile
+                self._pending = pending | self._pending
+            raise
+
+    def start(self) -> None:
+        """Start writing the pending heartbeats every ``flush_interval`` seconds in a background thread."""
+        if self._thread is None:
+            self._thread = threading.Thread(target=self._run, name="heartbeat-buffer", daemon=True)
+            self._thread.start()
+
+    def stop(self) -> None:
+        """Stop the background thread, once it wrote the pending heartbeats."""
+        self._stopped.set()
+        if self._thread is not None:
+            self._thread.join()
+            self._thread = None
+
+    def _run(self) -> None:
+        while True:
+            stopping = self._stopped.wait(self.flush_interval)
+            try:
+                with create_session() as session:
+                    self.flush(session)
+            except Exception:
+                log.exception("Failed to write buffered heartbeats")
+            if stopping:
+                return
+
+
+@cache
+def get_heartbeat_buffer() -> HeartbeatBuffer | None:
+    """Return the heartbeat buffer of the API server process, if heartbeats are buffered."""
+    if (flush_interval := conf.getfloat("execution_api", "heartbeat_flush_interval", fallback=0)) > 0:
+        return HeartbeatBuffer(flush_interval)
+    return None
+
+
+def write_heartbeats(heartbeats: dict[UUID, datetime], session: Session) -> None:
+    """Set ``last_heartbeat_at`` of the given task instances in a single bulk ``UPDATE``."""
+    if not heartbeats:
+        return
+    table = TI.__table__
+    session.connection().execute(
+        update(table).where(table.c.id == bindparam("ti_id")).values(last_heartbeat_at=bindparam("ts")),
+        [{"ti_id": ti_id, "ts": ts} for ti_id, ts in heartbeats.items()],
+    )
+    Stats.incr("ti.heartbeat.db_statements")
+    log.debug("Wrote buffered heartbeats", count=len(heartbeats))
@@ -37,6 +37,7 @@ from sqlalchemy.orm import joinedload
 from sqlalchemy.sql import select
 from structlog.contextvars import bind_contextvars
 
+from airflow._shared.observability.metrics.stats import Stats
 from airflow._shared.timezones import timezone
 from airflow.api_fastapi.common.dagbag import DagBagDep, get_latest_version_of_dag
 from airflow.api_fastapi.common.db.common import SessionDep
@@ -50,6 +51,7 @@ from airflow.api_fastapi.execution_api.datamodels.taskinstance import (
     TaskStatesResponse,
     TIDeferredStatePayload,
     TIEnterRunningPayload,
+    TIFinalizePayload,
     TIHeartbeatInfo,
     TIRescheduleStatePayload,
     TIRetryStatePayload,
@@ -60,6 +62,8 @@ from airflow.api_fastapi.execution_api.datamodels.taskinstance import (
     TITerminalStatePayload,
 )
 from airflow.api_fastapi.execution_api.deps import JWTBearerTIPathDep
+from airflow.api_fastapi.execution_api.heartbeats import HeartbeatOwner, get_heartbeat_buffer
+from airflow.api_fastapi.execution_api.routes.xcoms import store_xcom
 from airflow.exceptions import TaskNotFound
 from airflow.models.asset import AssetActive
 from airflow.models.dag import DagModel
@@ -88,6 +92,11 @@ ti_id_router = VersionedAPIRouter(
 log = structlog.get_logger(__name__)
 
 
+def _forget_heartbeat_owner(task_instance_id: UUID) -> None:
+    if heartbeat_buffer := get_heartbeat_buffer():
+        heartbeat_buffer.forget(task_instance_id)
+
+
 @ti_id_router.patch(
     "/{task_instance_id}/run",
     status_code=status.HTTP_200_OK,
@@ -110,6 +119,7 @@ def ti_run(
     This endpoint is used to start a TaskInstance that is in the QUEUED state.
     """
     bind_contextvars(ti_id=str(task_instance_id))
+    _forget_heartbeat_owner(task_instance_id)
     log.debug(
         "Starting task instance run",
         hostname=ti_run_payload.hostname,
@@ -294,6 +304,7 @@ def ti_update_state(
     passed along. (Check out the datamodels for details, the rendered docs might not reflect this accurately)
     """
     bind_contextvars(ti_id=str(task_instance_id))
+    _forget_heartbeat_owner(task_instance_id)
     log.debug("Updating task instance state", new_state=ti_patch_payload.state)
 
     old = (
@@ -579,22 +590,38 @@ def ti_heartbeat(
     # Hot path: since heartbeating a task is a very common operation, we try to do minimize the number of queries
     # and DB round trips as much as possible.
 
-    old = select(TI.state, TI.hostname, TI.pid).where(TI.id == task_instance_id).with_for_update()
-
-    try:
-        (previous_state, hostname, pid) = session.execute(old).one()
+    heartbeat_buffer = get_heartbeat_buffer()
+    cached_owner = heartbeat_buffer.get_owner(task_instance_id) if heartbeat_buffer else None
+    if cached_owner is not None:
+        (previous_state, hostname, pid) = cached_owner
         log.debug(
-            "Retrieved current task state", state=previous_state, current_hostname=hostname, current_pid=pid
-        )
-    except NoResultFound:
-        log.error("Task Instance not found")
-        raise HTTPException(
-            status_code=status.HTTP_404_NOT_FOUND,
-            detail={
-                "reason": "not_found",
-                "message": "Task Instance not found",
-            },
+            "Using cached task state", state=previous_state, current_hostname=hostname, current_pid=pid
         )
+    else:
+        old = select(TI.state, TI.hostname, TI.pid).where(TI.id == task_instance_id)
+        if heartbeat_buffer is None:
+            # Buffered heartbeats are written later without a lock anyway
+            old = old.with_for_update()
+
+        try:
+            (previous_state, hostname, pid) = session.execute(old).one()
+            log.debug(
+                "Retrieved current task state",
+                state=previous_state,
+                current_hostname=hostname,
+                current_pid=pid,
+            )
+        except NoResultFound:
+            log.error("Task Instance not found")
+            raise HTTPException(
+                status_code=status.HTTP_404_NOT_FOUND,
+                detail={
+                    "reason": "not_found",
+                    "message": "Task Instance not found",
+                },
+            )
+        finally:
+            Stats.incr("ti.heartbeat.db_statements")
 
     if hostname != ti_payload.hostname or pid != ti_payload.pid:
         log.warning(
@@ -625,8 +652,16 @@ def ti_heartbeat(
             },
         )
 
+    if heartbeat_buffer:
+        if cached_owner is None:
+            heartbeat_buffer.set_owner(task_instance_id, HeartbeatOwner(previous_state, hostname, pid))
+        heartbeat_buffer.add(task_instance_id, timezone.utcnow(), session)
+        log.debug("Heartbeat buffered", state=previous_state)
+        return
+
     # Update the last heartbeat time!
     session.execute(update(TI).where(TI.id == task_instance_id).values(last_heartbeat_at=timezone.utcnow()))
+    Stats.incr("ti.heartbeat.db_statements")
     log.debug("Heartbeat updated", state=previous_state)
 
 
@@ -666,6 +701,60 @@ def ti_put_rtif(
     return {"message": "Rendered task instance fields successfully set"}
 
 
+@ti_id_router.patch(
+    "/{task_instance_id}/finalize",
+    status_code=status.HTTP_204_NO_CONTENT,
+    summary="Set the final state of a Task Instance with its last results",
+    description="Store the XComs and rendered task instance fields sent by the worker, and update the state "
+    "of the task instance, in one transaction. Workers send this instead of separate requests when a task "
+    "finishes.",
+    responses={
+        status.HTTP_404_NOT_FOUND: {"description": "Task Instance not found"},
+        status.HTTP_409_CONFLICT: {"description": "The TI is already in the requested state"},
+        HTTP_422_UNPROCESSABLE_CONTENT: {"description": "Invalid payload for the state transition"},
+    },
+)
+def ti_finalize(
+    task_instance_id: UUID,
+    finalize_payload: Annotated[TIFinalizePayload, Body()],
+    session: SessionDep,
+    dag_bag: DagBagDep,
+):
+    """Set the XComs, rendered fields and state of a TaskInstance, sent together by the worker."""
+    bind_contextvars(ti_id=str(task_instance_id))
+    task_instance = session.scalar(select(TI).where(TI.id == task_instance_id))
+    if not task_instance:
+        log.error("Task Instance not found")
+        raise HTTPException(
+            status_code=status.HTTP_404_NOT_FOUND,
+            detail={
+                "reason": "not_found",
+                "message": "Task Instance not found",
+            },
+        )
+    log.debug(
+        "Finalizing task instance",
+        xcom_count=len(finalize_payload.xcoms),
+        has_rendered_fields=finalize_payload.rendered_fields is not None,
+    )
+
+    for xcom in finalize_payload.xcoms:
+        store_xcom(
+            dag_id=task_instance.dag_id,
+            run_id=task_instance.run_id,
+            task_id=task_instance.task_id,
+            key=xcom.key,
+            value=xcom.value,
+            map_index=task_instance.map_index,
+            mapped_length=xcom.mapped_length,
+            session=session,
+        )
+    if finalize_payload.rendered_fields is not None:
+        task_instance.update_rtif(finalize_payload.rendered_fields, session)
+    # Any error updating the state rolls back the XComs and rendered fields too
+    ti_update_state(task_instance_id, finalize_payload.state_update, session, dag_bag)
+
+
 @ti_id_router.patch(
     "/{task_instance_id}/rendered-map-index",
     status_code=status.HTTP_204_NO_CONTENT,
@@ -17,8 +17,9 @@
 
 from __future__ import annotations
 
+import itertools
 import logging
-from typing import Annotated
+from typing import TYPE_CHECKING, Annotated
 
 from fastapi import APIRouter, Body, Depends, HTTPException, Path, Query, Request, Response, status
 from pydantic import JsonValue
@@ -37,6 +38,9 @@ from airflow.models.taskmap import TaskMap
 from airflow.models.xcom import XComModel
 from airflow.utils.db import get_query_count
 
+if TYPE_CHECKING:
+    from sqlalchemy.orm import Session
+
 
 async def has_xcom_access(
     dag_id: str,
@@ -71,6 +75,9 @@ router = APIRouter(
 
 log = logging.getLogger(__name__)
 
+# Number of rows fetched from the database at a time when reading a sequence slice.
+_SLICE_YIELD_PER = 1000
+
 
 async def xcom_query(
     dag_id: str,
@@ -210,10 +217,13 @@ def get_mapped_xcom_by_slice(
             else:
                 query = query.slice(-stop, -start)
 
-    values = [row.value for row in session.execute(query.with_only_columns(XComModel.value)).all()]
-    if step != 1:
-        values = values[::step]
-    return XComSequenceSliceResponse(values)
+    # Stream the rows so a stepped slice over a long sequence only keeps the values it returns.
+    rows = session.scalars(
+        query.with_only_columns(XComModel.value).execution_options(yield_per=_SLICE_YIELD_PER)
+    )
+    if step < 0:
+        return XComSequenceSliceResponse(list(rows)[::step])
+    return XComSequenceSliceResponse(list(itertools.islice(rows, 0, None, step)))
 
 
 @router.head(
@@ -350,6 +360,31 @@ def set_xcom(
     ] = None,
 ):
     """Set an Airflow XCom."""
+    store_xcom(
+        dag_id=dag_id,
+        run_id=run_id,
+        task_id=task_id,
+        key=key,
+        value=value,
+        map_index=map_index,
+        mapped_length=mapped_length,
+        session=session,
+    )
+    return {"message": "XCom successfully set"}
+
+
+def store_xcom(
+    *,
+    dag_id: str,
+    run_id: str,
+    task_id: str,
+    key: str,
+    value: JsonValue,
+    map_index: int,
+    mapped_length: int | None,
+    session: Session,
+) -> None:
+    """Store an XCom value already serialized by the worker, raising HTTP errors for invalid ones."""
     from airflow.configuration import conf
 
     # Validate that the provided key is not empty
@@ -410,8 +445,6 @@ def set_xcom(
             },
         )
 
-    return {"message": "XCom successfully set"}
-
 
 @router.delete(
     "/{dag_id}/{run_id}/{task_id}/{key:path}",
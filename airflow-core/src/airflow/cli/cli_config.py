@@ -541,6 +541,24 @@ ARG_DB_BATCH_SIZE = Arg(
         "Lower values reduce long-running locks but increase the number of batches."
     ),
 )
+ARG_DB_WORKERS = Arg(
+    ("--workers",),
+    default=1,
+    type=positive_int(allow_zero=False),
+    help=(
+        "Number of tables to clean at the same time.\n"
+        "A table is only cleaned once the tables referencing it are done."
+    ),
+)
+ARG_DB_CHECKPOINT_FILE = Arg(
+    ("--checkpoint-file",),
+    default=None,
+    metavar="FILEPATH",
+    help=(
+        "File recording the progress of the cleanup after every batch.\n"
+        "If it exists, the cleanup resumes where the one that wrote it stopped."
+    ),
+)
 ARG_DAG_IDS = Arg(
     ("--dag-ids",),
     default=None,
@@ -1570,6 +1588,8 @@ DB_COMMANDS = (
             ARG_YES,
             ARG_DB_SKIP_ARCHIVE,
             ARG_DB_BATCH_SIZE,
+            ARG_DB_WORKERS,
+            ARG_DB_CHECKPOINT_FILE,
             ARG_DAG_IDS,
             ARG_EXCLUDE_DAG_IDS,
         ),
@@ -0,0 +1,161 @@
+#
+# Licensed to the Apache Software Foundation (ASF) under one
+# or more contributor license agreements.  See the NOTICE file
+# distributed with this work for additional information
+# regarding copyright ownership.  The ASF licenses this file
+# to you under the Apache License, Version 2.0 (the
+# "License"); you may not use this file except in compliance
+# with the License.  You may obtain a copy of the License at
+#
+#   http://www.apache.org/licenses/LICENSE-2.0
+#
+# Unless required by applicable law or agreed to in writing,
+# software distributed under the License is distributed on an
+# "AS IS" BASIS, WITHOUT WARRANTIES OR CONDITIONS OF ANY
+# KIND, either express or implied.  See the License for the
+# specific language governing permissions and limitations
+# under the License.
+"""Content fingerprints of DAG files, used to skip parsing files that have not changed."""
+
+from __future__ import annotations
+
+import ast
+import hashlib
+import zipfile
+from pathlib import Path
+from typing import TYPE_CHECKING, NamedTuple
+
+if TYPE_CHECKING:
+    from collections.abc import Iterator
+
+
+def _iter_imported_names(tree: ast.AST) -> Iterator[tuple[str, int]]:
+    """Yield ``(module, level)`` for every import in the tree, including the names of ``from`` imports."""
+    for node in ast.walk(tree):
+        if isinstance(node, ast.Import):
+            for alias in node.names:
+                yield alias.name, 0
+        elif isinstance(node, ast.ImportFrom):
+            base = node.module or ""
+            if base or node.level:
+                yield base, node.level
+            # ``from pkg import name`` may import the ``pkg.name`` submodule
+            for alias in node.names:
+                if alias.name != "*":
+                    yield f"{base}.{alias.name}" if base else alias.name, node.level
+
+
+def _resolve_local_module(module: str, level: int, importer: Path, root: Path) -> list[Path]:
+    """
+    Return the files of ``root`` that importing ``module`` would execute.
+
+    That is the module itself and the ``__init__.py`` of its parent packages. Modules that are not
+    found under ``root`` (the standard library, installed packages...) resolve to nothing.
+    """
+    if level:
+        base = importer.parent
+        for _ in range(level - 1):
+            base = base.parent
+    else:
+        base = root
+    parts = [part for part in module.split(".") if part]
+    found = []
+    current = base
+    for part in parts:
+        current = current / part
+        if (init := current / "__init__.py").is_file():
+            found.append(init)
+        elif (source := current.with_suffix(".py")).is_file():
+            found.append(source)
+            break
+        elif not current.is_dir():
+            # Not a namespace package either
+            break
+    return [path for path in found if path.is_relative_to(root)]
+
+
+class _FileState(NamedTuple):
+    """What fingerprinting a file needs from it, valid as long as its ``stat`` key does not change."""
+
+    key: tuple[int, int, int]
+    digest: bytes
+    is_zip: bool
+    imports: tuple[tuple[str, int], ...]
+
+
+class FileFingerprinter:
+    """
+    Compute fingerprints of DAG files, reading again only the files which changed since the last call.
+
+    The content digest and the imports of each file read are kept in memory along with its modification
+    time, size and inode, so that files for which those are unchanged are neither read, hashed nor parsed
+    again.
+    """
+
+    def __init__(self) -> None:
+        self._states: dict[Path, _FileState] = {}
+
+    def fingerprint(self, path: str | Path, bundle_path: str | Path, *, salt: str = "") -> str | None:
+        """
+        Compute a fingerprint of a DAG file and of the modules of its bundle that it imports.
+
+        The fingerprint changes whenever the DAG file or any local module it (transitively) imports changes.
+        Zip files are fingerprinted as a whole.
+
+        :param path: Absolute path of the DAG file.
+        :param bundle_path: Root of the bundle the file belongs to, which is where local modules are resolved.
+        :param salt: Extra input mixed into the fingerprint, e.g. the bundle version.
+        :return: A hex digest, or None if the file could not be read.
+        """
+        path = Path(path)
+        root = Path(bundle_path)
+        digest = hashlib.sha256(salt.encode())
+        seen: set[Path] = set()
+        pending = [path]
+        while pending:
+            current = pending.pop()
+            if current in seen:
+                continue
+            seen.add(current)
+            if (state := self._read(current)) is None:
+                if current == path:
+                    return None
+                continue
+            digest.update(str(current).encode())
+            digest.update(state.digest)
+            if current == path and state.is_zip:
+                break
+            for module, level in state.imports:
+                pending.extend(_resolve_local_module(module, level, current, root))
+        return digest.hexdigest()
+
+    def _read(self, path: Path) -> _FileState | None:
+        try:
+            stat = path.stat()
+        except OSError:
+            self._states.pop(path, None)
+            return None
+        key = (stat.st_mtime_ns, stat.st_size, stat.st_ino)
+        if (state := self._states.get(path)) is not None and state.key == key:
+            return state
+        try:
+            content = path.read_bytes()
+        except OSError:
+            self._states.pop(path, None)
+            return None
+        is_zip = zipfile.is_zipfile(path)
+        imports: tuple[tuple[str, int], ...] = ()
+        if not is_zip:
+            try:
+                imports = tuple(_iter_imported_names(ast.parse(content)))
+            except (SyntaxError, ValueError):
+                # Still fingerprinted by its content; importing it will report the error
+                pass
+        state = _FileState(key, hashlib.sha256(content).digest(), is_zip, imports)
+        self._states[path] = state
+        return state
+
+
+def compute_file_fingerprint(path: str | Path, bundle_path: str | Path, *, salt: str = "") -> str | None:
+    """Compute the fingerprint of a DAG file, see :meth:`FileFingerprinter.fingerprint`."""
+    return FileFingerprinter().fingerprint(path, bundle_path, salt=salt)
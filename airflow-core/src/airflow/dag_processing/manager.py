@@ -22,6 +22,7 @@ from __future__ import annotations
 import contextlib
 import functools
 import gc
+import importlib
 import inspect
 import logging
 import os
@@ -36,7 +37,7 @@ from dataclasses import dataclass, field
 from datetime import datetime, timedelta
 from operator import attrgetter, itemgetter
 from pathlib import Path
-from typing import TYPE_CHECKING, Any, Literal, NamedTuple, cast
+from typing import TYPE_CHECKING, Any, BinaryIO, Literal, NamedTuple, cast
 
 import attrs
 import structlog
@@ -52,7 +53,12 @@ from airflow.configuration import conf
 from airflow.dag_processing.bundles.base import BundleUsageTrackingManager
 from airflow.dag_processing.bundles.manager import DagBundlesManager
 from airflow.dag_processing.collection import update_dag_parsing_results_in_db
-from airflow.dag_processing.processor import DagFileParsingResult, DagFileProcessorProcess
+from airflow.dag_processing.fingerprint import FileFingerprinter
+from airflow.dag_processing.processor import (
+    DagFileParsingResult,
+    DagFileProcessorProcess,
+    SwitchableLogFile,
+)
 from airflow.exceptions import AirflowException
 from airflow.models.asset import remove_references_to_deleted_dags
 from airflow.models.dag import DagModel
@@ -81,6 +87,7 @@ if TYPE_CHECKING:
 
     from sqlalchemy.orm import Session
     from sqlalchemy.sql import Select
+    from structlog.typing import FilteringBoundLogger
 
     from airflow.callbacks.callback_requests import CallbackRequest
     from airflow.dag_processing.bundles.base import BaseDagBundle
@@ -104,6 +111,10 @@ class DagFileStat:
     last_duration: float | None = None
     run_count: int = 0
     last_num_of_db_queries: int = 0
+    fingerprint: str | None = None
+    """Fingerprint of the file as of its last parse, see ``compute_file_fingerprint``."""
+    last_skipped_time: datetime | None = None
+    """Last time parsing the file was skipped because its fingerprint had not changed."""
 
 
 @dataclass(frozen=True)
@@ -174,6 +185,12 @@ class DagFileProcessorManager(LoggingMixin):
     selector: selectors.BaseSelector = attrs.field(factory=selectors.DefaultSelector)
 
     _parallelism: int = attrs.field(factory=_config_int_factory("dag_processor", "parsing_processes"))
+    _parsing_process_max_files: int = attrs.field(
+        factory=_config_int_factory("dag_processor", "parsing_process_max_files")
+    )
+    _parsing_process_max_rss: int = attrs.field(
+        factory=lambda: conf.getint("dag_processor", "parsing_process_max_rss_mb") * 1024 * 1024
+    )
 
     parsing_cleanup_interval: float = attrs.field(
         factory=_config_int_factory("scheduler", "parsing_cleanup_interval")
@@ -184,6 +201,12 @@ class DagFileProcessorManager(LoggingMixin):
     _file_process_interval: float = attrs.field(
         factory=_config_int_factory("dag_processor", "min_file_process_interval")
     )
+    _unchanged_file_reparse_interval: float = attrs.field(
+        factory=_config_int_factory("dag_processor", "unchanged_file_reparse_interval")
+    )
+    _queued_fingerprints: dict[DagFileInfo, str | None] = attrs.field(factory=dict, init=False)
+    """Fingerprints of queued files, recorded in their stats once they are parsed."""
+    _fingerprinter: FileFingerprinter = attrs.field(factory=FileFingerprinter, init=False)
     stale_dag_threshold: float = attrs.field(
         factory=_config_int_factory("dag_processor", "stale_dag_threshold")
     )
@@ -207,6 +230,10 @@ class DagFileProcessorManager(LoggingMixin):
     _bundle_versions: dict[str, str | None] = attrs.field(factory=dict, init=False)
 
     _processors: dict[DagFileInfo, DagFileProcessorProcess] = attrs.field(factory=dict, init=False)
+    _idle_processors: list[DagFileProcessorProcess] = attrs.field(factory=list, init=False)
+    """Reusable processors that are done with their file and wait for another one."""
+    _retiring_processors: list[DagFileProcessorProcess] = attrs.field(factory=list, init=False)
+    """Reusable processors that were asked to exit and have not been reaped yet."""
 
     _parsing_start_time: float | None = attrs.field(default=None, init=False)
     _num_run: int = attrs.field(default=0, init=False)
@@ -301,11 +328,21 @@ class DagFileProcessorManager(LoggingMixin):
 
         self._symlink_latest_log_directory()
 
+        self._preload_modules()
+
         # To prevent COW in forked process parsing dag file
         gc.freeze()
 
         return self._run_parsing_loop()
 
+    def _preload_modules(self) -> None:
+        """Import the configured modules so that the parsing processes forked from us inherit them."""
+        for module in conf.getlist("dag_processor", "parsing_preload_modules", fallback=[]):
+            try:
+                importlib.import_module(module)
+            except Exception:
+                self.log.warning("Error when trying to preload module %s", module, exc_info=True)
+
     def _scan_stale_dags(self):
         """Scan and deactivate DAGs which are no longer present in files."""
         now = time.monotonic()
@@ -887,6 +924,7 @@ class DagFileProcessorManager(LoggingMixin):
         stats_to_remove = set(self._file_stats).difference(present)
         for file in stats_to_remove:
             del self._file_stats[file]
+            self._queued_fingerprints.pop(file, None)
 
     def terminate_orphan_processes(self, present: set[DagFileInfo]):
         """Stop processors that are working on deleted files."""
@@ -930,10 +968,44 @@ class DagFileProcessorManager(LoggingMixin):
                 is_callback_only=is_callback_only,
                 relative_fileloc=str(file.rel_path),
             )
+            fingerprint = self._queued_fingerprints.pop(file, None)
+            if not is_callback_only:
+                self._file_stats[file].fingerprint = fingerprint
 
         for file in finished:
             processor = self._processors.pop(file)
             processor.logger_filehandle.close()
+            if processor.is_idle:
+                self._release_processor(processor)
+
+        self._reap_retiring_processors()
+
+    def _release_processor(self, processor: DagFileProcessorProcess) -> None:
+        """Keep a reusable processor around for the next file, unless it has grown too large."""
+        if self._parsing_process_max_rss and processor.rss > self._parsing_process_max_rss:
+            self.log.info(
+                "Recycling parsing process %s as it uses more than %s bytes of memory",
+                processor.pid,
+                self._parsing_process_max_rss,
+            )
+            Stats.incr("dag_processing.processes_recycled", tags={"reason": "rss"})
+            self._retire_processor(processor)
+        else:
+            self._idle_processors.append(processor)
+
+    def _retire_processor(self, processor: DagFileProcessorProcess) -> None:
+        processor.retire()
+        self._retiring_processors.append(processor)
+
+    def _reap_retiring_processors(self) -> None:
+        """Forget about retired processors once they have exited and we have read all their output."""
+        still_running = []
+        for processor in self._retiring_processors:
+            if processor.is_ready:
+                processor.logger_filehandle.close()
+            else:
+                still_running.append(processor)
+        self._retiring_processors = still_running
 
     def _get_log_dir(self) -> str:
         return os.path.join(self.base_log_dir, timezone.utcnow().strftime("%Y-%m-%d"))
@@ -973,15 +1045,20 @@ class DagFileProcessorManager(LoggingMixin):
         relative_path = Path(dag_file.rel_path)
         return os.path.join(self._get_log_dir(), bundle.name, f"{relative_path}.log")
 
-    def _get_logger_for_dag_file(self, dag_file: DagFileInfo):
+    def _open_log_file_for_dag_file(self, dag_file: DagFileInfo) -> BinaryIO:
         log_filename = self._render_log_filename(dag_file)
         log_file = init_log_file(log_filename)
-        logger_filehandle = log_file.open("ab")
+        return log_file.open("ab")
+
+    @staticmethod
+    def _wrap_log_file(logger_filehandle: BinaryIO | SwitchableLogFile) -> FilteringBoundLogger:
         underlying_logger = structlog.BytesLogger(logger_filehandle)
         processors = logging_processors(json_output=True)
-        return structlog.wrap_logger(
-            underlying_logger, processors=processors, logger_name="processor"
-        ).bind(), logger_filehandle
+        return structlog.wrap_logger(underlying_logger, processors=processors, logger_name="processor").bind()
+
+    def _get_logger_for_dag_file(self, dag_file: DagFileInfo):
+        logger_filehandle = self._open_log_file_for_dag_file(dag_file)
+        return self._wrap_log_file(logger_filehandle), logger_filehandle
 
     @functools.cached_property
     def client(self) -> Client:
@@ -996,6 +1073,10 @@ class DagFileProcessorManager(LoggingMixin):
         id = uuid7()
 
         callback_to_execute_for_file = self._callback_to_execute.pop(dag_file, [])
+
+        if self._parsing_process_max_files > 1:
+            return self._start_reusable_process(dag_file, callback_to_execute_for_file)
+
         logger, logger_filehandle = self._get_logger_for_dag_file(dag_file)
 
         return DagFileProcessorProcess.start(
@@ -1010,6 +1091,48 @@ class DagFileProcessorManager(LoggingMixin):
             client=self.client,
         )
 
+    def _start_reusable_process(
+        self, dag_file: DagFileInfo, callbacks: list[CallbackRequest]
+    ) -> DagFileProcessorProcess:
+        """Hand the file to an idle processor, or start a new processor that will be kept for more files."""
+        logger_filehandle = self._open_log_file_for_dag_file(dag_file)
+
+        while self._idle_processors:
+            processor = self._idle_processors.pop()
+            if not processor.is_idle:
+                # Died while waiting for work
+                self._retiring_processors.append(processor)
+                continue
+            # The last file of a processor is sent without keep_alive, the processor exits once done with it
+            keep_alive = processor.files_processed + 1 < self._parsing_process_max_files
+            if not keep_alive:
+                Stats.incr("dag_processing.processes_recycled", tags={"reason": "max_files"})
+            processor.parse_next_file(
+                path=dag_file.absolute_path,
+                bundle_path=cast("Path", dag_file.bundle_path),
+                bundle_name=dag_file.bundle_name,
+                callbacks=callbacks,
+                logger_filehandle=logger_filehandle,
+                keep_alive=keep_alive,
+            )
+            return processor
+
+        log_file = SwitchableLogFile(logger_filehandle)
+        processor = DagFileProcessorProcess.start(
+            id=uuid7(),
+            path=dag_file.absolute_path,
+            bundle_path=cast("Path", dag_file.bundle_path),
+            bundle_name=dag_file.bundle_name,
+            callbacks=callbacks,
+            selector=self.selector,
+            logger=self._wrap_log_file(log_file),
+            logger_filehandle=logger_filehandle,
+            log_file=log_file,
+            client=self.client,
+            keep_alive=True,
+        )
+        return processor
+
     def _start_new_processes(self):
         """Start more processors if we have enough slots and files to process."""
         while self._parallelism > len(self._processors) and self._file_queue:
@@ -1067,7 +1190,9 @@ class DagFileProcessorManager(LoggingMixin):
                 modified_timestamp = os.path.getmtime(file.absolute_path)
                 modified_datetime = datetime.fromtimestamp(modified_timestamp, tz=timezone.utc)
                 files_with_mtime[file] = modified_timestamp
-                last_time = self._file_stats[file].last_finish_time
+                stat = self._file_stats[file]
+                # A file found unchanged after its modification does not need to be looked at again
+                last_time = max(filter(None, (stat.last_finish_time, stat.last_skipped_time)), default=None)
                 if not last_time:
                     continue
                 if modified_datetime > last_time:
@@ -1080,7 +1205,8 @@ class DagFileProcessorManager(LoggingMixin):
         return file_infos, changed_recently
 
     def processed_recently(self, now, file):
-        last_time = self._file_stats[file].last_finish_time
+        stat = self._file_stats[file]
+        last_time = max(filter(None, (stat.last_finish_time, stat.last_skipped_time)), default=None)
         if not last_time:
             return False
         elapsed_ss = (now - last_time).total_seconds()
@@ -1138,6 +1264,9 @@ class DagFileProcessorManager(LoggingMixin):
         # and we need to maintain the order of files for `[dag_processor] file_parsing_sort_mode`
         to_queue = [x for x in files if x not in to_exclude]
 
+        if self._unchanged_file_reparse_interval > 0:
+            to_queue = self._skip_unchanged_files(to_queue, now=now)
+
         if self.log.isEnabledFor(logging.DEBUG):
             for path, processor in self._processors.items():
                 self.log.debug(
@@ -1151,6 +1280,45 @@ class DagFileProcessorManager(LoggingMixin):
         self._add_files_to_queue(to_queue, mode="back")
         Stats.incr("dag_processing.file_path_queue_update_count")
 
+    def _skip_unchanged_files(self, files: list[DagFileInfo], *, now: datetime) -> list[DagFileInfo]:
+        """
+        Drop the files whose fingerprint has not changed since they were last parsed.
+
+        Only files that parsed without import errors less than ``[dag_processor]
+        unchanged_file_reparse_interval`` seconds ago are skipped. Fingerprints are kept in memory, so
+        every file is parsed once after the DAG processor starts; only files whose modification time or
+        size changed since are read again to compute them.
+        """
+        to_queue = []
+        skipped = 0
+        for file in files:
+            fingerprint = self._fingerprinter.fingerprint(
+                file.absolute_path,
+                cast("Path", file.bundle_path),
+                salt=self._bundle_versions.get(file.bundle_name) or "",
+            )
+            stat = self._file_stats.get(file)
+            if (
+                fingerprint is not None
+                and stat is not None
+                and stat.fingerprint == fingerprint
+                and not stat.import_errors
+                and stat.last_finish_time
+                and (now - stat.last_finish_time).total_seconds() < self._unchanged_file_reparse_interval
+            ):
+                stat.last_skipped_time = now
+                # Counts as a run of the file as far as ``max_runs`` is concerned
+                stat.run_count += 1
+                skipped += 1
+                continue
+            self._queued_fingerprints[file] = fingerprint
+            to_queue.append(file)
+
+        if skipped:
+            self.log.debug("Skipping %d files that have not changed since they were last parsed", skipped)
+            Stats.incr("dag_processing.unchanged_files_skipped", skipped)
+        return to_queue
+
     def _kill_timed_out_processors(self):
         """Kill any file processors that timeout to defend against process hangs."""
         now = time.monotonic()
@@ -1233,10 +1401,14 @@ class DagFileProcessorManager(LoggingMixin):
             )
             # SIGTERM, wait 5s, SIGKILL if still alive
             processor.kill(signal.SIGTERM, escalation_delay=5.0)
+        for processor in (*self._idle_processors, *self._retiring_processors):
+            processor.kill(signal.SIGTERM, escalation_delay=5.0)
 
     def end(self):
         """Kill all child processes on exit since we don't want to leave them as orphaned."""
-        pids_to_kill = [p.pid for p in self._processors.values()]
+        pids_to_kill = [
+            p.pid for p in (*self._processors.values(), *self._idle_processors, *self._retiring_processors)
+        ]
         if pids_to_kill:
             kill_child_processes_by_pids(pids_to_kill)
 
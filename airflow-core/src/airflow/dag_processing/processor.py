@@ -19,12 +19,16 @@ from __future__ import annotations
 import contextlib
 import importlib
 import os
+import socket
+import sys
+import time
 import traceback
 from collections.abc import Callable, Sequence
 from pathlib import Path
 from typing import TYPE_CHECKING, Annotated, BinaryIO, ClassVar, Literal
 
 import attrs
+import psutil
 from pydantic import BaseModel, Field, TypeAdapter
 
 from airflow._shared.observability.metrics.stats import Stats
@@ -68,6 +72,7 @@ from airflow.sdk.execution_time.comms import (
 )
 from airflow.sdk.execution_time.supervisor import WatchedSubprocess
 from airflow.sdk.execution_time.task_runner import RuntimeTaskInstance, _send_error_email_notification
+from airflow.serialization.json_schema import load_dag_schema
 from airflow.serialization.serialized_objects import DagSerialization, LazyDeserializedDAG
 from airflow.utils.dag_version_inflation_checker import check_dag_file_stability
 from airflow.utils.file import iter_airflow_imports
@@ -102,6 +107,10 @@ class DagFileParseRequest(BaseModel):
     """Bundle name for team-specific executor validation."""
 
     callback_requests: list[CallbackRequest] = Field(default_factory=list)
+
+    keep_alive: bool = False
+    """Whether the parsing process should wait for another file once this one is done, instead of exiting."""
+
     type: Literal["DagFileParseRequest"] = "DagFileParseRequest"
 
 
@@ -120,8 +129,21 @@ class DagFileParsingResult(BaseModel):
     type: Literal["DagFileParsingResult"] = "DagFileParsingResult"
 
 
+class DagFileProcessingComplete(BaseModel):
+    """
+    Sent by a reusable parsing process once it is done with a file.
+
+    A parsing process started for a single file signals completion by exiting; one that is kept alive to
+    parse further files sends this message instead, after the parsing result (if any).
+    """
+
+    fileloc: str
+    type: Literal["DagFileProcessingComplete"] = "DagFileProcessingComplete"
+
+
 ToManager = Annotated[
     DagFileParsingResult
+    | DagFileProcessingComplete
     | GetConnection
     | GetVariable
     | PutVariable
@@ -199,10 +221,26 @@ def _parse_file_entrypoint():
     task_runner.SUPERVISOR_COMMS = comms_decoder
     log = structlog.get_logger(logger_name="task")
 
-    result = _parse_file(msg, log)
+    while True:
+        result = _parse_file(msg, log)
 
-    if result is not None:
-        comms_decoder.send(result)
+        if result is not None:
+            comms_decoder.send(result)
+
+        if not msg.keep_alive:
+            return
+
+        # Make sure whatever the file printed is logged against it rather than against the next one.
+        sys.stdout.flush()
+        sys.stderr.flush()
+        comms_decoder.send(DagFileProcessingComplete(fileloc=msg.file))
+        try:
+            # Block until the manager hands us the next file, or closes the channel to retire us.
+            msg = comms_decoder._get_response()
+        except EOFError:
+            return
+        if not isinstance(msg, DagFileParseRequest):
+            raise RuntimeError(f"Expected a DagFileParseRequest, it was {msg}")
 
 
 def _parse_file(msg: DagFileParseRequest, log: FilteringBoundLogger) -> DagFileParsingResult | None:
@@ -493,6 +531,31 @@ def in_process_api_server() -> InProcessExecutionAPI:
     return api
 
 
+class SwitchableLogFile:
+    """
+    Binary file-like log target that can be re-pointed at another file.
+
+    The log forwarders of a parsing process are set up once, when it is started. A process that parses
+    several files writes to one of these, which the manager points at the log file of the DAG file
+    currently being parsed.
+    """
+
+    def __init__(self, target: BinaryIO):
+        self.target = target
+
+    def switch(self, target: BinaryIO) -> None:
+        self.target = target
+
+    def write(self, data: bytes) -> None:
+        # Late output of a previous file may arrive once its log file has already been closed
+        if not self.target.closed:
+            self.target.write(data)
+
+    def flush(self) -> None:
+        if not self.target.closed:
+            self.target.flush()
+
+
 @attrs.define(kw_only=True)
 class DagFileProcessorProcess(WatchedSubprocess):
     """
@@ -513,6 +576,15 @@ class DagFileProcessorProcess(WatchedSubprocess):
     client: Client
     """The HTTP client to use for communication with the API server."""
 
+    log_file: SwitchableLogFile | None = None
+    """Log target of a reusable process, pointed at the log file of the DAG file it is currently parsing."""
+
+    files_processed: int = 0
+    """Number of files this process has finished parsing (only counted for reusable processes)."""
+
+    _keep_alive: bool = attrs.field(default=False, init=False)
+    _file_complete: bool = attrs.field(default=False, init=False)
+
     @classmethod
     def start(  # type: ignore[override]
         cls,
@@ -523,15 +595,18 @@ class DagFileProcessorProcess(WatchedSubprocess):
         callbacks: list[CallbackRequest],
         target: Callable[[], None] = _parse_file_entrypoint,
         client: Client,
+        keep_alive: bool = False,
         **kwargs,
     ) -> Self:
         logger = kwargs["logger"]
 
         _pre_import_airflow_modules(os.fspath(path), logger)
+        # Compiled once, then inherited by every parsing process
+        load_dag_schema()
 
         proc: Self = super().start(target=target, client=client, **kwargs)
         proc.had_callbacks = bool(callbacks)  # Track if this process had callbacks
-        proc._on_child_started(callbacks, path, bundle_path, bundle_name)
+        proc._on_child_started(callbacks, path, bundle_path, bundle_name, keep_alive=keep_alive)
         return proc
 
     def _on_child_started(
@@ -540,15 +615,65 @@ class DagFileProcessorProcess(WatchedSubprocess):
         path: str | os.PathLike[str],
         bundle_path: Path,
         bundle_name: str,
+        keep_alive: bool = False,
     ) -> None:
+        self._keep_alive = keep_alive
         msg = DagFileParseRequest(
             file=os.fspath(path),
             bundle_path=bundle_path,
             bundle_name=bundle_name,
             callback_requests=callbacks,
+            keep_alive=keep_alive,
         )
         self.send_msg(msg, request_id=0)
 
+    def parse_next_file(
+        self,
+        *,
+        path: str | os.PathLike[str],
+        bundle_path: Path,
+        bundle_name: str,
+        callbacks: list[CallbackRequest],
+        logger_filehandle: BinaryIO,
+        keep_alive: bool,
+    ) -> None:
+        """
+        Hand another file to a process that has finished its previous one and is waiting for more.
+
+        :param keep_alive: Whether the process should wait for yet another file afterwards. The last file
+            of a process is sent with ``keep_alive=False`` and the process exits once done with it.
+        """
+        if not self.is_idle:
+            raise RuntimeError(f"{self} is not waiting for a file")
+        self.logger_filehandle = logger_filehandle
+        if self.log_file:
+            self.log_file.switch(logger_filehandle)
+        self.parsing_result = None
+        self.had_callbacks = bool(callbacks)
+        self._file_complete = False
+        self.start_time = time.monotonic()
+        self._on_child_started(callbacks, path, bundle_path, bundle_name, keep_alive=keep_alive)
+
+    @property
+    def is_idle(self) -> bool:
+        """Whether the process has finished its current file and is alive, waiting for another one."""
+        return self._keep_alive and self._file_complete and self._check_subprocess_exit() is None
+
+    def retire(self) -> None:
+        """Ask an idle process to exit by closing our side of its request channel."""
+        with contextlib.suppress(OSError):
+            self.stdin.shutdown(socket.SHUT_WR)
+        self._keep_alive = False
+        self._file_complete = False
+
+    @property
+    def rss(self) -> int:
+        """Resident set size of the parsing process, in bytes (0 if it is gone)."""
+        try:
+            return self._process.memory_info().rss
+        except psutil.Error:
+            return 0
+
     def _handle_request(self, msg: ToManager, log: FilteringBoundLogger, req_id: int) -> None:
         from airflow.sdk.api.datamodels._generated import (
             ConnectionResponse,
@@ -561,6 +686,9 @@ class DagFileProcessorProcess(WatchedSubprocess):
         dump_opts = {}
         if isinstance(msg, DagFileParsingResult):
             self.parsing_result = msg
+        elif isinstance(msg, DagFileProcessingComplete):
+            self.files_processed += 1
+            self._file_complete = True
         elif isinstance(msg, GetConnection):
             conn = self.client.connections.get(msg.conn_id)
             if isinstance(conn, ConnectionResponse):
@@ -671,6 +799,10 @@ class DagFileProcessorProcess(WatchedSubprocess):
 
     @property
     def is_ready(self) -> bool:
+        if self._keep_alive and self._file_complete:
+            # Reusable process that is done with its current file, it stays around for the next one
+            return True
+
         if self._check_subprocess_exit() is None:
             # Process still alive, def can't be finished yet
             return False
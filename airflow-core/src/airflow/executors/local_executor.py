@@ -26,15 +26,19 @@ LocalExecutor.
 from __future__ import annotations
 
 import ctypes
+import importlib
 import multiprocessing
 import multiprocessing.sharedctypes
 import os
 import sys
+import time
 from multiprocessing import Queue, SimpleQueue
+from pathlib import Path
 from typing import TYPE_CHECKING
 
 import structlog
 
+from airflow._shared.observability.metrics.stats import Stats
 from airflow.executors import workloads
 from airflow.executors.base_executor import BaseExecutor
 from airflow.executors.workloads.callback import execute_callback_workload
@@ -52,6 +56,7 @@ if TYPE_CHECKING:
     from structlog.typing import FilteringBoundLogger as Logger
 
     from airflow.executors.workloads.types import WorkloadResultType
+    from airflow.sdk.api.client import Client
 
 
 def _get_executor_process_title_prefix(team_name: str | None) -> str:
@@ -64,6 +69,59 @@ def _get_executor_process_title_prefix(team_name: str | None) -> str:
     return f"airflow worker -- LocalExecutor{team_suffix}:"
 
 
+class _WarmWorkerState:
+    """
+    State a LocalExecutor worker keeps between tasks, so each task process is forked from it warm.
+
+    The execution API client is shared by the tasks run by the worker (only the token is swapped per task),
+    on the transport shared by the supervisors of the process, and the Airflow modules imported by each Dag
+    file are imported once per bundle version in the worker, so the forked task processes inherit them.
+    """
+
+    def __init__(self) -> None:
+        self.client: Client | None = None
+        self.pre_imported: set[tuple[str, str | None, str]] = set()
+
+    def get_client(self, server: str, token: str) -> Client:
+        from airflow.sdk.api.client import BearerAuth, Client, get_shared_transport
+
+        if self.client is None:
+            self.client = Client(base_url=server, token=token, transport=get_shared_transport())
+        else:
+            self.client.auth = BearerAuth(token)
+        return self.client
+
+    def pre_import(self, log: Logger, workload: workloads.ExecuteTask) -> None:
+        from airflow.dag_processing.bundles.manager import DagBundlesManager
+        from airflow.utils.file import iter_airflow_imports
+
+        key = (workload.bundle_info.name, workload.bundle_info.version, os.fspath(workload.dag_rel_path))
+        if key in self.pre_imported:
+            return
+        self.pre_imported.add(key)
+        try:
+            bundle = DagBundlesManager().get_bundle(name=key[0], version=key[1])
+            dag_path = Path(bundle.path, key[2])
+        except Exception:
+            log.debug("Could not resolve the Dag file to pre-import", bundle=key[0], exc_info=True)
+            return
+        # The bundle is only initialized by the task process; skip files that are not checked out yet
+        if not dag_path.is_file():
+            return
+        for module in iter_airflow_imports(os.fspath(dag_path)):
+            try:
+                importlib.import_module(module)
+            except Exception as e:
+                log.warning(
+                    "Error when trying to pre-import module '%s' found in %s: %s", module, dag_path, e
+                )
+
+    def close(self) -> None:
+        if self.client is not None:
+            self.client.close()
+            self.client = None
+
+
 def _run_worker(
     logger_name: str,
     input: SimpleQueue[workloads.All | None],
@@ -79,6 +137,10 @@ def _run_worker(
     log = structlog.get_logger(logger_name)
     log.info("Worker starting up pid=%d", os.getpid())
 
+    warm_state = None
+    if team_conf.getboolean("core", "local_executor_reuse_worker_state", fallback=False):
+        warm_state = _WarmWorkerState()
+
     while True:
         setproctitle(f"{_get_executor_process_title_prefix(team_conf.team_name)} <idle>", log)
         try:
@@ -93,6 +155,8 @@ def _run_worker(
 
         if workload is None:
             # Received poison pill, no more tasks to run
+            if warm_state:
+                warm_state.close()
             return
 
         # Decrement this as soon as we pick up a message off the queue
@@ -102,7 +166,7 @@ def _run_worker(
         # Handle different workload types
         if isinstance(workload, workloads.ExecuteTask):
             try:
-                _execute_work(log, workload, team_conf)
+                _execute_work(log, workload, team_conf, warm_state=warm_state)
                 output.put((workload.ti.key, TaskInstanceState.SUCCESS, None))
             except Exception as e:
                 log.exception("Task execution failed.")
@@ -121,16 +185,20 @@ def _run_worker(
             raise ValueError(f"LocalExecutor does not know how to handle {type(workload)}")
 
 
-def _execute_work(log: Logger, workload: workloads.ExecuteTask, team_conf) -> None:
+def _execute_work(
+    log: Logger, workload: workloads.ExecuteTask, team_conf, warm_state: _WarmWorkerState | None = None
+) -> None:
     """
     Execute command received and stores result state in queue.
 
     :param log: Logger instance
     :param workload: The workload to execute
     :param team_conf: Team-specific executor configuration
+    :param warm_state: State kept by the worker between tasks, if it reuses it
     """
     from airflow.sdk.execution_time.supervisor import supervise
 
+    start = time.monotonic()
     setproctitle(f"{_get_executor_process_title_prefix(team_conf.team_name)} {workload.ti.id}", log)
 
     base_url = team_conf.get("api", "base_url", fallback="/")
@@ -138,6 +206,21 @@ def _execute_work(log: Logger, workload: workloads.ExecuteTask, team_conf) -> No
     if base_url.startswith("/"):
         base_url = f"http://localhost:8080{base_url}"
     default_execution_api_server = f"{base_url.rstrip('/')}/execution/"
+    server = team_conf.get("core", "execution_api_server_url", fallback=default_execution_api_server)
+
+    if warm_state:
+        warm_state.pre_import(log, workload)
+        client = warm_state.get_client(server, workload.token)
+        Stats.timing("local_executor.task_preparation_duration", (time.monotonic() - start) * 1000)
+        supervise(
+            ti=workload.ti,  # type: ignore[arg-type]
+            dag_rel_path=workload.dag_rel_path,
+            bundle_info=workload.bundle_info,
+            token=workload.token,
+            log_path=workload.log_path,
+            client=client,
+        )
+        return
 
     # This will return the exit code of the task process, but we don't care about that, just if the
     # _supervisor_ had an error reporting the state back (which will result in an exception.)
@@ -147,7 +230,7 @@ def _execute_work(log: Logger, workload: workloads.ExecuteTask, team_conf) -> No
         dag_rel_path=workload.dag_rel_path,
         bundle_info=workload.bundle_info,
         token=workload.token,
-        server=team_conf.get("core", "execution_api_server_url", fallback=default_execution_api_server),
+        server=server,
         log_path=workload.log_path,
     )
 
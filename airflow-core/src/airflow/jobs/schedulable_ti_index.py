@@ -0,0 +1,268 @@
+#
+# Licensed to the Apache Software Foundation (ASF) under one
+# or more contributor license agreements.  See the NOTICE file
+# distributed with this work for additional information
+# regarding copyright ownership.  The ASF licenses this file
+# to you under the Apache License, Version 2.0 (the
+# "License"); you may not use this file except in compliance
+# with the License.  You may obtain a copy of the License at
+#
+#   http://www.apache.org/licenses/LICENSE-2.0
+#
+# Unless required by applicable law or agreed to in writing,
+# software distributed under the License is distributed on an
+# "AS IS" BASIS, WITHOUT WARRANTIES OR CONDITIONS OF ANY
+# KIND, either express or implied.  See the License for the
+# specific language governing permissions and limitations
+# under the License.
+"""In-memory index of SCHEDULED task instances used by the scheduler critical section."""
+
+from __future__ import annotations
+
+import bisect
+import heapq
+from collections import defaultdict
+from collections.abc import Collection, Iterable, Iterator
+from datetime import datetime, timedelta
+from typing import TYPE_CHECKING, NamedTuple
+
+from sqlalchemy import select
+
+from airflow._shared.timezones import timezone
+from airflow.models.dag import DagModel
+from airflow.models.dagrun import DagRun
+from airflow.models.taskinstance import TaskInstance
+from airflow.utils.state import DagRunState, TaskInstanceState
+
+if TYPE_CHECKING:
+    from uuid import UUID
+
+    from sqlalchemy.orm import Session
+    from sqlalchemy.sql import Select
+
+TI = TaskInstance
+DR = DagRun
+DM = DagModel
+
+# Task instances are stamped with ``updated_at`` by whichever process moved them to SCHEDULED (the
+# triggerer, the API server, another scheduler...). Re-read a small window before the last watermark
+# so that clock skew between those hosts does not make us miss rows; adding an indexed TI is idempotent.
+WATERMARK_OVERLAP = timedelta(seconds=5)
+
+
+class IndexedTaskInstance(NamedTuple):
+    """
+    A schedulable task instance as tracked by :class:`SchedulableTaskInstanceIndex`.
+
+    Tuples compare by ``sort_key`` first, which mirrors the ordering of the critical section
+    query (``-priority_weight, logical_date, map_index``); ``id`` breaks ties.
+    """
+
+    sort_key: tuple[int, bool, float, int]
+    id: UUID
+    dag_id: str
+    task_id: str
+    run_id: str
+    map_index: int
+    pool: str
+
+
+def _sort_key(
+    priority_weight: int, logical_date: datetime | None, map_index: int
+) -> tuple[int, bool, float, int]:
+    # Runs without a logical date sort after the ones with one, as NULLs do with an ascending ORDER BY.
+    return (
+        -priority_weight,
+        logical_date is None,
+        logical_date.timestamp() if logical_date else 0.0,
+        map_index,
+    )
+
+
+class SchedulableTaskInstanceIndex:
+    """
+    Priority index of the task instances the critical section may queue.
+
+    The index holds, per pool, the SCHEDULED task instances of running dag runs of unpaused DAGs in
+    the same order as the critical section query would rank them. It is fed by the state transitions
+    the scheduler performs itself (scheduling TIs, queueing them, finishing dag runs), refreshed from
+    ``task_instance.updated_at`` for transitions made by other processes, and periodically rebuilt
+    from the database so that any drift is bounded by the reconcile interval.
+
+    The index is only a candidate source: the critical section still re-selects the candidates by
+    primary key, with row locks and the state filters applied, before queueing anything.
+    """
+
+    def __init__(self) -> None:
+        self._entries: dict[UUID, IndexedTaskInstance] = {}
+        self._by_pool: dict[str, list[IndexedTaskInstance]] = defaultdict(list)
+        self._by_dag_run: dict[tuple[str, str], set[UUID]] = defaultdict(set)
+        self.dag_max_active_tasks: dict[str, int] = {}
+        self.last_reconciled_at: datetime | None = None
+        self._watermark: datetime | None = None
+
+    def __len__(self) -> int:
+        return len(self._entries)
+
+    def __contains__(self, ti_id: object) -> bool:
+        return ti_id in self._entries
+
+    @property
+    def is_loaded(self) -> bool:
+        return self.last_reconciled_at is not None
+
+    def add(
+        self,
+        *,
+        ti_id: UUID,
+        dag_id: str,
+        task_id: str,
+        run_id: str,
+        map_index: int,
+        pool: str,
+        priority_weight: int,
+        logical_date: datetime | None,
+    ) -> None:
+        """Add a task instance to the index, replacing any existing entry with the same id."""
+        self.discard(ti_id)
+        entry = IndexedTaskInstance(
+            sort_key=_sort_key(priority_weight, logical_date, map_index),
+            id=ti_id,
+            dag_id=dag_id,
+            task_id=task_id,
+            run_id=run_id,
+            map_index=map_index,
+            pool=pool,
+        )
+        self._entries[ti_id] = entry
+        bisect.insort(self._by_pool[pool], entry)
+        self._by_dag_run[(dag_id, run_id)].add(ti_id)
+
+    def add_task_instances(self, dag_run: DagRun, tis: Iterable[TaskInstance]) -> None:
+        """Add task instances of ``dag_run`` that have just been moved to SCHEDULED."""
+        for ti in tis:
+            self.add(
+                ti_id=ti.id,
+                dag_id=ti.dag_id,
+                task_id=ti.task_id,
+                run_id=ti.run_id,
+                map_index=ti.map_index,
+                pool=ti.pool,
+                priority_weight=ti.priority_weight,
+                logical_date=dag_run.logical_date,
+            )
+
+    def discard(self, ti_id: UUID) -> None:
+        """Remove a task instance from the index if present."""
+        entry = self._entries.pop(ti_id, None)
+        if entry is None:
+            return
+        pool_entries = self._by_pool[entry.pool]
+        pos = bisect.bisect_left(pool_entries, entry)
+        if pos < len(pool_entries) and pool_entries[pos].id == ti_id:
+            del pool_entries[pos]
+        if not pool_entries:
+            del self._by_pool[entry.pool]
+        dag_run_key = (entry.dag_id, entry.run_id)
+        dag_run_ids = self._by_dag_run[dag_run_key]
+        dag_run_ids.discard(ti_id)
+        if not dag_run_ids:
+            del self._by_dag_run[dag_run_key]
+
+    def discard_many(self, ti_ids: Iterable[UUID]) -> None:
+        for ti_id in ti_ids:
+            self.discard(ti_id)
+
+    def discard_dag_run(self, dag_id: str, run_id: str) -> None:
+        """Remove all the task instances of a dag run, e.g. when it has finished."""
+        self.discard_many(list(self._by_dag_run.get((dag_id, run_id), ())))
+
+    def iter_candidates(self, exclude_pools: Collection[str] = ()) -> Iterator[IndexedTaskInstance]:
+        """Yield indexed task instances in scheduling order, skipping the given pools."""
+        return heapq.merge(*(entries for pool, entries in self._by_pool.items() if pool not in exclude_pools))
+
+    def clear(self) -> None:
+        self._entries.clear()
+        self._by_pool.clear()
+        self._by_dag_run.clear()
+        self.dag_max_active_tasks.clear()
+
+    @staticmethod
+    def _schedulable_query() -> Select:
+        return (
+            select(
+                TI.id,
+                TI.dag_id,
+                TI.task_id,
+                TI.run_id,
+                TI.map_index,
+                TI.pool,
+                TI.priority_weight,
+                DR.logical_date,
+                DM.max_active_tasks,
+            )
+            .join(TI.dag_run)
+            .where(DR.state == DagRunState.RUNNING)
+            .join(TI.dag_model)
+            .where(~DM.is_paused)
+            .where(DM.bundle_name.is_not(None))
+            .where(TI.state == TaskInstanceState.SCHEDULED)
+        )
+
+    def _load_rows(self, rows: Iterable) -> set[UUID]:
+        seen: set[UUID] = set()
+        for (
+            ti_id,
+            dag_id,
+            task_id,
+            run_id,
+            map_index,
+            pool,
+            priority_weight,
+            logical_date,
+            max_active,
+        ) in rows:
+            seen.add(ti_id)
+            self.dag_max_active_tasks[dag_id] = max_active
+            self.add(
+                ti_id=ti_id,
+                dag_id=dag_id,
+                task_id=task_id,
+                run_id=run_id,
+                map_index=map_index,
+                pool=pool,
+                priority_weight=priority_weight,
+                logical_date=logical_date,
+            )
+        return seen
+
+    def refresh(self, session: Session) -> int:
+        """
+        Pick up task instances moved to SCHEDULED by other processes since the last refresh.
+
+        :return: Number of task instances read from the database.
+        """
+        if self._watermark is None:
+            return self.reconcile(session)
+        started_at = timezone.utcnow()
+        # Read through the ti_state_updated_at index, so only the recently updated task instances are read
+        rows = session.execute(
+            self._schedulable_query().where(TI.updated_at >= self._watermark - WATERMARK_OVERLAP)
+        )
+        seen = self._load_rows(rows)
+        self._watermark = started_at
+        return len(seen)
+
+    def reconcile(self, session: Session) -> int:
+        """
+        Rebuild the index from the database.
+
+        :return: The drift, i.e. the number of task instances that were added or removed.
+        """
+        started_at = timezone.utcnow()
+        before = set(self._entries)
+        self.clear()
+        after = self._load_rows(session.execute(self._schedulable_query()))
+        self._watermark = started_at
+        self.last_reconciled_at = started_at
+        return len(before ^ after)
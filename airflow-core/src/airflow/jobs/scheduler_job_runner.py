@@ -69,6 +69,7 @@ from airflow.executors import workloads
 from airflow.executors.executor_loader import ExecutorLoader
 from airflow.jobs.base_job_runner import BaseJobRunner
 from airflow.jobs.job import Job, JobState, perform_heartbeat
+from airflow.jobs.schedulable_ti_index import SchedulableTaskInstanceIndex
 from airflow.models import Deadline, Log
 from airflow.models.asset import (
     AssetActive,
@@ -104,9 +105,11 @@ from airflow.serialization.definitions.assets import SerializedAssetUniqueKey
 from airflow.serialization.definitions.notset import NOTSET
 from airflow.ti_deps.dependencies_states import EXECUTION_STATES
 from airflow.timetables.simple import AssetTriggeredTimetable
+from airflow.utils import pool_slot_ledger
 from airflow.utils.dates import datetime_to_nano
 from airflow.utils.event_scheduler import EventScheduler
 from airflow.utils.log.logging_mixin import LoggingMixin
+from airflow.utils.loop_profiler import LoopProfiler, StackSampler
 from airflow.utils.retries import MAX_DB_RETRIES, retry_db_transaction, run_with_db_retries
 from airflow.utils.session import NEW_SESSION, create_session, provide_session
 from airflow.utils.span_status import SpanStatus
@@ -126,6 +129,7 @@ if TYPE_CHECKING:
     from pendulum.datetime import DateTime
     from sqlalchemy.orm import Session
     from sqlalchemy.orm.interfaces import LoaderOption
+    from sqlalchemy.sql import Select
     from sqlalchemy.sql.selectable import Subquery
 
     from airflow._shared.logging.types import Logger
@@ -287,6 +291,13 @@ class SchedulerJobRunner(BaseJobRunner, LoggingMixin):
 
         self.scheduler_dag_bag = DBDagBag(load_op_links=False)
 
+        self._loop_profiler = LoopProfiler.for_scheduler()
+        self._stack_sampler = StackSampler.for_component("scheduler")
+
+        self._schedulable_ti_index: SchedulableTaskInstanceIndex | None = None
+        if conf.getboolean("scheduler", "use_schedulable_ti_index", fallback=False):
+            self._schedulable_ti_index = SchedulableTaskInstanceIndex()
+
     @provide_session
     def heartbeat_callback(self, session: Session = NEW_SESSION) -> None:
         Stats.incr("scheduler_heartbeat", 1, 1)
@@ -308,10 +319,12 @@ class SchedulerJobRunner(BaseJobRunner, LoggingMixin):
         prev_int = signal.signal(signal.SIGINT, self._exit_gracefully)
         prev_term = signal.signal(signal.SIGTERM, self._exit_gracefully)
         prev_usr2 = signal.signal(signal.SIGUSR2, self._debug_dump)
+        prev_prof = signal.signal(signal.SIGPROF, self._toggle_stack_sampling)
 
         resetter.callback(signal.signal, signal.SIGINT, prev_int)
         resetter.callback(signal.signal, signal.SIGTERM, prev_term)
         resetter.callback(signal.signal, signal.SIGUSR2, prev_usr2)
+        resetter.callback(signal.signal, signal.SIGPROF, prev_prof)
 
         if self._enable_tracemalloc:
             prev = signal.signal(signal.SIGUSR1, self._log_memory_usage)
@@ -454,6 +467,175 @@ class SchedulerJobRunner(BaseJobRunner, LoggingMixin):
             self.log.info("\n\t".join(map(repr, callstack)))
             self.log.info("-" * 80)
 
+    def _toggle_stack_sampling(self, signum: int, frame: FrameType | None) -> None:
+        if not _is_parent_process():
+            return
+        self._stack_sampler.toggle()
+
+    @staticmethod
+    def _get_task_instances_to_examine_query(
+        *,
+        max_tis: int,
+        starved_pools: set[str],
+        starved_dags: set[str],
+        starved_tasks: set[tuple[str, str]],
+        starved_tasks_task_dagrun_concurrency: set[tuple[str, str, str]],
+    ) -> Select:
+        """Build the ranked query selecting the SCHEDULED TIs the critical section should examine."""
+        # This behaves the same as 'concurrency_map.load()' with the difference that
+        # 'load()' executes immediately while '_get_current_dr_task_concurrency' creates a
+        # subquery object that is then executed along with main query.
+        # The results of 'load()' aren't used again here because by the time the main query
+        # executes, there could be a change that will be ignored.
+        dr_task_concurrency_subquery = _get_current_dr_task_concurrency(states=EXECUTION_STATES)
+
+        query = (
+            select(TI)
+            .with_hint(TI, "USE INDEX (ti_state)", dialect_name="mysql")
+            .join(TI.dag_run)
+            .where(DR.state == DagRunState.RUNNING)
+            .join(TI.dag_model)
+            .where(~DM.is_paused)
+            .where(TI.state == TaskInstanceState.SCHEDULED)
+            .where(DM.bundle_name.is_not(None))
+            .join(
+                dr_task_concurrency_subquery,
+                and_(
+                    TI.dag_id == dr_task_concurrency_subquery.c.dag_id,
+                    TI.run_id == dr_task_concurrency_subquery.c.run_id,
+                ),
+                isouter=True,
+            )
+            .where(func.coalesce(dr_task_concurrency_subquery.c.task_per_dr_count, 0) < DM.max_active_tasks)
+            .order_by(-TI.priority_weight, DR.logical_date, TI.map_index)
+        )
+
+        # Starvation filters should be applied before computing the row_num based on the
+        # max_active_tasks limit. That way, starved dags and tasks that shouldn't run,
+        # won't occupy a slot.
+        if starved_pools:
+            query = query.where(TI.pool.not_in(starved_pools))
+
+        if starved_dags:
+            query = query.where(TI.dag_id.not_in(starved_dags))
+
+        if starved_tasks:
+            query = query.where(tuple_(TI.dag_id, TI.task_id).not_in(starved_tasks))
+
+        if starved_tasks_task_dagrun_concurrency:
+            query = query.where(
+                tuple_(TI.dag_id, TI.run_id, TI.task_id).not_in(starved_tasks_task_dagrun_concurrency)
+            )
+
+        # Create a subquery with row numbers partitioned by dag_id and run_id.
+        # Different dags can have the same run_id but
+        # the dag_id combined with the run_id uniquely identify a run.
+        ranked_query = (
+            query.add_columns(
+                func.row_number()
+                .over(
+                    partition_by=[TI.dag_id, TI.run_id],
+                    order_by=[-TI.priority_weight, DR.logical_date, TI.map_index],
+                )
+                .label("row_num"),
+                DM.max_active_tasks.label("dr_max_active_tasks"),
+                # Create columns for the order_by checks here for sqlite.
+                TI.priority_weight.label("priority_weight_for_ordering"),
+                DR.logical_date.label("logical_date_for_ordering"),
+                TI.map_index.label("map_index_for_ordering"),
+            )
+        ).subquery()
+
+        # Select only rows where row_number <= max_active_tasks.
+        query = (
+            select(TI)
+            .with_hint(TI, "USE INDEX (ti_state)", dialect_name="mysql")
+            .select_from(ranked_query)
+            .join(
+                TI,
+                (TI.dag_id == ranked_query.c.dag_id)
+                & (TI.task_id == ranked_query.c.task_id)
+                & (TI.run_id == ranked_query.c.run_id)
+                & (TI.map_index == ranked_query.c.map_index),
+            )
+            .where(ranked_query.c.row_num <= ranked_query.c.dr_max_active_tasks)
+            # Add the order_by columns from the ranked query for sqlite.
+            .order_by(
+                -ranked_query.c.priority_weight_for_ordering,
+                ranked_query.c.logical_date_for_ordering,
+                ranked_query.c.map_index_for_ordering,
+            )
+            .options(selectinload(TI.dag_model))
+        )
+
+        return query.limit(max_tis)
+
+    def _get_indexed_task_instances_to_examine(
+        self,
+        *,
+        index: SchedulableTaskInstanceIndex,
+        max_tis: int,
+        starved_pools: set[str],
+        starved_dags: set[str],
+        starved_tasks: set[tuple[str, str]],
+        starved_tasks_task_dagrun_concurrency: set[tuple[str, str, str]],
+        concurrency_map: ConcurrencyMap,
+        session: Session,
+    ) -> list[TI]:
+        """
+        Pick the TIs the critical section should examine from the schedulable TI index.
+
+        This applies the same starvation filters and per dag run ``max_active_tasks`` limit as
+        ``_get_task_instances_to_examine_query``, then re-selects the picked TIs by primary key with
+        row locks. Candidates that are not returned are either locked by another scheduler, and kept in
+        the index, or no longer schedulable, and dropped from it; the next reconcile restores them if needed.
+        """
+        if not index.is_loaded:
+            Stats.incr("scheduler.schedulable_ti_index.drift", index.reconcile(session))
+
+        candidates: list[UUID] = []
+        picked_per_dag_run: Counter[tuple[str, str]] = Counter()
+        for entry in index.iter_candidates(exclude_pools=starved_pools):
+            if entry.dag_id in starved_dags or (entry.dag_id, entry.task_id) in starved_tasks:
+                continue
+            if (entry.dag_id, entry.run_id, entry.task_id) in starved_tasks_task_dagrun_concurrency:
+                continue
+            dag_run_key = (entry.dag_id, entry.run_id)
+            max_active_tasks = index.dag_max_active_tasks.get(entry.dag_id)
+            if (
+                max_active_tasks is not None
+                and concurrency_map.dag_run_active_tasks_map[dag_run_key] + picked_per_dag_run[dag_run_key]
+                >= max_active_tasks
+            ):
+                continue
+            picked_per_dag_run[dag_run_key] += 1
+            candidates.append(entry.id)
+            if len(candidates) >= max_tis:
+                break
+
+        if not candidates:
+            return []
+
+        def schedulable(query: Select, ti_ids: list[UUID]) -> Select:
+            return (
+                query.join(TI.dag_run)
+                .where(DR.state == DagRunState.RUNNING)
+                .join(TI.dag_model)
+                .where(~DM.is_paused)
+                .where(DM.bundle_name.is_not(None))
+                .where(TI.state == TaskInstanceState.SCHEDULED)
+                .where(TI.id.in_(ti_ids))
+            )
+
+        query = schedulable(select(TI), candidates).options(selectinload(TI.dag_model))
+        locked_query = with_row_locks(query, of=TI, session=session, skip_locked=True)
+        tis_by_id = {ti.id: ti for ti in session.scalars(locked_query)}
+        if missing := [ti_id for ti_id in candidates if ti_id not in tis_by_id]:
+            # Rows locked by another scheduler are skipped above, but are still read without a lock
+            locked_elsewhere = set(session.scalars(schedulable(select(TI.id), missing)))
+            index.discard_many(ti_id for ti_id in missing if ti_id not in locked_elsewhere)
+        return [tis_by_id[ti_id] for ti_id in candidates if ti_id in tis_by_id]
+
     def _executable_task_instances_to_queued(self, max_tis: int, session: Session) -> list[TI]:
         """
         Find TIs that are ready for execution based on conditions.
@@ -527,102 +709,31 @@ class SchedulerJobRunner(BaseJobRunner, LoggingMixin):
             num_starved_tasks = len(starved_tasks)
             num_starved_tasks_task_dagrun_concurrency = len(starved_tasks_task_dagrun_concurrency)
 
-            # This behaves the same as 'concurrency_map.load()' with the difference that
-            # 'load()' executes immediately while '_get_current_dr_task_concurrency' creates a
-            # subquery object that is then executed along with main query.
-            # The results of 'load()' aren't used again here because by the time the main query
-            # executes, there could be a change that will be ignored.
-            dr_task_concurrency_subquery = _get_current_dr_task_concurrency(states=EXECUTION_STATES)
-
-            query = (
-                select(TI)
-                .with_hint(TI, "USE INDEX (ti_state)", dialect_name="mysql")
-                .join(TI.dag_run)
-                .where(DR.state == DagRunState.RUNNING)
-                .join(TI.dag_model)
-                .where(~DM.is_paused)
-                .where(TI.state == TaskInstanceState.SCHEDULED)
-                .where(DM.bundle_name.is_not(None))
-                .join(
-                    dr_task_concurrency_subquery,
-                    and_(
-                        TI.dag_id == dr_task_concurrency_subquery.c.dag_id,
-                        TI.run_id == dr_task_concurrency_subquery.c.run_id,
-                    ),
-                    isouter=True,
-                )
-                .where(
-                    func.coalesce(dr_task_concurrency_subquery.c.task_per_dr_count, 0) < DM.max_active_tasks
-                )
-                .order_by(-TI.priority_weight, DR.logical_date, TI.map_index)
-            )
-
-            # Starvation filters should be applied before computing the row_num based on the
-            # max_active_tasks limit. That way, starved dags and tasks that shouldn't run,
-            # won't occupy a slot.
-            if starved_pools:
-                query = query.where(TI.pool.not_in(starved_pools))
-
-            if starved_dags:
-                query = query.where(TI.dag_id.not_in(starved_dags))
-
-            if starved_tasks:
-                query = query.where(tuple_(TI.dag_id, TI.task_id).not_in(starved_tasks))
-
-            if starved_tasks_task_dagrun_concurrency:
-                query = query.where(
-                    tuple_(TI.dag_id, TI.run_id, TI.task_id).not_in(starved_tasks_task_dagrun_concurrency)
-                )
-
-            # Create a subquery with row numbers partitioned by dag_id and run_id.
-            # Different dags can have the same run_id but
-            # the dag_id combined with the run_id uniquely identify a run.
-            ranked_query = (
-                query.add_columns(
-                    func.row_number()
-                    .over(
-                        partition_by=[TI.dag_id, TI.run_id],
-                        order_by=[-TI.priority_weight, DR.logical_date, TI.map_index],
-                    )
-                    .label("row_num"),
-                    DM.max_active_tasks.label("dr_max_active_tasks"),
-                    # Create columns for the order_by checks here for sqlite.
-                    TI.priority_weight.label("priority_weight_for_ordering"),
-                    DR.logical_date.label("logical_date_for_ordering"),
-                    TI.map_index.label("map_index_for_ordering"),
-                )
-            ).subquery()
-
-            # Select only rows where row_number <= max_active_tasks.
-            query = (
-                select(TI)
-                .with_hint(TI, "USE INDEX (ti_state)", dialect_name="mysql")
-                .select_from(ranked_query)
-                .join(
-                    TI,
-                    (TI.dag_id == ranked_query.c.dag_id)
-                    & (TI.task_id == ranked_query.c.task_id)
-                    & (TI.run_id == ranked_query.c.run_id)
-                    & (TI.map_index == ranked_query.c.map_index),
-                )
-                .where(ranked_query.c.row_num <= ranked_query.c.dr_max_active_tasks)
-                # Add the order_by columns from the ranked query for sqlite.
-                .order_by(
-                    -ranked_query.c.priority_weight_for_ordering,
-                    ranked_query.c.logical_date_for_ordering,
-                    ranked_query.c.map_index_for_ordering,
-                )
-                .options(selectinload(TI.dag_model))
-            )
-
-            query = query.limit(max_tis)
-
             timer = Stats.timer("scheduler.critical_section_query_duration")
             timer.start()
 
             try:
-                locked_query = with_row_locks(query, of=TI, session=session, skip_locked=True)
-                task_instances_to_examine = session.scalars(locked_query).all()
+                if self._schedulable_ti_index is not None:
+                    task_instances_to_examine = self._get_indexed_task_instances_to_examine(
+                        index=self._schedulable_ti_index,
+                        max_tis=max_tis,
+                        starved_pools=starved_pools,
+                        starved_dags=starved_dags,
+                        starved_tasks=starved_tasks,
+                        starved_tasks_task_dagrun_concurrency=starved_tasks_task_dagrun_concurrency,
+                        concurrency_map=concurrency_map,
+                        session=session,
+                    )
+                else:
+                    query = self._get_task_instances_to_examine_query(
+                        max_tis=max_tis,
+                        starved_pools=starved_pools,
+                        starved_dags=starved_dags,
+                        starved_tasks=starved_tasks,
+                        starved_tasks_task_dagrun_concurrency=starved_tasks_task_dagrun_concurrency,
+                    )
+                    locked_query = with_row_locks(query, of=TI, session=session, skip_locked=True)
+                    task_instances_to_examine = session.scalars(locked_query).all()
 
                 if self.log.isEnabledFor(logging.DEBUG):
                     self.log.debug("Length of the tis to examine is %d", len(task_instances_to_examine))
@@ -904,6 +1015,9 @@ class SchedulerJobRunner(BaseJobRunner, LoggingMixin):
             for ti in executable_tis:
                 ti.emit_state_change_metric(TaskInstanceState.QUEUED)
 
+            if self._schedulable_ti_index is not None:
+                self._schedulable_ti_index.discard_many(ti.id for ti in executable_tis)
+
         for ti in executable_tis:
             make_transient(ti)
         return executable_tis
@@ -1002,6 +1116,11 @@ class SchedulerJobRunner(BaseJobRunner, LoggingMixin):
             self.log.debug("max_tis query size is less than or equal to zero. No query will be performed!")
             return 0
 
+        if self._schedulable_ti_index is not None:
+            # Pick up TIs moved to SCHEDULED by other components (e.g. the triggerer) before taking the
+            # pool locks, so that the critical section itself only has to lock pool rows and candidates.
+            self._schedulable_ti_index.refresh(session)
+
         queued_tis = self._executable_task_instances_to_queued(max_tis, session=session)
 
         # Sort queued TIs to their respective executor
@@ -1470,6 +1589,7 @@ class SchedulerJobRunner(BaseJobRunner, LoggingMixin):
             stats_factory = stats_utils.get_stats_factory(Stats)
             Stats.initialize(factory=stats_factory)
 
+            self._loop_profiler.attach(settings.engine)
             self._run_scheduler_loop()
 
             if settings.Session is not None:
@@ -1484,6 +1604,9 @@ class SchedulerJobRunner(BaseJobRunner, LoggingMixin):
                 except Exception:
                     self.log.exception("Exception when executing Executor.end on %s", executor)
 
+            self._loop_profiler.detach()
+            self._stack_sampler.stop()
+
             # Under normal execution, this doesn't matter, but by resetting signals it lets us run more things
             # in the same process under testing without leaking global state
             reset_signals.close()
@@ -1709,6 +1832,20 @@ class SchedulerJobRunner(BaseJobRunner, LoggingMixin):
             self._mark_backfills_complete,
         )
 
+        if self._schedulable_ti_index is not None:
+            self._reconcile_schedulable_ti_index()
+            timers.call_regular_interval(
+                conf.getfloat("scheduler", "schedulable_ti_index_reconcile_interval", fallback=60.0),
+                self._reconcile_schedulable_ti_index,
+            )
+
+        if pool_slot_ledger.is_enabled():
+            self._reconcile_pool_slot_ledger()
+            timers.call_regular_interval(
+                conf.getfloat("scheduler", "pool_slot_ledger_reconcile_interval", fallback=60.0),
+                self._reconcile_pool_slot_ledger,
+            )
+
         if self._is_metrics_enabled() or self._is_tracing_enabled():
             timers.call_regular_interval(
                 conf.getfloat("scheduler", "pool_metrics_interval", fallback=5.0),
@@ -1762,8 +1899,10 @@ class SchedulerJobRunner(BaseJobRunner, LoggingMixin):
         idle_count = 0
 
         for loop_count in itertools.count(start=1):
+            profiler = self._loop_profiler
+            profiler.start_loop()
             with Stats.timer("scheduler.scheduler_loop_duration") as timer:
-                with create_session() as session:
+                with create_session() as session, profiler.phase("do_scheduling"):
                     if self._is_tracing_enabled():
                         self._end_spans_of_externally_ended_ops(session)
 
@@ -1775,24 +1914,26 @@ class SchedulerJobRunner(BaseJobRunner, LoggingMixin):
                 # Heartbeat all executors, even if they're not receiving new tasks this loop. It will be
                 # either a no-op, or they will check-in on currently running tasks and send out new
                 # events to be processed below.
-                for executor in self.executors:
-                    executor.heartbeat()
+                with profiler.phase("executor_heartbeat"):
+                    for executor in self.executors:
+                        executor.heartbeat()
 
-                with create_session() as session:
+                with create_session() as session, profiler.phase("process_executor_events"):
                     num_finished_events = 0
                     for executor in self.executors:
                         num_finished_events += self._process_executor_events(
                             executor=executor, session=session
                         )
 
-                for executor in self.executors:
-                    try:
-                        with create_session() as session:
-                            self._process_task_event_logs(executor._task_event_logs, session)
-                    except Exception:
-                        self.log.exception("Something went wrong when trying to save task event logs.")
+                with profiler.phase("process_task_event_logs"):
+                    for executor in self.executors:
+                        try:
+                            with create_session() as session:
+                                self._process_task_event_logs(executor._task_event_logs, session)
+                        except Exception:
+                            self.log.exception("Something went wrong when trying to save task event logs.")
 
-                with create_session() as session:
+                with create_session() as session, profiler.phase("deadlines_and_callbacks"):
                     # Only retrieve expired deadlines that haven't been processed yet.
                     # `missed` is False by default until the handler sets it.
                     for deadline in session.scalars(
@@ -1807,14 +1948,17 @@ class SchedulerJobRunner(BaseJobRunner, LoggingMixin):
                     self._enqueue_executor_callbacks(session)
 
                 # Heartbeat the scheduler periodically
-                perform_heartbeat(
-                    job=self.job, heartbeat_callback=self.heartbeat_callback, only_if_necessary=True
-                )
+                with profiler.phase("scheduler_heartbeat"):
+                    perform_heartbeat(
+                        job=self.job, heartbeat_callback=self.heartbeat_callback, only_if_necessary=True
+                    )
 
                 # Run any pending timed events
-                next_event = timers.run(blocking=False)
+                with profiler.phase("timed_events"):
+                    next_event = timers.run(blocking=False)
                 self.log.debug("Next timed event is in %f", next_event)
 
+            profiler.end_loop()
             self.log.debug("Ran scheduling loop in %.2f ms", timer.duration)
 
             idle_in_this_run = not num_queued_tis and not num_finished_events
@@ -1870,31 +2014,36 @@ class SchedulerJobRunner(BaseJobRunner, LoggingMixin):
         :return: Number of TIs enqueued in this iteration
         """
         # Put a check in place to make sure we don't commit unexpectedly
+        profiler = self._loop_profiler
         with prohibit_commit(session) as guard:
             if conf.getboolean("scheduler", "use_job_schedule", fallback=True):
-                self._create_dagruns_for_dags(guard, session)
+                with profiler.phase("create_dagruns"):
+                    self._create_dagruns_for_dags(guard, session)
 
-            self._start_queued_dagruns(session)
-            guard.commit()
+            with profiler.phase("start_queued_dagruns"):
+                self._start_queued_dagruns(session)
+                guard.commit()
 
-            # Bulk fetch the currently active dag runs for the dags we are
-            # examining, rather than making one query per DagRun
-            dag_runs = DagRun.get_running_dag_runs_to_examine(session=session)
+            with profiler.phase("schedule_dag_runs"):
+                # Bulk fetch the currently active dag runs for the dags we are
+                # examining, rather than making one query per DagRun
+                dag_runs = DagRun.get_running_dag_runs_to_examine(session=session)
 
-            callback_tuples = self._schedule_all_dag_runs(guard, dag_runs, session)
+                callback_tuples = self._schedule_all_dag_runs(guard, dag_runs, session)
 
         # Send the callbacks after we commit to ensure the context is up to date when it gets run
         # cache saves time during scheduling of many dag_runs for same dag
         cached_get_dag: Callable[[DagRun], SerializedDAG | None] = lru_cache()(
             partial(self.scheduler_dag_bag.get_dag_for_run, session=session)
         )
-        for dag_run, callback_to_run in callback_tuples:
-            dag = cached_get_dag(dag_run)
-            if dag:
-                # Sending callbacks to the database, so it must be done outside of prohibit_commit.
-                self._send_dag_callbacks_to_processor(dag, callback_to_run)
-            else:
-                self.log.error("DAG '%s' not found in serialized_dag table", dag_run.dag_id)
+        with profiler.phase("send_dag_callbacks"):
+            for dag_run, callback_to_run in callback_tuples:
+                dag = cached_get_dag(dag_run)
+                if dag:
+                    # Sending callbacks to the database, so it must be done outside of prohibit_commit.
+                    self._send_dag_callbacks_to_processor(dag, callback_to_run)
+                else:
+                    self.log.error("DAG '%s' not found in serialized_dag table", dag_run.dag_id)
 
         with prohibit_commit(session) as guard:
             # Without this, the session has an invalid view of the DB
@@ -1913,7 +2062,8 @@ class SchedulerJobRunner(BaseJobRunner, LoggingMixin):
                     timer.start()
 
                     # Find any TIs in state SCHEDULED, try to QUEUE them (send it to the executors)
-                    num_queued_tis = self._critical_section_enqueue_task_instances(session=session)
+                    with profiler.phase("critical_section"):
+                        num_queued_tis = self._critical_section_enqueue_task_instances(session=session)
 
                     # Make sure we only sent this metric if we obtained the lock, otherwise we'll skew the
                     # metric, way down
@@ -2400,7 +2550,10 @@ class SchedulerJobRunner(BaseJobRunner, LoggingMixin):
         session: Session,
     ) -> list[tuple[DagRun, DagCallbackRequest | None]]:
         """Make scheduling decisions for all `dag_runs`."""
-        callback_tuples = [(run, self._schedule_dag_run(run, session=session)) for run in dag_runs]
+        callback_tuples: list[tuple[DagRun, DagCallbackRequest | None]] = []
+        for run in dag_runs:
+            with self._loop_profiler.dag(run.dag_id):
+                callback_tuples.append((run, self._schedule_dag_run(run, session=session)))
         guard.commit()
         return callback_tuples
 
@@ -2540,6 +2693,17 @@ class SchedulerJobRunner(BaseJobRunner, LoggingMixin):
             )
         dag_run.schedule_tis(schedulable_tis, session, max_tis_per_query=self.job.max_tis_per_query)
 
+        if self._schedulable_ti_index is not None:
+            if dag_run.state in State.finished_dr_states:
+                self._schedulable_ti_index.discard_dag_run(dag_run.dag_id, dag_run.run_id)
+            elif schedulable_tis:
+                # Keep the index in step with the TIs we just moved to SCHEDULED, so they can be queued
+                # in this very loop instead of waiting for the next refresh.
+                self._schedulable_ti_index.dag_max_active_tasks[dag_run.dag_id] = dag_model.max_active_tasks
+                self._schedulable_ti_index.add_task_instances(
+                    dag_run, (ti for ti in schedulable_tis if ti.is_schedulable)
+                )
+
         return callback_to_run
 
     def _verify_integrity_if_dag_changed(self, dag_run: DagRun, session: Session) -> bool:
@@ -2796,6 +2960,27 @@ class SchedulerJobRunner(BaseJobRunner, LoggingMixin):
 
             self.previous_ti_metrics[state] = ti_metrics
 
+    @provide_session
+    def _reconcile_schedulable_ti_index(self, session: Session = NEW_SESSION) -> None:
+        """Rebuild the schedulable TI index from the database and report how far it had drifted."""
+        if self._schedulable_ti_index is None:
+            return
+        with Stats.timer("scheduler.schedulable_ti_index.reconcile_duration"):
+            drift = self._schedulable_ti_index.reconcile(session)
+        if drift:
+            self.log.debug("Schedulable TI index reconciled with a drift of %d task instances", drift)
+        Stats.incr("scheduler.schedulable_ti_index.drift", drift)
+        Stats.gauge("scheduler.schedulable_ti_index.size", len(self._schedulable_ti_index))
+
+    @provide_session
+    def _reconcile_pool_slot_ledger(self, session: Session = NEW_SESSION) -> None:
+        """Correct the pool slot ledger from the task instances and report how far it had drifted."""
+        with Stats.timer("scheduler.pool_slot_ledger.reconcile_duration"):
+            drift = pool_slot_ledger.reconcile_pool_slot_usage(session)
+        if drift:
+            self.log.warning("Pool slot ledger reconciled with a drift of %d slots", drift)
+        Stats.incr("scheduler.pool_slot_ledger.drift", drift)
+
     @provide_session
     def _emit_running_dags_metric(self, session: Session = NEW_SESSION) -> None:
         stmt = select(func.count()).select_from(DagRun).where(DagRun.state == DagRunState.RUNNING)
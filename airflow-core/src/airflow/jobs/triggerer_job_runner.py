@@ -30,13 +30,14 @@ from contextlib import suppress
 from datetime import datetime
 from socket import socket
 from traceback import format_exception
-from typing import TYPE_CHECKING, Annotated, Any, BinaryIO, ClassVar, Literal, TextIO, TypedDict
+from typing import TYPE_CHECKING, Annotated, Any, BinaryIO, ClassVar, Literal, TextIO, TypedDict, TypeVar
 
 import anyio
 import attrs
 import structlog
 from pydantic import BaseModel, Field, TypeAdapter
 from sqlalchemy import func, select
+from sqlalchemy.exc import OperationalError
 from structlog.contextvars import bind_contextvars as bind_log_contextvars
 
 from airflow._shared.module_loading import import_string
@@ -88,6 +89,8 @@ from airflow.utils.log.logging_mixin import LoggingMixin
 from airflow.utils.session import provide_session
 
 if TYPE_CHECKING:
+    from collections.abc import Callable
+
     from sqlalchemy.orm import Session
     from structlog.typing import FilteringBoundLogger, WrappedLogger
 
@@ -344,6 +347,43 @@ def in_process_api_server() -> InProcessExecutionAPI:
     return api
 
 
+_T = TypeVar("_T", bound=tuple)
+
+
+def _submit_in_batch(
+    items: list[_T], pending: deque[_T], submit: Callable[[list[_T]], None]
+) -> list[tuple[_T, Exception]]:
+    """
+    Submit trigger events or failures in one transaction, or one by one if the batch fails.
+
+    The submitted items are dropped from the start of ``pending``. If the database is unavailable, the
+    error is raised and the remaining items are kept to be submitted again. Any other error is caused by
+    an item of the batch, so the items are then submitted in a transaction each: those failing on their
+    own are dropped, and returned with their error.
+    """
+    try:
+        submit(items)
+    except OperationalError:
+        raise
+    except Exception:
+        log.exception("Failed to submit a batch, submitting its items one by one", count=len(items))
+    else:
+        for _ in items:
+            pending.popleft()
+        return []
+    unsubmitted = []
+    for item in items:
+        try:
+            submit([item])
+        except OperationalError:
+            raise
+        except Exception as e:
+            log.exception("Failed to submit the item of a trigger, dropping it", trigger_id=item[0])
+            unsubmitted.append((item, e))
+        pending.popleft()
+    return unsubmitted
+
+
 @attrs.define(kw_only=True)
 class TriggerRunnerSupervisor(WatchedSubprocess):
     """
@@ -358,6 +398,7 @@ class TriggerRunnerSupervisor(WatchedSubprocess):
     queues: set[str] | None = None
 
     health_check_threshold = conf.getint("triggerer", "triggerer_health_check_threshold")
+    sharded_assignment = conf.getboolean("triggerer", "sharded_assignment")
 
     runner: TriggerRunner | None = None
     stop: bool = False
@@ -580,19 +621,26 @@ class TriggerRunnerSupervisor(WatchedSubprocess):
             self.capacity,
             self.health_check_threshold,
             queues=self.queues,
+            sharded=self.sharded_assignment,
         )
         ids = Trigger.ids_for_triggerer(self.job.id, queues=self.queues)
+        Stats.gauge("triggerer.assigned_triggers", len(ids), tags={"hostname": self.job.hostname})
         self.update_triggers(set(ids))
 
     def handle_events(self):
         """Dispatch outbound events to the Trigger model which pushes them to the relevant task instances."""
-        while self.events:
-            # Get the event and its trigger ID
-            trigger_id, event = self.events.popleft()
-            # Tell the model to wake up its tasks
-            Trigger.submit_event(trigger_id=trigger_id, event=event)
-            # Emit stat event
-            Stats.incr("triggers.succeeded")
+        if not self.events:
+            return
+        # Hand all the pending events to the model in one transaction
+        events = list(self.events)
+        with Stats.timer("triggerer.submit_events_duration"):
+            # Tell the model to wake up the tasks
+            unsubmitted = _submit_in_batch(events, self.events, Trigger.submit_events)
+        for (trigger_id, _), exc in unsubmitted:
+            # Fail the tasks waiting for the event, rather than leaving them deferred
+            self.failed_triggers.append((trigger_id, format_exception(type(exc), exc, exc.__traceback__)))
+        # Emit stat event
+        Stats.incr("triggers.succeeded", len(events) - len(unsubmitted))
 
     def clean_unused(self):
         """Clean out unused or finished triggers."""
@@ -604,12 +652,14 @@ class TriggerRunnerSupervisor(WatchedSubprocess):
 
         Task Instances that depend on them need failing.
         """
-        while self.failed_triggers:
-            # Tell the model to fail this trigger's deps
-            trigger_id, saved_exc = self.failed_triggers.popleft()
-            Trigger.submit_failure(trigger_id=trigger_id, exc=saved_exc)
-            # Emit stat event
-            Stats.incr("triggers.failed")
+        if not self.failed_triggers:
+            return
+        failures = list(self.failed_triggers)
+        with Stats.timer("triggerer.submit_failures_duration"):
+            # Tell the model to fail these triggers' deps
+            _submit_in_batch(failures, self.failed_triggers, Trigger.submit_failures)
+        # Emit stat event
+        Stats.incr("triggers.failed", len(failures))
 
     def emit_metrics(self):
         DualStatsManager.gauge(
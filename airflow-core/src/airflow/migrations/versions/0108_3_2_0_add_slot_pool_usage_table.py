@@ -0,0 +1,55 @@
+#
+# Licensed to the Apache Software Foundation (ASF) under one
+# or more contributor license agreements.  See the NOTICE file
+# distributed with this work for additional information
+# regarding copyright ownership.  The ASF licenses this file
+# to you under the Apache License, Version 2.0 (the
+# "License"); you may not use this file except in compliance
+# with the License.  You may obtain a copy of the License at
+#
+#   http://www.apache.org/licenses/LICENSE-2.0
+#
+# Unless required by applicable law or agreed to in writing,
+# software distributed under the License is distributed on an
+# "AS IS" BASIS, WITHOUT WARRANTIES OR CONDITIONS OF ANY
+# KIND, either express or implied.  See the License for the
+# specific language governing permissions and limitations
+# under the License.
+
+"""
+Add slot_pool_usage table.
+
+Revision ID: 92f07d7fb3f3
+Revises: 6222ce48e289
+Create Date: 2026-03-02 10:14:37.412093
+
+"""
+
+from __future__ import annotations
+
+import sqlalchemy as sa
+from alembic import op
+
+# revision identifiers, used by Alembic.
+revision = "92f07d7fb3f3"
+down_revision = "6222ce48e289"
+branch_labels = None
+depends_on = None
+airflow_version = "3.2.0"
+
+
+def upgrade():
+    """Add slot_pool_usage table."""
+    # Left empty: the schedulers fill it from the task instances when the pool slot ledger is enabled
+    op.create_table(
+        "slot_pool_usage",
+        sa.Column("pool", sa.String(length=256), nullable=False),
+        sa.Column("state", sa.String(length=20), nullable=False),
+        sa.Column("slots", sa.Integer(), nullable=False),
+        sa.PrimaryKeyConstraint("pool", "state", name=op.f("slot_pool_usage_pkey")),
+    )
+
+
+def downgrade():
+    """Remove slot_pool_usage table."""
+    op.drop_table("slot_pool_usage")
@@ -0,0 +1,52 @@
+#
+# Licensed to the Apache Software Foundation (ASF) under one
+# or more contributor license agreements.  See the NOTICE file
+# distributed with this work for additional information
+# regarding copyright ownership.  The ASF licenses this file
+# to you under the Apache License, Version 2.0 (the
+# "License"); you may not use this file except in compliance
+# with the License.  You may obtain a copy of the License at
+#
+#   http://www.apache.org/licenses/LICENSE-2.0
+#
+# Unless required by applicable law or agreed to in writing,
+# software distributed under the License is distributed on an
+# "AS IS" BASIS, WITHOUT WARRANTIES OR CONDITIONS OF ANY
+# KIND, either express or implied.  See the License for the
+# specific language governing permissions and limitations
+# under the License.
+
+"""
+Add revoked_at to revoked_token table.
+
+Revision ID: 4c1e7f3a9b2d
+Revises: 92f07d7fb3f3
+Create Date: 2026-03-09 09:41:12.538210
+
+"""
+
+from __future__ import annotations
+
+import sqlalchemy as sa
+from alembic import op
+
+from airflow.utils.sqlalchemy import UtcDateTime
+
+# revision identifiers, used by Alembic.
+revision = "4c1e7f3a9b2d"
+down_revision = "92f07d7fb3f3"
+branch_labels = None
+depends_on = None
+airflow_version = "3.2.0"
+
+
+def upgrade():
+    """Add revoked_at to revoked_token table."""
+    with op.batch_alter_table("revoked_token", schema=None) as batch_op:
+        batch_op.add_column(sa.Column("revoked_at", UtcDateTime, nullable=True))
+
+
+def downgrade():
+    """Remove revoked_at from revoked_token table."""
+    with op.batch_alter_table("revoked_token", schema=None) as batch_op:
+        batch_op.drop_column("revoked_at")
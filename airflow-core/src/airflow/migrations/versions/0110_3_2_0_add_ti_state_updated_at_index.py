@@ -0,0 +1,49 @@
+#
+# Licensed to the Apache Software Foundation (ASF) under one
+# or more contributor license agreements.  See the NOTICE file
+# distributed with this work for additional information
+# regarding copyright ownership.  The ASF licenses this file
+# to you under the Apache License, Version 2.0 (the
+# "License"); you may not use this file except in compliance
+# with the License.  You may obtain a copy of the License at
+#
+#   http://www.apache.org/licenses/LICENSE-2.0
+#
+# Unless required by applicable law or agreed to in writing,
+# software distributed under the License is distributed on an
+# "AS IS" BASIS, WITHOUT WARRANTIES OR CONDITIONS OF ANY
+# KIND, either express or implied.  See the License for the
+# specific language governing permissions and limitations
+# under the License.
+
+"""
+Add index on state and updated_at to task_instance table.
+
+Revision ID: 7d2a5c81e4f6
+Revises: 4c1e7f3a9b2d
+Create Date: 2026-03-11 14:22:05.713942
+
+"""
+
+from __future__ import annotations
+
+from alembic import op
+
+# revision identifiers, used by Alembic.
+revision = "7d2a5c81e4f6"
+down_revision = "4c1e7f3a9b2d"
+branch_labels = None
+depends_on = None
+airflow_version = "3.2.0"
+
+
+def upgrade():
+    """Add index on state and updated_at to task_instance table."""
+    with op.batch_alter_table("task_instance", schema=None) as batch_op:
+        batch_op.create_index("ti_state_updated_at", ["state", "updated_at"], unique=False)
+
+
+def downgrade():
+    """Remove index on state and updated_at from task_instance table."""
+    with op.batch_alter_table("task_instance", schema=None) as batch_op:
+        batch_op.drop_index("ti_state_updated_at")
@@ -18,13 +18,17 @@
 from __future__ import annotations
 
 import hashlib
-from typing import TYPE_CHECKING, Any
+import threading
+from collections import OrderedDict
+from typing import TYPE_CHECKING, Any, NamedTuple
 from uuid import UUID
 
 from sqlalchemy import String, inspect, select
 from sqlalchemy.orm import Mapped, joinedload, mapped_column
 from sqlalchemy.orm.attributes import NO_VALUE
 
+from airflow._shared.observability.metrics.stats import Stats
+from airflow.configuration import conf
 from airflow.models.base import Base, StringID
 from airflow.models.dag_version import DagVersion
 
@@ -38,21 +42,149 @@ if TYPE_CHECKING:
     from airflow.serialization.definitions.dag import SerializedDAG
 
 
+class _CachedDag(NamedTuple):
+    dag: SerializedDAG
+    dag_hash: str | None
+    size: int
+
+
+class DagVersionCache:
+    """
+    Thread-safe LRU cache of deserialized dags, keyed by dag_version_id.
+
+    The cache is bounded both by the number of entries and by their estimated size in bytes; ``0``
+    disables the corresponding limit. The most recently inserted entry is never evicted, so a single
+    dag larger than ``max_bytes`` can still be served from the cache.
+
+    :meta private:
+    """
+
+    def __init__(self, max_entries: int = 0, max_bytes: int = 0) -> None:
+        self.max_entries = max_entries
+        self.max_bytes = max_bytes
+        self._items: OrderedDict[UUID, _CachedDag] = OrderedDict()
+        self._size_bytes = 0
+        self._lock = threading.Lock()
+
+    def __len__(self) -> int:
+        return len(self._items)
+
+    def __contains__(self, version_id: object) -> bool:
+        return version_id in self._items
+
+    @property
+    def size_bytes(self) -> int:
+        return self._size_bytes
+
+    def get(self, version_id: UUID, dag_hash: str | None = None) -> SerializedDAG | None:
+        """
+        Get a cached dag and mark it as most recently used.
+
+        :param dag_hash: If given, the cached dag is only returned if it was built from data with the
+            same hash, since the serialized dag of a version can be updated in place.
+        """
+        with self._lock:
+            item = self._items.get(version_id)
+            if item is None or (dag_hash is not None and item.dag_hash != dag_hash):
+                item = None
+            else:
+                self._items.move_to_end(version_id)
+        if item is None:
+            Stats.incr("dagbag_cache.misses")
+            return None
+        Stats.incr("dagbag_cache.hits")
+        return item.dag
+
+    def put(
+        self, version_id: UUID, dag: SerializedDAG, *, dag_hash: str | None = None, size: int = 0
+    ) -> None:
+        """Add a dag to the cache, evicting the least recently used dags if a limit is exceeded."""
+        evictions = 0
+        with self._lock:
+            if (previous := self._items.pop(version_id, None)) is not None:
+                self._size_bytes -= previous.size
+            self._items[version_id] = _CachedDag(dag, dag_hash, size)
+            self._size_bytes += size
+            while len(self._items) > 1 and (
+                (self.max_entries and len(self._items) > self.max_entries)
+                or (self.max_bytes and self._size_bytes > self.max_bytes)
+            ):
+                _, evicted = self._items.popitem(last=False)
+                self._size_bytes -= evicted.size
+                evictions += 1
+            size_bytes = self._size_bytes
+        if evictions:
+            Stats.incr("dagbag_cache.evictions", evictions)
+        Stats.gauge("dagbag_cache.size_bytes", size_bytes)
+
+    def values(self) -> list[SerializedDAG]:
+        with self._lock:
+            return [item.dag for item in self._items.values()]
+
+    def clear(self) -> None:
+        with self._lock:
+            self._items.clear()
+            self._size_bytes = 0
+
+
+# Typical ratio between the size of serialized dag data and the size of its compressed form
+_COMPRESSION_RATIO = 10
+# Typical size of the serialized data of a task, used for rows stored as uncompressed JSON
+_SERIALIZED_TASK_SIZE = 2048
+
+
+def _estimate_size(serdag: SerializedDagModel) -> int:
+    """
+    Estimate the memory footprint of a deserialized dag from the stored serialized data.
+
+    The data is not decoded or encoded again: compressed rows are estimated from their length, and rows stored
+    as JSON from their number of tasks.
+    """
+    if serdag._data_compressed:
+        return len(serdag._data_compressed) * _COMPRESSION_RATIO
+    tasks = (serdag._data or {}).get("dag", {}).get("tasks", ())
+    return (len(tasks) + 1) * _SERIALIZED_TASK_SIZE
+
+
 class DBDagBag:
     """
     Internal class for retrieving and caching dags in the scheduler.
 
+    Deserialized dags are kept in a :class:`DagVersionCache` bounded by
+    ``[core] dag_bag_cache_max_entries`` and ``[core] dag_bag_cache_max_bytes``.
+
     :meta private:
     """
 
-    def __init__(self, load_op_links: bool = True) -> None:
-        self._dags: dict[UUID, SerializedDAG] = {}  # dag_version_id to dag
+    def __init__(
+        self,
+        load_op_links: bool = True,
+        max_entries: int | None = None,
+        max_bytes: int | None = None,
+    ) -> None:
+        if max_entries is None:
+            max_entries = conf.getint("core", "dag_bag_cache_max_entries", fallback=2000)
+        if max_bytes is None:
+            max_bytes = conf.getint("core", "dag_bag_cache_max_bytes", fallback=1 << 30)
+        self._dags = DagVersionCache(max_entries=max_entries, max_bytes=max_bytes)
         self.load_op_links = load_op_links
 
-    def _read_dag(self, serdag: SerializedDagModel) -> SerializedDAG | None:
+    def read_dag(self, serdag: SerializedDagModel) -> SerializedDAG:
+        """Get the dag of an already loaded serialized dag row, reusing the cached dag if unchanged."""
+        if dag := self._dags.get(serdag.dag_version_id, dag_hash=serdag.dag_hash):
+            return dag
+        return self._load_dag(serdag)
+
+    def _load_dag(self, serdag: SerializedDagModel) -> SerializedDAG:
         serdag.load_op_links = self.load_op_links
-        if dag := serdag.dag:
-            self._dags[serdag.dag_version_id] = dag
+        dag = serdag.dag
+        self._dags.put(
+            serdag.dag_version_id,
+            dag,
+            dag_hash=serdag.dag_hash,
+            # The size only matters to bound the cache by size
+            size=_estimate_size(serdag) if self._dags.max_bytes else 0,
+        )
         return dag
 
     def _get_dag(self, version_id: UUID, session: Session) -> SerializedDAG | None:
@@ -63,7 +195,7 @@ class DBDagBag:
             return None
         if not (serdag := dag_version.serialized_dag):
             return None
-        return self._read_dag(serdag)
+        return self._load_dag(serdag)
 
     @staticmethod
     def _version_from_dag_run(dag_run: DagRun, *, session: Session) -> DagVersion | None:
@@ -85,12 +217,27 @@ class DBDagBag:
             return self._get_dag(version_id=version.id, session=session)
         return None
 
+    def find_dag_for_run(
+        self, dag_run: DagRun, session: Session
+    ) -> SerializedDAG | SerializedDagModel | None:
+        """
+        Get the dag of a run if it is cached, or else its serialized dag row to pass to ``read_dag``.
+
+        This lets callers read the database and deserialize the dag in different threads.
+        """
+        if not (version := self._version_from_dag_run(dag_run=dag_run, session=session)):
+            return None
+        if dag := self._dags.get(version.id):
+            return dag
+        dag_version = session.get(DagVersion, version.id, options=[joinedload(DagVersion.serialized_dag)])
+        return dag_version.serialized_dag if dag_version else None
+
     def iter_all_latest_version_dags(self, *, session: Session) -> Generator[SerializedDAG, None, None]:
         """Walk through all latest version dags available in the database."""
         from airflow.models.serialized_dag import SerializedDagModel
 
         for sdm in session.scalars(select(SerializedDagModel)):
-            if dag := self._read_dag(sdm):
+            if dag := self.read_dag(sdm):
                 yield dag
 
     def get_latest_version_of_dag(self, dag_id: str, *, session: Session) -> SerializedDAG | None:
@@ -99,7 +246,7 @@ class DBDagBag:
 
         if not (serdag := SerializedDagModel.get(dag_id, session=session)):
             return None
-        return self._read_dag(serdag)
+        return self.read_dag(serdag)
 
 
 def generate_md5_hash(context):
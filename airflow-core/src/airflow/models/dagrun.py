@@ -1526,6 +1526,7 @@ class DagRun(Base, LoggingMixin):
             flag_upstream_failed=True,
             ignore_unmapped_tasks=True,  # Ignore this Dep, as we will expand it if we can.
             finished_tis=finished_tis,
+            batch_upstream_states=True,
         )
 
         def _expand_mapped_task_if_needed(ti: TI) -> Iterable[TI] | None:
@@ -1584,6 +1585,8 @@ class DagRun(Base, LoggingMixin):
                 if new_tis is not None:
                     additional_tis.extend(new_tis)
                     expansion_happened = True
+                    # The upstream tis counted so far do not include the new ones
+                    dep_context.reset_upstream_state_counts()
             if new_tis is None and schedulable.state in SCHEDULEABLE_STATES:
                 # It's enough to revise map index once per task id,
                 # checking the map index for each mapped task significantly slows down scheduling
@@ -1594,6 +1597,9 @@ class DagRun(Base, LoggingMixin):
                         )
                     )
                     revised_map_index_task_ids.add(schedulable.task.task_id)
+                    if schedulable.map_index >= 0:
+                        # Revising a mapped task may have added tis or removed finished ones
+                        dep_context.reset_upstream_state_counts()
 
                 # _revise_map_indexes_if_mapped might mark the current task as REMOVED
                 # after calculating mapped task length, so we need to re-check
@@ -1620,6 +1626,7 @@ class DagRun(Base, LoggingMixin):
             ignore_in_retry_period=True,
             ignore_in_reschedule_period=True,
             finished_tis=finished_tis,
+            batch_upstream_states=True,
         )
         # there might be runnable tasks that are up for retry and for some reason(retry delay, etc.) are
         # not ready yet, so we set the flags to count them in
@@ -72,6 +72,21 @@ class PoolStats(TypedDict):
     scheduled: int
 
 
+class PoolSlotUsage(Base):
+    """
+    Slots used by the task instances of a pool in a state.
+
+    Only maintained when ``[scheduler] use_pool_slot_ledger`` is enabled, see
+    :mod:`airflow.utils.pool_slot_ledger`.
+    """
+
+    __tablename__ = "slot_pool_usage"
+
+    pool: Mapped[str] = mapped_column(String(256), primary_key=True)
+    state: Mapped[str] = mapped_column(String(20), primary_key=True)
+    slots: Mapped[int] = mapped_column(Integer, nullable=False, default=0)
+
+
 class Pool(Base):
     """the class to get Pool info."""
 
@@ -172,6 +187,9 @@ class Pool(Base):
         """
         Get Pool stats (Number of Running, Queued, Open & Total tasks).
 
+        The slots used are read from the pool slot ledger if ``[scheduler] use_pool_slot_ledger`` is enabled,
+        instead of being summed over the task instances.
+
         If ``lock_rows`` is True, and the database engine in use supports the ``NOWAIT`` syntax, then a
         non-blocking lock will be attempted -- if the lock is not available then SQLAlchemy will throw an
         OperationalError.
@@ -180,6 +198,7 @@ class Pool(Base):
         :param session: SQLAlchemy ORM Session
         """
         from airflow.models.taskinstance import TaskInstance  # Avoid circular import
+        from airflow.utils import pool_slot_ledger
 
         pools: dict[str, PoolStats] = {}
         pool_includes_deferred: dict[str, bool] = {}
@@ -202,11 +221,18 @@ class Pool(Base):
             TaskInstanceState.DEFERRED,
             TaskInstanceState.SCHEDULED,
         }
-        state_count_by_pool = session.execute(
-            select(TaskInstance.pool, TaskInstance.state, func.sum(TaskInstance.pool_slots))
-            .filter(TaskInstance.state.in_(allowed_execution_states))
-            .group_by(TaskInstance.pool, TaskInstance.state)
-        )
+        if pool_slot_ledger.is_enabled():
+            state_count_by_pool = session.execute(
+                select(PoolSlotUsage.pool, PoolSlotUsage.state, PoolSlotUsage.slots).where(
+                    PoolSlotUsage.state.in_(allowed_execution_states)
+                )
+            )
+        else:
+            state_count_by_pool = session.execute(
+                select(TaskInstance.pool, TaskInstance.state, func.sum(TaskInstance.pool_slots))
+                .filter(TaskInstance.state.in_(allowed_execution_states))
+                .group_by(TaskInstance.pool, TaskInstance.state)
+            )
 
         # calculate queued and running metrics
         for pool_name, state, decimal_count in state_count_by_pool:
@@ -17,14 +17,17 @@
 # under the License.
 from __future__ import annotations
 
+import threading
 import time
-from datetime import datetime, timezone
+from datetime import datetime, timedelta, timezone
+from functools import cache
 from typing import TYPE_CHECKING, ClassVar
 
 import structlog
 from sqlalchemy import String, delete, exists, select
 from sqlalchemy.orm import Mapped, mapped_column
 
+from airflow._shared.observability.metrics.stats import Stats
 from airflow.configuration import conf
 from airflow.models.base import Base
 from airflow.utils.session import NEW_SESSION, provide_session
@@ -46,18 +49,23 @@ class RevokedToken(Base):
 
     jti: Mapped[str] = mapped_column(String(32), primary_key=True)
     exp: Mapped[datetime] = mapped_column(UtcDateTime, nullable=False, index=True)
+    revoked_at: Mapped[datetime | None] = mapped_column(UtcDateTime, nullable=True)
 
     @classmethod
     @provide_session
     def revoke(cls, jti: str, exp: datetime, session: Session = NEW_SESSION) -> None:
         """Add a token JTI to the revoked tokens."""
-        session.merge(cls(jti=jti, exp=exp))
+        session.merge(cls(jti=jti, exp=exp, revoked_at=datetime.now(tz=timezone.utc)))
+        if (revoked_tokens := get_revoked_token_cache()).enabled:
+            revoked_tokens.add(jti, exp)
 
     @classmethod
     @provide_session
     def is_revoked(cls, jti: str, session: Session = NEW_SESSION) -> bool:
         """Check if a token JTI has been revoked."""
         cls._maybe_cleanup_expired(session)
+        if (revoked_tokens := get_revoked_token_cache()).enabled:
+            return revoked_tokens.is_revoked(jti, session=session)
         return bool(session.scalar(select(exists().where(cls.jti == jti))))
 
     @classmethod
@@ -77,3 +85,71 @@ class RevokedToken(Base):
                 session.execute(delete(cls).where(cls.exp < datetime.now(tz=timezone.utc)))
             except Exception:
                 log.exception("Failed to clean up expired revoked tokens")
+
+
+class RevokedTokenCache:
+    """
+    Local copy of the revoked token JTIs, so that validating a token does not need to query the database.
+
+    The tokens revoked by other processes are read every ``refresh_interval`` seconds: only the ones revoked
+    since the latest read, with an overlap covering clock differences between processes and transactions
+    committed late. Expired tokens are dropped, so the copy is bounded by the tokens revoked within their
+    lifetime. A token revoked by another process is only rejected by this one once the copy is refreshed.
+
+    :param refresh_interval: seconds between reads of the revoked tokens, ``0`` disables the cache
+    """
+
+    #: How far before the latest revocation read the next read starts
+    overlap = timedelta(minutes=1)
+
+    def __init__(self, refresh_interval: float) -> None:
+        self.refresh_interval = refresh_interval
+        self._exp_by_jti: dict[str, datetime] = {}
+        # Latest revocation time read, None until one is read
+        self._watermark: datetime | None = None
+        self._refreshed_at: float | None = None
+        self._lock = threading.Lock()
+
+    @property
+    def enabled(self) -> bool:
+        return self.refresh_interval > 0
+
+    def __len__(self) -> int:
+        return len(self._exp_by_jti)
+
+    def add(self, jti: str, exp: datetime) -> None:
+        """Add a token revoked by this process, without waiting for the next refresh."""
+        with self._lock:
+            self._exp_by_jti[jti] = exp
+
+    def is_revoked(self, jti: str, *, session: Session) -> bool:
+        refreshed_at = self._refreshed_at
+        if refreshed_at is None or time.monotonic() - refreshed_at >= self.refresh_interval:
+            self.refresh(session)
+        return jti in self._exp_by_jti
+
+    def refresh(self, session: Session) -> None:
+        """Read the tokens revoked since the latest refresh, and drop the expired ones."""
+        now = datetime.now(tz=timezone.utc)
+        query = select(RevokedToken.jti, RevokedToken.exp, RevokedToken.revoked_at).where(
+            RevokedToken.exp >= now
+        )
+        if self._watermark is not None:
+            query = query.where(RevokedToken.revoked_at >= self._watermark - self.overlap)
+        rows = session.execute(query).all()
+        with self._lock:
+            exp_by_jti = {jti: exp for jti, exp in self._exp_by_jti.items() if exp >= now}
+            for jti, exp, revoked_at in rows:
+                exp_by_jti[jti] = exp
+                if revoked_at is not None and (self._watermark is None or revoked_at > self._watermark):
+                    self._watermark = revoked_at
+            self._exp_by_jti = exp_by_jti
+            self._refreshed_at = time.monotonic()
+        Stats.gauge("api.revoked_token_cache.size", len(exp_by_jti))
+
+
+@cache
+def get_revoked_token_cache() -> RevokedTokenCache:
+    return RevokedTokenCache(
+        refresh_interval=conf.getfloat("api_auth", "revoked_token_cache_refresh_interval", fallback=0)
+    )
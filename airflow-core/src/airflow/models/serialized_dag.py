@@ -26,6 +26,7 @@ from datetime import datetime, timedelta
 from typing import TYPE_CHECKING, Any, Literal
 from uuid import UUID
 
+import msgspec
 import uuid6
 from sqlalchemy import JSON, ForeignKey, LargeBinary, String, Uuid, exists, select, tuple_, update
 from sqlalchemy.dialects.postgresql import JSONB
@@ -68,6 +69,60 @@ log = logging.getLogger(__name__)
 
 # If set to True, serialized DAGs is compressed before writing to DB,
 _COMPRESS_SERIALIZED_DAGS = conf.getboolean("core", "compress_serialized_dags", fallback=False)
+# Either "json" (the data column, or zlib-compressed JSON with compress_serialized_dags) or "msgpack"
+_STORAGE_FORMAT = conf.get("core", "serialized_dag_storage_format", fallback="json").lower()
+# If set to True, the operators of DAGs loaded from the DB are only deserialized when first accessed
+_LAZY_DESERIALIZE_TASKS = conf.getboolean("core", "lazy_deserialize_dag_tasks", fallback=False)
+
+# Rows stored in a binary format start with this header, followed by the name of their codec and ":".
+# zlib streams never start with a NUL byte, which tells them apart from rows of compressed JSON.
+_BINARY_HEADER = b"\x00airflow-sdag:"
+_msgpack_encoder = msgspec.msgpack.Encoder()
+_msgpack_decoder = msgspec.msgpack.Decoder()
+
+
+def _get_zstd():
+    """Return a module with zstd ``compress`` and ``decompress`` functions, or None if not installed."""
+    try:
+        from compression import zstd  # type: ignore[import-not-found]  # Python 3.14+
+    except ImportError:
+        try:
+            import zstandard as zstd
+        except ImportError:
+            return None
+    return zstd
+
+
+def _encode_dag_data(dag_data: dict) -> bytes:
+    """Encode serialized DAG data to msgpack, compressed with zstd if available or zlib otherwise."""
+    payload = _msgpack_encoder.encode(dag_data)
+    if zstd := _get_zstd():
+        return _BINARY_HEADER + b"msgpack+zstd:" + zstd.compress(payload)
+    return _BINARY_HEADER + b"msgpack+zlib:" + zlib.compress(payload)
+
+
+def _decompress_dag_data(data: bytes) -> tuple[str, bytes]:
+    """Return the encoding (``json`` or ``msgpack``) and the decompressed payload of a compressed row."""
+    if not data.startswith(_BINARY_HEADER):
+        return "json", zlib.decompress(data)
+    codec, _, compressed = data[len(_BINARY_HEADER) :].partition(b":")
+    if codec == b"msgpack+zlib":
+        return "msgpack", zlib.decompress(compressed)
+    if codec == b"msgpack+zstd":
+        if (zstd := _get_zstd()) is None:
+            raise RuntimeError(
+                "The serialized DAG is compressed with zstd, install the `zstandard` package to read it"
+            )
+        return "msgpack", zstd.decompress(compressed)
+    raise ValueError(f"Unknown serialized DAG codec: {codec.decode(errors='replace')!r}")
+
+
+def _decode_dag_data(data: bytes) -> dict:
+    """Decode the ``data_compressed`` column, written either as compressed JSON or in a binary format."""
+    encoding, payload = _decompress_dag_data(data)
+    if encoding == "msgpack":
+        return _msgpack_decoder.decode(payload)
+    return json.loads(payload)
 
 
 class _DagDependenciesResolver:
@@ -285,6 +340,8 @@ class SerializedDagModel(Base):
       to use a smaller interval such as 60
     * ``[core] compress_serialized_dags``:
       whether compressing the dag data to the Database.
+    * ``[core] serialized_dag_storage_format``:
+      whether the dag data is stored as JSON or as compressed msgpack.
 
     It is used by webserver to load dags
     because reading from database is lightweight compared to importing from files,
@@ -340,10 +397,12 @@ class SerializedDagModel(Base):
         dag_data = dag.data
         self.dag_hash = SerializedDagModel.hash(dag_data)
 
-        # partially ordered json data
-        dag_data_json = json.dumps(dag_data, sort_keys=True).encode("utf-8")
-
-        if _COMPRESS_SERIALIZED_DAGS:
+        if _STORAGE_FORMAT == "msgpack":
+            self._data = None
+            self._data_compressed = _encode_dag_data(dag_data)
+        elif _COMPRESS_SERIALIZED_DAGS:
+            # partially ordered json data
+            dag_data_json = json.dumps(dag_data, sort_keys=True).encode("utf-8")
             self._data = None
             self._data_compressed = zlib.compress(dag_data_json)
         else:
@@ -360,14 +419,15 @@ class SerializedDagModel(Base):
     @classmethod
     def hash(cls, dag_data):
         """Hash the data to get the dag_hash."""
-        dag_data = cls._sort_serialized_dag_dict(dag_data)
-        data_ = dag_data.copy()
+        # Sorting builds a new tree, so it can be modified without touching dag_data
+        data_ = cls._sort_serialized_dag_dict(dag_data)
         # Remove fileloc from the hash so changes to fileloc
         # does not affect the hash. In 3.0+, a combination of
         # bundle_path and relative fileloc more correctly determines the
         # dag file location.
         data_["dag"].pop("fileloc", None)
-        data_json = json.dumps(data_, sort_keys=True).encode("utf-8")
+        # Keys are already sorted, a single encoding pass gives the same bytes as sort_keys=True
+        data_json = json.dumps(data_).encode("utf-8")
         return md5(data_json).hexdigest()
 
     @classmethod
@@ -747,7 +807,7 @@ class SerializedDagModel(Base):
         # use __data_cache to avoid decompress and loads
         if not hasattr(self, "_SerializedDagModel__data_cache") or self.__data_cache is None:
             if self._data_compressed:
-                self.__data_cache = json.loads(zlib.decompress(self._data_compressed))
+                self.__data_cache = _decode_dag_data(self._data_compressed)
             else:
                 self.__data_cache = self._data
 
@@ -756,14 +816,15 @@ class SerializedDagModel(Base):
     @property
     def dag(self) -> SerializedDAG:
         """The DAG deserialized from the ``data`` column."""
-        DagSerialization._load_operator_extra_links = self.load_op_links
         if isinstance(self.data, dict):
             data = self.data
         elif isinstance(self.data, str):
             data = json.loads(self.data)
         else:
             raise ValueError("invalid or missing serialized DAG data")
-        return DagSerialization.from_dict(data)
+        return DagSerialization.from_dict(
+            data, lazy_tasks=_LAZY_DESERIALIZE_TASKS, load_op_links=self.load_op_links
+        )
 
     @classmethod
     @provide_session
@@ -805,7 +866,7 @@ class SerializedDagModel(Base):
         """
         load_json: Callable
         data_col_to_select: ColumnElement[Any] | InstrumentedAttribute[bytes | None]
-        if _COMPRESS_SERIALIZED_DAGS is False:
+        if _COMPRESS_SERIALIZED_DAGS is False and _STORAGE_FORMAT == "json":
             dialect = get_dialect_name(session)
             if dialect in ["sqlite", "mysql"]:
                 data_col_to_select = func.json_extract(cls._data, "$.dag.dag_dependencies")
@@ -824,7 +885,7 @@ class SerializedDagModel(Base):
             data_col_to_select = cls._data_compressed
 
             def load_json(deps_data):
-                return json.loads(zlib.decompress(deps_data))["dag"]["dag_dependencies"] if deps_data else []
+                return _decode_dag_data(deps_data)["dag"]["dag_dependencies"] if deps_data else []
 
         latest_sdag_subquery = (
             select(cls.dag_id, func.max(cls.created_at).label("max_created")).group_by(cls.dag_id).subquery()
@@ -16,9 +16,12 @@
 # under the License.
 from __future__ import annotations
 
+import bisect
 import datetime
+import hashlib
 import logging
-from collections.abc import Iterable
+from collections import defaultdict
+from collections.abc import Collection, Iterable
 from enum import Enum
 from functools import singledispatch
 from traceback import format_exception
@@ -37,7 +40,8 @@ from airflow.models.asset import AssetWatcherModel
 from airflow.models.base import Base
 from airflow.models.taskinstance import TaskInstance
 from airflow.triggers.base import BaseTaskEndEvent
-from airflow.utils.retries import run_with_db_retries
+from airflow.utils.helpers import chunks
+from airflow.utils.retries import retry_db_transaction, run_with_db_retries
 from airflow.utils.session import NEW_SESSION, provide_session
 from airflow.utils.sqlalchemy import UtcDateTime, get_dialect_name, with_row_locks
 from airflow.utils.state import TaskInstanceState
@@ -56,6 +60,9 @@ Internal use only.
 :meta private:
 """
 
+SUBMIT_BATCH_QUERY_SIZE = 500
+"""Maximum number of triggers whose task instances are looked up with one query when submitting events."""
+
 log = logging.getLogger(__name__)
 
 
@@ -264,27 +271,67 @@ class Trigger(Base):
         Resume all tasks that were in deferred state.
         Send an event to all assets associated to the trigger.
         """
-        # Resume deferred tasks
-        for task_instance in session.scalars(
-            select(TaskInstance).where(
-                TaskInstance.trigger_id == trigger_id, TaskInstance.state == TaskInstanceState.DEFERRED
-            )
-        ):
-            handle_event_submit(event, task_instance=task_instance, session=session)
+        cls._submit_events([(trigger_id, event)], session=session)
 
-        # Send an event to assets
-        trigger = session.scalars(select(cls).where(cls.id == trigger_id)).one_or_none()
-        if trigger is None:
-            # Already deleted for some reason
-            return
-        for asset in trigger.assets:
-            AssetManager.register_asset_change(
-                asset=asset.to_serialized(),
-                extra={"from_trigger": True, "payload": event.payload},
-                session=session,
-            )
-        if trigger.callback:
-            trigger.callback.handle_event(event, session)
+    @classmethod
+    def submit_events(
+        cls, events: Iterable[tuple[int, TriggerEvent]], session: Session | None = None
+    ) -> None:
+        """
+        Fire a batch of events, in order.
+
+        This is equivalent to calling :meth:`submit_event` for each event, but the deferred task
+        instances and the triggers of the whole batch are loaded with a query each. Without a session,
+        the batch is submitted in a transaction of its own, retried on database errors.
+        """
+        if session is None:
+            cls._submit_events_with_retries(list(events))
+        else:
+            cls._submit_events(events, session=session)
+
+    @classmethod
+    @provide_session
+    @retry_db_transaction
+    def _submit_events_with_retries(
+        cls, events: list[tuple[int, TriggerEvent]], session: Session = NEW_SESSION
+    ) -> None:
+        cls._submit_events(events, session=session)
+
+    @classmethod
+    def _submit_events(cls, events: Iterable[tuple[int, TriggerEvent]], *, session: Session) -> None:
+        for batch in chunks(list(events), SUBMIT_BATCH_QUERY_SIZE):
+            trigger_ids = {trigger_id for trigger_id, _ in batch}
+            deferred_tis = cls._get_deferred_task_instances(trigger_ids, session=session)
+            triggers = {
+                trigger.id: trigger
+                for trigger in session.scalars(
+                    select(cls)
+                    .where(cls.id.in_(trigger_ids))
+                    .options(
+                        selectinload(cls.asset_watchers).joinedload(AssetWatcherModel.asset),
+                        selectinload(cls.callback),
+                    )
+                )
+            }
+            for trigger_id, event in batch:
+                # Resume deferred tasks. Once resumed they no longer depend on the trigger, so any later
+                # event of the same trigger in the batch does not see them, as with separate submissions.
+                for task_instance in deferred_tis.pop(trigger_id, ()):
+                    handle_event_submit(event, task_instance=task_instance, session=session)
+
+                # Send an event to assets
+                trigger = triggers.get(trigger_id)
+                if trigger is None:
+                    # Already deleted for some reason
+                    continue
+                for asset in trigger.assets:
+                    AssetManager.register_asset_change(
+                        asset=asset.to_serialized(),
+                        extra={"from_trigger": True, "payload": event.payload},
+                        session=session,
+                    )
+                if trigger.callback:
+                    trigger.callback.handle_event(event, session)
 
     @classmethod
     @provide_session
@@ -300,26 +347,77 @@ class Trigger(Base):
         the runtime code understands as immediate-fail, and pack the error into
         next_kwargs.
         """
+        cls._submit_failures([(trigger_id, exc)], session=session)
+
+    @classmethod
+    def submit_failures(
+        cls,
+        failures: Iterable[tuple[int, BaseException | list[str] | str | None]],
+        session: Session | None = None,
+    ) -> None:
+        """
+        Fail the task instances depending on a batch of failed triggers.
+
+        This is equivalent to calling :meth:`submit_failure` for each failure, but the deferred task
+        instances of the whole batch are loaded with one query. Without a session, the batch is submitted
+        in a transaction of its own, retried on database errors.
+        """
+        if session is None:
+            cls._submit_failures_with_retries(list(failures))
+        else:
+            cls._submit_failures(failures, session=session)
+
+    @classmethod
+    @provide_session
+    @retry_db_transaction
+    def _submit_failures_with_retries(
+        cls,
+        failures: list[tuple[int, BaseException | list[str] | str | None]],
+        session: Session = NEW_SESSION,
+    ) -> None:
+        cls._submit_failures(failures, session=session)
+
+    @classmethod
+    def _submit_failures(
+        cls, failures: Iterable[tuple[int, BaseException | list[str] | str | None]], *, session: Session
+    ) -> None:
+        for batch in chunks(list(failures), SUBMIT_BATCH_QUERY_SIZE):
+            deferred_tis = cls._get_deferred_task_instances(
+                {trigger_id for trigger_id, _ in batch}, session=session
+            )
+            for trigger_id, exc in batch:
+                for task_instance in deferred_tis.pop(trigger_id, ()):
+                    # Add the error and set the next_method to the fail state
+                    if isinstance(exc, BaseException):
+                        traceback = format_exception(type(exc), exc, exc.__traceback__)
+                    else:
+                        traceback = exc
+                    task_instance.next_method = TRIGGER_FAIL_REPR
+                    task_instance.next_kwargs = {
+                        "error": TriggerFailureReason.TRIGGER_FAILURE,
+                        "traceback": traceback,
+                    }
+                    # Remove ourselves as its trigger
+                    task_instance.trigger_id = None
+                    # Finally, mark it as scheduled so it gets re-queued
+                    task_instance.state = TaskInstanceState.SCHEDULED
+                    task_instance.scheduled_dttm = timezone.utcnow()
+
+    @staticmethod
+    def _get_deferred_task_instances(
+        trigger_ids: Collection[int], *, session: Session
+    ) -> dict[int, list[TaskInstance]]:
+        """Return the task instances deferred on the given triggers, by trigger id."""
+        deferred_tis: dict[int, list[TaskInstance]] = defaultdict(list)
         for task_instance in session.scalars(
             select(TaskInstance).where(
-                TaskInstance.trigger_id == trigger_id, TaskInstance.state == TaskInstanceState.DEFERRED
+                TaskInstance.trigger_id.in_(trigger_ids), TaskInstance.state == TaskInstanceState.DEFERRED
             )
         ):
-            # Add the error and set the next_method to the fail state
-            if isinstance(exc, BaseException):
-                traceback = format_exception(type(exc), exc, exc.__traceback__)
-            else:
-                traceback = exc
-            task_instance.next_method = TRIGGER_FAIL_REPR
-            task_instance.next_kwargs = {
-                "error": TriggerFailureReason.TRIGGER_FAILURE,
-                "traceback": traceback,
-            }
-            # Remove ourselves as its trigger
-            task_instance.trigger_id = None
-            # Finally, mark it as scheduled so it gets re-queued
-            task_instance.state = TaskInstanceState.SCHEDULED
-            task_instance.scheduled_dttm = timezone.utcnow()
+            if TYPE_CHECKING:
+                assert task_instance.trigger_id is not None
+            deferred_tis[task_instance.trigger_id].append(task_instance)
+        return deferred_tis
 
     @classmethod
     @provide_session
@@ -346,6 +444,7 @@ class Trigger(Base):
         capacity,
         health_check_threshold,
         queues: set[str] | None = None,
+        sharded: bool = False,
         session: Session = NEW_SESSION,
     ) -> None:
         """
@@ -354,9 +453,23 @@ class Trigger(Base):
         Takes a triggerer_id, the capacity for that triggerer, the Triggerer job heartrate
         health check threshold, and the queues and assigns unassigned triggers until that
         capacity is reached, or there are no more unassigned triggers.
+
+        With ``sharded``, only the triggers of this triggerer's range of the hash ring of alive
+        triggerers are assigned, see :meth:`_assign_from_shard`.
         """
         from airflow.jobs.job import Job  # To avoid circular import
 
+        alive_triggerer_ids = select(Job.id).where(
+            Job.end_date.is_(None),
+            Job.latest_heartbeat > timezone.utcnow() - datetime.timedelta(seconds=health_check_threshold),
+            Job.job_type == "TriggererJob",
+        )
+
+        if sharded:
+            cls._assign_from_shard(triggerer_id, capacity, alive_triggerer_ids, queues, session)
+            session.commit()
+            return
+
         count = session.scalar(select(func.count(cls.id)).filter(cls.triggerer_id == triggerer_id))
         capacity -= count
 
@@ -368,12 +481,6 @@ class Trigger(Base):
             )
             return
 
-        alive_triggerer_ids = select(Job.id).where(
-            Job.end_date.is_(None),
-            Job.latest_heartbeat > timezone.utcnow() - datetime.timedelta(seconds=health_check_threshold),
-            Job.job_type == "TriggererJob",
-        )
-
         # Find triggers who do NOT have an alive triggerer_id, and then assign
         # up to `capacity` of those to us.
         trigger_ids_query = cls.get_sorted_triggers(
@@ -392,6 +499,113 @@ class Trigger(Base):
 
         session.commit()
 
+    @classmethod
+    def _assignment_queries(cls, alive_triggerer_ids: list[int] | Select) -> list[Select]:
+        """Return the queries selecting the ids of the triggers to assign, in the order to assign them."""
+        # Add triggers associated to callbacks first, then tasks, then assets
+        # It prioritizes callbacks, then DAGs over event driven scheduling which is fair
+        return [
+            # Callback triggers
+            select(cls.id)
+            .join(Callback, isouter=False)
+            .order_by(Callback.priority_weight.desc(), cls.created_date),
+            # Task Instance triggers
+            select(cls.id)
+            .prefix_with("STRAIGHT_JOIN", dialect="mysql")
+            .join(TaskInstance, cls.id == TaskInstance.trigger_id, isouter=False)
+            .where(or_(cls.triggerer_id.is_(None), cls.triggerer_id.not_in(alive_triggerer_ids)))
+            .order_by(coalesce(TaskInstance.priority_weight, 0).desc(), cls.created_date),
+            # Asset triggers
+            select(cls.id).where(cls.assets.any()).order_by(cls.created_date),
+        ]
+
+    @classmethod
+    def _assign_from_shard(
+        cls,
+        triggerer_id: int,
+        capacity: int,
+        alive_triggerer_ids: Select,
+        queues: set[str] | None,
+        session: Session,
+    ) -> None:
+        """
+        Assign the triggers of this triggerer's range of the hash ring of alive triggerers.
+
+        Each alive triggerer owns the triggers that :class:`TriggererHashRing` maps to it, so triggerers
+        do not compete for the same rows. When triggerers join or leave, the triggers whose owner changed
+        are handed back by their current triggerer and claimed by their new owner, at most
+        ``max_trigger_to_select_per_loop`` at a time. The triggers of a triggerer that is at capacity can
+        be claimed by any triggerer that has room for them.
+        """
+        alive = set(session.scalars(alive_triggerer_ids))
+        # We might not have heartbeated yet
+        alive.add(triggerer_id)
+        ring = TriggererHashRing(alive)
+        # Other triggerers' capacity is not recorded, assume it is the same as ours
+        load: dict[int, int] = defaultdict(int)
+        load.update(
+            session.execute(
+                select(cls.triggerer_id, func.count(cls.id))
+                .where(cls.triggerer_id.in_(alive))
+                .group_by(cls.triggerer_id)
+            ).all()
+        )
+
+        # Hand back the triggers of our range's neighbours, when they have room for them
+        to_release = []
+        for trigger_id in session.scalars(select(cls.id).where(cls.triggerer_id == triggerer_id)):
+            owner = ring.owner(trigger_id)
+            if owner != triggerer_id and load[owner] < capacity:
+                to_release.append(trigger_id)
+                load[owner] += 1
+                if len(to_release) >= cls.max_trigger_to_select_per_loop:
+                    break
+        if to_release:
+            session.execute(
+                update(cls)
+                .where(cls.id.in_(to_release), cls.triggerer_id == triggerer_id)
+                .values(triggerer_id=None)
+                .execution_options(synchronize_session=False)
+            )
+            load[triggerer_id] -= len(to_release)
+
+        remaining_capacity = min(capacity - load[triggerer_id], cls.max_trigger_to_select_per_loop)
+        if remaining_capacity <= 0:
+            log.info(
+                "Triggerer %s has reached the maximum capacity triggers assigned (%d). Not assigning any more triggers",
+                triggerer_id,
+                load[triggerer_id],
+            )
+            return
+
+        unassigned = or_(cls.triggerer_id.is_(None), cls.triggerer_id.not_in(alive_triggerer_ids))
+        # About one in len(alive) unassigned triggers is ours, don't read much more than we need
+        scan_limit = remaining_capacity * (len(alive) + 1) * 2
+        to_claim: list[int] = []
+        queue_filter = cls.queue.in_(queues) if queues else cls.queue.is_(None)
+        for query in cls._assignment_queries(alive_triggerer_ids):
+            for trigger_id in session.scalars(query.where(unassigned, queue_filter).limit(scan_limit)):
+                owner = ring.owner(trigger_id)
+                if (owner == triggerer_id or load[owner] >= capacity) and trigger_id not in to_claim:
+                    to_claim.append(trigger_id)
+                    if len(to_claim) >= remaining_capacity:
+                        break
+            if len(to_claim) >= remaining_capacity:
+                break
+
+        if to_claim:
+            locked_ids = session.scalars(
+                with_row_locks(
+                    select(cls.id).where(cls.id.in_(to_claim), unassigned), session, skip_locked=True
+                )
+            ).all()
+            session.execute(
+                update(cls)
+                .where(cls.id.in_(locked_ids))
+                .values(triggerer_id=triggerer_id)
+                .execution_options(synchronize_session=False)
+            )
+
     @classmethod
     def get_sorted_triggers(
         cls,
@@ -410,25 +624,8 @@ class Trigger(Base):
         """
         result: list[Row[Any]] = []
 
-        # Add triggers associated to callbacks first, then tasks, then assets
-        # It prioritizes callbacks, then DAGs over event driven scheduling which is fair
-        queries = [
-            # Callback triggers
-            select(cls.id)
-            .join(Callback, isouter=False)
-            .order_by(Callback.priority_weight.desc(), cls.created_date),
-            # Task Instance triggers
-            select(cls.id)
-            .prefix_with("STRAIGHT_JOIN", dialect="mysql")
-            .join(TaskInstance, cls.id == TaskInstance.trigger_id, isouter=False)
-            .where(or_(cls.triggerer_id.is_(None), cls.triggerer_id.not_in(alive_triggerer_ids)))
-            .order_by(coalesce(TaskInstance.priority_weight, 0).desc(), cls.created_date),
-            # Asset triggers
-            select(cls.id).where(cls.assets.any()).order_by(cls.created_date),
-        ]
-
         # Process each query while avoiding unnecessary queries when capacity is reached
-        for query in queries:
+        for query in cls._assignment_queries(alive_triggerer_ids):
             remaining_capacity = capacity - len(result)
             if remaining_capacity <= 0:
                 break
@@ -451,6 +648,37 @@ class Trigger(Base):
         return result
 
 
+class TriggererHashRing:
+    """
+    Consistent hash ring mapping trigger ids to triggerer job ids.
+
+    Each triggerer is placed at ``replicas`` points of the ring, and a trigger is owned by the triggerer
+    at the first point following the trigger's own hash. Adding or removing a triggerer only changes the
+    owner of the triggers in the ranges it gains or loses, about ``1 / len(triggerer_ids)`` of them.
+    """
+
+    def __init__(self, triggerer_ids: Iterable[int], replicas: int = 64):
+        points = sorted(
+            (self._hash(f"{triggerer_id}-{replica}"), triggerer_id)
+            for triggerer_id in triggerer_ids
+            for replica in range(replicas)
+        )
+        if not points:
+            raise ValueError("The hash ring needs at least one triggerer")
+        self._hashes = [point for point, _ in points]
+        self._owners = [owner for _, owner in points]
+
+    @staticmethod
+    def _hash(key: str) -> int:
+        # Must be stable across processes, which the built-in hash() of a str is not
+        return int.from_bytes(hashlib.blake2b(key.encode(), digest_size=8).digest(), "big")
+
+    def owner(self, trigger_id: int) -> int:
+        """Return the id of the triggerer owning the trigger."""
+        index = bisect.bisect(self._hashes, self._hash(str(trigger_id)))
+        return self._owners[index % len(self._owners)]
+
+
 @singledispatch
 def handle_event_submit(event: TriggerEvent, *, task_instance: TaskInstance, session: Session) -> None:
     """
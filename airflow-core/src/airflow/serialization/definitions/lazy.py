@@ -0,0 +1,107 @@
+#
+# Licensed to the Apache Software Foundation (ASF) under one
+# or more contributor license agreements.  See the NOTICE file
+# distributed with this work for additional information
+# regarding copyright ownership.  The ASF licenses this file
+# to you under the Apache License, Version 2.0 (the
+# "License"); you may not use this file except in compliance
+# with the License.  You may obtain a copy of the License at
+#
+#   http://www.apache.org/licenses/LICENSE-2.0
+#
+# Unless required by applicable law or agreed to in writing,
+# software distributed under the License is distributed on an
+# "AS IS" BASIS, WITHOUT WARRANTIES OR CONDITIONS OF ANY
+# KIND, either express or implied.  See the License for the
+# specific language governing permissions and limitations
+# under the License.
+
+"""Mappings whose values are deserialized on first access."""
+
+from __future__ import annotations
+
+import copy
+import threading
+from collections.abc import MutableMapping
+from typing import TYPE_CHECKING, Any
+
+if TYPE_CHECKING:
+    from collections.abc import Callable, Iterator
+
+
+class _Pending:
+    """Serialized form of a value of a :class:`LazyDict` that has not been loaded yet."""
+
+    __slots__ = ("data",)
+
+    def __init__(self, data: Any):
+        self.data = data
+
+
+class LazyDict(MutableMapping):
+    """
+    Dict-like mapping whose values are loaded from their serialized form on first access.
+
+    Keys, iteration order and membership are known upfront; loading a value is delegated to ``load``,
+    which is called at most once per key. A value is only stored once ``load`` returns, so other threads
+    never get it half loaded; ``load`` may put it in ``_loading`` first, for the lookups of the same key it
+    makes while loading it. Copies resolve their pending values through the original, so both hold the
+    same objects. Deep copies and pickles are plain dicts with every value loaded.
+    """
+
+    def __init__(self, load: Callable[[str, Any], Any]):
+        self._items: dict[str, Any] = {}
+        self._load = load
+        self._lock = threading.RLock()
+        # Values being loaded, only looked up by the thread loading them which holds the lock
+        self._loading: dict[str, Any] = {}
+
+    def add_pending(self, key: str, data: Any) -> None:
+        self._items[key] = _Pending(data)
+
+    def is_loaded(self, key: str) -> bool:
+        return not isinstance(self._items[key], _Pending)
+
+    def loaded_values(self) -> Iterator[Any]:
+        """Iterate over the values that have been loaded, without loading the others."""
+        return (value for value in self._items.values() if not isinstance(value, _Pending))
+
+    def __getitem__(self, key: str) -> Any:
+        value = self._items[key]
+        if isinstance(value, _Pending):
+            with self._lock:
+                value = self._items[key]
+                if isinstance(value, _Pending):
+                    if key in self._loading:
+                        return self._loading[key]
+                    value = self._items[key] = self._load(key, value.data)
+        return value
+
+    def __setitem__(self, key: str, value: Any) -> None:
+        self._items[key] = value
+
+    def __delitem__(self, key: str) -> None:
+        del self._items[key]
+
+    def __contains__(self, key: object) -> bool:
+        return key in self._items
+
+    def __iter__(self) -> Iterator[str]:
+        return iter(self._items)
+
+    def __len__(self) -> int:
+        return len(self._items)
+
+    def __repr__(self) -> str:
+        return f"<{type(self).__name__}: {len(self._items)} items>"
+
+    def __copy__(self) -> LazyDict:
+        copied = LazyDict(lambda key, _: self[key])
+        copied._items = dict(self._items)
+        return copied
+
+    def __deepcopy__(self, memo: dict[int, Any]) -> dict[str, Any]:
+        return copy.deepcopy(dict(self.items()), memo)
+
+    def __reduce__(self):
+        return dict, (dict(self.items()),)
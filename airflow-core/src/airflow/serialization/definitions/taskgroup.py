@@ -28,6 +28,7 @@ from typing import TYPE_CHECKING
 import attrs
 import methodtools
 
+from airflow.serialization.definitions.lazy import LazyDict
 from airflow.serialization.definitions.node import DAGNode
 
 if TYPE_CHECKING:
@@ -179,7 +180,9 @@ class SerializedTaskGroup(DAGNode):
             if not isinstance(node, SerializedTaskGroup):
                 return
             yield node.group_id, node
-            for child in node.children.values():
+            # Children that are not loaded yet are operators, see LazyDict
+            children = node.children
+            for child in children.loaded_values() if isinstance(children, LazyDict) else children.values():
                 yield from build_map(child)
 
         return dict(build_map(self))
@@ -19,9 +19,12 @@
 
 from __future__ import annotations
 
+import numbers
 import pkgutil
-from collections.abc import Iterable
-from typing import TYPE_CHECKING, Protocol
+import re
+from collections.abc import Callable, Iterable
+from functools import cache, cached_property
+from typing import TYPE_CHECKING, Any, Protocol
 
 from airflow.exceptions import AirflowException
 from airflow.settings import json
@@ -66,9 +69,301 @@ def load_dag_schema_dict() -> dict:
     return schema
 
 
+@cache
 def load_dag_schema() -> Validator:
-    """Load & Validate Json Schema for DAG."""
-    import jsonschema
+    """
+    Load & Validate Json Schema for DAG.
 
+    The validator is compiled once per process, and inherited by the processes forked from it.
+    """
     schema = load_dag_schema_dict()
-    return jsonschema.Draft7Validator(schema)
+    try:
+        return CompiledValidator(schema)
+    except UnsupportedSchemaError:
+        import jsonschema
+
+        return jsonschema.Draft7Validator(schema)
+
+
+class UnsupportedSchemaError(Exception):
+    """Raised when a schema uses a keyword which ``CompiledValidator`` cannot check."""
+
+
+class CompiledValidator:
+    """
+    Draft 7 JSON schema validator compiled to nested Python functions, for the keywords the DAG schema uses.
+
+    ``jsonschema`` walks the whole schema and yields the errors of each keyword for every value it validates,
+    which is slow on DAGs with thousands of tasks. This validator only checks whether a document is valid,
+    with a function per schema built once; the errors of invalid documents are then found by ``jsonschema``,
+    so they are the same as before.
+
+    :param schema: the JSON schema
+    :raises UnsupportedSchemaError: if the schema uses a keyword which cannot be compiled
+    """
+
+    def __init__(self, schema: dict) -> None:
+        self.schema = schema
+        self._is_valid = _SchemaCompiler(schema).compile(schema)
+
+    @cached_property
+    def _jsonschema_validator(self) -> Validator:
+        import jsonschema
+
+        return jsonschema.Draft7Validator(self.schema)
+
+    def is_valid(self, instance) -> bool:
+        """Check if the instance is valid under the current schema."""
+        return self._is_valid(instance)
+
+    def validate(self, instance, *args, **kwargs) -> None:
+        """Check if the instance is valid under the current schema, raising validation error if not."""
+        if args or kwargs or not self._is_valid(instance):
+            self._jsonschema_validator.validate(instance, *args, **kwargs)
+
+    def iter_errors(self, instance) -> Iterable[jsonschema.exceptions.ValidationError]:
+        """Lazily yield each of the validation errors in the given instance."""
+        if self._is_valid(instance):
+            return iter(())
+        return self._jsonschema_validator.iter_errors(instance)
+
+
+_Check = Callable[[Any], bool]
+
+_TYPE_CHECKS: dict[str, _Check] = {
+    "array": lambda instance: isinstance(instance, list),
+    "boolean": lambda instance: isinstance(instance, bool),
+    "integer": lambda instance: (
+        not isinstance(instance, bool)
+        and (isinstance(instance, int) or (isinstance(instance, float) and instance.is_integer()))
+    ),
+    "null": lambda instance: instance is None,
+    "number": lambda instance: not isinstance(instance, bool) and isinstance(instance, numbers.Number),
+    "object": lambda instance: isinstance(instance, dict),
+    "string": lambda instance: isinstance(instance, str),
+}
+
+# Draft 7 keywords which are not compiled; other unknown keywords are ignored, as by ``jsonschema``
+_UNSUPPORTED_KEYWORDS = frozenset(
+    {
+        "additionalItems",
+        "contains",
+        "else",
+        "if",
+        "multipleOf",
+        "propertyNames",
+        "then",
+        "uniqueItems",
+    }
+)
+
+
+def _always_valid(instance: Any) -> bool:
+    return True
+
+
+def _never_valid(instance: Any) -> bool:
+    return False
+
+
+def _equal(one: Any, two: Any) -> bool:
+    """Compare JSON values as ``jsonschema`` does: booleans are not equal to numbers."""
+    if isinstance(one, str) or isinstance(two, str):
+        return one == two
+    if isinstance(one, bool) or isinstance(two, bool):
+        return isinstance(one, bool) and isinstance(two, bool) and one == two
+    if isinstance(one, dict) and isinstance(two, dict):
+        return one.keys() == two.keys() and all(_equal(one[key], two[key]) for key in one)
+    if isinstance(one, list) and isinstance(two, list):
+        return len(one) == len(two) and all(_equal(a, b) for a, b in zip(one, two))
+    return one == two
+
+
+def _all_of(checks: list[_Check]) -> _Check:
+    if not checks:
+        return _always_valid
+    if len(checks) == 1:
+        return checks[0]
+
+    def check(instance: Any) -> bool:
+        for check_ in checks:
+            if not check_(instance):
+                return False
+        return True
+
+    return check
+
+
+class _SchemaCompiler:
+    """Compile a schema and the schemas it references to functions checking whether values are valid."""
+
+    def __init__(self, root: dict) -> None:
+        self.root = root
+        self._refs: dict[str, _Check] = {}
+        self._compiling: set[str] = set()
+
+    def compile(self, schema: dict | bool) -> _Check:
+        if schema is True:
+            return _always_valid
+        if schema is False:
+            return _never_valid
+        if not isinstance(schema, dict):
+            raise UnsupportedSchemaError(f"Invalid schema: {schema!r}")
+        if "$ref" in schema:
+            # In Draft 7, the keywords next to $ref are ignored
+            return self._compile_ref(schema["$ref"])
+        if unsupported := _UNSUPPORTED_KEYWORDS.intersection(schema):
+            raise UnsupportedSchemaError(f"Unsupported keywords: {sorted(unsupported)}")
+
+        checks: list[_Check] = []
+        if "type" in schema:
+            checks.append(self._compile_type(schema["type"]))
+        if "properties" in schema or "additionalProperties" in schema or "patternProperties" in schema:
+            checks.append(self._compile_properties(schema))
+        if "required" in schema:
+            checks.append(self._compile_required(schema["required"]))
+        if "dependencies" in schema:
+            checks.append(self._compile_dependencies(schema["dependencies"]))
+        if "items" in schema:
+            checks.append(self._compile_items(schema["items"]))
+        for keyword, combine in (("allOf", all), ("anyOf", any)):
+            if keyword in schema:
+                checks.append(self._compile_combination(schema[keyword], combine))
+        if "oneOf" in schema:
+            checks.append(self._compile_one_of(schema["oneOf"]))
+        if "not" in schema:
+            negated = self.compile(schema["not"])
+            checks.append(lambda instance: not negated(instance))
+        if "const" in schema:
+            const = schema["const"]
+            checks.append(lambda instance: _equal(instance, const))
+        if "enum" in schema:
+            enum = schema["enum"]
+            checks.append(lambda instance: any(_equal(instance, value) for value in enum))
+        checks.extend(self._compile_bounds(schema))
+        return _all_of(checks)
+
+    def _compile_ref(self, ref: str) -> _Check:
+        refs = self._refs
+        if ref in self._compiling:
+            # A schema referencing itself: the function is only looked up when checking values
+            return lambda instance: refs[ref](instance)
+        if ref not in refs:
+            if not ref.startswith("#"):
+                raise UnsupportedSchemaError(f"Unsupported reference: {ref}")
+            target: Any = self.root
+            try:
+                for part in ref[1:].split("/")[1:]:
+                    part = part.replace("~1", "/").replace("~0", "~")
+                    target = target[int(part)] if isinstance(target, list) else target[part]
+            except (KeyError, IndexError, ValueError):
+                raise UnsupportedSchemaError(f"Unresolvable reference: {ref}") from None
+            self._compiling.add(ref)
+            try:
+                refs[ref] = self.compile(target)
+            finally:
+                self._compiling.discard(ref)
+        return refs[ref]
+
+    def _compile_type(self, types: str | list[str]) -> _Check:
+        type_names = [types] if isinstance(types, str) else types
+        if unknown := set(type_names) - _TYPE_CHECKS.keys():
+            raise UnsupportedSchemaError(f"Unknown types: {sorted(unknown)}")
+        if len(type_names) == 1:
+            return _TYPE_CHECKS[type_names[0]]
+        type_checks = [_TYPE_CHECKS[type_] for type_ in type_names]
+        return lambda instance: any(type_check(instance) for type_check in type_checks)
+
+    def _compile_properties(self, schema: dict) -> _Check:
+        properties = {name: self.compile(value) for name, value in schema.get("properties", {}).items()}
+        patterns = [
+            (re.compile(pattern), self.compile(value))
+            for pattern, value in schema.get("patternProperties", {}).items()
+        ]
+        additional = self.compile(schema.get("additionalProperties", True))
+
+        def check(instance: Any) -> bool:
+            if not isinstance(instance, dict):
+                return True
+            for name, value in instance.items():
+                matched = False
+                if (property_check := properties.get(name)) is not None:
+                    if not property_check(value):
+                        return False
+                    matched = True
+                for pattern, pattern_check in patterns:
+                    if pattern.search(name):
+                        if not pattern_check(value):
+                            return False
+                        matched = True
+                if not matched and additional is not _always_valid and not additional(value):
+                    return False
+            return True
+
+        return check
+
+    def _compile_required(self, required: list[str]) -> _Check:
+        return lambda instance: not isinstance(instance, dict) or all(name in instance for name in required)
+
+    def _compile_dependencies(self, dependencies: dict) -> _Check:
+        compiled = {
+            name: (
+                self._compile_required(dependency)
+                if isinstance(dependency, list)
+                else self.compile(dependency)
+            )
+            for name, dependency in dependencies.items()
+        }
+
+        def check(instance: Any) -> bool:
+            if not isinstance(instance, dict):
+                return True
+            return all(dependency(instance) for name, dependency in compiled.items() if name in instance)
+
+        return check
+
+    def _compile_items(self, items: dict | bool | list) -> _Check:
+        if isinstance(items, list):
+            positional = [self.compile(item) for item in items]
+            return lambda instance: not isinstance(instance, list) or all(
+                item_check(item) for item_check, item in zip(positional, instance)
+            )
+        item_check = self.compile(items)
+        return lambda instance: not isinstance(instance, list) or all(item_check(item) for item in instance)
+
+    def _compile_combination(self, schemas: list, combine: Callable[[Iterable[bool]], bool]) -> _Check:
+        checks = [self.compile(schema) for schema in schemas]
+        return lambda instance: combine(check(instance) for check in checks)
+
+    def _compile_one_of(self, schemas: list) -> _Check:
+        checks = [self.compile(schema) for schema in schemas]
+        return lambda instance: sum(1 for check in checks if check(instance)) == 1
+
+    def _compile_bounds(self, schema: dict) -> list[_Check]:
+        checks: list[_Check] = []
+        for keyword, applies, is_within in _BOUNDS:
+            if keyword in schema:
+                bound = schema[keyword]
+                checks.append(
+                    lambda instance, applies=applies, is_within=is_within, bound=bound: (
+                        not applies(instance) or is_within(instance, bound)
+                    )
+                )
+        if "pattern" in schema:
+            pattern = re.compile(schema["pattern"])
+            checks.append(lambda instance: not isinstance(instance, str) or bool(pattern.search(instance)))
+        return checks
+
+
+_BOUNDS: list[tuple[str, _Check, Callable[[Any, Any], bool]]] = [
+    ("minimum", _TYPE_CHECKS["number"], lambda instance, bound: instance >= bound),
+    ("maximum", _TYPE_CHECKS["number"], lambda instance, bound: instance <= bound),
+    ("exclusiveMinimum", _TYPE_CHECKS["number"], lambda instance, bound: instance > bound),
+    ("exclusiveMaximum", _TYPE_CHECKS["number"], lambda instance, bound: instance < bound),
+    ("minItems", _TYPE_CHECKS["array"], lambda instance, bound: len(instance) >= bound),
+    ("maxItems", _TYPE_CHECKS["array"], lambda instance, bound: len(instance) <= bound),
+    ("minLength", _TYPE_CHECKS["string"], lambda instance, bound: len(instance) >= bound),
+    ("maxLength", _TYPE_CHECKS["string"], lambda instance, bound: len(instance) <= bound),
+    ("minProperties", _TYPE_CHECKS["object"], lambda instance, bound: len(instance) >= bound),
+    ("maxProperties", _TYPE_CHECKS["object"], lambda instance, bound: len(instance) <= bound),
+]
@@ -27,6 +27,7 @@ import enum
 import itertools
 import logging
 import math
+import random
 import sys
 import weakref
 from collections.abc import Collection, Iterable, Mapping
@@ -44,6 +45,7 @@ from pendulum.tz.timezone import FixedTimezone, Timezone
 from airflow._shared.module_loading import import_string, qualname
 from airflow._shared.timezones.timezone import from_timestamp, parse_timezone, utcnow
 from airflow.callbacks.callback_requests import DagCallbackRequest, TaskCallbackRequest
+from airflow.configuration import conf
 from airflow.exceptions import AirflowException, DeserializationError, SerializationError
 from airflow.models.connection import Connection
 from airflow.models.expandinput import SchedulerMappedArgument, create_expand_input
@@ -80,6 +82,7 @@ from airflow.serialization.definitions.assets import (
 from airflow.serialization.definitions.baseoperator import SerializedBaseOperator
 from airflow.serialization.definitions.dag import SerializedDAG
 from airflow.serialization.definitions.deadline import SerializedDeadlineAlert
+from airflow.serialization.definitions.lazy import LazyDict
 from airflow.serialization.definitions.node import DAGNode
 from airflow.serialization.definitions.operatorlink import XComOperatorLink
 from airflow.serialization.definitions.param import SerializedParam, SerializedParamsDict
@@ -109,6 +112,7 @@ from airflow.timetables.base import DagRunInfo, Timetable
 from airflow.triggers.base import BaseTrigger, StartTriggerArgs
 from airflow.utils.code_utils import get_python_source
 from airflow.utils.db import LazySelectSequence
+from airflow.utils.hashlib_wrapper import md5
 
 if TYPE_CHECKING:
     from inspect import Parameter
@@ -1069,6 +1073,7 @@ class OperatorSerialization(DAGNode, BaseSerialization):
         op: SerializedOperator,
         encoded_op: dict[str, Any],
         client_defaults: dict[str, Any] | None = None,
+        load_op_links: bool | None = None,
     ) -> None:
         """
         Populate operator attributes with serialized values.
@@ -1077,7 +1082,11 @@ class OperatorSerialization(DAGNode, BaseSerialization):
         DAG. Setting references (such as ``op.dag`` and task dependencies) is
         done in ``set_task_dag_references`` instead, which is called after the
         DAG is hydrated.
+
+        :param load_op_links: Load the extra operator links, defaults to ``_load_operator_extra_links``.
         """
+        if load_op_links is None:
+            load_op_links = cls._load_operator_extra_links
         # Apply defaults by merging them into encoded_op BEFORE main deserialization
         encoded_op = cls._apply_defaults_to_encoded_op(encoded_op, client_defaults)
 
@@ -1087,7 +1096,7 @@ class OperatorSerialization(DAGNode, BaseSerialization):
         op_extra_links_from_plugin = {}
 
         # We don't want to load Extra Operator links in Scheduler
-        if cls._load_operator_extra_links:
+        if load_op_links:
             from airflow import plugins_manager
 
             for ope in plugins_manager.get_operator_extra_links():
@@ -1118,7 +1127,7 @@ class OperatorSerialization(DAGNode, BaseSerialization):
             if k in encoded_op.get("template_fields", []):
                 pass  # Template fields are handled separately
             elif k == "_operator_extra_links":
-                if cls._load_operator_extra_links:
+                if load_op_links:
                     op_predefined_extra_links = cls._deserialize_operator_extra_links(v)
 
                     # If OperatorLinks with the same name exists, Links via Plugin have higher precedence
@@ -1220,6 +1229,15 @@ class OperatorSerialization(DAGNode, BaseSerialization):
         ``populate_operator``. This function further fixes object references
         that were not possible before the task's containing DAG is hydrated.
         """
+        OperatorSerialization._set_task_dag_attributes(task, dag)
+
+        for task_id in task.downstream_task_ids:
+            # Bypass set_upstream etc here - it does more than we want
+            dag.task_dict[task_id].upstream_task_ids.add(task.task_id)
+
+    @staticmethod
+    def _set_task_dag_attributes(task: SerializedOperator | MappedOperator, dag: SerializedDAG) -> None:
+        """Set the attributes of an operator that come from its DAG, without touching other tasks."""
         task.dag = dag
 
         for date_attr in ("start_date", "end_date"):
@@ -1231,10 +1249,6 @@ class OperatorSerialization(DAGNode, BaseSerialization):
             if isinstance(kwargs_ref := getattr(task, k, None), _ExpandInputRef):
                 setattr(task, k, kwargs_ref.deref(dag))
 
-        for task_id in task.downstream_task_ids:
-            # Bypass set_upstream etc here - it does more than we want
-            dag.task_dict[task_id].upstream_task_ids.add(task.task_id)
-
     @classmethod
     def get_operator_const_fields(cls) -> set[str]:
         """Get the set of operator fields that are marked as const in the JSON schema."""
@@ -1272,6 +1286,7 @@ class OperatorSerialization(DAGNode, BaseSerialization):
         cls,
         encoded_op: dict[str, Any],
         client_defaults: dict[str, Any] | None = None,
+        load_op_links: bool | None = None,
     ) -> SerializedOperator:
         """Deserializes an operator from a JSON object."""
         op: SerializedOperator
@@ -1312,7 +1327,7 @@ class OperatorSerialization(DAGNode, BaseSerialization):
         else:
             op = SerializedBaseOperator(task_id=encoded_op["task_id"])
 
-        cls.populate_operator(op, encoded_op, client_defaults)
+        cls.populate_operator(op, encoded_op, client_defaults, load_op_links)
 
         return op
 
@@ -1669,6 +1684,55 @@ class OperatorSerialization(DAGNode, BaseSerialization):
         return result
 
 
+class _LazyTaskDict(LazyDict):
+    """
+    Task dict of a lazily deserialized DAG.
+
+    Only an index of the task ids, the upstream relations and the task groups of the tasks is built
+    upfront; each operator is deserialized on first access. The serialized operators are kept until then.
+    """
+
+    def __init__(
+        self,
+        dag: SerializedDAG,
+        encoded_tasks: Iterable[dict],
+        client_defaults: dict | None,
+        load_op_links: bool,
+    ):
+        super().__init__(self._load_task)
+        self.dag = dag
+        self.client_defaults = client_defaults
+        self.load_op_links = load_op_links
+        self.task_groups: dict[str, SerializedTaskGroup] = {}
+        self._upstream_task_ids: dict[str, set[str]] = {}
+        for obj in encoded_tasks:
+            if obj.get(Encoding.TYPE) != DAT.OP:
+                continue
+            encoded_op = obj[Encoding.VAR]
+            task_id = encoded_op["task_id"]
+            self.add_pending(task_id, encoded_op)
+            downstream = encoded_op.get("downstream_task_ids", encoded_op.get("_downstream_task_ids"))
+            for downstream_task_id in downstream or ():
+                self._upstream_task_ids.setdefault(downstream_task_id, set()).add(task_id)
+
+    def _load_task(self, task_id: str, encoded_op: dict) -> SerializedOperator:
+        try:
+            op = OperatorSerialization.deserialize_operator(
+                encoded_op, self.client_defaults, self.load_op_links
+            )
+            # Resolving the references to the DAG may look this task up again
+            self._loading[task_id] = op
+            if (group := self.task_groups.get(task_id)) is not None:
+                op.task_group = weakref.proxy(group)
+            op.upstream_task_ids.update(self._upstream_task_ids.get(task_id, ()))
+            OperatorSerialization._set_task_dag_attributes(op, self.dag)
+        except Exception as err:
+            raise DeserializationError(self.dag.dag_id) from err
+        finally:
+            self._loading.pop(task_id, None)
+        return op
+
+
 class DagSerialization(BaseSerialization):
     """Logic to encode a ``DAG`` object and decode the data into ``SerializedDAG``."""
 
@@ -1690,6 +1754,11 @@ class DagSerialization(BaseSerialization):
 
     _json_schema: ClassVar[Validator] = lazy_object_proxy.Proxy(load_dag_schema)
 
+    # Digest of the serialization of each DAG last validated by this process. DAG processor processes parse
+    # the same files again and again, and a DAG serialized the same way as when validated is not validated
+    # again.
+    _validated_digests: ClassVar[dict[str, bytes]] = {}
+
     @classmethod
     def serialize_dag(cls, dag: DAG) -> dict:
         """Serialize a DAG into a JSON object."""
@@ -1754,9 +1823,18 @@ class DagSerialization(BaseSerialization):
 
     @classmethod
     def deserialize_dag(
-        cls, encoded_dag: dict[str, Any], client_defaults: dict[str, Any] | None = None
+        cls,
+        encoded_dag: dict[str, Any],
+        client_defaults: dict[str, Any] | None = None,
+        lazy_tasks: bool = False,
+        load_op_links: bool | None = None,
     ) -> SerializedDAG:
-        """Deserializes a DAG from a JSON object."""
+        """
+        Deserializes a DAG from a JSON object.
+
+        :param lazy_tasks: Deserialize each operator on first access instead of all of them upfront.
+        :param load_op_links: Load the extra operator links, defaults to ``_load_operator_extra_links``.
+        """
         if "dag_id" not in encoded_dag:
             raise DeserializationError(
                 message="Encoded dag object has no dag_id key. "
@@ -1766,7 +1844,7 @@ class DagSerialization(BaseSerialization):
         dag_id = encoded_dag["dag_id"]
 
         try:
-            return cls._deserialize_dag_internal(encoded_dag, client_defaults)
+            return cls._deserialize_dag_internal(encoded_dag, client_defaults, lazy_tasks, load_op_links)
         except (TimetableNotRegistered, DeserializationError):
             # Let specific errors bubble up unchanged
             raise
@@ -1776,9 +1854,15 @@ class DagSerialization(BaseSerialization):
 
     @classmethod
     def _deserialize_dag_internal(
-        cls, encoded_dag: dict[str, Any], client_defaults: dict[str, Any] | None = None
+        cls,
+        encoded_dag: dict[str, Any],
+        client_defaults: dict[str, Any] | None = None,
+        lazy_tasks: bool = False,
+        load_op_links: bool | None = None,
     ) -> SerializedDAG:
         """Handle the main Dag deserialization logic."""
+        if load_op_links is None:
+            load_op_links = cls._load_operator_extra_links
         dag = SerializedDAG(dag_id=encoded_dag["dag_id"])
         dag.last_loaded = utcnow()
 
@@ -1790,12 +1874,17 @@ class DagSerialization(BaseSerialization):
             if k == "_downstream_task_ids":
                 v = set(v)
             elif k == "tasks":
-                OperatorSerialization._load_operator_extra_links = cls._load_operator_extra_links
-                tasks = {}
-                for obj in v:
-                    if obj.get(Encoding.TYPE) == DAT.OP:
-                        deser = OperatorSerialization.deserialize_operator(obj[Encoding.VAR], client_defaults)
-                        tasks[deser.task_id] = deser
+                tasks: dict[str, SerializedOperator] | _LazyTaskDict
+                if lazy_tasks:
+                    tasks = _LazyTaskDict(dag, v, client_defaults, load_op_links)
+                else:
+                    tasks = {}
+                    for obj in v:
+                        if obj.get(Encoding.TYPE) == DAT.OP:
+                            deser = OperatorSerialization.deserialize_operator(
+                                obj[Encoding.VAR], client_defaults, load_op_links
+                            )
+                            tasks[deser.task_id] = deser
                 k = "task_dict"
                 v = tasks
             elif k == "timezone":
@@ -1864,8 +1953,9 @@ class DagSerialization(BaseSerialization):
         for k in keys_to_set_none:
             setattr(dag, k, None)
 
-        for t in dag.task_dict.values():
-            OperatorSerialization.set_task_dag_references(t, dag)
+        if not isinstance(dag.task_dict, _LazyTaskDict):
+            for t in dag.task_dict.values():
+                OperatorSerialization.set_task_dag_references(t, dag)
 
         return dag
 
@@ -1925,9 +2015,22 @@ class DagSerialization(BaseSerialization):
             json_dict["client_defaults"] = {"tasks": client_defaults}
 
         # Validate Serialized DAG with Json Schema. Raises Error if it mismatches
-        cls.validate_schema(json_dict)
+        sample_rate = conf.getfloat("core", "serialized_dag_schema_validation_sample_rate", fallback=1.0)
+        if sample_rate >= 1 or random.random() < sample_rate:
+            cls._validate_schema_if_changed(json_dict)
         return json_dict
 
+    @classmethod
+    def _validate_schema_if_changed(cls, json_dict: dict) -> None:
+        """Validate a serialized DAG, unless this process already validated the same serialization."""
+        dag_id = json_dict["dag"]["dag_id"]
+        # Encoding is much cheaper than validating, and within a process a DAG is always encoded the same way
+        digest = md5(json.dumps(json_dict).encode("utf-8")).digest()
+        if cls._validated_digests.get(dag_id) == digest:
+            return
+        cls.validate_schema(json_dict)
+        cls._validated_digests[dag_id] = digest
+
     @staticmethod
     def conversion_v1_to_v2(ser_obj: dict):
         dag_dict = ser_obj["dag"]
@@ -2066,8 +2169,15 @@ class DagSerialization(BaseSerialization):
         ser_obj["__version"] = 3
 
     @classmethod
-    def from_dict(cls, serialized_obj: dict) -> SerializedDAG:
-        """Deserializes a python dict in to the DAG and operators it contains."""
+    def from_dict(
+        cls, serialized_obj: dict, lazy_tasks: bool = False, load_op_links: bool | None = None
+    ) -> SerializedDAG:
+        """
+        Deserializes a python dict in to the DAG and operators it contains.
+
+        :param lazy_tasks: Deserialize each operator on first access instead of all of them upfront.
+        :param load_op_links: Load the extra operator links, defaults to ``_load_operator_extra_links``.
+        """
         ver = serialized_obj.get("__version", "<not present>")
         if ver not in (1, 2, 3):
             raise ValueError(f"Unsure how to deserialize version {ver!r}")
@@ -2080,7 +2190,7 @@ class DagSerialization(BaseSerialization):
         client_defaults = serialized_obj.get("client_defaults", {})
 
         # Pass client_defaults directly to deserialize_dag
-        return cls.deserialize_dag(serialized_obj["dag"], client_defaults)
+        return cls.deserialize_dag(serialized_obj["dag"], client_defaults, lazy_tasks, load_op_links)
 
 
 class TaskGroupSerialization(BaseSerialization):
@@ -2145,6 +2255,19 @@ class TaskGroupSerialization(BaseSerialization):
                 **kwargs,
             )
 
+        if isinstance(task_dict, _LazyTaskDict):
+            # Operators are resolved through the task dict, which sets their task group when loading them
+            children = LazyDict(lambda label, task_id: task_dict[task_id])
+            for label, (_type, val) in sorted(encoded_group["children"].items()):
+                if _type == DAT.OP:
+                    task_dict.task_groups[val] = group
+                    children.add_pending(label, val)
+                else:
+                    children[label] = cls.deserialize_task_group(val, group, task_dict, dag=dag)
+            group.children = cast("dict[str, DAGNode]", children)
+            cls._set_task_group_relations(group, encoded_group)
+            return group
+
         def set_ref(task: SerializedOperator) -> SerializedOperator:
             task.task_group = weakref.proxy(group)
             return task
@@ -2157,11 +2280,15 @@ class TaskGroupSerialization(BaseSerialization):
             )
             for label, (_type, val) in sorted(encoded_group["children"].items())
         }
+        cls._set_task_group_relations(group, encoded_group)
+        return group
+
+    @classmethod
+    def _set_task_group_relations(cls, group: SerializedTaskGroup, encoded_group: dict[str, Any]) -> None:
         group.upstream_group_ids.update(cls.deserialize(encoded_group["upstream_group_ids"]))
         group.downstream_group_ids.update(cls.deserialize(encoded_group["downstream_group_ids"]))
         group.upstream_task_ids.update(cls.deserialize(encoded_group["upstream_task_ids"]))
         group.downstream_task_ids.update(cls.deserialize(encoded_group["downstream_task_ids"]))
-        return group
 
 
 @cache
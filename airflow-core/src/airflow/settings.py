@@ -347,7 +347,24 @@ def _get_connect_args(mode: Literal["sync", "async"]) -> Any:
     return {}
 
 
-def _configure_async_session() -> None:
+# Engine args of the sync engine which also apply to the async engine. The others are specific to the
+# sync DB API driver.
+_ASYNC_ENGINE_ARGS = frozenset(
+    {"pool_size", "max_overflow", "pool_recycle", "pool_pre_ping", "isolation_level"}
+)
+
+
+def _prepare_async_engine_args(disable_connection_pool: bool = False) -> dict[str, Any]:
+    """Prepare the args of the async engine, with the same pool settings as the sync engine."""
+    engine_args = prepare_engine_args(disable_connection_pool)
+    async_engine_args = {key: value for key, value in engine_args.items() if key in _ASYNC_ENGINE_ARGS}
+    # Other pool classes cannot be used by an async engine, which uses its own async adapted queue pool
+    if engine_args.get("poolclass") is NullPool:
+        async_engine_args["poolclass"] = NullPool
+    return async_engine_args
+
+
+def _configure_async_session(disable_connection_pool: bool = False) -> None:
     """
     Configure async SQLAlchemy session.
 
@@ -365,6 +382,7 @@ def _configure_async_session() -> None:
     async_engine = create_async_engine(
         SQL_ALCHEMY_CONN_ASYNC,
         connect_args=_get_connect_args("async"),
+        **_prepare_async_engine_args(disable_connection_pool),
         future=True,
     )
     AsyncSession = async_sessionmaker(
@@ -412,7 +430,7 @@ def configure_orm(disable_connection_pool=False, pool_class=None):
         **engine_args,
         future=True,
     )
-    _configure_async_session()
+    _configure_async_session(disable_connection_pool)
     mask_secret(engine.url.password)
     setup_event_handlers(engine)
 
@@ -595,10 +613,18 @@ def _configure_secrets_masker():
         DEFAULT_SENSITIVE_FIELDS,
         _secrets_masker as secrets_masker_core,
     )
+    from airflow._shared.secrets_masker.replacers import REPLACER_CLASSES
     from airflow.configuration import conf
+    from airflow.exceptions import AirflowConfigException
 
     min_length_to_mask = conf.getint("logging", "min_length_masked_secret", fallback=5)
     secret_mask_adapter = conf.getimport("logging", "secret_mask_adapter", fallback=None)
+    masking_engine = conf.get("logging", "secret_masking_engine", fallback="trie")
+    if masking_engine not in REPLACER_CLASSES:
+        raise AirflowConfigException(
+            f"Invalid value {masking_engine!r} for [logging] secret_masking_engine, "
+            f"expected one of {sorted(REPLACER_CLASSES)}"
+        )
     sensitive_fields = DEFAULT_SENSITIVE_FIELDS.copy()
     sensitive_variable_fields = conf.get("core", "sensitive_var_conn_names")
     if sensitive_variable_fields:
@@ -610,6 +636,7 @@ def _configure_secrets_masker():
     core_masker.min_length_to_mask = min_length_to_mask
     core_masker.sensitive_variables_fields = list(sensitive_fields)
     core_masker.secret_mask_adapter = secret_mask_adapter
+    core_masker.masking_engine = masking_engine
     core_masker.hide_sensitive_var_conn_fields = hide_sensitive_var_conn_fields
 
     from airflow.sdk._shared.secrets_masker import _secrets_masker as sdk_secrets_masker
@@ -618,6 +645,7 @@ def _configure_secrets_masker():
     sdk_masker.min_length_to_mask = min_length_to_mask
     sdk_masker.sensitive_variables_fields = list(sensitive_fields)
     sdk_masker.secret_mask_adapter = secret_mask_adapter
+    sdk_masker.masking_engine = masking_engine
     sdk_masker.hide_sensitive_var_conn_fields = hide_sensitive_var_conn_fields
 
 
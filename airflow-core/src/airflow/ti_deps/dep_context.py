@@ -18,7 +18,8 @@
 from __future__ import annotations
 
 import contextlib
-from typing import TYPE_CHECKING
+from collections import Counter
+from typing import TYPE_CHECKING, Any
 
 import attr
 
@@ -67,6 +68,10 @@ class DepContext:
         trigger rule
     :param ignore_ti_state: Ignore the task instance's previous failure/success
     :param finished_tis: A list of all the finished task instances of this run
+    :param batch_upstream_states: Count the states of the finished task instances per task once and
+        share the counts, and the number of upstream task instances, between all the task instances
+        evaluated with this context, instead of scanning ``finished_tis`` for each of them. Only
+        task instances outside of mapped task groups use the shared counts.
     """
 
     deps: set = attr.ib(factory=set)
@@ -81,10 +86,17 @@ class DepContext:
     ignore_unmapped_tasks: bool = False
     finished_tis: list[TaskInstance] | None = None
     description: str | None = None
+    batch_upstream_states: bool = False
 
     have_changed_ti_states: bool = False
     """Have any of the TIs state's been changed as a result of evaluating dependencies"""
 
+    finished_ti_state_counts: dict[str, Counter[str]] | None = attr.ib(default=None, init=False)
+    """States of ``finished_tis`` counted per task id, if ``batch_upstream_states`` is set"""
+
+    upstream_ti_counts: dict[frozenset[str], Any] = attr.ib(factory=dict, init=False)
+    """Number of task instances per task id of a set of upstream tasks, if ``batch_upstream_states`` is set"""
+
     def ensure_finished_tis(self, dag_run: DagRun, session: Session) -> list[TaskInstance]:
         """
         Ensure finished_tis is populated if it's currently None, which allows running tasks without dag_run.
@@ -103,3 +115,22 @@ class DepContext:
         else:
             finished_tis = self.finished_tis
         return finished_tis
+
+    def ensure_finished_ti_state_counts(self, dag_run: DagRun, session: Session) -> dict[str, Counter[str]]:
+        """
+        Count the states of the finished task instances of the run per task id.
+
+        :param dag_run: The DagRun for which to find finished tasks
+        :return: A mapping of task ids to the number of their finished task instances in each state
+        """
+        if self.finished_ti_state_counts is None:
+            counts: dict[str, Counter[str]] = {}
+            for ti in self.ensure_finished_tis(dag_run, session):
+                counts.setdefault(ti.task_id, Counter())[ti.state] += 1
+            self.finished_ti_state_counts = counts
+        return self.finished_ti_state_counts
+
+    def reset_upstream_state_counts(self) -> None:
+        """Discard the shared counts, e.g. after task instances were added or their state was changed."""
+        self.finished_ti_state_counts = None
+        self.upstream_ti_counts.clear()
@@ -90,6 +90,38 @@ class _UpstreamTIStates(NamedTuple):
             skipped_setup=setup_counter.get(TaskInstanceState.SKIPPED, 0),
         )
 
+    @classmethod
+    def calculate_from_counts(
+        cls, state_counts: Mapping[str, Counter[str]], upstream_tasks: Mapping[str, Operator]
+    ) -> _UpstreamTIStates:
+        """
+        Calculate states for a task instance from the states of the finished tis counted per task id.
+
+        This gives the same result as ``calculate`` over all the finished tis of ``upstream_tasks``,
+        in time proportional to the number of upstream tasks rather than of finished tis.
+
+        :param state_counts: states of the finished tis of the dag_run, counted per task id
+        :param upstream_tasks: the upstream tasks of the task instance, by task id
+        """
+        counter: Counter[str] = Counter()
+        setup_counter: Counter[str] = Counter()
+        for task_id, task in upstream_tasks.items():
+            if (task_counter := state_counts.get(task_id)) is None:
+                continue
+            counter.update(task_counter)
+            if task.is_setup:
+                setup_counter.update(task_counter)
+        return _UpstreamTIStates(
+            success=counter.get(TaskInstanceState.SUCCESS, 0),
+            skipped=counter.get(TaskInstanceState.SKIPPED, 0),
+            failed=counter.get(TaskInstanceState.FAILED, 0),
+            upstream_failed=counter.get(TaskInstanceState.UPSTREAM_FAILED, 0),
+            removed=counter.get(TaskInstanceState.REMOVED, 0),
+            done=sum(counter.values()),
+            success_setup=setup_counter.get(TaskInstanceState.SUCCESS, 0),
+            skipped_setup=setup_counter.get(TaskInstanceState.SKIPPED, 0),
+        )
+
 
 class TriggerRuleDep(BaseTIDep):
     """Determines if a task's upstream tasks are in a state that allows a given task instance to run."""
@@ -255,6 +287,40 @@ class TriggerRuleDep(BaseTIDep):
                 else:
                     yield and_(TaskInstance.task_id == upstream_id, TaskInstance.map_index == map_indexes)
 
+        def _uses_batched_upstream_states() -> bool:
+            # Outside of mapped task groups every ti of an upstream task is relevant, so the upstream
+            # states only depend on the task and can be shared between its tis.
+            return dep_context.batch_upstream_states and task.get_closest_mapped_task_group() is None
+
+        def _calculate_upstream_states(relevant_tasks: Mapping[str, Operator]) -> _UpstreamTIStates:
+            if _uses_batched_upstream_states():
+                return _UpstreamTIStates.calculate_from_counts(
+                    dep_context.ensure_finished_ti_state_counts(ti.get_dagrun(session), session),
+                    relevant_tasks,
+                )
+            finished_upstream_tis = (
+                finished_ti
+                for finished_ti in dep_context.ensure_finished_tis(ti.get_dagrun(session), session)
+                if _is_relevant_upstream(upstream=finished_ti, relevant_ids=relevant_tasks.keys())
+            )
+            return _UpstreamTIStates.calculate(finished_upstream_tis)
+
+        def _count_upstream_tis(relevant_tasks: Mapping[str, Operator]) -> Sequence[Row]:
+            """Count the tis of each of ``relevant_tasks`` that the current ti depends on."""
+            batched = _uses_batched_upstream_states()
+            if batched and (counts := dep_context.upstream_ti_counts.get(frozenset(relevant_tasks))):
+                return counts
+            # The below type annotation is acceptable on SQLA2.1, but not on 2.0
+            task_id_counts: Sequence[Row[Unpack[tuple[str, int]]]] = session.execute(  # type: ignore[type-arg]
+                select(TaskInstance.task_id, func.count(TaskInstance.task_id))
+                .where(TaskInstance.dag_id == ti.dag_id, TaskInstance.run_id == ti.run_id)
+                .where(or_(*_iter_upstream_conditions(relevant_tasks=relevant_tasks)))
+                .group_by(TaskInstance.task_id)
+            ).all()
+            if batched:
+                dep_context.upstream_ti_counts[frozenset(relevant_tasks)] = task_id_counts
+            return task_id_counts
+
         def _evaluate_setup_constraint(
             *, relevant_setups: Mapping[str, Operator]
         ) -> Iterator[tuple[TIDepStatus, bool]]:
@@ -267,12 +333,7 @@ class TriggerRuleDep(BaseTIDep):
                 return
 
             indirect_setups = {k: v for k, v in relevant_setups.items() if k not in task.upstream_task_ids}
-            finished_upstream_tis = (
-                x
-                for x in dep_context.ensure_finished_tis(ti.get_dagrun(session), session)
-                if _is_relevant_upstream(upstream=x, relevant_ids=indirect_setups.keys())
-            )
-            upstream_states = _UpstreamTIStates.calculate(finished_upstream_tis)
+            upstream_states = _calculate_upstream_states(indirect_setups)
 
             # all of these counts reflect indirect setups which are relevant for this ti
             success = upstream_states.success
@@ -286,13 +347,7 @@ class TriggerRuleDep(BaseTIDep):
             if not any(t.get_needs_expansion() for t in indirect_setups.values()):
                 upstream = len(indirect_setups)
             else:
-                task_id_counts = session.execute(
-                    select(TaskInstance.task_id, func.count(TaskInstance.task_id))
-                    .where(TaskInstance.dag_id == ti.dag_id, TaskInstance.run_id == ti.run_id)
-                    .where(or_(*_iter_upstream_conditions(relevant_tasks=indirect_setups)))
-                    .group_by(TaskInstance.task_id)
-                ).all()
-                upstream = sum(count for _, count in task_id_counts)
+                upstream = sum(count for _, count in _count_upstream_tis(indirect_setups))
 
             new_state = None
             changed = False
@@ -350,12 +405,7 @@ class TriggerRuleDep(BaseTIDep):
             trigger_rule = task.trigger_rule
             trigger_rule_str = getattr(trigger_rule, "value", trigger_rule)
 
-            finished_upstream_tis = (
-                finished_ti
-                for finished_ti in dep_context.ensure_finished_tis(ti.get_dagrun(session), session)
-                if _is_relevant_upstream(upstream=finished_ti, relevant_ids=task.upstream_task_ids)
-            )
-            upstream_states = _UpstreamTIStates.calculate(finished_upstream_tis)
+            upstream_states = _calculate_upstream_states(upstream_tasks)
 
             success = upstream_states.success
             skipped = upstream_states.skipped
@@ -372,13 +422,7 @@ class TriggerRuleDep(BaseTIDep):
                 upstream = len(upstream_tasks)
                 upstream_setup = sum(1 for x in upstream_tasks.values() if x.is_setup)
             else:
-                # The below type annotation is acceptable on SQLA2.1, but not on 2.0
-                task_id_counts: Sequence[Row[Unpack[tuple[str, int]]]] = session.execute(  # type: ignore[type-arg]
-                    select(TaskInstance.task_id, func.count(TaskInstance.task_id))
-                    .where(TaskInstance.dag_id == ti.dag_id, TaskInstance.run_id == ti.run_id)
-                    .where(or_(*_iter_upstream_conditions(relevant_tasks=upstream_tasks)))
-                    .group_by(TaskInstance.task_id)
-                ).all()
+                task_id_counts = _count_upstream_tis(upstream_tasks)
                 upstream = sum(count for _, count in task_id_counts)
                 upstream_setup = sum(c for t, c in task_id_counts if upstream_tasks[t].is_setup)
 
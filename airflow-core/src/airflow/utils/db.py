@@ -113,7 +113,7 @@ _REVISION_HEADS_MAP: dict[str, str] = {
     "3.0.3": "fe199e1abd77",
     "3.1.0": "cc92b33c6709",
     "3.1.8": "509b94a1042d",
-    "3.2.0": "6222ce48e289",
+    "3.2.0": "7d2a5c81e4f6",
 }
 
 # Prefix used to identify tables holding data moved during migration.
@@ -24,13 +24,18 @@ See:
 from __future__ import annotations
 
 import csv
+import json
 import logging
 import os
+import re
+import threading
+import time
+from concurrent.futures import FIRST_COMPLETED, Future, ThreadPoolExecutor, wait
 from contextlib import contextmanager
 from dataclasses import dataclass
 from typing import TYPE_CHECKING, Any
 
-from sqlalchemy import and_, column, func, inspect, select, table, text
+from sqlalchemy import and_, column, func, inspect, literal, literal_column, select, table, text
 from sqlalchemy.exc import OperationalError, ProgrammingError
 from sqlalchemy.ext.compiler import compiles
 from sqlalchemy.orm import aliased
@@ -42,12 +47,14 @@ from airflow.configuration import conf
 from airflow.exceptions import AirflowException
 from airflow.utils.db import reflect_tables
 from airflow.utils.helpers import ask_yesno
-from airflow.utils.session import NEW_SESSION, provide_session
+from airflow.utils.session import NEW_SESSION, create_session, provide_session
 from airflow.utils.types import DagRunType
 
 if TYPE_CHECKING:
+    from collections.abc import Callable, Sequence
+
     from pendulum import DateTime
-    from sqlalchemy import Select
+    from sqlalchemy import ColumnElement, Select, Table
     from sqlalchemy.orm import Session
 
     from airflow.models import Base
@@ -55,6 +62,8 @@ if TYPE_CHECKING:
 logger = logging.getLogger(__name__)
 
 ARCHIVE_TABLE_PREFIX = "_airflow_deleted__"
+# Alias of the cleaned table in the queries selecting its old rows
+BASE_TABLE_ALIAS = "base"
 # Archived tables created by DB migrations
 ARCHIVED_TABLES_FROM_DB_MIGRATIONS = [
     "_xcom_archive"  # Table created by the AF 2 -> 3.0.0 migration when the XComs had pickled values
@@ -214,81 +223,192 @@ def _dump_table_to_file(*, target_table: str, file_path: str, export_format: str
         raise AirflowException(f"Export format {export_format} is not supported.")
 
 
-def _do_delete(
-    *, query: Select, orm_model: Base, skip_archive: bool, session: Session, batch_size: int | None
-) -> None:
-    import itertools
-    import re
+class _CleanupCheckpoint:
+    """
+    Progress of a cleanup, saved to a JSON file after every batch so that an interrupted cleanup can resume.
 
-    bind = session.get_bind()
-    dialect_name = bind.dialect.name
-    batch_counter = itertools.count(1)
+    For each table, it records the archive table the rows are moved to, the primary key of the last row
+    moved, the number of rows moved so far and whether the table is done.
 
-    while True:
-        limited_query = query.limit(batch_size) if batch_size else query
-        if (
-            session.scalars(select(func.count()).select_from(limited_query.subquery())).one() == 0
-        ):  # nothing left to delete
-            break
+    :param path: the file the checkpoint is read from, if it exists, and written to
+    :param run: the arguments of the cleanup, which must match those the checkpoint was written with
+    """
 
-        batch_no = next(batch_counter)
-        suffix = f"__b{batch_no}" if batch_size else ""
+    def __init__(self, path: str, run: dict[str, Any]):
+        self.path = path
+        self.run = run
+        self._tables: dict[str, dict[str, Any]] = {}
+        self._lock = threading.Lock()
+        if os.path.exists(path):
+            with open(path) as f:
+                data = json.load(f)
+            if data.get("run") != run:
+                raise AirflowException(
+                    f"Checkpoint {path} was written by a cleanup with other arguments: {data.get('run')}. "
+                    f"Remove it to start a new cleanup."
+                )
+            self._tables = data["tables"]
+            print(f"Resuming cleanup from checkpoint {path}")
+
+    def get(self, table_name: str) -> dict[str, Any]:
+        with self._lock:
+            return dict(self._tables.get(table_name, {}))
+
+    def update(self, table_name: str, **values: Any) -> None:
+        with self._lock:
+            self._tables.setdefault(table_name, {}).update(values)
+            tmp_path = f"{self.path}.tmp"
+            with open(tmp_path, "w") as f:
+                json.dump({"run": self.run, "tables": self._tables}, f, default=str)
+            os.replace(tmp_path, self.path)
+
+
+def _key_range(
+    columns: Sequence[ColumnElement], lower: Sequence[Any] | None, upper: Sequence[Any] | None
+) -> list[ColumnElement[bool]]:
+    """Return the conditions selecting the rows whose primary key is in ``(lower, upper]``."""
+    key = tuple_(*columns) if len(columns) > 1 else columns[0]
+
+    def key_value(values: Sequence[Any]) -> ColumnElement:
+        literals = [literal(value, col.type) for value, col in zip(values, columns)]
+        return tuple_(*literals) if len(literals) > 1 else literals[0]
+
+    conditions = []
+    if lower is not None:
+        conditions.append(key > key_value(lower))
+    if upper is not None:
+        conditions.append(key <= key_value(upper))
+    return conditions
+
+
+def _load_key(values: Sequence[Any] | None, columns: Sequence[ColumnElement]) -> list[Any] | None:
+    """Convert a primary key read from a checkpoint back to the types of its columns."""
+    if values is None:
+        return None
+    key = []
+    for value, col in zip(values, columns):
+        try:
+            python_type = col.type.python_type
+        except NotImplementedError:
+            python_type = None
+        if value is not None and python_type is not None and not isinstance(value, python_type):
+            value = python_type(value)
+        key.append(value)
+    return key
 
-        if batch_size:
-            print(f"Performing Delete (batch {batch_no}, max {batch_size} rows)...")
-        else:
-            print("Performing Delete...")
 
-        # using bulk delete
-        # create a new table and copy the rows there
-        timestamp_str = re.sub(r"[^\d]", "", timezone.utcnow().isoformat())[:14]
-        target_table_name = f"{ARCHIVE_TABLE_PREFIX}{orm_model.name}__{timestamp_str}{suffix}"
-        print(f"Moving data to table {target_table_name}")
-        target_table = None
+def _do_delete(
+    *,
+    query: Select,
+    orm_model: Base,
+    skip_archive: bool,
+    session: Session,
+    batch_size: int | None,
+    total_rows: int | None = None,
+    checkpoint: _CleanupCheckpoint | None = None,
+) -> None:
+    """
+    Move the rows selected by ``query`` to an archive table, then delete them.
 
-        try:
-            if dialect_name == "mysql":
-                # MySQL with replication needs this split into two queries, so just do it for all MySQL
-                # ERROR 1786 (HY000): Statement violates GTID consistency: CREATE TABLE ... SELECT.
-                session.execute(text(f"CREATE TABLE {target_table_name} LIKE {orm_model.name}"))
-                metadata = reflect_tables([target_table_name], session)
-                target_table = metadata.tables[target_table_name]
-                insert_stm = target_table.insert().from_select(target_table.c, limited_query)
+    With ``batch_size``, the table is walked in primary key order: each batch is the range of keys from
+    the last one of the previous batch to the last one of the next ``batch_size`` rows, so no batch rescans
+    the rows handled before it. All the batches are appended to the same archive table.
+    """
+    bind = session.get_bind()
+    dialect_name = bind.dialect.name
+    table_name = orm_model.name
+    state = checkpoint.get(table_name) if checkpoint else {}
+
+    source_table = reflect_tables([table_name], session).tables[table_name]
+    pk_names = [col.name for col in source_table.primary_key.columns]
+    quote = bind.dialect.identifier_preparer.quote
+    # The primary key of the cleaned table, as selected by the query
+    query_pk = [
+        literal_column(f"{BASE_TABLE_ALIAS}.{quote(name)}", type_=source_table.c[name].type)
+        for name in pk_names
+    ]
+
+    timestamp_str = re.sub(r"[^\d]", "", timezone.utcnow().isoformat())[:14]
+    target_table_name = state.get("archive_table") or f"{ARCHIVE_TABLE_PREFIX}{table_name}__{timestamp_str}"
+    target_table: Table | None = None
+    if inspect(bind).has_table(target_table_name):
+        target_table = reflect_tables([target_table_name], session).tables[target_table_name]
+    print(f"Moving data to table {target_table_name}")
+
+    last_key = _load_key(state.get("last_key"), query_pk)
+    moved_rows = resumed_rows = state.get("rows", 0)
+    batch_no = 0
+    start = time.monotonic()
+    try:
+        while True:
+            upper_key = None
+            batch_query = query.where(*_key_range(query_pk, last_key, None))
+            if batch_size:
+                keys = session.execute(
+                    batch_query.with_only_columns(*query_pk).order_by(*query_pk).limit(batch_size)
+                ).all()
+                if not keys:
+                    break
+                upper_key = list(keys[-1])
+                batch_query = batch_query.where(*_key_range(query_pk, None, upper_key))
+            batch_no += 1
+
+            if target_table is None:
+                if dialect_name == "mysql":
+                    # MySQL with replication needs this split into two queries, so just do it for all MySQL
+                    # ERROR 1786 (HY000): Statement violates GTID consistency: CREATE TABLE ... SELECT.
+                    session.execute(text(f"CREATE TABLE {target_table_name} LIKE {table_name}"))
+                else:
+                    stmt = CreateTableAs(target_table_name, batch_query.selectable)
+                    logger.debug("ctas query:\n%s", stmt.compile())
+                    session.execute(stmt)
+                target_table = reflect_tables([target_table_name], session).tables[target_table_name]
+                copy_rows = dialect_name == "mysql"
+            else:
+                copy_rows = True
+            if copy_rows:
+                insert_stm = target_table.insert().from_select(target_table.c, batch_query)
                 logger.debug("insert statement:\n%s", insert_stm.compile())
                 session.execute(insert_stm)
-            else:
-                stmt = CreateTableAs(target_table_name, limited_query.selectable)
-                logger.debug("ctas query:\n%s", stmt.compile())
-                session.execute(stmt)
-            session.commit()
 
-            # delete the rows from the old table
-            metadata = reflect_tables([orm_model.name, target_table_name], session)
-            source_table = metadata.tables[orm_model.name]
-            target_table = metadata.tables[target_table_name]
-            logger.debug("rows moved; purging from %s", source_table.name)
+            # delete the rows of this batch from the old table, in the transaction that archived them so that
+            # a batch interrupted half-way is neither lost nor archived twice
+            archived_pk = [target_table.c[name] for name in pk_names]
+            batch_range = _key_range(archived_pk, last_key, upper_key)
+            logger.debug("rows moved; purging from %s", table_name)
             if dialect_name == "sqlite":
-                pk_cols = source_table.primary_key.columns
                 delete = source_table.delete().where(
-                    tuple_(*pk_cols).in_(
-                        select(*[target_table.c[x.name] for x in source_table.primary_key.columns])
-                    )
+                    tuple_(*source_table.primary_key.columns).in_(select(*archived_pk).where(*batch_range))
                 )
             else:
                 delete = source_table.delete().where(
-                    and_(*[col == target_table.c[col.name] for col in source_table.primary_key.columns])
+                    *[source_table.c[name] == target_table.c[name] for name in pk_names], *batch_range
                 )
             logger.debug("delete statement:\n%s", delete.compile())
-            session.execute(delete)
+            result = session.execute(delete)
+            if skip_archive:
+                session.execute(target_table.delete())
             session.commit()
 
-        except BaseException as e:
-            raise e
-        finally:
-            if target_table is not None and skip_archive:
-                bind = session.get_bind()
-                target_table.drop(bind=bind)
-                session.commit()
+            batch_rows = len(keys) if batch_size else result.rowcount
+            moved_rows += batch_rows
+            rows_per_second = (moved_rows - resumed_rows) / max(time.monotonic() - start, 1e-6)
+            out_of = f" out of {resumed_rows + total_rows}" if total_rows is not None else ""
+            print(
+                f"Table {table_name}: batch {batch_no} moved {batch_rows} rows "
+                f"({moved_rows}{out_of} so far, {rows_per_second:.0f} rows/s)"
+            )
+            if checkpoint:
+                checkpoint.update(
+                    table_name, archive_table=target_table_name, last_key=upper_key, rows=moved_rows
+                )
+            last_key = upper_key
+            if not batch_size:
+                break
+    finally:
+        if target_table is not None and skip_archive:
+            target_table.drop(bind=bind)
+            session.commit()
 
     print("Finished Performing Delete")
 
@@ -341,9 +461,8 @@ def _build_query(
     exclude_dag_ids: list[str] | None = None,
     **kwargs,
 ) -> Select:
-    base_table_alias = "base"
-    base_table = aliased(orm_model, name=base_table_alias)
-    query = select(text(f"{base_table_alias}.*")).select_from(base_table)
+    base_table = aliased(orm_model, name=BASE_TABLE_ALIAS)
+    query = select(text(f"{BASE_TABLE_ALIAS}.*")).select_from(base_table)
     base_table_recency_col = base_table.c[recency_column.name]
     conditions = [base_table_recency_col < clean_before_timestamp]
 
@@ -392,11 +511,15 @@ def _cleanup_table(
     skip_archive: bool = False,
     session: Session,
     batch_size: int | None = None,
+    checkpoint: _CleanupCheckpoint | None = None,
     **kwargs,
 ) -> None:
     print()
     if dry_run:
         print(f"Performing dry run for table {orm_model.name}")
+    elif checkpoint and checkpoint.get(orm_model.name).get("done"):
+        print(f"Table {orm_model.name} was already cleaned according to the checkpoint")
+        return
     query = _build_query(
         orm_model=orm_model,
         recency_column=recency_column,
@@ -420,7 +543,11 @@ def _cleanup_table(
             skip_archive=skip_archive,
             session=session,
             batch_size=batch_size,
+            total_rows=num_rows,
+            checkpoint=checkpoint,
         )
+    if checkpoint and not dry_run:
+        checkpoint.update(orm_model.name, done=True)
 
     session.commit()
 
@@ -554,6 +681,8 @@ def run_cleanup(
     skip_archive: bool = False,
     session: Session = NEW_SESSION,
     batch_size: int | None = None,
+    workers: int = 1,
+    checkpoint_path: str | None = None,
 ) -> None:
     """
     Purges old records in airflow metadata database.
@@ -577,6 +706,10 @@ def run_cleanup(
     :param skip_archive: Set to True if you don't want the purged rows preserved in an archive table.
     :param session: Session representing connection to the metadata database.
     :param batch_size: Maximum number of rows to delete or archive in a single transaction.
+    :param workers: Number of tables cleaned at the same time. A table is only cleaned once the tables
+        depending on it are done.
+    :param checkpoint_path: Optional. File recording the progress of the cleanup. If it exists, the cleanup
+        resumes where the one that wrote it stopped.
     """
     clean_before_timestamp = timezone.coerce_datetime(clean_before_timestamp)
 
@@ -598,23 +731,76 @@ def run_cleanup(
         )
     existing_tables = reflect_tables(tables=None, session=session).tables
 
-    for table_name, table_config in effective_config_dict.items():
-        if table_name in existing_tables:
-            with _suppress_with_logging(table_name, session):
-                _cleanup_table(
-                    clean_before_timestamp=clean_before_timestamp,
-                    dag_ids=dag_ids,
-                    exclude_dag_ids=exclude_dag_ids,
-                    dry_run=dry_run,
-                    verbose=verbose,
-                    **table_config.__dict__,
-                    skip_archive=skip_archive,
-                    session=session,
-                    batch_size=batch_size,
-                )
-                session.commit()
-        else:
+    checkpoint = None
+    if checkpoint_path and not dry_run:
+        checkpoint = _CleanupCheckpoint(
+            checkpoint_path,
+            run={
+                "clean_before_timestamp": clean_before_timestamp.isoformat(),
+                "table_names": sorted(effective_table_names),
+                "dag_ids": dag_ids,
+                "exclude_dag_ids": exclude_dag_ids,
+                "skip_archive": skip_archive,
+            },
+        )
+
+    def clean_table(table_name: str, session: Session) -> None:
+        if table_name not in existing_tables:
             logger.warning("Table %s not found.  Skipping.", table_name)
+            return
+        with _suppress_with_logging(table_name, session):
+            _cleanup_table(
+                clean_before_timestamp=clean_before_timestamp,
+                dag_ids=dag_ids,
+                exclude_dag_ids=exclude_dag_ids,
+                dry_run=dry_run,
+                verbose=verbose,
+                **effective_config_dict[table_name].__dict__,
+                skip_archive=skip_archive,
+                session=session,
+                batch_size=batch_size,
+                checkpoint=checkpoint,
+            )
+            session.commit()
+
+    if workers > 1 and session.get_bind().dialect.name == "sqlite":
+        logger.warning("SQLite does not support concurrent writes; cleaning one table at a time.")
+        workers = 1
+    if workers <= 1 or dry_run:
+        for table_name in effective_table_names:
+            clean_table(table_name, session)
+    else:
+        _clean_tables_in_parallel(effective_config_dict, workers=workers, clean_table=clean_table)
+
+
+def _clean_tables_in_parallel(
+    configs: dict[str, _TableConfig], *, workers: int, clean_table: Callable[[str, Session], None]
+) -> None:
+    """
+    Clean the tables in ``workers`` threads, each with its own session.
+
+    A table is only cleaned once all the tables depending on it are done, as the serial cleanup does.
+    """
+
+    def clean_in_new_session(table_name: str) -> None:
+        with create_session(scoped=False) as worker_session:
+            clean_table(table_name, worker_session)
+
+    pending = dict(configs)
+    done: set[str] = set()
+    running: dict[Future, str] = {}
+    with ThreadPoolExecutor(max_workers=workers, thread_name_prefix="db-cleanup") as executor:
+        while pending or running:
+            for table_name, config in list(pending.items()):
+                if all(dep in done or dep not in configs for dep in config.dependent_tables or []):
+                    del pending[table_name]
+                    running[executor.submit(clean_in_new_session, table_name)] = table_name
+            if not running:
+                raise AirflowException(f"Circular dependencies between tables {sorted(pending)}")
+            finished, _ = wait(running, return_when=FIRST_COMPLETED)
+            for future in finished:
+                done.add(running.pop(future))
+                future.result()
 
 
 @provide_session
@@ -106,6 +106,8 @@ class LogMetadata(TypedDict):
 
     end_of_log: bool
     log_pos: NotRequired[int]
+    # byte offsets up to which the local and served log files of a running task were read, by source
+    log_offsets: NotRequired[dict[str, int]]
     # the following attributes are used for Elasticsearch and OpenSearch log handlers
     offset: NotRequired[str | int]
     # Ensure a string here. Large offset numbers will get JSON.parsed incorrectly
@@ -166,7 +168,7 @@ def _set_task_deferred_context_var():
         h.ctx_task_deferred = True
 
 
-def _fetch_logs_from_service(url: str, log_relative_path: str) -> Response:
+def _fetch_logs_from_service(url: str, log_relative_path: str, offset: int = 0) -> Response:
     # Import occurs in function scope for perf. Ref: https://github.com/apache/airflow/pull/21438
     import requests
 
@@ -184,12 +186,10 @@ def _fetch_logs_from_service(url: str, log_relative_path: str) -> Response:
         valid_for=conf.getint("webserver", "log_request_clock_grace", fallback=30),
         audience="task-instance-logs",
     )
-    response = requests.get(
-        url,
-        timeout=timeout,
-        headers={"Authorization": generator.generate({"filename": log_relative_path})},
-        stream=True,
-    )
+    headers = {"Authorization": generator.generate({"filename": log_relative_path})}
+    if offset:
+        headers["Range"] = f"bytes={offset}-"
+    response = requests.get(url, timeout=timeout, headers=headers, stream=True)
     response.encoding = "utf-8"
     return response
 
@@ -247,6 +247,44 @@ def _stream_lines_by_chunk(
         yield from buffer.split("\n")
 
 
+def _stream_lines_from_offset(
+    log_io: IO[bytes],
+    source: str,
+    log_offsets: dict[str, int],
+    hold_partial_line: bool = False,
+) -> RawLogStream:
+    """
+    Stream lines from a binary file-like IO object, keeping track of the byte offset read up to.
+
+    The offset of ``source`` in ``log_offsets`` is moved past each complete line streamed, so that the next
+    read can seek directly to the first line not streamed yet. A last line without line break may still be
+    being written, so the next read starts from it again.
+
+    :param log_io: A binary file-like IO object, positioned at the offset of ``source`` in ``log_offsets``.
+    :param source: The source of the log, keying its offset in ``log_offsets``.
+    :param log_offsets: The byte offsets up to which the log sources were read.
+    :param hold_partial_line: Do not stream a last line without line break, for the next read to stream
+        it once complete, rather than streaming it twice.
+    :return: A generator that yields individual lines.
+    """
+    offset = log_offsets.get(source, 0)
+    buffer = b""
+    try:
+        while chunk := log_io.read(CHUNK_SIZE):
+            buffer += chunk
+            *lines, buffer = buffer.split(b"\n")
+            for line in lines:
+                offset += len(line) + 1
+                log_offsets[source] = offset
+                yield line.decode("utf-8")
+        if buffer and not hold_partial_line:
+            yield buffer.decode("utf-8")
+    except Exception as e:
+        logger.error("Error reading log stream: %s", e)
+    finally:
+        log_io.close()
+
+
 def _log_stream_to_parsed_log_stream(
     log_stream: RawLogStream,
 ) -> ParsedLogStream:
@@ -597,12 +635,18 @@ class FileTaskHandler(logging.Handler):
                                   which was retrieved in previous calls, this
                                   part will be skipped and only following test
                                   returned to be added to tail.
+                         log_offsets: Byte offsets to which the local and served
+                                      logs were retrieved in previous calls, they
+                                      are read from there instead of being read
+                                      from the start and skipped.
         :return: log message as a string and metadata.
                  Following attributes are used in metadata:
                  end_of_log: Boolean, True if end of log is reached or False
                              if further calls might get more log text.
                              This is determined by the status of the TaskInstance
                  log_pos: (absolute) Char position to which the log is retrieved
+                 log_offsets: Byte offsets to which the local and served logs
+                              are retrieved, unless end_of_log is True
         """
         # Task instance here might be different from task instance when
         # initializing the handler. Thus explicitly getting log location
@@ -643,13 +687,31 @@ class FileTaskHandler(logging.Handler):
             if sources:
                 source_list.extend(sources)
                 has_k8s_exec_pod = True
+        end_of_log = ti.try_number != try_number or ti.state not in (
+            TaskInstanceState.RUNNING,
+            TaskInstanceState.DEFERRED,
+        )
+        # Local and served logs are read from where the previous call stopped, unless the log
+        # also has remote or executor logs, which are read from the start every time
+        log_offsets: dict[str, int] = {}
+        resumed_log_pos: int | None = None
+        if metadata and "log_offsets" in metadata and "log_pos" in metadata:
+            if not (remote_logs or executor_logs):
+                log_offsets = dict(metadata["log_offsets"])
+                resumed_log_pos = metadata["log_pos"]
+        # While the offsets are returned, a last line still being written is left for the next call
+        track_offsets = not (end_of_log or remote_logs or executor_logs)
         if not (remote_logs and ti.state not in State.unfinished):
             # when finished, if we have remote logs, no need to check local
             worker_log_full_path = Path(self.local_base, worker_log_rel_path)
-            sources, local_logs = self._read_from_local(worker_log_full_path)
+            sources, local_logs = self._read_from_local(
+                worker_log_full_path, log_offsets, hold_partial_line=track_offsets
+            )
             source_list.extend(sources)
         if ti.state in (TaskInstanceState.RUNNING, TaskInstanceState.DEFERRED) and not has_k8s_exec_pod:
-            sources, served_logs = self._read_from_logs_server(ti, worker_log_rel_path)
+            sources, served_logs = self._read_from_logs_server(
+                ti, worker_log_rel_path, log_offsets, hold_partial_line=track_offsets
+            )
             source_list.extend(sources)
         elif (ti.state not in State.unfinished or ti.state in _STATES_WITH_COMPLETED_ATTEMPT) and not (
             local_logs or remote_logs
@@ -657,7 +719,7 @@ class FileTaskHandler(logging.Handler):
             # ordinarily we don't check served logs, with the assumption that users set up
             # remote logging or shared drive for logs for persistence, but that's not always true
             # so even if task is done, if no local logs or remote logs are found, we'll check the worker
-            sources, served_logs = self._read_from_logs_server(ti, worker_log_rel_path)
+            sources, served_logs = self._read_from_logs_server(ti, worker_log_rel_path, log_offsets)
             source_list.extend(sources)
 
         out_stream: LogHandlerOutputStream = _interleave_logs(
@@ -673,26 +735,28 @@ class FileTaskHandler(logging.Handler):
             StructuredLogMessage(event="::group::Log message source details", sources=source_list),  # type: ignore[call-arg]
             StructuredLogMessage(event="::endgroup::"),
         ]
-        end_of_log = ti.try_number != try_number or ti.state not in (
-            TaskInstanceState.RUNNING,
-            TaskInstanceState.DEFERRED,
-        )
 
         with LogStreamAccumulator(out_stream, HEAP_DUMP_SIZE) as stream_accumulator:
             log_pos = stream_accumulator.total_lines
             out_stream = stream_accumulator.stream
 
-            # skip log stream until the last position
-            if metadata and "log_pos" in metadata:
-                islice(out_stream, metadata["log_pos"])
+            if resumed_log_pos is not None:
+                # only the lines after the last position were read
+                log_pos += resumed_log_pos
+            elif metadata and "log_pos" in metadata:
+                # skip log stream until the last position
+                next(islice(out_stream, metadata["log_pos"], metadata["log_pos"]), None)
             else:
                 # first time reading log, add messages before interleaved log stream
                 out_stream = chain(header, out_stream)
 
-            return out_stream, {
+            out_metadata: LogMetadata = {
                 "end_of_log": end_of_log,
                 "log_pos": log_pos,
             }
+            if track_offsets:
+                out_metadata["log_offsets"] = log_offsets
+            return out_stream, out_metadata
 
     @staticmethod
     @staticmethod
@@ -860,30 +924,45 @@ class FileTaskHandler(logging.Handler):
     @staticmethod
     def _read_from_local(
         worker_log_path: Path,
+        log_offsets: dict[str, int] | None = None,
+        hold_partial_line: bool = False,
     ) -> StreamingLogResponse:
         sources: LogSourceInfo = []
         log_streams: list[RawLogStream] = []
+        if log_offsets is None:
+            log_offsets = {}
         paths = sorted(worker_log_path.parent.glob(worker_log_path.name + "*"))
         if not paths:
             return sources, log_streams
 
         for path in paths:
-            sources.append(os.fspath(path))
-            # Read the log file and yield lines
-            log_streams.append(_stream_lines_by_chunk(open(path, encoding="utf-8")))
+            source = os.fspath(path)
+            sources.append(source)
+            log_file = open(path, "rb")
+            if log_offsets.get(source, 0) > os.fstat(log_file.fileno()).st_size:
+                # The file was truncated or replaced since it was last read
+                log_offsets[source] = 0
+            # Read the log file from where it was last read and yield lines
+            log_file.seek(log_offsets.get(source, 0))
+            log_streams.append(_stream_lines_from_offset(log_file, source, log_offsets, hold_partial_line))
         return sources, log_streams
 
     def _read_from_logs_server(
         self,
         ti: TaskInstance | TaskInstanceHistory,
         worker_log_rel_path: str,
+        log_offsets: dict[str, int] | None = None,
+        hold_partial_line: bool = False,
     ) -> StreamingLogResponse:
         sources: LogSourceInfo = []
         log_streams: list[RawLogStream] = []
+        if log_offsets is None:
+            log_offsets = {}
         try:
             log_type = LogType.TRIGGER if getattr(ti, "triggerer_job", False) else LogType.WORKER
             url, rel_path = self._get_log_retrieval_url(ti, worker_log_rel_path, log_type=log_type)
-            response = _fetch_logs_from_service(url, rel_path)
+            offset = log_offsets.get(url, 0)
+            response = _fetch_logs_from_service(url, rel_path, offset)
             if response.status_code == 403:
                 sources.append(
                     "!!!! Please make sure that all your Airflow components (e.g. "
@@ -899,7 +978,9 @@ class FileTaskHandler(logging.Handler):
                 # and the original worker's logs are no longer accessible.
                 # Fall back to local filesystem read if available.
                 worker_log_full_path = Path(self.local_base, worker_log_rel_path)
-                fallback_sources, fallback_streams = self._read_from_local(worker_log_full_path)
+                fallback_sources, fallback_streams = self._read_from_local(
+                    worker_log_full_path, log_offsets, hold_partial_line
+                )
                 if fallback_sources:
                     sources.extend(fallback_sources)
                     log_streams.extend(fallback_streams)
@@ -910,15 +991,20 @@ class FileTaskHandler(logging.Handler):
                         f"are no longer accessible. "
                         f"Consider configuring remote logging (S3, GCS, etc.) for log persistence."
                     )
+            elif response.status_code == 416:
+                # The log file did not grow since it was last read
+                sources.append(url)
             else:
                 # Check if the resource was properly fetched
                 response.raise_for_status()
 
                 if int(response.headers.get("Content-Length", 0)) > 0:
                     sources.append(url)
-                    log_streams.append(
-                        _stream_lines_by_chunk(io.TextIOWrapper(cast("IO[bytes]", response.raw)))
-                    )
+                    log_io = cast("IO[bytes]", response.raw)
+                    if offset and response.status_code != 206:
+                        # The log server ignored the range, skip the part of the log already read
+                        log_io.read(offset)
+                    log_streams.append(_stream_lines_from_offset(log_io, url, log_offsets, hold_partial_line))
         except Exception as e:
             from requests.exceptions import InvalidURL
 
@@ -0,0 +1,318 @@
+#
+# Licensed to the Apache Software Foundation (ASF) under one
+# or more contributor license agreements.  See the NOTICE file
+# distributed with this work for additional information
+# regarding copyright ownership.  The ASF licenses this file
+# to you under the Apache License, Version 2.0 (the
+# "License"); you may not use this file except in compliance
+# with the License.  You may obtain a copy of the License at
+#
+#   http://www.apache.org/licenses/LICENSE-2.0
+#
+# Unless required by applicable law or agreed to in writing,
+# software distributed under the License is distributed on an
+# "AS IS" BASIS, WITHOUT WARRANTIES OR CONDITIONS OF ANY
+# KIND, either express or implied.  See the License for the
+# specific language governing permissions and limitations
+# under the License.
+"""Instrumentation of the hot loops of Airflow components, like the scheduler loop."""
+
+from __future__ import annotations
+
+import os
+import sys
+import threading
+import time
+from collections import Counter
+from collections.abc import Iterator
+from contextlib import AbstractContextManager, contextmanager, nullcontext
+from dataclasses import dataclass
+from typing import TYPE_CHECKING
+
+import structlog
+from sqlalchemy import event
+
+from airflow._shared.observability.metrics.stats import Stats
+from airflow.configuration import AIRFLOW_HOME, conf
+
+if TYPE_CHECKING:
+    from types import FrameType
+
+    from sqlalchemy.engine import Engine
+
+log = structlog.get_logger(logger_name=__name__)
+
+
+@dataclass
+class PhaseStats:
+    """Cost of a phase of a loop, or of the work done for a DAG, in one iteration."""
+
+    duration: float = 0.0
+    calls: int = 0
+    statements: int = 0
+    rows: int = 0
+
+
+class LoopProfiler:
+    """
+    Time the phases of a loop, and count the SQL statements they run and the rows these return or change.
+
+    Phases are nested like spans: a phase entered within another is named ``<outer>.<inner>``, and the
+    statements of a phase are also counted in all the enclosing phases. Work can also be attributed to a DAG
+    with :meth:`dag`, to find which DAGs a loop spends its time on.
+
+    At the end of each iteration the phases are sent as metrics, and iterations slower than
+    ``slow_loop_threshold`` seconds are logged with their breakdown and their most expensive DAGs.
+
+    Statements are only counted when they run in the thread the profiler was attached from. Rows are the
+    counts reported by the database driver, which some drivers (like SQLite's) do not report for ``SELECT``.
+
+    :param metric_prefix: prefix of the metrics sent
+    :param enabled: when False, :meth:`phase` and :meth:`dag` return no-op context managers
+    :param slow_loop_threshold: seconds above which an iteration is logged with its breakdown
+    :param top_dags: number of DAGs logged for a slow iteration
+    """
+
+    def __init__(
+        self,
+        metric_prefix: str,
+        *,
+        enabled: bool = True,
+        slow_loop_threshold: float = 0.0,
+        top_dags: int = 10,
+    ):
+        self.metric_prefix = metric_prefix
+        self.enabled = enabled
+        self.slow_loop_threshold = slow_loop_threshold
+        self.top_dags = top_dags
+        self.loop = PhaseStats()
+        self.phases: dict[str, PhaseStats] = {}
+        self.dags: dict[str, PhaseStats] = {}
+        self._names: list[str] = []
+        # The loop, the phases entered and the current DAG, which the statements run are counted in
+        self._active: list[PhaseStats] = [self.loop]
+        self._loop_start = time.perf_counter()
+        self._engine: Engine | None = None
+        self._thread_id: int | None = None
+
+    @classmethod
+    def for_scheduler(cls) -> LoopProfiler:
+        """Return the profiler of the scheduler loop, as configured."""
+        return cls(
+            "scheduler.loop_phase",
+            enabled=conf.getboolean("profiling", "scheduler_loop_profiling", fallback=False),
+            slow_loop_threshold=conf.getfloat("profiling", "scheduler_slow_loop_threshold", fallback=5.0),
+        )
+
+    def attach(self, engine: Engine) -> None:
+        """Count the statements run on ``engine`` by the current thread."""
+        if not self.enabled or self._engine is not None:
+            return
+        self._engine = engine
+        self._thread_id = threading.get_ident()
+        event.listen(engine, "after_cursor_execute", self._after_cursor_execute)
+
+    def detach(self) -> None:
+        if self._engine is not None:
+            event.remove(self._engine, "after_cursor_execute", self._after_cursor_execute)
+            self._engine = None
+
+    def _after_cursor_execute(self, conn, cursor, statement, parameters, context, executemany) -> None:
+        if threading.get_ident() != self._thread_id:
+            return
+        # -1 when the driver does not know
+        rows = max(getattr(cursor, "rowcount", -1), 0)
+        for stats in self._active:
+            stats.statements += 1
+            stats.rows += rows
+
+    def start_loop(self) -> None:
+        """Start a new iteration, forgetting the costs of the previous one."""
+        if not self.enabled:
+            return
+        self.loop = PhaseStats(calls=1)
+        self.phases = {}
+        self.dags = {}
+        self._names = []
+        self._active = [self.loop]
+        self._loop_start = time.perf_counter()
+
+    def phase(self, name: str) -> AbstractContextManager[None]:
+        """Return a context manager timing a phase of the current iteration."""
+        if not self.enabled:
+            return nullcontext()
+        return self._measure(name, self.phases, ".".join([*self._names, name]))
+
+    def dag(self, dag_id: str) -> AbstractContextManager[None]:
+        """Return a context manager attributing the cost of the work done within it to a DAG."""
+        if not self.enabled:
+            return nullcontext()
+        return self._measure(None, self.dags, dag_id)
+
+    @contextmanager
+    def _measure(self, name: str | None, costs: dict[str, PhaseStats], key: str) -> Iterator[None]:
+        stats = costs.setdefault(key, PhaseStats())
+        if name is not None:
+            self._names.append(name)
+        self._active.append(stats)
+        start = time.perf_counter()
+        try:
+            yield
+        finally:
+            stats.duration += time.perf_counter() - start
+            stats.calls += 1
+            self._active.pop()
+            if name is not None:
+                self._names.pop()
+
+    def end_loop(self) -> None:
+        """End the current iteration, sending its metrics and logging it if it was slow."""
+        if not self.enabled:
+            return
+        self.loop.duration = time.perf_counter() - self._loop_start
+        for name, stats in self.phases.items():
+            tags = {"phase": name}
+            Stats.timing(f"{self.metric_prefix}.duration", stats.duration * 1000, tags=tags)
+            Stats.incr(f"{self.metric_prefix}.queries", stats.statements, tags=tags)
+            Stats.incr(f"{self.metric_prefix}.rows", stats.rows, tags=tags)
+        if self.loop.duration >= self.slow_loop_threshold:
+            log.warning("Loop took %.2f seconds\n%s", self.loop.duration, self.format_breakdown())
+
+    def format_breakdown(self) -> str:
+        """Return a table of the costs of the phases and of the most expensive DAGs of the iteration."""
+        lines = [
+            f"{'phase':<60} {'calls':>6} {'seconds':>9} {'queries':>8} {'rows':>8}",
+            _format_row("(loop)", self.loop),
+        ]
+        lines.extend(_format_row(name, stats) for name, stats in self.phases.items())
+        if self.dags:
+            lines.append(f"{'dag':<60} {'calls':>6} {'seconds':>9} {'queries':>8} {'rows':>8}")
+            most_expensive = sorted(self.dags.items(), key=lambda item: item[1].duration, reverse=True)
+            lines.extend(_format_row(dag_id, stats) for dag_id, stats in most_expensive[: self.top_dags])
+        return "\n".join(lines)
+
+
+def _format_row(name: str, stats: PhaseStats) -> str:
+    return f"{name:<60} {stats.calls:>6} {stats.duration:>9.3f} {stats.statements:>8} {stats.rows:>8}"
+
+
+class StackSampler:
+    """
+    Sample the stack of a thread from a background thread, and write them as collapsed stacks.
+
+    Every ``interval`` seconds the stack of the sampled thread is recorded; every ``flush_interval`` seconds
+    the stacks recorded since the last write are written to a new file of ``output_dir``, one
+    ``frame;frame;... count`` line per distinct stack, which flame graph tools (``flamegraph.pl``,
+    speedscope, ...) read. Sampling only reads the frames of the thread, so it barely slows it down.
+
+    :param output_dir: directory the stacks are written to
+    :param name: prefix of the files written
+    :param interval: seconds between two samples
+    :param flush_interval: seconds between two writes
+    :param thread_id: the thread sampled, the main thread by default
+    """
+
+    def __init__(
+        self,
+        output_dir: str,
+        name: str,
+        *,
+        interval: float = 0.01,
+        flush_interval: float = 60.0,
+        thread_id: int | None = None,
+    ):
+        self.output_dir = output_dir
+        self.name = name
+        self.interval = interval
+        self.flush_interval = flush_interval
+        self.thread_id = thread_id if thread_id is not None else threading.main_thread().ident
+        self._counts: Counter[str] = Counter()
+        self._flushes = 0
+        self._lock = threading.Lock()
+        self._stop = threading.Event()
+        self._thread: threading.Thread | None = None
+
+    @classmethod
+    def for_component(cls, name: str) -> StackSampler:
+        """Return the sampler of an Airflow component, as configured."""
+        output_dir = conf.get("profiling", "stack_sampling_output_dir", fallback="") or os.path.join(
+            AIRFLOW_HOME, "stack_samples"
+        )
+        return cls(
+            output_dir,
+            name,
+            interval=conf.getfloat("profiling", "stack_sampling_interval", fallback=0.01),
+            flush_interval=conf.getfloat("profiling", "stack_sampling_flush_interval", fallback=60.0),
+        )
+
+    @property
+    def running(self) -> bool:
+        return self._thread is not None
+
+    def start(self) -> None:
+        if self._thread is not None:
+            return
+        os.makedirs(self.output_dir, exist_ok=True)
+        self._stop.clear()
+        self._thread = threading.Thread(target=self._run, name=f"{self.name}-stack-sampler", daemon=True)
+        self._thread.start()
+        log.info("Stack sampling started", output_dir=self.output_dir, interval=self.interval)
+
+    def stop(self) -> None:
+        """Stop sampling, and write the stacks not written yet."""
+        if self._thread is None:
+            return
+        self._stop.set()
+        self._thread.join()
+        self._thread = None
+        self.flush()
+        log.info("Stack sampling stopped")
+
+    def toggle(self) -> None:
+        if self.running:
+            self.stop()
+        else:
+            self.start()
+
+    def sample(self) -> None:
+        """Record the current stack of the sampled thread."""
+        frame = sys._current_frames().get(self.thread_id)  # type: ignore[arg-type]
+        if frame is None:
+            return
+        stack = _collapse_stack(frame)
+        with self._lock:
+            self._counts[stack] += 1
+
+    def flush(self) -> str | None:
+        """Write the stacks recorded since the last write to a new file, returning its path."""
+        with self._lock:
+            counts, self._counts = self._counts, Counter()
+        if not counts:
+            return None
+        self._flushes += 1
+        path = os.path.join(
+            self.output_dir,
+            f"{self.name}-{os.getpid()}-{time.strftime('%Y%m%dT%H%M%S')}-{self._flushes}.collapsed",
+        )
+        with open(path, "w") as f:
+            f.writelines(f"{stack} {count}\n" for stack, count in counts.most_common())
+        log.debug("Wrote stack samples", path=path, samples=sum(counts.values()))
+        return path
+
+    def _run(self) -> None:
+        next_flush = time.monotonic() + self.flush_interval
+        while not self._stop.wait(self.interval):
+            self.sample()
+            if time.monotonic() >= next_flush:
+                self.flush()
+                next_flush = time.monotonic() + self.flush_interval
+
+
+def _collapse_stack(frame: FrameType | None) -> str:
+    """Return a stack as ``;`` separated frames, outermost first."""
+    frames = []
+    while frame is not None:
+        code = frame.f_code
+        frames.append(f"{code.co_name} ({code.co_filename}:{code.co_firstlineno})")
+        frame = frame.f_back
+    return ";".join(reversed(frames))
@@ -68,6 +68,11 @@ def setup_event_handlers(engine):
                 f"attempting to check out in pid {pid}"
             )
 
+    if conf.getboolean("scheduler", "use_pool_slot_ledger", fallback=False):
+        from airflow.utils.pool_slot_ledger import track_pool_slot_usage
+
+        track_pool_slot_usage()
+
     if conf.getboolean("debug", "sqlalchemy_stats", fallback=False):
 
         @event.listens_for(engine, "before_cursor_execute")
@@ -0,0 +1,332 @@
+#
+# Licensed to the Apache Software Foundation (ASF) under one
+# or more contributor license agreements.  See the NOTICE file
+# distributed with this work for additional information
+# regarding copyright ownership.  The ASF licenses this file
+# to you under the Apache License, Version 2.0 (the
+# "License"); you may not use this file except in compliance
+# with the License.  You may obtain a copy of the License at
+#
+#   http://www.apache.org/licenses/LICENSE-2.0
+#
+# Unless required by applicable law or agreed to in writing,
+# software distributed under the License is distributed on an
+# "AS IS" BASIS, WITHOUT WARRANTIES OR CONDITIONS OF ANY
+# KIND, either express or implied.  See the License for the
+# specific language governing permissions and limitations
+# under the License.
+"""
+Ledger of the pool slots used by task instances, per pool and state.
+
+The scheduler needs the slots used in each pool in its critical section, while the pool rows are locked.
+Summing them over the task instance table takes longer the more task instances are active, whereas the
+ledger (the ``slot_pool_usage`` table) has one row per pool and state.
+
+The ledger is kept up to date by the sessions changing task instances: the changes of ORM objects are
+counted when they are flushed, and the ``UPDATE`` and ``DELETE`` statements on task instances read the rows
+they change. The counts of a transaction are added to the ledger when it commits, in a stable order so that
+concurrent transactions cannot deadlock on the ledger rows.
+
+Changes made without the ORM session (like the task instances deleted with their Dag run by a cascading
+foreign key) are not counted, so the ledger is periodically corrected from the task instance table.
+"""
+
+from __future__ import annotations
+
+import logging
+from collections import Counter
+from typing import TYPE_CHECKING, Any
+
+from sqlalchemy import delete, event, func, select, update
+from sqlalchemy.orm import Session, attributes
+from sqlalchemy.sql.elements import BindParameter
+
+from airflow.configuration import conf
+from airflow.ti_deps.dependencies_states import EXECUTION_STATES
+from airflow.utils.sqlalchemy import with_row_locks
+from airflow.utils.state import TaskInstanceState
+
+if TYPE_CHECKING:
+    from sqlalchemy.engine import Result
+    from sqlalchemy.orm import ORMExecuteState, SessionTransaction
+
+log = logging.getLogger(__name__)
+
+#: The states the slots of task instances are counted in
+TRACKED_STATES = frozenset(EXECUTION_STATES | {TaskInstanceState.DEFERRED, TaskInstanceState.SCHEDULED})
+
+# The columns of a task instance which the ledger depends on
+_TRACKED_COLUMNS = ("pool", "state", "pool_slots")
+
+# Key of the counts of the current transaction in ``Session.info``
+_DELTAS_KEY = "pool_slot_ledger_deltas"
+
+# Number of task instances read at once after a statement changing them
+_CHUNK_SIZE = 1000
+
+
+def is_enabled() -> bool:
+    return conf.getboolean("scheduler", "use_pool_slot_ledger", fallback=False)
+
+
+def track_pool_slot_usage() -> None:
+    """Keep the ledger up to date with the task instances changed by all ORM sessions."""
+    for name, handler in _HANDLERS.items():
+        if not event.contains(Session, name, handler):
+            event.listen(Session, name, handler)
+
+
+def untrack_pool_slot_usage() -> None:
+    for name, handler in _HANDLERS.items():
+        if event.contains(Session, name, handler):
+            event.remove(Session, name, handler)
+
+
+def _read_ledger(session: Session) -> dict[tuple[str, str], int]:
+    from airflow.models.pool import PoolSlotUsage
+
+    return {
+        (pool, state): slots
+        for pool, state, slots in session.execute(
+            select(PoolSlotUsage.pool, PoolSlotUsage.state, PoolSlotUsage.slots)
+        )
+    }
+
+
+def reconcile_pool_slot_usage(session: Session) -> int:
+    """
+    Correct the ledger from the task instance table, returning by how many slots it had drifted.
+
+    The task instances are summed without locking anything, between two reads of the ledger. The counts
+    which did not change between both reads are corrected by adding their difference to the ledger rows,
+    so the transactions committing meanwhile are neither blocked by the sum nor overwritten. The counts
+    which changed are left to the next reconcile.
+    """
+    from airflow.models.pool import Pool, PoolSlotUsage
+    from airflow.models.taskinstance import TaskInstance
+
+    before = _read_ledger(session)
+    actual: Counter[tuple[str, str]] = Counter()
+    for pool, state, slots in session.execute(
+        select(TaskInstance.pool, TaskInstance.state, func.sum(TaskInstance.pool_slots))
+        .where(TaskInstance.state.in_(TRACKED_STATES))
+        .group_by(TaskInstance.pool, TaskInstance.state)
+    ):
+        # Some databases return decimal.Decimal here.
+        actual[(pool, state)] = int(slots)
+    ledger = _read_ledger(session)
+
+    drift = 0
+    corrections: dict[tuple[str, str], int] = {}
+    for pool in session.scalars(select(Pool.pool)):
+        for state in TRACKED_STATES:
+            slots = actual[(pool, state)]
+            recorded = ledger.pop((pool, state), None)
+            if recorded is None:
+                session.add(PoolSlotUsage(pool=pool, state=state, slots=slots))
+                drift += slots
+            elif recorded != slots and before.get((pool, state)) == recorded:
+                corrections[(pool, state)] = slots - recorded
+    # In the same order as the transactions adding their counts, so they cannot deadlock
+    for (pool, state), correction in sorted(corrections.items()):
+        session.execute(
+            update(PoolSlotUsage)
+            .where(PoolSlotUsage.pool == pool, PoolSlotUsage.state == state)
+            .values(slots=PoolSlotUsage.slots + correction)
+            .execution_options(synchronize_session=False)
+        )
+        drift += abs(correction)
+    # Rows of deleted or renamed pools
+    for pool, state in ledger:
+        session.execute(
+            delete(PoolSlotUsage)
+            .where(PoolSlotUsage.pool == pool, PoolSlotUsage.state == state)
+            .execution_options(synchronize_session=False)
+        )
+    session.flush()
+    return drift
+
+
+def _pending_deltas(session: Session) -> Counter[tuple[str, str]]:
+    return session.info.setdefault(_DELTAS_KEY, Counter())
+
+
+def _count(
+    deltas: Counter[tuple[str, str]], pool: str | None, state: str | None, slots: int | None, sign: int
+) -> None:
+    if pool is not None and state in TRACKED_STATES and slots:
+        deltas[(pool, state)] += sign * slots
+
+
+def _loaded_values(obj: Any) -> tuple[Any, ...] | None:
+    """Return the tracked columns of a task instance as last loaded or flushed, or None if one is unloaded."""
+    values = []
+    for key in _TRACKED_COLUMNS:
+        history = attributes.get_history(obj, key, passive=attributes.PASSIVE_NO_INITIALIZE)
+        loaded = history.deleted or history.unchanged
+        if not loaded:
+            return None
+        values.append(loaded[0])
+    return tuple(values)
+
+
+def _before_flush(session: Session, flush_context: Any, instances: Any) -> None:
+    """Count the slots of the task instances added, changed and deleted by the flush."""
+    from airflow.models.pool import Pool, PoolSlotUsage
+    from airflow.models.taskinstance import TaskInstance as TI
+
+    deltas = _pending_deltas(session)
+    # Task instances changed or deleted without their previous values loaded, which are read from their rows
+    unloaded_ids = []
+    for obj in session.new:
+        if isinstance(obj, TI):
+            _count(deltas, obj.pool, obj.state, obj.pool_slots, 1)
+        elif isinstance(obj, Pool) and obj.pool:
+            session.add_all(PoolSlotUsage(pool=obj.pool, state=state, slots=0) for state in TRACKED_STATES)
+    for obj in session.dirty:
+        if not isinstance(obj, TI) or not any(
+            attributes.get_history(obj, key, passive=attributes.PASSIVE_NO_INITIALIZE).has_changes()
+            for key in _TRACKED_COLUMNS
+        ):
+            continue
+        if (old := _loaded_values(obj)) is None:
+            unloaded_ids.append(obj.id)
+        else:
+            _count(deltas, *old, sign=-1)
+        _count(deltas, obj.pool, obj.state, obj.pool_slots, 1)
+    for obj in session.deleted:
+        if not isinstance(obj, TI):
+            continue
+        if (old := _loaded_values(obj)) is None:
+            unloaded_ids.append(obj.id)
+        else:
+            _count(deltas, *old, sign=-1)
+    # Not flushed yet, so the rows still hold the previous values; locked until the flush changes them
+    for start in range(0, len(unloaded_ids), _CHUNK_SIZE):
+        chunk = unloaded_ids[start : start + _CHUNK_SIZE]
+        before = with_row_locks(
+            select(TI.pool, TI.state, TI.pool_slots).where(TI.id.in_(chunk)), session=session
+        )
+        for pool, state, slots in session.execute(before):
+            _count(deltas, pool, state, slots, -1)
+
+
+def _updated_columns(orm_execute_state: ORMExecuteState) -> dict[str, Any]:
+    """Return the values set by an ``UPDATE`` statement, by column name."""
+    statement = orm_execute_state.statement
+    values = dict(getattr(statement, "_values", None) or {})
+    values.update(getattr(statement, "_ordered_values", None) or ())
+    updated = {getattr(column, "key", column): value for column, value in values.items()}
+    parameters = orm_execute_state.parameters
+    # Bulk updates by primary key pass the values of each row as parameters
+    for row in parameters if isinstance(parameters, list) else [parameters or {}]:
+        updated.update(row)
+    return updated
+
+
+def _do_orm_execute(orm_execute_state: ORMExecuteState) -> Result | None:
+    """Count the slots of the task instances changed by ``UPDATE`` and ``DELETE`` statements."""
+    from airflow.models.taskinstance import TaskInstance as TI
+
+    if not (orm_execute_state.is_update or orm_execute_state.is_delete):
+        return None
+    mapper = orm_execute_state.bind_mapper
+    if mapper is None or mapper.class_ is not TI:
+        return None
+    updated = _updated_columns(orm_execute_state) if orm_execute_state.is_update else {}
+    if orm_execute_state.is_update and not updated.keys() & set(_TRACKED_COLUMNS):
+        return None
+
+    session = orm_execute_state.session
+    statement = orm_execute_state.statement
+    parameters = orm_execute_state.parameters
+    # Locked, so the rows cannot change between reading them and the statement changing them
+    rows = with_row_locks(select(TI.id, TI.pool, TI.state, TI.pool_slots), session=session, of=TI)
+    if isinstance(parameters, list) and "id" in updated:
+        before = [
+            row
+            for start in range(0, len(parameters), _CHUNK_SIZE)
+            for row in session.execute(
+                rows.where(TI.id.in_([params["id"] for params in parameters[start : start + _CHUNK_SIZE]]))
+            )
+        ]
+    elif isinstance(parameters, list):
+        if statement.whereclause is None:
+            raise ValueError("Bulk updates of task instances must pass their id or have a WHERE clause")
+        # Executed once per set of bound parameters; a row matched by several sets is counted once
+        before = list(
+            {
+                row.id: row
+                for params in parameters
+                for row in session.execute(rows.where(statement.whereclause), params)
+            }.values()
+        )
+    else:
+        if statement.whereclause is not None:
+            rows = rows.where(statement.whereclause)
+        before = session.execute(rows).all()
+
+    result = orm_execute_state.invoke_statement()
+
+    deltas = _pending_deltas(session)
+    for _, pool, state, slots in before:
+        _count(deltas, pool, state, slots, -1)
+    if orm_execute_state.is_delete or not before:
+        return result
+    literals = {
+        key: value.value
+        for key, value in updated.items()
+        if key in _TRACKED_COLUMNS and isinstance(value, BindParameter) and value.callable is None
+    }
+    if not isinstance(parameters, list) and literals.keys() == updated.keys() & set(_TRACKED_COLUMNS):
+        # The new values are known, no need to read the rows again
+        for _, pool, state, slots in before:
+            _count(
+                deltas,
+                literals.get("pool", pool),
+                literals.get("state", state),
+                literals.get("pool_slots", slots),
+                1,
+            )
+        return result
+    ids = [row.id for row in before]
+    for start in range(0, len(ids), _CHUNK_SIZE):
+        after = select(TI.pool, TI.state, TI.pool_slots).where(TI.id.in_(ids[start : start + _CHUNK_SIZE]))
+        for pool, state, slots in session.execute(after):
+            _count(deltas, pool, state, slots, 1)
+    return result
+
+
+def _before_commit(session: Session) -> None:
+    """Add the slots counted in the transaction to the ledger."""
+    from airflow.models.pool import PoolSlotUsage
+
+    # Flush first: the changes flushed by the commit itself would only be counted after this event
+    session.flush()
+    deltas = session.info.pop(_DELTAS_KEY, None)
+    if not deltas:
+        return
+    # Always in the same order, so concurrent transactions lock the ledger rows in the same order
+    for (pool, state), delta in sorted(deltas.items()):
+        if not delta:
+            continue
+        session.execute(
+            update(PoolSlotUsage)
+            .where(PoolSlotUsage.pool == pool, PoolSlotUsage.state == state)
+            .values(slots=PoolSlotUsage.slots + delta)
+            .execution_options(synchronize_session=False)
+        )
+
+
+def _after_transaction_end(session: Session, transaction: SessionTransaction) -> None:
+    # The counts of a rolled back transaction are dropped; those of savepoints are kept until the end
+    if transaction.parent is None:
+        session.info.pop(_DELTAS_KEY, None)
+
+
+_HANDLERS = {
+    "before_flush": _before_flush,
+    "do_orm_execute": _do_orm_execute,
+    "before_commit": _before_commit,
+    "after_transaction_end": _after_transaction_end,
+}
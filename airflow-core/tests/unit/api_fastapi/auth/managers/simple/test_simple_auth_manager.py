@@ -326,6 +326,9 @@ class TestSimpleAuthManager:
         )
         assert expected is result
 
+    def test_grants_dag_access_per_team(self, auth_manager):
+        assert auth_manager.grants_dag_access_per_team()
+
     def test_filter_authorized_menu_items(self, auth_manager):
         items = [MenuItem.ASSETS]
         results = auth_manager.filter_authorized_menu_items(
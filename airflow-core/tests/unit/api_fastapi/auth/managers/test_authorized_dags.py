@@ -0,0 +1,137 @@
+# Licensed to the Apache Software Foundation (ASF) under one
+# or more contributor license agreements.  See the NOTICE file
+# distributed with this work for additional information
+# regarding copyright ownership.  The ASF licenses this file
+# to you under the Apache License, Version 2.0 (the
+# "License"); you may not use this file except in compliance
+# with the License.  You may obtain a copy of the License at
+#
+#   http://www.apache.org/licenses/LICENSE-2.0
+#
+# Unless required by applicable law or agreed to in writing,
+# software distributed under the License is distributed on an
+# "AS IS" BASIS, WITHOUT WARRANTIES OR CONDITIONS OF ANY
+# KIND, either express or implied.  See the License for the
+# specific language governing permissions and limitations
+# under the License.
+from __future__ import annotations
+
+from unittest import mock
+
+import pytest
+from sqlalchemy import select
+
+from airflow.api_fastapi.auth.managers.authorized_dags import AuthorizedDagIds, AuthorizedDagIdsCache
+from airflow.models.dag import DagModel, DagRun
+
+DAGS_BY_TEAM = {None: {"dag1", "dag2"}, "team1": {"dag3", "dag4"}, "team2": {"dag5"}}
+
+
+def compile_clause(dag_ids: AuthorizedDagIds) -> str:
+    statement = select(DagRun.id).where(dag_ids.dag_id_clause(DagRun.dag_id))
+    return str(statement.compile(compile_kwargs={"literal_binds": True}))
+
+
+class TestAuthorizedDagIds:
+    @pytest.mark.parametrize(
+        ("authorized", "complete_teams", "all_dags"),
+        [
+            ({}, set(), False),
+            ({None: {"dag1"}, "team1": {"dag3"}}, set(), False),
+            ({None: {"dag1"}, "team1": {"dag3", "dag4"}}, {"team1"}, False),
+            ({None: {"dag1", "dag2"}, "team1": set(), "team2": {"dag5"}}, {None, "team2"}, False),
+            (DAGS_BY_TEAM, {None, "team1", "team2"}, True),
+        ],
+    )
+    def test_from_teams(self, authorized, complete_teams, all_dags):
+        dag_ids = AuthorizedDagIds.from_teams(authorized, DAGS_BY_TEAM)
+
+        assert dag_ids == set().union(*authorized.values())
+        assert dag_ids.complete_teams == complete_teams
+        assert dag_ids.all_dags is all_dags
+        copy = dag_ids.copy()
+        assert (copy, copy.complete_teams, copy.all_dags) == (dag_ids, complete_teams, all_dags)
+
+    def test_dag_id_clause_lists_dag_ids(self):
+        dag_ids = AuthorizedDagIds.from_teams({None: {"dag1"}, "team1": {"dag3"}}, DAGS_BY_TEAM)
+
+        sql = compile_clause(dag_ids)
+        assert "dag_run.dag_id IN ('dag1', 'dag3')" in sql or "dag_run.dag_id IN ('dag3', 'dag1')" in sql
+        assert "team_name" not in sql
+
+    def test_dag_id_clause_selects_complete_teams(self):
+        dag_ids = AuthorizedDagIds.from_teams({None: {"dag1"}, "team1": {"dag3", "dag4"}}, DAGS_BY_TEAM)
+
+        sql = compile_clause(dag_ids)
+        assert "dag_bundle_team.team_name IN ('team1')" in sql
+        assert "dag_run.dag_id IN ('dag1')" in sql
+        assert "dag3" not in sql
+
+    def test_dag_id_clause_all_dags(self):
+        dag_ids = AuthorizedDagIds.from_teams(DAGS_BY_TEAM, DAGS_BY_TEAM)
+
+        sql = compile_clause(dag_ids)
+        assert "dag_run.dag_id IN (SELECT dag.dag_id" in sql
+        assert "dag1" not in sql
+
+    def test_plain_set_lists_dag_ids(self):
+        statement = select(DagModel.dag_id).where(AuthorizedDagIds({"dag1"}).dag_id_clause(DagModel.dag_id))
+
+        assert "dag.dag_id IN ('dag1')" in str(statement.compile(compile_kwargs={"literal_binds": True}))
+
+
+class TestAuthorizedDagIdsCache:
+    @mock.patch("airflow.api_fastapi.auth.managers.authorized_dags.Stats")
+    def test_get_put(self, mock_stats):
+        dag_ids_cache = AuthorizedDagIdsCache(ttl=30, max_entries=10)
+        dag_ids = AuthorizedDagIds({"dag1"}, complete_teams={None}, all_dags=True)
+
+        assert dag_ids_cache.get("user", "fingerprint") is None
+        dag_ids_cache.put("user", "fingerprint", dag_ids)
+        cached = dag_ids_cache.get("user", "fingerprint")
+        assert cached == dag_ids
+        assert cached.all_dags
+        # Callers get their own copy
+        cached.add("dag2")
+        assert dag_ids_cache.get("user", "fingerprint") == {"dag1"}
+
+        assert mock_stats.incr.mock_calls == [
+            mock.call("api.authorized_dag_ids_cache.misses"),
+            mock.call("api.authorized_dag_ids_cache.hits"),
+            mock.call("api.authorized_dag_ids_cache.hits"),
+        ]
+
+    def test_changed_fingerprint(self):
+        dag_ids_cache = AuthorizedDagIdsCache(ttl=30, max_entries=10)
+        dag_ids_cache.put("user", "fingerprint", AuthorizedDagIds({"dag1"}))
+
+        assert dag_ids_cache.get("user", "other fingerprint") is None
+        assert dag_ids_cache.get("user", "fingerprint") is None
+        assert len(dag_ids_cache) == 0
+
+    @mock.patch("airflow.api_fastapi.auth.managers.authorized_dags.time.monotonic")
+    def test_expiry(self, mock_monotonic):
+        dag_ids_cache = AuthorizedDagIdsCache(ttl=30, max_entries=10)
+        mock_monotonic.return_value = 100
+        dag_ids_cache.put("user", "fingerprint", AuthorizedDagIds({"dag1"}))
+        mock_monotonic.return_value = 129
+        assert dag_ids_cache.get("user", "fingerprint") == {"dag1"}
+        mock_monotonic.return_value = 131
+        assert dag_ids_cache.get("user", "fingerprint") is None
+
+    def test_evicts_least_recently_used(self):
+        dag_ids_cache = AuthorizedDagIdsCache(ttl=30, max_entries=2)
+        dag_ids_cache.put("user1", "fingerprint", AuthorizedDagIds({"dag1"}))
+        dag_ids_cache.put("user2", "fingerprint", AuthorizedDagIds({"dag2"}))
+        dag_ids_cache.get("user1", "fingerprint")
+        dag_ids_cache.put("user3", "fingerprint", AuthorizedDagIds({"dag3"}))
+
+        assert dag_ids_cache.get("user2", "fingerprint") is None
+        assert dag_ids_cache.get("user1", "fingerprint") == {"dag1"}
+
+    def test_disabled(self):
+        dag_ids_cache = AuthorizedDagIdsCache(ttl=0, max_entries=10)
+        dag_ids_cache.put("user", "fingerprint", AuthorizedDagIds({"dag1"}))
+
+        assert not dag_ids_cache.enabled
+        assert len(dag_ids_cache) == 0
@@ -22,6 +22,7 @@ from unittest.mock import AsyncMock, MagicMock, Mock, patch
 import pytest
 from jwt import InvalidTokenError
 
+from airflow.api_fastapi.auth.managers.authorized_dags import get_authorized_dag_ids_cache
 from airflow.api_fastapi.auth.managers.base_auth_manager import BaseAuthManager, T
 from airflow.api_fastapi.auth.managers.models.base_user import BaseUser
 from airflow.api_fastapi.auth.managers.models.resource_details import (
@@ -447,6 +448,46 @@ class TestBaseAuthManager:
         result = auth_manager.get_authorized_dag_ids(user=user, session=session)
         assert result == expected
 
+    @pytest.mark.parametrize("per_team", [False, True])
+    def test_get_authorized_dag_ids_filtered_by_team_only_when_granted_per_team(self, auth_manager, per_team):
+        auth_manager.is_authorized_dag = MagicMock(return_value=True)
+        auth_manager.grants_dag_access_per_team = MagicMock(return_value=per_team)
+        session = Mock()
+        session.execute.return_value.all.return_value = [("dag1", None), ("dag2", "team1")]
+
+        result = auth_manager.get_authorized_dag_ids(user=Mock(), session=session)
+
+        assert result == {"dag1", "dag2"}
+        assert result.all_dags is per_team
+        assert result.complete_teams == ({None, "team1"} if per_team else set())
+
+    @patch("airflow.api_fastapi.auth.managers.base_auth_manager.dags_fingerprint")
+    def test_get_authorized_dag_ids_cached(self, mock_dags_fingerprint, auth_manager):
+        get_authorized_dag_ids_cache.cache_clear()
+        auth_manager.is_authorized_dag = MagicMock(return_value=True)
+        user = BaseAuthManagerUserTest(name="test")
+        session = Mock()
+        session.execute.return_value.all.return_value = [("dag1", None), ("dag2", "team1")]
+        mock_dags_fingerprint.return_value = (("bundle", None, 2, "dag1", "dag2"),)
+
+        with conf_vars({("api", "authorized_dag_ids_cache_ttl"): "30"}):
+            result = auth_manager.get_authorized_dag_ids(user=user, session=session)
+            assert result == {"dag1", "dag2"}
+            assert auth_manager.get_authorized_dag_ids(user=user, session=session) == result
+            assert auth_manager.is_authorized_dag.call_count == 2
+
+            # Other users and methods are not served from the cache
+            auth_manager.get_authorized_dag_ids(user=BaseAuthManagerUserTest(name="other"), session=session)
+            auth_manager.get_authorized_dag_ids(user=user, method="PUT", session=session)
+            assert auth_manager.is_authorized_dag.call_count == 6
+
+            # Changed Dags are not served from the cache
+            mock_dags_fingerprint.return_value = (("bundle", None, 3, "dag1", "dag3"),)
+            session.execute.return_value.all.return_value = [("dag1", None), ("dag3", "team1")]
+            assert auth_manager.get_authorized_dag_ids(user=user, session=session) == {"dag1", "dag3"}
+            assert auth_manager.is_authorized_dag.call_count == 8
+        get_authorized_dag_ids_cache.cache_clear()
+
     @pytest.mark.parametrize(
         ("access_per_connection", "access_per_team", "rows", "expected"),
         [
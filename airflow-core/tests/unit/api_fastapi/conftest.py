@@ -54,6 +54,20 @@ def get_api_path(request):
     return API_PATHS.get(subdirectory_name, "/")
 
 
+@pytest.fixture(autouse=True)
+def reconfigure_async_db_engine():
+    """
+    Reconfigure the async engine for each test, without a connection pool.
+
+    The way we init async engine does not work well with FastAPI app init. Async connections are bound to
+    the event loop they were opened in, and the test clients run each request in a new event loop; without
+    a pool, every session opens its connection in the loop of its request.
+    """
+    from airflow.settings import _configure_async_session
+
+    _configure_async_session(disable_connection_pool=True)
+
+
 @pytest.fixture
 def test_client(request):
     with conf_vars(
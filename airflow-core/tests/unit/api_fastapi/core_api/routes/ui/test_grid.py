@@ -19,14 +19,17 @@ from __future__ import annotations
 
 from datetime import timedelta
 from operator import attrgetter
+from unittest import mock
 
 import pendulum
 import pytest
 from sqlalchemy import select
 
 from airflow._shared.timezones import timezone
+from airflow.api_fastapi.core_api.services.ui.grid_cache import get_grid_response_cache
 from airflow.models.dag import DagModel
 from airflow.models.dagbag import DBDagBag
+from airflow.models.dagrun import DagRun
 from airflow.models.taskinstance import TaskInstance
 from airflow.providers.standard.operators.empty import EmptyOperator
 from airflow.providers.standard.operators.python import PythonOperator
@@ -373,9 +376,11 @@ def setup(dag_maker, session=None):
 def _clean():
     clear_db_runs()
     clear_db_assets()
+    get_grid_response_cache().clear()
     yield
     clear_db_runs()
     clear_db_assets()
+    get_grid_response_cache().clear()
 
 
 # Create this as a fixture so that it is applied before the `dag_with_runs` fixture is!
@@ -387,7 +392,7 @@ def _freeze_time_for_dagruns(time_machine):
 @pytest.mark.usefixtures("_freeze_time_for_dagruns")
 class TestGetGridDataEndpoint:
     def test_should_response_200(self, test_client):
-        with assert_queries_count(6):
+        with assert_queries_count(7):
             response = test_client.get(f"/grid/runs/{DAG_ID}")
         assert response.status_code == 200
         assert _strip_dag_version_ids(response.json()) == [
@@ -429,7 +434,7 @@ class TestGetGridDataEndpoint:
         ],
     )
     def test_should_response_200_order_by(self, test_client, order_by, expected):
-        with assert_queries_count(6):
+        with assert_queries_count(7):
             response = test_client.get(f"/grid/runs/{DAG_ID}", params={"order_by": order_by})
         assert response.status_code == 200
         assert _strip_dag_version_ids(response.json()) == expected
@@ -448,7 +453,7 @@ class TestGetGridDataEndpoint:
         ],
     )
     def test_should_response_200_limit(self, test_client, limit, expected):
-        with assert_queries_count(6):
+        with assert_queries_count(7):
             response = test_client.get(f"/grid/runs/{DAG_ID}", params={"limit": limit})
         assert response.status_code == 200
         assert _strip_dag_version_ids(response.json()) == expected
@@ -473,7 +478,7 @@ class TestGetGridDataEndpoint:
         ],
     )
     def test_runs_should_response_200_date_filters(self, test_client, params, expected):
-        with assert_queries_count(6):
+        with assert_queries_count(7):
             response = test_client.get(
                 f"/grid/runs/{DAG_ID}",
                 params=params,
@@ -536,7 +541,7 @@ class TestGetGridDataEndpoint:
         assert response.json() == [{"id": "task2", "label": "task2"}]
 
     def test_runs_should_response_200_without_dag_run(self, test_client):
-        with assert_queries_count(5):
+        with assert_queries_count(6):
             response = test_client.get(f"/grid/runs/{DAG_ID_2}")
         assert response.status_code == 200
         assert response.json() == []
@@ -565,7 +570,7 @@ class TestGetGridDataEndpoint:
         ]
 
         # Also verify that TI summaries include a leaf entry for the removed task
-        with assert_queries_count(4):
+        with assert_queries_count(5):
             ti_resp = test_client.get(f"/grid/ti_summaries/{DAG_ID_3}/run_3")
         assert ti_resp.status_code == 200
         ti_payload = ti_resp.json()
@@ -635,7 +640,7 @@ class TestGetGridDataEndpoint:
 
     def test_get_grid_runs(self, session, test_client):
         session.commit()
-        with assert_queries_count(6):
+        with assert_queries_count(7):
             response = test_client.get(f"/grid/runs/{DAG_ID}?limit=5")
         assert response.status_code == 200
         assert _strip_dag_version_ids(response.json()) == [GRID_RUN_1, GRID_RUN_2]
@@ -671,7 +676,7 @@ class TestGetGridDataEndpoint:
 
     def test_get_grid_runs_filter_by_run_type_and_triggering_user(self, session, test_client):
         session.commit()
-        with assert_queries_count(6):
+        with assert_queries_count(7):
             response = test_client.get(f"/grid/runs/{DAG_ID}?run_type=manual&triggering_user=user2")
         assert response.status_code == 200
         assert _strip_dag_version_ids(response.json()) == [GRID_RUN_2]
@@ -696,7 +701,7 @@ class TestGetGridDataEndpoint:
         run_id = "run_4-1"
         session.commit()
 
-        with assert_queries_count(4):
+        with assert_queries_count(5):
             response = test_client.get(f"/grid/ti_summaries/{DAG_ID_4}/{run_id}")
         assert response.status_code == 200
         actual = response.json()
@@ -796,7 +801,7 @@ class TestGetGridDataEndpoint:
         run_id = "run_2"
         session.commit()
 
-        with assert_queries_count(4):
+        with assert_queries_count(5):
             response = test_client.get(f"/grid/ti_summaries/{DAG_ID}/{run_id}")
         assert response.status_code == 200
         data = response.json()
@@ -1114,3 +1119,71 @@ class TestGetGridDataEndpoint:
         nodes = response.json()
         task_ids = sorted([node["id"] for node in nodes])
         assert task_ids == expected_task_ids, description
+
+    @pytest.mark.parametrize(
+        "url",
+        [f"/grid/runs/{DAG_ID}", f"/grid/structure/{DAG_ID}", f"/grid/ti_summaries/{DAG_ID}/run_1"],
+    )
+    def test_conditional_request(self, test_client, url):
+        response = test_client.get(url)
+        assert response.status_code == 200
+        etag = response.headers["ETag"]
+        assert response.headers["Cache-Control"] == "no-cache"
+
+        response = test_client.get(url, headers={"If-None-Match": etag})
+
+        assert response.status_code == 304
+        assert response.headers["ETag"] == etag
+        assert response.content == b""
+
+    def test_ti_summaries_cached_until_task_instances_change(self, session, test_client):
+        url = f"/grid/ti_summaries/{DAG_ID}/run_1"
+        response = test_client.get(url)
+        etag = response.headers["ETag"]
+
+        assert len(get_grid_response_cache()) == 1
+
+        cached = test_client.get(url)
+        assert len(get_grid_response_cache()) == 1
+        assert cached.json() == response.json()
+        assert cached.headers["ETag"] == etag
+
+        ti = session.scalars(
+            select(TaskInstance).where(TaskInstance.dag_id == DAG_ID, TaskInstance.run_id == "run_1")
+        ).first()
+        ti.state = TaskInstanceState.UP_FOR_RETRY
+        session.commit()
+
+        response = test_client.get(url, headers={"If-None-Match": etag})
+        assert response.status_code == 200
+        assert response.headers["ETag"] != etag
+        assert response.json() != cached.json()
+
+    def test_structure_cached_without_deserializing_dag(self, test_client):
+        url = f"/grid/structure/{DAG_ID}"
+        response = test_client.get(url)
+        assert response.status_code == 200
+
+        with mock.patch.object(DBDagBag, "read_dag") as read_dag:
+            cached = test_client.get(url)
+
+        read_dag.assert_not_called()
+        assert cached.json() == response.json()
+
+    def test_runs_with_unfinished_run_not_answered_as_not_modified(self, session, test_client, time_machine):
+        dag_run = session.scalar(select(DagRun).where(DagRun.dag_id == DAG_ID, DagRun.run_id == "run_2"))
+        dag_run.state = DagRunState.RUNNING
+        dag_run.end_date = None
+        session.commit()
+        url = f"/grid/runs/{DAG_ID}"
+        response = test_client.get(url)
+        assert response.status_code == 200
+        assert "ETag" not in response.headers
+
+        time_machine.shift(timedelta(minutes=1))
+        cached = test_client.get(url, headers={"If-None-Match": "*"})
+
+        assert cached.status_code == 200
+        durations = {run["run_id"]: run["duration"] for run in response.json()}
+        cached_durations = {run["run_id"]: run["duration"] for run in cached.json()}
+        assert cached_durations == {**durations, "run_2": durations["run_2"] + 60}
@@ -31,11 +31,13 @@ from sqlalchemy.orm import Session
 from airflow._shared.timezones import timezone
 from airflow.api_fastapi.auth.tokens import JWTValidator
 from airflow.api_fastapi.execution_api.app import lifespan
+from airflow.api_fastapi.execution_api.heartbeats import HeartbeatBuffer
 from airflow.exceptions import AirflowSkipException
 from airflow.models import RenderedTaskInstanceFields, TaskReschedule, Trigger
 from airflow.models.asset import AssetActive, AssetAliasModel, AssetEvent, AssetModel
 from airflow.models.taskinstance import TaskInstance
 from airflow.models.taskinstancehistory import TaskInstanceHistory
+from airflow.models.xcom import XComModel
 from airflow.providers.standard.operators.empty import EmptyOperator
 from airflow.sdk import Asset, TaskGroup, TriggerRule, task, task_group
 from airflow.utils.state import DagRunState, State, TaskInstanceState, TerminalTIState
@@ -46,6 +48,7 @@ from tests_common.test_utils.db import (
     clear_db_dags,
     clear_db_runs,
     clear_db_serialized_dags,
+    clear_db_xcom,
     clear_rendered_ti_fields,
 )
 
@@ -1655,6 +1658,107 @@ class TestTIHealthEndpoint:
         session.refresh(ti)
         assert ti.last_heartbeat_at == time_now.add(minutes=10)
 
+    def test_ti_heartbeat_buffered(self, client, session, create_task_instance, time_machine):
+        """Test that buffered heartbeats keep their conflict checks and are written in bulk."""
+        time_now = timezone.parse("2024-10-31T12:00:00Z")
+        time_machine.move_to(time_now, tick=False)
+
+        ti = create_task_instance(
+            task_id="test_ti_heartbeat_buffered",
+            state=State.RUNNING,
+            hostname="random-hostname",
+            pid=1547,
+            session=session,
+        )
+        session.commit()
+        heartbeat_buffer = HeartbeatBuffer(flush_interval=60)
+        url = f"/execution/task-instances/{ti.id}/heartbeat"
+
+        with mock.patch(
+            "airflow.api_fastapi.execution_api.routes.task_instances.get_heartbeat_buffer",
+            return_value=heartbeat_buffer,
+        ):
+            response = client.put(url, json={"hostname": "random-hostname", "pid": 1547})
+            assert response.status_code == 204
+            session.refresh(ti)
+            assert ti.last_heartbeat_at is None
+
+            # The cached owner is still checked
+            response = client.put(url, json={"hostname": "random-hostname", "pid": 1054})
+            assert response.status_code == 409
+            assert response.json()["detail"]["reason"] == "running_elsewhere"
+
+            # Once the flush interval has passed, the pending heartbeats are written
+            heartbeat_buffer._last_flush -= 60
+            response = client.put(url, json={"hostname": "random-hostname", "pid": 1547})
+            assert response.status_code == 204
+            session.refresh(ti)
+            assert ti.last_heartbeat_at == time_now
+
+            # A state change through the API evicts the cached owner
+            response = client.patch(
+                f"/execution/task-instances/{ti.id}/state",
+                json={"state": "success", "end_date": "2024-10-31T12:00:00Z"},
+            )
+            assert response.status_code == 204
+            response = client.put(url, json={"hostname": "random-hostname", "pid": 1547})
+            assert response.status_code == 409
+            assert response.json()["detail"]["reason"] == "not_running"
+
+    def test_ti_heartbeat_buffered_state_changed_elsewhere(self, client, session, create_task_instance):
+        """Test that flushing the buffer evicts the task instances changed outside of the Execution API."""
+        ti = create_task_instance(
+            task_id="test_ti_heartbeat_buffered_state_changed_elsewhere",
+            state=State.RUNNING,
+            hostname="random-hostname",
+            pid=1547,
+            session=session,
+        )
+        session.commit()
+        heartbeat_buffer = HeartbeatBuffer(flush_interval=60)
+        url = f"/execution/task-instances/{ti.id}/heartbeat"
+
+        with mock.patch(
+            "airflow.api_fastapi.execution_api.routes.task_instances.get_heartbeat_buffer",
+            return_value=heartbeat_buffer,
+        ):
+            response = client.put(url, json={"hostname": "random-hostname", "pid": 1547})
+            assert response.status_code == 204
+
+            ti.state = State.FAILED
+            session.commit()
+
+            heartbeat_buffer.flush(session)
+            session.commit()
+            assert heartbeat_buffer.get_owner(ti.id) is None
+            session.refresh(ti)
+            assert ti.last_heartbeat_at is None
+
+            response = client.put(url, json={"hostname": "random-hostname", "pid": 1547})
+            assert response.status_code == 409
+            assert response.json()["detail"]["reason"] == "not_running"
+
+    def test_heartbeat_buffer_flushes_on_stop(self, session, create_task_instance, time_machine):
+        """Test that the pending heartbeats are written when the buffer stops."""
+        time_now = timezone.parse("2024-10-31T12:00:00Z")
+        time_machine.move_to(time_now, tick=False)
+        ti = create_task_instance(
+            task_id="test_heartbeat_buffer_flushes_on_stop",
+            state=State.RUNNING,
+            hostname="random-hostname",
+            pid=1547,
+            session=session,
+        )
+        session.commit()
+        heartbeat_buffer = HeartbeatBuffer(flush_interval=60)
+        heartbeat_buffer.add(ti.id, time_now, session)
+
+        heartbeat_buffer.start()
+        heartbeat_buffer.stop()
+
+        session.refresh(ti)
+        assert ti.last_heartbeat_at == time_now
+
 
 class TestTIPutRTIF:
     def setup_method(self):
@@ -1721,6 +1825,69 @@ class TestTIPutRTIF:
         assert response.json()["detail"] == "Not Found"
 
 
+class TestTIFinalize:
+    def setup_method(self):
+        clear_db_runs()
+        clear_db_xcom()
+        clear_rendered_ti_fields()
+
+    def teardown_method(self):
+        clear_db_runs()
+        clear_db_xcom()
+        clear_rendered_ti_fields()
+
+    def test_ti_finalize(self, client, session, create_task_instance):
+        ti = create_task_instance(
+            task_id="test_ti_finalize", start_date=DEFAULT_START_DATE, state=State.RUNNING, session=session
+        )
+        session.commit()
+
+        response = client.patch(
+            f"/execution/task-instances/{ti.id}/finalize",
+            json={
+                "state_update": {"state": "success", "end_date": DEFAULT_END_DATE.isoformat()},
+                "rendered_fields": {"field1": "rendered"},
+                "xcoms": [{"key": "return_value", "value": '"result"'}, {"key": "link", "value": None}],
+            },
+        )
+
+        assert response.status_code == 204
+        session.expire_all()
+        ti = session.get(TaskInstance, ti.id)
+        assert ti.state == State.SUCCESS
+        assert ti.end_date == DEFAULT_END_DATE
+        xcoms = session.scalars(select(XComModel).where(XComModel.task_id == ti.task_id)).all()
+        assert {xcom.key: xcom.value for xcom in xcoms} == {"return_value": '"result"', "link": None}
+        rtif = session.scalars(select(RenderedTaskInstanceFields)).one()
+        assert rtif.rendered_fields == {"field1": "rendered"}
+
+    def test_ti_finalize_rolls_back_on_invalid_state(self, client, session, create_task_instance):
+        ti = create_task_instance(
+            task_id="test_ti_finalize_rolls_back", state=State.SUCCESS, session=session
+        )
+        session.commit()
+
+        response = client.patch(
+            f"/execution/task-instances/{ti.id}/finalize",
+            json={
+                "state_update": {"state": "success", "end_date": DEFAULT_END_DATE.isoformat()},
+                "xcoms": [{"key": "return_value", "value": '"result"'}],
+            },
+        )
+
+        assert response.status_code == 409
+        assert session.scalars(select(XComModel)).all() == []
+
+    def test_ti_finalize_missing_ti(self, client):
+        response = client.patch(
+            f"/execution/task-instances/{uuid6.uuid7()}/finalize",
+            json={"state_update": {"state": "failed", "end_date": DEFAULT_END_DATE.isoformat()}},
+        )
+
+        assert response.status_code == 404
+        assert response.json()["detail"]["reason"] == "not_found"
+
+
 class TestPreviousDagRun:
     def setup_method(self):
         clear_db_runs()
@@ -1892,7 +2059,6 @@ class TestGetCount:
         # Set different states for the task instances
         for ti, state in zip(tis, [State.SUCCESS, State.FAILED, State.SKIPPED]):
             ti.state = state
-            session.merge(ti)
         session.commit()
 
         response = client.get(
@@ -2035,7 +2201,6 @@ class TestGetCount:
         # Set different states for the task instances
         for ti, state in zip(tis, [State.SUCCESS, State.FAILED, State.SKIPPED]):
             ti.state = state
-            session.merge(ti)
         session.commit()
 
         response = client.get(
@@ -2080,7 +2245,6 @@ class TestGetCount:
 
         for ti in tis:
             ti.state = State.SUCCESS
-            session.merge(ti)
         session.commit()
 
         map_index = {} if map_index is None else {"map_index": map_index}
@@ -2392,7 +2556,6 @@ class TestGetTaskStates:
         # Set different states for the task instances
         for ti, state in zip(tis, [State.SUCCESS, State.FAILED]):
             ti.state = state
-            session.merge(ti)
         session.commit()
 
         response = client.get(
@@ -2425,7 +2588,6 @@ class TestGetTaskStates:
         # Set different states for the task instances
         for ti, state in zip(tis, [State.SUCCESS, State.FAILED, State.SKIPPED]):
             ti.state = state
-            session.merge(ti)
         session.commit()
 
         response = client.get(
@@ -2586,7 +2748,6 @@ class TestGetTaskStates:
         tis = dr.get_task_instances()
         for ti in tis:
             ti.state = states.get(str(ti.map_index))
-            session.merge(ti)
         session.commit()
 
         map_index = {} if map_index is None else {"map_index": map_index}
@@ -2694,7 +2855,6 @@ class TestGetTaskStates:
         tis = dr.get_task_instances()
         for ti in tis:
             ti.state = states.get(str(ti.map_index))
-            session.merge(ti)
         session.commit()
         params = {}
 
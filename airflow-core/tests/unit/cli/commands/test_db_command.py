@@ -709,6 +709,8 @@ class TestCLIDBClean:
             confirm=False,
             skip_archive=False,
             batch_size=None,
+            workers=1,
+            checkpoint_path=None,
         )
 
     @pytest.mark.parametrize("timezone", ["UTC", "Europe/Berlin", "America/Los_Angeles"])
@@ -732,6 +734,8 @@ class TestCLIDBClean:
             confirm=False,
             skip_archive=False,
             batch_size=None,
+            workers=1,
+            checkpoint_path=None,
         )
 
     @pytest.mark.parametrize(("confirm_arg", "expected"), [(["-y"], False), ([], True)])
@@ -761,6 +765,8 @@ class TestCLIDBClean:
             confirm=expected,
             skip_archive=False,
             batch_size=None,
+            workers=1,
+            checkpoint_path=None,
         )
 
     @pytest.mark.parametrize(("extra_arg", "expected"), [(["--skip-archive"], True), ([], False)])
@@ -790,6 +796,8 @@ class TestCLIDBClean:
             confirm=True,
             skip_archive=expected,
             batch_size=None,
+            workers=1,
+            checkpoint_path=None,
         )
 
     @pytest.mark.parametrize(("dry_run_arg", "expected"), [(["--dry-run"], True), ([], False)])
@@ -819,6 +827,8 @@ class TestCLIDBClean:
             confirm=True,
             skip_archive=False,
             batch_size=None,
+            workers=1,
+            checkpoint_path=None,
         )
 
     @pytest.mark.parametrize(
@@ -850,6 +860,8 @@ class TestCLIDBClean:
             confirm=True,
             skip_archive=False,
             batch_size=None,
+            workers=1,
+            checkpoint_path=None,
         )
 
     @pytest.mark.parametrize(("extra_args", "expected"), [(["--verbose"], True), ([], False)])
@@ -879,6 +891,8 @@ class TestCLIDBClean:
             confirm=True,
             skip_archive=False,
             batch_size=None,
+            workers=1,
+            checkpoint_path=None,
         )
 
     @pytest.mark.parametrize(("extra_args", "expected"), [(["--batch-size", "1234"], 1234), ([], None)])
@@ -908,6 +922,8 @@ class TestCLIDBClean:
             confirm=True,
             skip_archive=False,
             batch_size=expected,
+            workers=1,
+            checkpoint_path=None,
         )
 
     @pytest.mark.parametrize(
@@ -939,6 +955,8 @@ class TestCLIDBClean:
             confirm=True,
             skip_archive=False,
             batch_size=None,
+            workers=1,
+            checkpoint_path=None,
         )
 
     @pytest.mark.parametrize(
@@ -970,6 +988,8 @@ class TestCLIDBClean:
             confirm=True,
             skip_archive=False,
             batch_size=None,
+            workers=1,
+            checkpoint_path=None,
         )
 
     @patch("airflow.cli.commands.db_command.export_archived_records")
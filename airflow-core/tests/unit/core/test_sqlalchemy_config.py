@@ -115,3 +115,38 @@ class TestSqlAlchemySettings:
         with pytest.raises(AirflowConfigException):
             with conf_vars(config):
                 settings.configure_orm()
+
+    @patch("airflow.settings.setup_event_handlers")
+    @patch("airflow.settings.scoped_session")
+    @patch("airflow.settings.sessionmaker")
+    @patch("airflow.settings.create_engine")
+    @patch("airflow.settings.create_async_engine")
+    @pytest.mark.parametrize("pool_enabled", ["True", "False"])
+    def test_configure_orm_async_engine_args(
+        self,
+        mock_create_async_engine,
+        mock_create_engine,
+        mock_sessionmaker,
+        mock_scoped_session,
+        mock_setup_event_handlers,
+        pool_enabled,
+    ):
+        config = {
+            ("database", "sql_alchemy_engine_args"): '{"arg": 1}',
+            ("database", "sql_alchemy_pool_enabled"): pool_enabled,
+        }
+        with conf_vars(config):
+            settings.configure_orm()
+
+        if pool_enabled == "True":
+            pool_args = dict(max_overflow=10, pool_pre_ping=True, pool_recycle=1800, pool_size=5)
+        else:
+            pool_args = dict(poolclass=NullPool)
+        # Only the pool settings and isolation level are shared with the sync engine
+        mock_create_async_engine.assert_called_once_with(
+            settings.SQL_ALCHEMY_CONN_ASYNC,
+            connect_args={},
+            isolation_level="READ COMMITTED",
+            future=True,
+            **pool_args,
+        )
@@ -0,0 +1,92 @@
+#
+# Licensed to the Apache Software Foundation (ASF) under one
+# or more contributor license agreements.  See the NOTICE file
+# distributed with this work for additional information
+# regarding copyright ownership.  The ASF licenses this file
+# to you under the Apache License, Version 2.0 (the
+# "License"); you may not use this file except in compliance
+# with the License.  You may obtain a copy of the License at
+#
+#   http://www.apache.org/licenses/LICENSE-2.0
+#
+# Unless required by applicable law or agreed to in writing,
+# software distributed under the License is distributed on an
+# "AS IS" BASIS, WITHOUT WARRANTIES OR CONDITIONS OF ANY
+# KIND, either express or implied.  See the License for the
+# specific language governing permissions and limitations
+# under the License.
+from __future__ import annotations
+
+from pathlib import Path
+from unittest import mock
+
+import pytest
+
+from airflow.dag_processing.fingerprint import FileFingerprinter, compute_file_fingerprint
+
+
+@pytest.fixture
+def bundle(tmp_path):
+    (tmp_path / "common").mkdir()
+    (tmp_path / "common" / "__init__.py").write_text("")
+    (tmp_path / "common" / "schedules.py").write_text("DAILY = '@daily'\n")
+    (tmp_path / "common" / "helpers.py").write_text("from .schedules import DAILY\n")
+    (tmp_path / "unrelated.py").write_text("")
+    (tmp_path / "dag.py").write_text(
+        "import os\nfrom common import helpers\n\ndef make():\n    import json\n"
+    )
+    return tmp_path
+
+
+def test_fingerprint_is_stable(bundle):
+    assert compute_file_fingerprint(bundle / "dag.py", bundle) == compute_file_fingerprint(
+        bundle / "dag.py", bundle
+    )
+
+
+@pytest.mark.parametrize(
+    "changed",
+    [
+        pytest.param("dag.py", id="dag-file"),
+        pytest.param("common/helpers.py", id="imported-module"),
+        pytest.param("common/schedules.py", id="relatively-imported-module"),
+        pytest.param("common/__init__.py", id="parent-package"),
+    ],
+)
+def test_fingerprint_changes_with_local_imports(bundle, changed):
+    before = compute_file_fingerprint(bundle / "dag.py", bundle)
+    with open(bundle / changed, "a") as f:
+        f.write("# changed\n")
+
+    assert compute_file_fingerprint(bundle / "dag.py", bundle) != before
+
+
+def test_fingerprint_ignores_modules_not_imported(bundle):
+    before = compute_file_fingerprint(bundle / "dag.py", bundle)
+    (bundle / "unrelated.py").write_text("# changed\n")
+
+    assert compute_file_fingerprint(bundle / "dag.py", bundle) == before
+
+
+def test_fingerprint_salt(bundle):
+    assert compute_file_fingerprint(bundle / "dag.py", bundle, salt="v1") != compute_file_fingerprint(
+        bundle / "dag.py", bundle, salt="v2"
+    )
+
+
+def test_fingerprint_of_missing_file(tmp_path):
+    assert compute_file_fingerprint(tmp_path / "missing.py", tmp_path) is None
+
+
+def test_fingerprinter_reads_changed_files_only(bundle):
+    fingerprinter = FileFingerprinter()
+    before = fingerprinter.fingerprint(bundle / "dag.py", bundle)
+
+    with mock.patch.object(Path, "read_bytes", autospec=True, side_effect=Path.read_bytes) as read:
+        assert fingerprinter.fingerprint(bundle / "dag.py", bundle) == before
+        assert read.call_count == 0
+
+        with open(bundle / "common" / "schedules.py", "a") as f:
+            f.write("# changed\n")
+        assert fingerprinter.fingerprint(bundle / "dag.py", bundle) != before
+        assert [call.args[0] for call in read.call_args_list] == [bundle / "common" / "schedules.py"]
@@ -34,6 +34,7 @@ from unittest import mock
 from unittest.mock import MagicMock
 
 import msgspec
+import psutil
 import pytest
 import time_machine
 from sqlalchemy import func, select
@@ -514,6 +515,39 @@ class TestDagFileProcessorManager:
                 > (freezed_base_time - manager._file_stats[dag_file].last_finish_time).total_seconds()
             )
 
+    @conf_vars({("dag_processor", "unchanged_file_reparse_interval"): "3600"})
+    def test_unchanged_files_are_not_parsed_again(self, tmp_path):
+        (tmp_path / "dag.py").write_text("import helpers\n")
+        (tmp_path / "helpers.py").write_text("SCHEDULE = None\n")
+        dag_file = DagFileInfo(bundle_name="testing", rel_path=Path("dag.py"), bundle_path=tmp_path)
+        known_files = {"testing": {dag_file}}
+        manager = DagFileProcessorManager(max_runs=-1)
+
+        def parse_queued_file(import_errors=0):
+            assert manager._file_queue.popleft() == dag_file
+            manager._file_stats[dag_file] = DagFileStat(
+                import_errors=import_errors,
+                last_finish_time=timezone.utcnow() - timedelta(minutes=5),
+                fingerprint=manager._queued_fingerprints.pop(dag_file),
+            )
+
+        manager.prepare_file_queue(known_files=known_files)
+        parse_queued_file()
+
+        manager.prepare_file_queue(known_files=known_files)
+        assert manager._file_queue == deque()
+        assert manager._file_stats[dag_file].last_skipped_time is not None
+
+        # A change in an imported module of the bundle is a change of the file
+        (tmp_path / "helpers.py").write_text("SCHEDULE = '@daily'\n")
+        manager._file_stats[dag_file].last_skipped_time = None
+        manager.prepare_file_queue(known_files=known_files)
+        parse_queued_file(import_errors=1)
+
+        # Files that failed to import are always parsed again
+        manager.prepare_file_queue(known_files=known_files)
+        assert manager._file_queue == deque([dag_file])
+
     def test_file_paths_in_queue_sorted_by_priority(self):
         from airflow.models.dagbag import DagPriorityParsingRequest
 
@@ -694,6 +728,7 @@ class TestDagFileProcessorManager:
                     "bundle_path": "/opt/airflow/dags",
                     "bundle_name": "testing",
                     "callback_requests": [],
+                    "keep_alive": False,
                     "type": "DagFileParseRequest",
                 },
             ),
@@ -727,6 +762,7 @@ class TestDagFileProcessorManager:
                             "type": "DagCallbackRequest",
                         }
                     ],
+                    "keep_alive": False,
                     "type": "DagFileParseRequest",
                 },
             ),
@@ -1627,6 +1663,53 @@ class TestDagFileProcessorManager:
         call_kwargs = mock_process_start.call_args.kwargs
         assert call_kwargs["bundle_name"] == "testing"
 
+    @conf_vars({("dag_processor", "parsing_process_max_files"): "2"})
+    @mock.patch.object(DagFileProcessorProcess, "start")
+    def test_create_process_reuses_idle_processor(self, mock_process_start, configure_testing_dag_bundle):
+        with configure_testing_dag_bundle("/tmp"):
+            manager = DagFileProcessorManager(max_runs=1)
+            manager._dag_bundles = list(DagBundlesManager().get_all_dag_bundles())
+
+        first, second = (
+            DagFileInfo(bundle_name="testing", rel_path=Path(name), bundle_path=TEST_DAGS_FOLDER)
+            for name in ("first.py", "second.py")
+        )
+        processor, _ = self.mock_processor()
+        mock_process_start.return_value = processor
+
+        assert manager._create_process(first) is processor
+        assert mock_process_start.call_args.kwargs["keep_alive"] is True
+
+        # The processor is done with the first file and waits for another one
+        processor._keep_alive = True
+        processor._file_complete = True
+        processor.files_processed = 1
+        processor._process.wait.side_effect = psutil.TimeoutExpired(0)
+        manager._release_processor(processor)
+
+        with mock.patch.object(DagFileProcessorProcess, "parse_next_file") as parse_next_file:
+            assert manager._create_process(second) is processor
+
+        mock_process_start.assert_called_once()
+        # Second file out of two, the processor exits once done with it
+        assert parse_next_file.call_args.kwargs["keep_alive"] is False
+        assert parse_next_file.call_args.kwargs["path"] == second.absolute_path
+        assert manager._idle_processors == []
+
+    @conf_vars({("dag_processor", "parsing_process_max_files"): "10"})
+    def test_release_processor_retires_processor_over_rss_limit(self):
+        manager = DagFileProcessorManager(max_runs=1)
+        manager._parsing_process_max_rss = 1024
+        processor, read_end = self.mock_processor()
+        processor._process.memory_info.return_value.rss = 2048
+
+        manager._release_processor(processor)
+
+        assert manager._idle_processors == []
+        assert manager._retiring_processors == [processor]
+        # The processor sees EOF on its request channel and exits
+        assert read_end.recv(1) == b""
+
     @mock.patch("airflow.dag_processing.manager.Stats.initialize")
     def test_stats_initialize_called_on_run(self, stats_init_mock, tmp_path, configure_testing_dag_bundle):
         """Test that Stats.initialize() is called when DagFileProcessorManager.run() is executed."""
@@ -296,6 +296,89 @@ class TestDagFileProcessor:
             all_vars = session.scalars(select(VariableORM)).all()
             assert len(all_vars) == 0
 
+    def test_reusable_process_parses_several_files(self, tmp_path: pathlib.Path, inprocess_client):
+        logger = MagicMock(spec=FilteringBoundLogger)
+
+        def first_dag():
+            from airflow.sdk import DAG
+
+            with DAG("first_dag"):
+                ...
+
+        def second_dag():
+            from airflow.sdk import DAG
+
+            with DAG("second_dag"):
+                ...
+
+        proc = DagFileProcessorProcess.start(
+            id=1,
+            path=write_dag_in_a_fn_to_file(first_dag, tmp_path),
+            bundle_path=tmp_path,
+            bundle_name="testing",
+            callbacks=[],
+            logger=logger,
+            logger_filehandle=MagicMock(spec=BinaryIO),
+            client=inprocess_client,
+            keep_alive=True,
+        )
+
+        while not proc.is_ready:
+            proc._service_subprocess(0.1)
+
+        assert proc.is_idle
+        assert proc.files_processed == 1
+        assert proc.parsing_result is not None
+        assert proc.parsing_result.serialized_dags[0].dag_id == "first_dag"
+
+        pid = proc.pid
+        proc.parse_next_file(
+            path=write_dag_in_a_fn_to_file(second_dag, tmp_path),
+            bundle_path=tmp_path,
+            bundle_name="testing",
+            callbacks=[],
+            logger_filehandle=MagicMock(spec=BinaryIO),
+            keep_alive=False,
+        )
+
+        while not proc.is_ready:
+            proc._service_subprocess(0.1)
+
+        # Without keep_alive the process exits once done with the file, as a single-file process would
+        assert proc.pid == pid
+        assert proc._exit_code == 0
+        assert not proc.is_idle
+        assert proc.parsing_result is not None
+        assert proc.parsing_result.serialized_dags[0].dag_id == "second_dag"
+
+    def test_retire_idle_process(self, tmp_path: pathlib.Path, inprocess_client):
+        def dag_in_a_fn():
+            from airflow.sdk import DAG
+
+            with DAG("test_dag"):
+                ...
+
+        proc = DagFileProcessorProcess.start(
+            id=1,
+            path=write_dag_in_a_fn_to_file(dag_in_a_fn, tmp_path),
+            bundle_path=tmp_path,
+            bundle_name="testing",
+            callbacks=[],
+            logger=MagicMock(spec=FilteringBoundLogger),
+            logger_filehandle=MagicMock(spec=BinaryIO),
+            client=inprocess_client,
+            keep_alive=True,
+        )
+        while not proc.is_ready:
+            proc._service_subprocess(0.1)
+        assert proc.is_idle
+
+        proc.retire()
+
+        while not proc.is_ready:
+            proc._service_subprocess(0.1)
+        assert proc._exit_code == 0
+
     def test_top_level_connection_access(
         self, tmp_path: pathlib.Path, monkeypatch: pytest.MonkeyPatch, inprocess_client
     ):
@@ -28,7 +28,7 @@ from uuid6 import uuid7
 
 from airflow._shared.timezones import timezone
 from airflow.executors import workloads
-from airflow.executors.local_executor import LocalExecutor, _execute_work
+from airflow.executors.local_executor import LocalExecutor, _execute_work, _WarmWorkerState
 from airflow.executors.workloads.base import BundleInfo
 from airflow.executors.workloads.callback import CallbackDTO
 from airflow.executors.workloads.task import TaskInstanceDTO
@@ -288,6 +288,48 @@ class TestLocalExecutor:
                 call_kwargs = mock_supervise.call_args[1]
                 assert call_kwargs["server"] == default_server
 
+    @mock.patch("airflow.executors.local_executor.Stats.timing")
+    @mock.patch("airflow.sdk.execution_time.supervisor.supervise")
+    def test_execute_work_reuses_warm_worker_state(self, mock_supervise, mock_timing):
+        from airflow.executors.base_executor import ExecutorConf
+        from airflow.sdk.api.client import BearerAuth, get_shared_transport
+
+        warm_state = _WarmWorkerState()
+        with conf_vars({("core", "execution_api_server_url"): "http://localhost:8080/execution/"}):
+            team_conf = ExecutorConf(team_name=None)
+            for token in ("token1", "token2"):
+                workload = mock.MagicMock(token=token, dag_rel_path="missing_dag.py")
+                _execute_work(
+                    log=mock.MagicMock(), workload=workload, team_conf=team_conf, warm_state=warm_state
+                )
+
+        assert mock_supervise.call_count == 2
+        clients = [call.kwargs["client"] for call in mock_supervise.call_args_list]
+        assert clients[0] is clients[1] is warm_state.client
+        assert warm_state.client._transport is get_shared_transport()
+        assert isinstance(warm_state.client.auth, BearerAuth)
+        assert warm_state.client.auth.token == "token2"
+        assert mock_timing.call_count == 2
+        assert mock_timing.call_args.args[0] == "local_executor.task_preparation_duration"
+        warm_state.close()
+
+    def test_warm_worker_state_pre_imports_once_per_bundle_version(self, tmp_path):
+        dag_file = tmp_path / "dag.py"
+        dag_file.write_text("import airflow.providers.standard.operators.empty\n")
+        workload = mock.MagicMock(dag_rel_path="dag.py", bundle_info=BundleInfo(name="b", version="1"))
+        warm_state = _WarmWorkerState()
+
+        with (
+            mock.patch("airflow.dag_processing.bundles.manager.DagBundlesManager") as mock_manager,
+            mock.patch("airflow.executors.local_executor.importlib.import_module") as mock_import,
+        ):
+            mock_manager.return_value.get_bundle.return_value.path = tmp_path
+            warm_state.pre_import(mock.MagicMock(), workload)
+            warm_state.pre_import(mock.MagicMock(), workload)
+
+        mock_import.assert_called_once_with("airflow.providers.standard.operators.empty")
+        assert warm_state.pre_imported == {("b", "1", "dag.py")}
+
     def test_multiple_team_executors_isolation(self):
         """Test that multiple team executors can coexist with isolated resources"""
         team_a_executor = LocalExecutor(parallelism=2, team_name="team_a")
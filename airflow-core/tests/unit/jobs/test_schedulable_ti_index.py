@@ -0,0 +1,102 @@
+#
+# Licensed to the Apache Software Foundation (ASF) under one
+# or more contributor license agreements.  See the NOTICE file
+# distributed with this work for additional information
+# regarding copyright ownership.  The ASF licenses this file
+# to you under the Apache License, Version 2.0 (the
+# "License"); you may not use this file except in compliance
+# with the License.  You may obtain a copy of the License at
+#
+#   http://www.apache.org/licenses/LICENSE-2.0
+#
+# Unless required by applicable law or agreed to in writing,
+# software distributed under the License is distributed on an
+# "AS IS" BASIS, WITHOUT WARRANTIES OR CONDITIONS OF ANY
+# KIND, either express or implied.  See the License for the
+# specific language governing permissions and limitations
+# under the License.
+from __future__ import annotations
+
+import datetime
+from uuid import uuid4
+
+from airflow.jobs.schedulable_ti_index import SchedulableTaskInstanceIndex
+
+DATE = datetime.datetime(2025, 1, 1, tzinfo=datetime.timezone.utc)
+
+
+def _add(
+    index, *, task_id, pool="default_pool", priority_weight=1, logical_date=DATE, map_index=-1, run_id="r1"
+):
+    ti_id = uuid4()
+    index.add(
+        ti_id=ti_id,
+        dag_id="dag",
+        task_id=task_id,
+        run_id=run_id,
+        map_index=map_index,
+        pool=pool,
+        priority_weight=priority_weight,
+        logical_date=logical_date,
+    )
+    return ti_id
+
+
+class TestSchedulableTaskInstanceIndex:
+    def test_candidates_follow_critical_section_ordering(self):
+        index = SchedulableTaskInstanceIndex()
+        _add(index, task_id="low", priority_weight=1)
+        _add(index, task_id="high", priority_weight=5, pool="other")
+        _add(index, task_id="later", priority_weight=5, logical_date=DATE + datetime.timedelta(days=1))
+        _add(index, task_id="no_date", priority_weight=5, logical_date=None)
+        _add(index, task_id="mapped_1", priority_weight=3, map_index=1)
+        _add(index, task_id="mapped_0", priority_weight=3, map_index=0)
+
+        assert [e.task_id for e in index.iter_candidates()] == [
+            "high",
+            "later",
+            "no_date",
+            "mapped_0",
+            "mapped_1",
+            "low",
+        ]
+        assert next(index.iter_candidates(exclude_pools={"other"})).task_id == "later"
+
+    def test_discard(self):
+        index = SchedulableTaskInstanceIndex()
+        first = _add(index, task_id="a")
+        second = _add(index, task_id="b")
+
+        index.discard(first)
+        index.discard(first)
+
+        assert len(index) == 1
+        assert first not in index
+        assert [e.id for e in index.iter_candidates()] == [second]
+
+    def test_readding_replaces_entry(self):
+        index = SchedulableTaskInstanceIndex()
+        ti_id = _add(index, task_id="a")
+        index.add(
+            ti_id=ti_id,
+            dag_id="dag",
+            task_id="a",
+            run_id="r1",
+            map_index=-1,
+            pool="other",
+            priority_weight=1,
+            logical_date=DATE,
+        )
+
+        assert len(index) == 1
+        assert [e.pool for e in index.iter_candidates()] == ["other"]
+
+    def test_discard_dag_run(self):
+        index = SchedulableTaskInstanceIndex()
+        _add(index, task_id="a", run_id="r1")
+        _add(index, task_id="b", run_id="r1")
+        kept = _add(index, task_id="c", run_id="r2")
+
+        index.discard_dag_run("dag", "r1")
+
+        assert [e.id for e in index.iter_candidates()] == [kept]
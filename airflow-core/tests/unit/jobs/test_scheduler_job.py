@@ -94,6 +94,7 @@ from airflow.serialization.serialized_objects import LazyDeserializedDAG
 from airflow.timetables.base import DagRunInfo, DataInterval
 from airflow.utils.session import create_session, provide_session
 from airflow.utils.span_status import SpanStatus
+from airflow.utils.sqlalchemy import with_row_locks
 from airflow.utils.state import CallbackState, DagRunState, State, TaskInstanceState
 from airflow.utils.thread_safe_dict import ThreadSafeDict
 from airflow.utils.types import DagRunTriggeredByType, DagRunType
@@ -1736,6 +1737,96 @@ class TestSchedulerJob:
 
         session.rollback()
 
+    @conf_vars({("scheduler", "use_schedulable_ti_index"): "True"})
+    def test_find_executable_task_instances_with_schedulable_ti_index(self, dag_maker):
+        """The index path honours priority, pools and max_active_tasks like the ranked query does."""
+        session = settings.Session()
+        session.add(Pool(pool="pool1", slots=32, include_deferred=False))
+        session.add(Pool(pool="pool2", slots=32, include_deferred=False))
+
+        with dag_maker(dag_id="test_schedulable_ti_index", max_active_tasks=2, session=session):
+            op1 = EmptyOperator(task_id="dummy1", priority_weight=1, pool="pool1")
+            op2 = EmptyOperator(task_id="dummy2", priority_weight=2, pool="pool2")
+            op3 = EmptyOperator(task_id="dummy3", priority_weight=3, pool="pool1")
+
+        dag_run = dag_maker.create_dagrun(run_type=DagRunType.SCHEDULED)
+        tis = [dag_run.get_task_instance(op.task_id, session) for op in (op1, op2, op3)]
+        for ti in tis:
+            ti.state = State.SCHEDULED
+        session.flush()
+
+        self.job_runner = SchedulerJobRunner(job=Job())
+        index = self.job_runner._schedulable_ti_index
+        assert index is not None
+
+        res = self.job_runner._executable_task_instances_to_queued(max_tis=32, session=session)
+
+        assert [ti.key for ti in res] == [tis[2].key, tis[1].key]
+        # Queued TIs leave the index, the one held back by max_active_tasks stays.
+        assert list(index._entries) == [tis[0].id]
+        session.rollback()
+
+    @conf_vars({("scheduler", "use_schedulable_ti_index"): "True"})
+    def test_schedulable_ti_index_drops_stale_candidates(self, dag_maker):
+        session = settings.Session()
+        with dag_maker(dag_id="test_schedulable_ti_index_stale", session=session):
+            op1 = EmptyOperator(task_id="dummy1")
+            op2 = EmptyOperator(task_id="dummy2")
+
+        dag_run = dag_maker.create_dagrun(run_type=DagRunType.SCHEDULED)
+        ti1 = dag_run.get_task_instance(op1.task_id, session)
+        ti2 = dag_run.get_task_instance(op2.task_id, session)
+        ti1.state = State.SCHEDULED
+        ti2.state = State.SCHEDULED
+        session.flush()
+
+        self.job_runner = SchedulerJobRunner(job=Job())
+        index = self.job_runner._schedulable_ti_index
+        assert index.reconcile(session) == 2
+
+        # Another component moved ti2 on without the index knowing about it.
+        ti2.state = State.SKIPPED
+        session.flush()
+
+        res = self.job_runner._executable_task_instances_to_queued(max_tis=32, session=session)
+
+        assert [ti.key for ti in res] == [ti1.key]
+        assert len(index) == 0
+        session.rollback()
+
+    @conf_vars({("scheduler", "use_schedulable_ti_index"): "True"})
+    def test_schedulable_ti_index_keeps_candidates_locked_elsewhere(self, dag_maker):
+        session = settings.Session()
+        with dag_maker(dag_id="test_schedulable_ti_index_locked", session=session):
+            op1 = EmptyOperator(task_id="dummy1")
+            op2 = EmptyOperator(task_id="dummy2")
+
+        dag_run = dag_maker.create_dagrun(run_type=DagRunType.SCHEDULED)
+        ti1 = dag_run.get_task_instance(op1.task_id, session)
+        ti2 = dag_run.get_task_instance(op2.task_id, session)
+        ti1.state = State.SCHEDULED
+        ti2.state = State.SCHEDULED
+        session.flush()
+
+        self.job_runner = SchedulerJobRunner(job=Job())
+        index = self.job_runner._schedulable_ti_index
+        assert index.reconcile(session) == 2
+
+        def skip_ti2_locked_elsewhere(query, **kwargs):
+            if kwargs.get("skip_locked"):
+                query = query.where(TaskInstance.id != ti2.id)
+            return with_row_locks(query, **kwargs)
+
+        with mock.patch(
+            "airflow.jobs.scheduler_job_runner.with_row_locks", side_effect=skip_ti2_locked_elsewhere
+        ):
+            res = self.job_runner._executable_task_instances_to_queued(max_tis=32, session=session)
+
+        assert [ti.key for ti in res] == [ti1.key]
+        # ti2 is still scheduled, so it stays in the index for the next loop
+        assert list(index._entries) == [ti2.id]
+        session.rollback()
+
     def test_find_executable_task_instances_order_logical_date_and_priority(self, dag_maker):
         dag_id_1 = "SchedulerJobTest.test_find_executable_task_instances_order_logical_date_and_priority-a"
         dag_id_2 = "SchedulerJobTest.test_find_executable_task_instances_order_logical_date_and_priority-b"
@@ -32,6 +32,7 @@ from unittest.mock import ANY, AsyncMock, MagicMock, patch
 import pendulum
 import pytest
 from asgiref.sync import sync_to_async
+from sqlalchemy.exc import OperationalError
 from structlog.typing import FilteringBoundLogger
 
 from airflow._shared.timezones import timezone
@@ -747,6 +748,60 @@ def test_failed_trigger(session, dag_maker, supervisor_builder):
     assert task_instance.next_kwargs["traceback"][-1] == "ModuleNotFoundError: No module named 'fake'\n"
 
 
+def test_events_and_failures_are_kept_when_database_unavailable(supervisor_builder):
+    supervisor: TriggerRunnerSupervisor = supervisor_builder()
+    supervisor.events.extend([(1, TriggerEvent("first")), (2, TriggerEvent("second"))])
+    supervisor.failed_triggers.append((3, None))
+    db_error = OperationalError("SELECT 1", {}, Exception("db error"))
+
+    with (
+        patch.object(Trigger, "submit_events", side_effect=db_error),
+        pytest.raises(OperationalError),
+    ):
+        supervisor.handle_events()
+    with (
+        patch.object(Trigger, "submit_failures", side_effect=db_error),
+        pytest.raises(OperationalError),
+    ):
+        supervisor.handle_failed_triggers()
+
+    assert [trigger_id for trigger_id, _ in supervisor.events] == [1, 2]
+    assert list(supervisor.failed_triggers) == [(3, None)]
+
+    with patch.object(Trigger, "submit_events") as mock_submit_events:
+        supervisor.handle_events()
+    mock_submit_events.assert_called_once()
+    assert not supervisor.events
+
+
+def test_failing_event_does_not_hold_back_the_others(supervisor_builder):
+    supervisor: TriggerRunnerSupervisor = supervisor_builder()
+    supervisor.events.extend(
+        [(1, TriggerEvent("first")), (2, TriggerEvent("bad")), (3, TriggerEvent("third"))]
+    )
+    submitted = []
+
+    def submit_events(events):
+        if any(event.payload == "bad" for _, event in events):
+            raise ValueError("bad event")
+        submitted.extend(trigger_id for trigger_id, _ in events)
+
+    with patch.object(Trigger, "submit_events", side_effect=submit_events):
+        supervisor.handle_events()
+
+    assert submitted == [1, 3]
+    assert not supervisor.events
+    # The tasks waiting for the event are failed instead of staying deferred
+    [(trigger_id, traceback)] = supervisor.failed_triggers
+    assert trigger_id == 2
+    assert traceback[-1] == "ValueError: bad event\n"
+
+    # A failure which cannot be submitted either is dropped, rather than stopping the triggerer
+    with patch.object(Trigger, "submit_failures", side_effect=ValueError("bad failure")):
+        supervisor.handle_failed_triggers()
+    assert not supervisor.failed_triggers
+
+
 class CustomTrigger(BaseTrigger):
     """Custom Trigger that will access one Variable and one Connection."""
 
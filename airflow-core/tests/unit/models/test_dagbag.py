@@ -16,8 +16,15 @@
 # under the License.
 from __future__ import annotations
 
+from unittest import mock
+from uuid import uuid4
+
 import pytest
 
+from airflow.models.dagbag import DagVersionCache, DBDagBag
+from airflow.models.serialized_dag import SerializedDagModel
+from airflow.providers.standard.operators.empty import EmptyOperator
+
 pytestmark = pytest.mark.db_test
 
 # This file previously contained tests for DagBag functionality, but those tests
@@ -25,4 +32,142 @@ pytestmark = pytest.mark.db_test
 # the source code reorganization where DagBag moved from models to dag_processing.
 #
 # Tests for models-specific functionality (DBDagBag, DagPriorityParsingRequest, etc.)
-# would remain in this file, but currently no such tests exist.
+# remain in this file.
+
+
+class TestDagVersionCache:
+    def test_lru_eviction_by_entries(self):
+        cache = DagVersionCache(max_entries=2)
+        first, second, third = uuid4(), uuid4(), uuid4()
+        cache.put(first, mock.sentinel.first)
+        cache.put(second, mock.sentinel.second)
+
+        # Touch the first entry so that the second one becomes the least recently used
+        assert cache.get(first) is mock.sentinel.first
+        cache.put(third, mock.sentinel.third)
+
+        assert first in cache
+        assert second not in cache
+        assert third in cache
+
+    def test_eviction_by_size(self):
+        cache = DagVersionCache(max_bytes=100)
+        first, second = uuid4(), uuid4()
+        cache.put(first, mock.sentinel.first, size=60)
+        cache.put(second, mock.sentinel.second, size=60)
+
+        assert len(cache) == 1
+        assert cache.size_bytes == 60
+        assert second in cache
+
+    def test_oversized_entry_is_kept(self):
+        cache = DagVersionCache(max_bytes=10)
+        version_id = uuid4()
+        cache.put(version_id, mock.sentinel.dag, size=60)
+
+        assert cache.get(version_id) is mock.sentinel.dag
+
+    def test_hash_mismatch_is_a_miss(self):
+        cache = DagVersionCache()
+        version_id = uuid4()
+        cache.put(version_id, mock.sentinel.dag, dag_hash="a")
+
+        assert cache.get(version_id, dag_hash="a") is mock.sentinel.dag
+        assert cache.get(version_id, dag_hash="b") is None
+        assert cache.get(version_id) is mock.sentinel.dag
+
+    @mock.patch("airflow.models.dagbag.Stats")
+    def test_metrics(self, mock_stats):
+        cache = DagVersionCache(max_entries=1)
+        first, second = uuid4(), uuid4()
+        cache.put(first, mock.sentinel.first, size=5)
+        cache.get(first)
+        cache.get(second)
+        cache.put(second, mock.sentinel.second, size=7)
+
+        mock_stats.incr.assert_has_calls(
+            [
+                mock.call("dagbag_cache.hits"),
+                mock.call("dagbag_cache.misses"),
+                mock.call("dagbag_cache.evictions", 1),
+            ]
+        )
+        mock_stats.gauge.assert_called_with("dagbag_cache.size_bytes", 7)
+
+
+class TestDBDagBag:
+    def test_reuses_deserialized_dag(self, dag_maker, session):
+        with dag_maker("test_dbdagbag_cache", session=session):
+            EmptyOperator(task_id="task")
+        dag_bag = DBDagBag()
+
+        first = dag_bag.get_latest_version_of_dag("test_dbdagbag_cache", session=session)
+        second = dag_bag.get_latest_version_of_dag("test_dbdagbag_cache", session=session)
+
+        assert first is not None
+        assert first is second
+
+    def test_rereads_dag_updated_in_place(self, dag_maker, session):
+        with dag_maker("test_dbdagbag_cache_update", session=session):
+            EmptyOperator(task_id="task")
+        dag_bag = DBDagBag()
+        first = dag_bag.get_latest_version_of_dag("test_dbdagbag_cache_update", session=session)
+
+        serdag = SerializedDagModel.get("test_dbdagbag_cache_update", session=session)
+        serdag.dag_hash = "changed"
+        session.flush()
+
+        second = dag_bag.get_latest_version_of_dag("test_dbdagbag_cache_update", session=session)
+        assert second is not first
+
+    def test_find_dag_for_run(self, dag_maker, session):
+        with dag_maker("test_dbdagbag_find", session=session):
+            EmptyOperator(task_id="task")
+        dag_run = dag_maker.create_dagrun(session=session)
+        dag_bag = DBDagBag()
+
+        # Not cached yet: the serialized dag row is returned, to be deserialized by the caller
+        serdag = dag_bag.find_dag_for_run(dag_run, session=session)
+        assert isinstance(serdag, SerializedDagModel)
+        dag = dag_bag.read_dag(serdag)
+
+        assert dag_bag.find_dag_for_run(dag_run, session=session) is dag
+        assert dag_bag.get_dag_for_run(dag_run, session=session) is dag
+
+    def test_cache_is_bounded(self, dag_maker, session):
+        for dag_id in ("test_dbdagbag_bounded_1", "test_dbdagbag_bounded_2"):
+            with dag_maker(dag_id, session=session):
+                EmptyOperator(task_id="task")
+        dag_bag = DBDagBag(max_entries=1)
+
+        dag_bag.get_latest_version_of_dag("test_dbdagbag_bounded_1", session=session)
+        dag_bag.get_latest_version_of_dag("test_dbdagbag_bounded_2", session=session)
+
+        assert [dag.dag_id for dag in dag_bag._dags.values()] == ["test_dbdagbag_bounded_2"]
+
+    def test_cache_is_bounded_by_default(self):
+        cache = DBDagBag()._dags
+        assert (cache.max_entries, cache.max_bytes) == (2000, 1 << 30)
+
+        version_ids = [uuid4() for _ in range(cache.max_entries + 1)]
+        for version_id in version_ids:
+            cache.put(version_id, mock.sentinel.dag, size=1)
+        assert len(cache) == cache.max_entries
+        assert version_ids[0] not in cache
+
+        big_version_ids = [uuid4(), uuid4()]
+        for version_id in big_version_ids:
+            cache.put(version_id, mock.sentinel.big_dag, size=cache.max_bytes // 2 + 1)
+        assert list(cache._items) == big_version_ids[1:]
+        assert cache.size_bytes == cache.max_bytes // 2 + 1
+
+    @pytest.mark.parametrize(("max_bytes", "size_bytes"), [(0, 0), (1_000_000, 4 * 2048)])
+    def test_size_is_estimated_when_bounded_by_size(self, dag_maker, session, max_bytes, size_bytes):
+        with dag_maker("test_dbdagbag_size", session=session):
+            for task_id in ("task_1", "task_2", "task_3"):
+                EmptyOperator(task_id=task_id)
+        dag_bag = DBDagBag(max_bytes=max_bytes)
+
+        dag_bag.get_latest_version_of_dag("test_dbdagbag_size", session=session)
+
+        assert dag_bag._dags.size_bytes == size_bytes
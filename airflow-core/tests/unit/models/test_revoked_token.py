@@ -19,7 +19,9 @@ from __future__ import annotations
 from datetime import datetime, timedelta, timezone
 from unittest.mock import MagicMock, patch
 
-from airflow.models.revoked_token import RevokedToken
+from airflow.models.revoked_token import RevokedToken, RevokedTokenCache, get_revoked_token_cache
+
+from tests_common.test_utils.config import conf_vars
 
 
 class TestRevokedTokenModel:
@@ -33,6 +35,7 @@ class TestRevokedTokenModel:
         assert isinstance(arg, RevokedToken)
         assert arg.jti == "test-jti-123"
         assert arg.exp == exp
+        assert arg.revoked_at is not None
 
     def test_is_revoked_returns_true(self):
         """Test that a revoked JTI is detected."""
@@ -90,3 +93,71 @@ class TestRevokedTokenCleanup:
             mock_session.execute.assert_not_called()
         finally:
             RevokedToken._last_cleanup_time = original_last_cleanup
+
+
+class TestRevokedTokenCache:
+    """Tests for the local copy of the revoked tokens."""
+
+    @staticmethod
+    def session_returning(*results):
+        mock_session = MagicMock()
+        mock_session.execute.return_value.all.side_effect = list(results)
+        return mock_session
+
+    def test_reads_revoked_tokens_since_watermark(self):
+        now = datetime.now(tz=timezone.utc)
+        exp = now + timedelta(hours=1)
+        cache = RevokedTokenCache(refresh_interval=5)
+        mock_session = self.session_returning(
+            [("jti-1", exp, None), ("jti-2", exp, now - timedelta(minutes=10))],
+            [("jti-3", exp, now)],
+        )
+
+        with patch("airflow.models.revoked_token.time.monotonic", return_value=100.0):
+            assert cache.is_revoked("jti-1", session=mock_session)
+            assert not cache.is_revoked("jti-3", session=mock_session)
+        # Not refreshed until the interval passed
+        assert mock_session.execute.call_count == 1
+        assert "revoked_at" not in str(mock_session.execute.call_args[0][0].whereclause)
+
+        with patch("airflow.models.revoked_token.time.monotonic", return_value=105.0):
+            assert cache.is_revoked("jti-3", session=mock_session)
+            assert cache.is_revoked("jti-2", session=mock_session)
+        assert mock_session.execute.call_count == 2
+        query = mock_session.execute.call_args[0][0]
+        assert "revoked_token.revoked_at >=" in str(query.whereclause)
+        assert len(cache) == 3
+
+    def test_drops_expired_tokens(self):
+        now = datetime.now(tz=timezone.utc)
+        cache = RevokedTokenCache(refresh_interval=5)
+        cache.add("expired", now - timedelta(seconds=1))
+        cache.add("valid", now + timedelta(hours=1))
+
+        cache.refresh(self.session_returning([]))
+
+        assert not cache.is_revoked("expired", session=MagicMock())
+        assert cache.is_revoked("valid", session=MagicMock())
+
+    @patch("airflow.models.revoked_token.Stats")
+    def test_refresh_emits_size(self, mock_stats):
+        exp = datetime.now(tz=timezone.utc) + timedelta(hours=1)
+        cache = RevokedTokenCache(refresh_interval=5)
+
+        cache.refresh(self.session_returning([("jti-1", exp, None), ("jti-2", exp, None)]))
+
+        mock_stats.gauge.assert_called_once_with("api.revoked_token_cache.size", 2)
+
+    def test_is_revoked_uses_cache(self):
+        exp = datetime.now(tz=timezone.utc) + timedelta(hours=1)
+        get_revoked_token_cache.cache_clear()
+        try:
+            with conf_vars({("api_auth", "revoked_token_cache_refresh_interval"): "5"}):
+                mock_session = self.session_returning([])
+                assert not RevokedToken.is_revoked("jti-1", session=mock_session)
+                RevokedToken.revoke("jti-1", exp, session=mock_session)
+                # Revoked by this process: known without waiting for the next refresh
+                assert RevokedToken.is_revoked("jti-1", session=mock_session)
+                mock_session.scalar.assert_not_called()
+        finally:
+            get_revoked_token_cache.cache_clear()
@@ -19,7 +19,9 @@
 
 from __future__ import annotations
 
+import contextlib
 import logging
+import zlib
 from datetime import timedelta
 from unittest import mock
 
@@ -93,15 +95,24 @@ class TestSerializedDagModel:
     @pytest.fixture(
         autouse=True,
         params=[
-            pytest.param(False, id="raw-serialized_dags"),
-            pytest.param(True, id="compress-serialized_dags"),
+            pytest.param((False, "json"), id="raw-serialized_dags"),
+            pytest.param((True, "json"), id="compress-serialized_dags"),
+            pytest.param((False, "msgpack"), id="msgpack-serialized_dags"),
         ],
     )
     def setup_test_cases(self, request, monkeypatch):
+        compress, storage_format = request.param
         db.clear_db_dags()
         db.clear_db_runs()
         db.clear_db_serialized_dags()
-        with conf_vars({("core", "compress_serialized_dags"): str(request.param)}):
+        monkeypatch.setattr("airflow.models.serialized_dag._COMPRESS_SERIALIZED_DAGS", compress)
+        monkeypatch.setattr("airflow.models.serialized_dag._STORAGE_FORMAT", storage_format)
+        with conf_vars(
+            {
+                ("core", "compress_serialized_dags"): str(compress),
+                ("core", "serialized_dag_storage_format"): storage_format,
+            }
+        ):
             yield
         db.clear_db_serialized_dags()
 
@@ -571,6 +582,43 @@ class TestSerializedDagModel:
         assert "fileloc" in test_data["dag"]
         assert test_data["dag"]["fileloc"] == "/different/path/to/dag.py"
 
+    def test_hash_matches_sorted_json_encoding(self):
+        """The hash must not change for existing rows, or every DAG would get a new version on upgrade."""
+        test_data = {
+            "__version": 3,
+            "dag": {
+                "fileloc": "/dag.py",
+                "dag_id": "test_dag",
+                "tags": ["b", "a"],
+                "params": {"z": 1, "a": 2},
+            },
+        }
+        expected_data = SDM._sort_serialized_dag_dict(test_data)
+        expected_data["dag"].pop("fileloc")
+
+        assert (
+            SDM.hash(test_data) == md5(json.dumps(expected_data, sort_keys=True).encode("utf-8")).hexdigest()
+        )
+
+    @pytest.mark.parametrize("zstd_installed", [True, False])
+    def test_msgpack_storage_round_trip(self, zstd_installed):
+        from airflow.models import serialized_dag
+
+        data = {"__version": 3, "dag": {"dag_id": "test_dag", "tasks": [{"__var": {"task_id": "t"}}]}}
+        if zstd_installed:
+            pytest.importorskip("zstandard")
+            get_zstd = contextlib.nullcontext()
+        else:
+            get_zstd = mock.patch.object(serialized_dag, "_get_zstd", return_value=None)
+        with get_zstd:
+            encoded = serialized_dag._encode_dag_data(data)
+            codec = b"msgpack+zstd:" if zstd_installed else b"msgpack+zlib:"
+            assert encoded.startswith(serialized_dag._BINARY_HEADER + codec)
+            assert serialized_dag._decode_dag_data(encoded) == data
+
+        # Rows written as compressed JSON stay readable
+        assert serialized_dag._decode_dag_data(zlib.compress(json.dumps(data).encode())) == data
+
     def test_hash_method_consistent_with_dict_ordering_in_template_fields(self, dag_maker):
         from airflow.sdk.bases.operator import BaseOperator
 
@@ -20,13 +20,14 @@ import datetime
 import json
 from collections.abc import AsyncIterator
 from typing import TYPE_CHECKING, Any
-from unittest.mock import patch
+from unittest.mock import MagicMock, patch
 
 import pendulum
 import pytest
 import pytz
 from cryptography.fernet import Fernet
-from sqlalchemy import delete, func, select
+from sqlalchemy import delete, func, select, update
+from sqlalchemy.exc import OperationalError
 
 from airflow._shared.timezones import timezone
 from airflow.jobs.job import Job
@@ -34,6 +35,7 @@ from airflow.jobs.triggerer_job_runner import TriggererJobRunner
 from airflow.models import TaskInstance, Trigger
 from airflow.models.asset import AssetEvent, AssetModel, AssetWatcherModel
 from airflow.models.callback import Callback, TriggererCallback
+from airflow.models.trigger import TriggererHashRing
 from airflow.models.xcom import XComModel
 from airflow.providers.standard.operators.empty import EmptyOperator
 from airflow.sdk.definitions.callback import AsyncCallback
@@ -241,6 +243,99 @@ def test_submit_failure(session, create_task_instance):
     assert updated_task_instance.next_method == "__fail__"
 
 
+def test_submit_events_batch(session, dag_maker):
+    """Tests that a batch of events resumes the task instances of each trigger, in order."""
+    first_trigger = Trigger(classpath="airflow.triggers.testing.SuccessTrigger", kwargs={})
+    second_trigger = Trigger(classpath="airflow.triggers.testing.SuccessTrigger", kwargs={})
+    session.add_all([first_trigger, second_trigger])
+    session.flush()
+
+    with dag_maker(session=session):
+        EmptyOperator(task_id="first")
+        EmptyOperator(task_id="second")
+        EmptyOperator(task_id="other")
+    dr = dag_maker.create_dagrun(logical_date=timezone.utcnow())
+    tis = {ti.task_id: ti for ti in dr.task_instances}
+    for task_id, trigger in (("first", first_trigger), ("second", second_trigger)):
+        tis[task_id].state = State.DEFERRED
+        tis[task_id].trigger_id = trigger.id
+    # Not deferred anymore, must be left alone
+    tis["other"].state = State.SUCCESS
+    tis["other"].trigger_id = first_trigger.id
+    session.flush()
+
+    asset = AssetModel("test_submit_events_batch")
+    asset.add_trigger(first_trigger, "watcher")
+    session.add(asset)
+    session.flush()
+
+    Trigger.submit_events(
+        [
+            (first_trigger.id, TriggerEvent("first")),
+            (first_trigger.id, TriggerEvent("again")),
+            (second_trigger.id, TriggerEvent("second")),
+            (first_trigger.id + second_trigger.id, TriggerEvent("deleted trigger")),
+        ],
+        session=session,
+    )
+    session.flush()
+    session.expire_all()
+
+    tis = {ti.task_id: ti for ti in dr.get_task_instances(session=session)}
+    assert tis["first"].state == State.SCHEDULED
+    assert tis["first"].next_kwargs == {"event": "first"}
+    assert tis["second"].state == State.SCHEDULED
+    assert tis["second"].next_kwargs == {"event": "second"}
+    assert tis["other"].state == State.SUCCESS
+    # Every event of a trigger is sent to its assets
+    asset_events = session.scalars(select(AssetEvent).where(AssetEvent.asset_id == asset.id)).all()
+    assert [event.extra["payload"] for event in asset_events] == ["first", "again"]
+
+
+def test_submit_event_does_not_retry_on_the_session_of_the_caller():
+    session = MagicMock()
+    db_error = OperationalError("SELECT 1", {}, Exception("db error"))
+
+    with patch.object(Trigger, "_submit_events", side_effect=db_error) as submit_events:
+        with pytest.raises(OperationalError):
+            Trigger.submit_event(1, TriggerEvent("event"), session=session)
+        with pytest.raises(OperationalError):
+            Trigger.submit_events([(1, TriggerEvent("event"))], session=session)
+
+    assert submit_events.call_count == 2
+    session.rollback.assert_not_called()
+
+
+def test_submit_failures_batch(session, dag_maker):
+    """Tests that a batch of failures fails the task instances of each trigger."""
+    first_trigger = Trigger(classpath="airflow.triggers.testing.SuccessTrigger", kwargs={})
+    second_trigger = Trigger(classpath="airflow.triggers.testing.SuccessTrigger", kwargs={})
+    session.add_all([first_trigger, second_trigger])
+    session.flush()
+
+    with dag_maker(session=session):
+        EmptyOperator(task_id="first")
+        EmptyOperator(task_id="second")
+    dr = dag_maker.create_dagrun(logical_date=timezone.utcnow())
+    tis = {ti.task_id: ti for ti in dr.task_instances}
+    for task_id, trigger in (("first", first_trigger), ("second", second_trigger)):
+        tis[task_id].state = State.DEFERRED
+        tis[task_id].trigger_id = trigger.id
+    session.flush()
+
+    Trigger.submit_failures(
+        [(first_trigger.id, ["Traceback", "boom"]), (second_trigger.id, None)], session=session
+    )
+    session.flush()
+    session.expire_all()
+
+    tis = {ti.task_id: ti for ti in dr.get_task_instances(session=session)}
+    assert {ti.state for ti in tis.values()} == {State.SCHEDULED}
+    assert {ti.next_method for ti in tis.values()} == {"__fail__"}
+    assert tis["first"].next_kwargs["traceback"] == ["Traceback", "boom"]
+    assert tis["second"].trigger_id is None
+
+
 @pytest.mark.parametrize(
     ("event_cls", "expected"),
     [
@@ -529,6 +624,96 @@ def test_assign_unassigned_with_qeueus(session, create_triggerer, create_trigger
     )
 
 
+def test_triggerer_hash_ring_moves_few_triggers_on_join():
+    ring = TriggererHashRing([1, 2, 3])
+    before = {trigger_id: ring.owner(trigger_id) for trigger_id in range(3000)}
+
+    assert before == {trigger_id: TriggererHashRing([3, 1, 2]).owner(trigger_id) for trigger_id in before}
+    assert set(before.values()) == {1, 2, 3}
+
+    grown = TriggererHashRing([1, 2, 3, 4])
+    moved = [trigger_id for trigger_id, owner in before.items() if grown.owner(trigger_id) != owner]
+    # Only the triggers of the new triggerer's ranges move, and all of them to the new triggerer
+    assert {grown.owner(trigger_id) for trigger_id in moved} == {4}
+    assert len(moved) < len(before) / 2
+
+
+@pytest.mark.need_serialized_dag
+def test_assign_unassigned_sharded(session, create_triggerer, create_trigger):
+    time_now = timezone.utcnow()
+    first = create_triggerer(session, State.RUNNING, latest_heartbeat=time_now)
+    second = create_triggerer(session, State.RUNNING, latest_heartbeat=time_now)
+    session.commit()
+    triggers = [
+        create_trigger(
+            session=session,
+            name=f"trigger_{i}",
+            logical_date=time_now + datetime.timedelta(hours=i),
+            triggerer_id=None,
+        )
+        for i in range(10)
+    ]
+    session.commit()
+    ring = TriggererHashRing([first.id, second.id])
+
+    Trigger.assign_unassigned(first.id, capacity=100, health_check_threshold=30, sharded=True)
+    session.expire_all()
+    assigned = {trigger.id: trigger.triggerer_id for trigger in session.scalars(select(Trigger)).all()}
+    for trigger in triggers:
+        expected = first.id if ring.owner(trigger.id) == first.id else None
+        assert assigned[trigger.id] == expected
+
+    Trigger.assign_unassigned(second.id, capacity=100, health_check_threshold=30, sharded=True)
+    session.expire_all()
+    assert {trigger.id: trigger.triggerer_id for trigger in session.scalars(select(Trigger)).all()} == {
+        trigger.id: ring.owner(trigger.id) for trigger in triggers
+    }
+
+
+@pytest.mark.need_serialized_dag
+def test_assign_unassigned_sharded_hands_back_and_takes_overflow(session, create_triggerer, create_trigger):
+    time_now = timezone.utcnow()
+    first = create_triggerer(session, State.RUNNING, latest_heartbeat=time_now)
+    second = create_triggerer(session, State.RUNNING, latest_heartbeat=time_now)
+    session.commit()
+    triggers = [
+        create_trigger(
+            session=session,
+            name=f"trigger_{i}",
+            logical_date=time_now + datetime.timedelta(hours=i),
+            triggerer_id=first.id,
+        )
+        for i in range(10)
+    ]
+    session.commit()
+    ring = TriggererHashRing([first.id, second.id])
+    owned_by_second = {trigger.id for trigger in triggers if ring.owner(trigger.id) == second.id}
+    assert owned_by_second
+
+    Trigger.assign_unassigned(first.id, capacity=100, health_check_threshold=30, sharded=True)
+    session.expire_all()
+    # The second triggerer has room, so the triggers of its range are handed back for it to claim
+    assert set(session.scalars(select(Trigger.id).where(Trigger.triggerer_id.is_(None)))) == owned_by_second
+
+    # Once the second triggerer is at capacity, the first one takes its triggers as overflow
+    session.execute(update(Trigger).values(triggerer_id=second.id))
+    new_triggers = [
+        create_trigger(
+            session=session,
+            name=f"new_trigger_{i}",
+            logical_date=time_now + datetime.timedelta(days=1, hours=i),
+            triggerer_id=None,
+        )
+        for i in range(4)
+    ]
+    session.commit()
+    Trigger.assign_unassigned(first.id, capacity=len(triggers), health_check_threshold=30, sharded=True)
+    session.expire_all()
+    assert set(session.scalars(select(Trigger.id).where(Trigger.triggerer_id == first.id))) == {
+        trigger.id for trigger in new_triggers
+    }
+
+
 def test_queue_column_max_len_matches_ti_column_max_len() -> None:
     """Ensures that the `trigger.queue` column has the same max length as the `task_instance.queue` column."""
     expected_queue_col_max_length_from_ti = TaskInstance.queue.property.columns[0].type.length
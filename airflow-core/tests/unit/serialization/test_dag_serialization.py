@@ -31,6 +31,7 @@ import os
 import pickle
 import re
 import sys
+import threading
 import warnings
 from collections.abc import Generator
 from datetime import datetime, timedelta, timezone as dt_timezone
@@ -52,6 +53,7 @@ from airflow._shared.timezones import timezone
 from airflow.dag_processing.dagbag import DagBag
 from airflow.exceptions import (
     AirflowException,
+    DeserializationError,
     ParamValidationError,
     SerializationError,
 )
@@ -1728,6 +1730,103 @@ class TestStringifiedDAGs:
 
         check_task_group(serialized_dag.task_group)
 
+    def test_lazy_task_deserialization(self):
+        from airflow.providers.standard.operators.empty import EmptyOperator
+
+        with DAG("test_lazy_task_deserialization", schedule=None, start_date=datetime(2020, 1, 1)) as dag:
+            task1 = EmptyOperator(task_id="task1")
+            with TaskGroup("group23") as group23:
+                task2 = EmptyOperator(task_id="task2")
+                task3 = BashOperator.partial(task_id="task3").expand(bash_command=XComArg(task2))
+            task1 >> group23
+
+        serialized_dag = DagSerialization.from_dict(DagSerialization.to_dict(dag), lazy_tasks=True)
+
+        assert serialized_dag.task_ids == ["task1", "group23.task2", "group23.task3"]
+        assert not any(serialized_dag.task_dict.is_loaded(task_id) for task_id in serialized_dag.task_ids)
+        assert set(serialized_dag.task_group_dict) == {"group23"}
+
+        lazy_task3 = serialized_dag.get_task("group23.task3")
+        assert lazy_task3.upstream_task_ids == {"group23.task2"}
+        assert lazy_task3.task_group.group_id == "group23"
+        assert lazy_task3.dag is serialized_dag
+        # task2 was loaded to dereference the expand input of task3
+        assert serialized_dag.task_dict.is_loaded("group23.task2")
+        assert not serialized_dag.task_dict.is_loaded("task1")
+        assert serialized_dag.task_group.children["group23"].children["group23.task3"] is lazy_task3
+        assert serialized_dag.get_task("group23.task2").upstream_task_ids == {task1.task_id}
+
+        eager_dag = DagSerialization.from_dict(DagSerialization.to_dict(dag))
+        for task in (task1, task2, task3):
+            assert OperatorSerialization.serialize_operator(
+                serialized_dag.get_task(task.task_id)
+            ) == OperatorSerialization.serialize_operator(eager_dag.get_task(task.task_id))
+        subset = serialized_dag.partial_subset("group23.task3", include_upstream=True)
+        assert set(subset.task_ids) == {"task1", "group23.task2", "group23.task3"}
+
+    def test_lazy_task_deserialization_without_operator_extra_links(self):
+        with DAG("test_lazy_without_links", schedule=None, start_date=datetime(2020, 1, 1)) as dag:
+            CustomOperator(task_id="simple_task", bash_command="true")
+        encoded_dag = DagSerialization.to_dict(dag)
+
+        lazy_dag = DagSerialization.from_dict(encoded_dag, lazy_tasks=True, load_op_links=False)
+        linked_dag = DagSerialization.from_dict(encoded_dag, lazy_tasks=True)
+
+        # The flag is passed to the deferred deserialization, not stored on the class
+        assert DagSerialization._load_operator_extra_links
+        assert not lazy_dag.get_task("simple_task").operator_extra_links
+        assert linked_dag.get_task("simple_task").operator_extra_links
+
+    def test_lazy_task_is_only_shared_once_loaded(self):
+        from airflow.providers.standard.operators.empty import EmptyOperator
+
+        with DAG("test_lazy_task_sharing", schedule=None, start_date=datetime(2020, 1, 1)) as dag:
+            EmptyOperator(task_id="task1")
+        serialized_dag = DagSerialization.from_dict(DagSerialization.to_dict(dag), lazy_tasks=True)
+        set_task_dag_attributes = OperatorSerialization._set_task_dag_attributes
+        from_other_thread = []
+        other_thread = threading.Thread(
+            target=lambda: from_other_thread.append(serialized_dag.get_task("task1"))
+        )
+
+        def set_attributes_while_looked_up(task, dag):
+            # Resolved for the thread loading the task, not for the others until it is loaded
+            assert serialized_dag.task_dict["task1"] is task
+            assert not serialized_dag.task_dict.is_loaded("task1")
+            other_thread.start()
+            other_thread.join(timeout=0.1)
+            assert not from_other_thread
+            set_task_dag_attributes(task, dag)
+
+        with mock.patch.object(
+            OperatorSerialization, "_set_task_dag_attributes", side_effect=set_attributes_while_looked_up
+        ):
+            task = serialized_dag.get_task("task1")
+        other_thread.join()
+
+        assert from_other_thread == [task]
+        assert task.dag is serialized_dag
+
+    def test_lazy_task_stays_pending_when_failing_to_load(self):
+        from airflow.providers.standard.operators.empty import EmptyOperator
+
+        with DAG("test_lazy_task_failure", schedule=None, start_date=datetime(2020, 1, 1)) as dag:
+            EmptyOperator(task_id="task1")
+        serialized_dag = DagSerialization.from_dict(DagSerialization.to_dict(dag), lazy_tasks=True)
+
+        with mock.patch.object(OperatorSerialization, "_set_task_dag_attributes", side_effect=ValueError):
+            with pytest.raises(DeserializationError):
+                serialized_dag.get_task("task1")
+        assert not serialized_dag.task_dict.is_loaded("task1")
+
+        assert serialized_dag.get_task("task1").dag is serialized_dag
+
+    def test_lazy_task_deserialization_of_example_dags(self):
+        dags, _ = collect_dags("airflow-core/src/airflow/example_dags")
+        for dag in dags.values():
+            lazy_dag = DagSerialization.from_dict(DagSerialization.to_dict(dag), lazy_tasks=True)
+            self.validate_deserialized_dag(lazy_dag, dag)
+
     @staticmethod
     def assert_taskgroup_children(se_task_group, dag_task_group, expected_children):
         assert se_task_group.children.keys() == dag_task_group.children.keys() == expected_children
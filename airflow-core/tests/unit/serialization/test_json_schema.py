@@ -0,0 +1,170 @@
+# Licensed to the Apache Software Foundation (ASF) under one
+# or more contributor license agreements.  See the NOTICE file
+# distributed with this work for additional information
+# regarding copyright ownership.  The ASF licenses this file
+# to you under the Apache License, Version 2.0 (the
+# "License"); you may not use this file except in compliance
+# with the License.  You may obtain a copy of the License at
+#
+#   http://www.apache.org/licenses/LICENSE-2.0
+#
+# Unless required by applicable law or agreed to in writing,
+# software distributed under the License is distributed on an
+# "AS IS" BASIS, WITHOUT WARRANTIES OR CONDITIONS OF ANY
+# KIND, either express or implied.  See the License for the
+# specific language governing permissions and limitations
+# under the License.
+from __future__ import annotations
+
+from datetime import datetime
+from unittest import mock
+
+import jsonschema
+import pytest
+
+from airflow.providers.standard.operators.bash import BashOperator
+from airflow.sdk import DAG
+from airflow.serialization.json_schema import (
+    CompiledValidator,
+    UnsupportedSchemaError,
+    load_dag_schema,
+    load_dag_schema_dict,
+)
+from airflow.serialization.serialized_objects import DagSerialization
+
+from tests_common.test_utils.config import conf_vars
+
+SCHEMA = {
+    "definitions": {
+        "node": {
+            "type": "object",
+            "properties": {
+                "name": {"type": "string", "pattern": "^[a-z]+$"},
+                "weight": {"type": ["integer", "null"], "minimum": 0},
+                "kind": {"anyOf": [{"const": "leaf"}, {"const": "branch"}]},
+                "children": {"type": "array", "items": {"$ref": "#/definitions/node"}, "maxItems": 2},
+                "flag": {"const": True},
+            },
+            "required": ["name"],
+            "additionalProperties": False,
+            "dependencies": {"children": ["kind"]},
+        }
+    },
+    "$ref": "#/definitions/node",
+}
+
+
+@pytest.mark.parametrize(
+    "instance",
+    [
+        {"name": "root"},
+        {"name": "root", "weight": 3, "flag": True},
+        {"name": "root", "weight": 3.0},
+        {"name": "root", "weight": None, "kind": "branch", "children": [{"name": "leaf", "kind": "leaf"}]},
+        {"name": "Root"},
+        {"name": "root", "weight": -1},
+        {"name": "root", "weight": 2.5},
+        {"name": "root", "weight": True},
+        {"name": "root", "flag": 1},
+        {"name": "root", "kind": "trunk"},
+        {"name": "root", "children": []},
+        {"name": "root", "kind": "branch", "children": [{"name": "a"}, {"name": "b"}, {"name": "c"}]},
+        {"name": "root", "kind": "branch", "children": [{"name": "leaf", "other": 1}]},
+        {"weight": 1},
+        ["name"],
+        "root",
+    ],
+)
+def test_compiled_validator_agrees_with_jsonschema(instance):
+    compiled = CompiledValidator(SCHEMA)
+    reference = jsonschema.Draft7Validator(SCHEMA)
+
+    assert compiled.is_valid(instance) == reference.is_valid(instance)
+    assert [error.message for error in compiled.iter_errors(instance)] == [
+        error.message for error in reference.iter_errors(instance)
+    ]
+
+
+def test_compiled_validator_raises_jsonschema_errors():
+    with pytest.raises(jsonschema.ValidationError, match="'Root' does not match"):
+        CompiledValidator(SCHEMA).validate({"name": "Root"})
+
+
+def test_compiled_validator_only_uses_jsonschema_for_invalid_instances():
+    validator = CompiledValidator(SCHEMA)
+
+    with mock.patch("jsonschema.Draft7Validator") as mock_validator:
+        validator.validate({"name": "root"})
+    mock_validator.assert_not_called()
+
+
+@pytest.mark.parametrize(
+    "schema",
+    [
+        {"type": "array", "uniqueItems": True},
+        {"type": "decimal"},
+        {"$ref": "other.json#/definitions/node"},
+        {"$ref": "#/definitions/missing"},
+    ],
+)
+def test_unsupported_schema(schema):
+    with pytest.raises(UnsupportedSchemaError):
+        CompiledValidator(schema)
+
+
+def test_dag_schema_is_compiled():
+    validator = load_dag_schema()
+
+    assert isinstance(validator, CompiledValidator)
+    assert validator.schema == load_dag_schema_dict()
+    assert load_dag_schema() is validator
+
+
+class TestSchemaValidationSampleRate:
+    @pytest.fixture(autouse=True)
+    def clear_validated_digests(self):
+        DagSerialization._validated_digests.clear()
+
+    @pytest.fixture
+    def dag(self):
+        with DAG("test_schema_validation", schedule=None, start_date=datetime(2025, 1, 1)) as dag:
+            BashOperator(task_id="task", bash_command="echo")
+        return dag
+
+    @pytest.mark.parametrize(
+        ("sample_rate", "random_value", "validated"),
+        [
+            ("1.0", 0.99, True),
+            ("0.1", 0.05, True),
+            ("0.1", 0.5, False),
+            ("0", 0.0, False),
+        ],
+    )
+    def test_to_dict_validates_sample(self, dag, sample_rate, random_value, validated):
+        with (
+            conf_vars({("core", "serialized_dag_schema_validation_sample_rate"): sample_rate}),
+            mock.patch("airflow.serialization.serialized_objects.random.random", return_value=random_value),
+            mock.patch.object(DagSerialization, "validate_schema") as mock_validate_schema,
+        ):
+            DagSerialization.to_dict(dag)
+
+        assert mock_validate_schema.called is validated
+
+    def test_to_dict_validates_changed_dags_only(self, dag):
+        with mock.patch.object(DagSerialization, "validate_schema") as mock_validate_schema:
+            DagSerialization.to_dict(dag)
+            DagSerialization.to_dict(dag)
+            assert mock_validate_schema.call_count == 1
+
+            dag.description = "changed"
+            DagSerialization.to_dict(dag)
+            assert mock_validate_schema.call_count == 2
+
+    def test_invalid_dags_are_validated_again(self, dag):
+        with mock.patch.object(
+            DagSerialization, "validate_schema", side_effect=jsonschema.ValidationError("invalid")
+        ) as mock_validate_schema:
+            for _ in range(2):
+                with pytest.raises(jsonschema.ValidationError):
+                    DagSerialization.to_dict(dag)
+        assert mock_validate_schema.call_count == 2
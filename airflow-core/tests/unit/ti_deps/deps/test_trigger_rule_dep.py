@@ -17,6 +17,7 @@
 # under the License.
 from __future__ import annotations
 
+import itertools
 from collections.abc import Iterator
 from datetime import datetime
 from typing import TYPE_CHECKING
@@ -33,7 +34,7 @@ from airflow.sdk.bases.operator import BaseOperator
 from airflow.task.trigger_rule import TriggerRule
 from airflow.ti_deps.dep_context import DepContext
 from airflow.ti_deps.deps.trigger_rule_dep import TriggerRuleDep, _UpstreamTIStates
-from airflow.utils.state import DagRunState, TaskInstanceState
+from airflow.utils.state import DagRunState, State, TaskInstanceState
 
 pytestmark = pytest.mark.db_test
 
@@ -1784,6 +1785,61 @@ def test_setup_mapped_task_group_finished_upstream_before_expand(
     )
 
 
+
+@pytest.mark.parametrize("trigger_rule", [tr for tr in TriggerRule if tr != TriggerRule.ALWAYS])
+def test_batched_upstream_states_match_per_ti_evaluation(dag_maker, session, trigger_rule):
+    """Evaluating with counts shared through the dep context gives the same result as per ti."""
+    with dag_maker(session=session):
+        setup = EmptyOperator(task_id="setup").as_setup()
+        up1 = EmptyOperator(task_id="up1")
+        up2 = EmptyOperator(task_id="up2")
+        down = EmptyOperator(task_id="down", trigger_rule=trigger_rule)
+        setup >> up1 >> down
+        up2 >> down
+    dr = dag_maker.create_dagrun()
+    tis = {ti.task_id: ti for ti in dr.task_instances}
+    upstream_tis = [tis["setup"], tis["up1"], tis["up2"]]
+
+    def _evaluate(batch_upstream_states: bool):
+        dep_context = DepContext(
+            flag_upstream_failed=True,
+            finished_tis=[ti for ti in upstream_tis if ti.state in State.finished],
+            batch_upstream_states=batch_upstream_states,
+        )
+        statuses = [
+            (status.passed, status.reason)
+            for status in TriggerRuleDep()._get_dep_statuses(tis["down"], session, dep_context)
+        ]
+        result = statuses, tis["down"].state, dep_context.have_changed_ti_states
+        tis["down"].state = None
+        return result
+
+    states = [None, SUCCESS, FAILED, SKIPPED, UPSTREAM_FAILED]
+    for combination in itertools.product(states, repeat=len(upstream_tis)):
+        for ti, state in zip(upstream_tis, combination):
+            ti.state = state
+        assert _evaluate(batch_upstream_states=True) == _evaluate(batch_upstream_states=False), combination
+
+
+def test_calculate_from_counts_matches_calculate(dag_maker, session):
+    with dag_maker(session=session):
+        setup = EmptyOperator(task_id="setup").as_setup()
+        up1 = EmptyOperator(task_id="up1")
+        up2 = EmptyOperator(task_id="up2")
+        setup >> [up1, up2] >> EmptyOperator(task_id="down")
+    dr = dag_maker.create_dagrun()
+    tis = {ti.task_id: ti for ti in dr.task_instances}
+    tis["setup"].state = SKIPPED
+    tis["up1"].state = SUCCESS
+    tis["up2"].state = FAILED
+    dep_context = DepContext(finished_tis=[tis["setup"], tis["up1"], tis["up2"]])
+
+    upstream_tasks = {t.task_id: t for t in (setup, up1, up2)}
+    assert _UpstreamTIStates.calculate_from_counts(
+        dep_context.ensure_finished_ti_state_counts(dr, session), upstream_tasks
+    ) == _UpstreamTIStates.calculate(tis[task_id] for task_id in upstream_tasks)
+
+
 def _test_trigger_rule(
     ti: TaskInstance,
     session: Session,
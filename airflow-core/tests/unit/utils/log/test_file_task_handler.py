@@ -17,9 +17,12 @@
 # under the License.
 from __future__ import annotations
 
+import io
 from pathlib import Path
 from unittest.mock import MagicMock, patch
 
+import pytest
+
 from airflow.utils.log.file_task_handler import FileTaskHandler
 
 
@@ -52,7 +55,7 @@ class TestFileTaskHandlerLogServer:
 
         assert sources == ["/tmp/test_logs/dag/run/task/1.log"]
         assert streams == [mock_stream]
-        mock_read_local.assert_called_once_with(Path("/tmp/test_logs", "dag/run/task/1.log"))
+        mock_read_local.assert_called_once_with(Path("/tmp/test_logs", "dag/run/task/1.log"), {}, False)
 
     @patch("airflow.utils.log.file_task_handler._fetch_logs_from_service")
     @patch.object(FileTaskHandler, "_get_log_retrieval_url")
@@ -90,3 +93,47 @@ class TestFileTaskHandlerLogServer:
         assert len(sources) == 1
         assert "secret_key" in sources[0]
         assert streams == []
+
+    @pytest.mark.parametrize(
+        ("status_code", "content"),
+        [
+            pytest.param(206, b"line2\nline3\n", id="range"),
+            pytest.param(200, b"line1\nline2\nline3\n", id="range_not_supported"),
+        ],
+    )
+    @patch("airflow.utils.log.file_task_handler._fetch_logs_from_service")
+    @patch.object(FileTaskHandler, "_get_log_retrieval_url")
+    def test_reads_from_offset(self, mock_get_url, mock_fetch, status_code, content):
+        """The log is read from the offset it was last read to."""
+        mock_get_url.return_value = ("http://worker-1/log", "dag/run/task/1.log")
+
+        mock_response = MagicMock()
+        mock_response.status_code = status_code
+        mock_response.headers = {"Content-Length": str(len(content))}
+        mock_response.raw = io.BytesIO(content)
+        mock_fetch.return_value = mock_response
+        log_offsets = {"http://worker-1/log": 6}
+
+        sources, streams = self.handler._read_from_logs_server(self.ti, "dag/run/task/1.log", log_offsets)
+
+        assert sources == ["http://worker-1/log"]
+        assert list(streams[0]) == ["line2", "line3"]
+        assert log_offsets == {"http://worker-1/log": 18}
+        mock_fetch.assert_called_once_with("http://worker-1/log", "dag/run/task/1.log", 6)
+
+    @patch("airflow.utils.log.file_task_handler._fetch_logs_from_service")
+    @patch.object(FileTaskHandler, "_get_log_retrieval_url")
+    def test_416_when_log_did_not_grow(self, mock_get_url, mock_fetch):
+        """When the log did not grow since it was last read, there is nothing to stream."""
+        mock_get_url.return_value = ("http://worker-1/log", "dag/run/task/1.log")
+
+        mock_response = MagicMock()
+        mock_response.status_code = 416
+        mock_fetch.return_value = mock_response
+        log_offsets = {"http://worker-1/log": 18}
+
+        sources, streams = self.handler._read_from_logs_server(self.ti, "dag/run/task/1.log", log_offsets)
+
+        assert sources == ["http://worker-1/log"]
+        assert streams == []
+        assert log_offsets == {"http://worker-1/log": 18}
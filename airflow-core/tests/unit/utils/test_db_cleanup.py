@@ -43,9 +43,12 @@ from airflow.utils.db_cleanup import (
     ARCHIVE_TABLE_PREFIX,
     CreateTableAs,
     _build_query,
+    _clean_tables_in_parallel,
     _cleanup_table,
+    _CleanupCheckpoint,
     _confirm_drop_archives,
     _dump_table_to_file,
+    _effective_table_names,
     _get_archived_table_names,
     config_dict,
     drop_archived_tables,
@@ -488,6 +491,72 @@ class TestDBCleanup:
         archived_table_names = _get_archived_table_names(["dag_run"], session)
         assert len(archived_table_names) == 0
 
+    def test__cleanup_table_in_batches(self):
+        """Verify that batches walk the table by primary key and are all appended to one archive table."""
+        base_date = pendulum.DateTime(2022, 1, 1, tzinfo=pendulum.timezone("UTC"))
+        create_tis(base_date=base_date, num_tis=10)
+        with create_session() as session:
+            _cleanup_table(
+                **config_dict["task_instance"].__dict__,
+                clean_before_timestamp=base_date.add(days=7),
+                dry_run=False,
+                session=session,
+                batch_size=3,
+            )
+            assert session.scalar(select(func.count()).select_from(TaskInstance)) == 3
+            (archive_table,) = _get_archived_table_names(["task_instance"], session)
+            assert session.scalar(text(f"SELECT COUNT(*) FROM {archive_table}")) == 7
+
+    def test__cleanup_table_resumes_from_checkpoint(self, tmp_path):
+        base_date = pendulum.DateTime(2022, 1, 1, tzinfo=pendulum.timezone("UTC"))
+        create_tis(base_date=base_date, num_tis=10)
+        checkpoint_path = str(tmp_path / "checkpoint.json")
+        run = {"clean_before_timestamp": "x"}
+        with create_session() as session:
+            _cleanup_table(
+                **config_dict["task_instance"].__dict__,
+                clean_before_timestamp=base_date.add(days=4),
+                dry_run=False,
+                session=session,
+                batch_size=3,
+                checkpoint=_CleanupCheckpoint(checkpoint_path, run=run),
+            )
+            checkpoint = _CleanupCheckpoint(checkpoint_path, run=run)
+            state = checkpoint.get("task_instance")
+            assert state["done"] is True
+            assert state["rows"] == 4
+            assert state["archive_table"] in _get_archived_table_names(["task_instance"], session)
+
+            # A table done according to the checkpoint is not cleaned again
+            with patch("airflow.utils.db_cleanup._do_delete") as do_delete:
+                _cleanup_table(
+                    **config_dict["task_instance"].__dict__,
+                    clean_before_timestamp=base_date.add(days=7),
+                    dry_run=False,
+                    session=session,
+                    checkpoint=checkpoint,
+                )
+            do_delete.assert_not_called()
+            assert session.scalar(select(func.count()).select_from(TaskInstance)) == 6
+
+        with pytest.raises(AirflowException, match="written by a cleanup with other arguments"):
+            _CleanupCheckpoint(checkpoint_path, run={"clean_before_timestamp": "y"})
+
+    def test_clean_tables_in_parallel_respects_dependencies(self):
+        """A table is only cleaned once the tables depending on it are done."""
+        _, configs = _effective_table_names(table_names=["dag_version"])
+        cleaned = []
+
+        def clean_table(table_name, session):
+            cleaned.append(table_name)
+
+        _clean_tables_in_parallel(configs, workers=4, clean_table=clean_table)
+
+        assert sorted(cleaned) == sorted(configs)
+        for table_name, config in configs.items():
+            for dep in config.dependent_tables or []:
+                assert cleaned.index(dep) < cleaned.index(table_name)
+
     def test_no_models_missing(self):
         """
         1. Verify that for all tables in `airflow.models`, we either have them enabled in db cleanup,
@@ -527,6 +596,7 @@ class TestDBCleanup:
             "dag_warning",  # self-maintaining
             "connection",  # leave alone
             "slot_pool",  # leave alone
+            "slot_pool_usage",  # self-maintaining
             "dag_schedule_asset_reference",  # leave alone for now
             "dag_schedule_asset_alias_reference",  # leave alone for now
             "dag_schedule_asset_name_reference",  # leave alone for now
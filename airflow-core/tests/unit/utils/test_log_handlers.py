@@ -471,7 +471,7 @@ class TestFileTaskLogHandler:
         )
         fth = FileTaskHandler("")
         log_handler_output_stream, metadata = fth._read(ti=local_log_file_read, try_number=1)
-        mock_read_local.assert_called_with(path)
+        mock_read_local.assert_called_with(path, {}, hold_partial_line=False)
         assert extract_events(log_handler_output_stream) == ["the log"]
         assert metadata == {"end_of_log": True, "log_pos": 1}
 
@@ -488,6 +488,84 @@ class TestFileTaskLogHandler:
         assert list(log_streams[0]) == ["file1 content", "file1 content2"]
         assert list(log_streams[1]) == ["file2 content", "file2 content2"]
 
+    def test__read_from_local_from_offsets(self, tmp_path):
+        """Tests that _read_from_local reads log files from the offsets they were last read to"""
+        path = tmp_path / "hello1.log"
+        path.write_text("line1\nline2\npartial")
+        log_offsets: dict[str, int] = {}
+        fth = FileTaskHandler("")
+
+        _, log_streams = fth._read_from_local(path, log_offsets)
+        assert list(log_streams[0]) == ["line1", "line2", "partial"]
+        # the last line is read again, as it may not be complete
+        assert log_offsets == {str(path): 12}
+
+        _, log_streams = fth._read_from_local(path, log_offsets, hold_partial_line=True)
+        assert list(log_streams[0]) == []
+        assert log_offsets == {str(path): 12}
+
+        with path.open("a") as f:
+            f.write(" line\nline3\n")
+        _, log_streams = fth._read_from_local(path, log_offsets)
+        assert list(log_streams[0]) == ["partial line", "line3"]
+        assert log_offsets == {str(path): 31}
+
+        # the file was replaced by a shorter one
+        path.write_text("new file\n")
+        _, log_streams = fth._read_from_local(path, log_offsets)
+        assert list(log_streams[0]) == ["new file"]
+        assert log_offsets == {str(path): 9}
+
+    def test__read_resumes_from_log_offsets(self, create_task_instance, tmp_path):
+        """Tests that logs of running tasks are read from where the previous read stopped"""
+        ti = create_task_instance(
+            dag_id="dag_for_testing_log_offsets",
+            task_id="task_for_testing_log_offsets",
+            run_type=DagRunType.SCHEDULED,
+            logical_date=DEFAULT_DATE,
+            state=TaskInstanceState.RUNNING,
+        )
+        ti.try_number = 1
+        fth = FileTaskHandler(os.fspath(tmp_path))
+        fth._get_executor_get_task_log = mock.Mock(return_value=mock.Mock(return_value=None))
+        fth._read_from_logs_server = mock.Mock(return_value=([], []))
+        log_path = tmp_path / fth._render_filename(ti, 1)
+        log_path.parent.mkdir(parents=True)
+        log_path.write_text("line1\nline2\n")
+
+        logs, metadata = fth._read(ti=ti, try_number=1)
+        assert extract_events(logs) == ["line1", "line2"]
+        assert metadata == {"end_of_log": False, "log_pos": 2, "log_offsets": {str(log_path): 12}}
+
+        with log_path.open("a") as f:
+            f.write("line3\n")
+        logs, metadata = fth._read(ti=ti, try_number=1, metadata=metadata)
+        assert extract_events(logs) == ["line3"]
+        assert metadata == {"end_of_log": False, "log_pos": 3, "log_offsets": {str(log_path): 18}}
+
+        # without offsets, the log is read from the start and skipped until the last position
+        logs, metadata = fth._read(ti=ti, try_number=1, metadata={"end_of_log": False, "log_pos": 1})
+        assert extract_events(logs) == ["line2", "line3"]
+        assert metadata == {"end_of_log": False, "log_pos": 3, "log_offsets": {str(log_path): 18}}
+
+        # a line still being written is streamed once complete
+        with log_path.open("a") as f:
+            f.write("line4")
+        logs, metadata = fth._read(ti=ti, try_number=1, metadata=metadata)
+        assert extract_events(logs) == []
+        assert metadata == {"end_of_log": False, "log_pos": 3, "log_offsets": {str(log_path): 18}}
+        with log_path.open("a") as f:
+            f.write(" done\nline5")
+        logs, metadata = fth._read(ti=ti, try_number=1, metadata=metadata)
+        assert extract_events(logs) == ["line4 done"]
+        assert metadata == {"end_of_log": False, "log_pos": 4, "log_offsets": {str(log_path): 29}}
+
+        # or when the end of the log is read
+        ti.state = TaskInstanceState.SUCCESS
+        logs, metadata = fth._read(ti=ti, try_number=1, metadata=metadata)
+        assert extract_events(logs) == ["line5"]
+        assert metadata == {"end_of_log": True, "log_pos": 5}
+
     @pytest.mark.parametrize(
         ("remote_logs", "local_logs", "served_logs_checked"),
         [
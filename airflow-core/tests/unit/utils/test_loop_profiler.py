@@ -0,0 +1,164 @@
+#
+# Licensed to the Apache Software Foundation (ASF) under one
+# or more contributor license agreements.  See the NOTICE file
+# distributed with this work for additional information
+# regarding copyright ownership.  The ASF licenses this file
+# to you under the Apache License, Version 2.0 (the
+# "License"); you may not use this file except in compliance
+# with the License.  You may obtain a copy of the License at
+#
+#   http://www.apache.org/licenses/LICENSE-2.0
+#
+# Unless required by applicable law or agreed to in writing,
+# software distributed under the License is distributed on an
+# "AS IS" BASIS, WITHOUT WARRANTIES OR CONDITIONS OF ANY
+# KIND, either express or implied.  See the License for the
+# specific language governing permissions and limitations
+# under the License.
+from __future__ import annotations
+
+import threading
+from contextlib import nullcontext
+from unittest import mock
+
+from sqlalchemy import create_engine, text
+
+from airflow.utils.loop_profiler import LoopProfiler, StackSampler
+
+from tests_common.test_utils.config import conf_vars
+
+
+class TestLoopProfiler:
+    def test_disabled_by_default(self):
+        profiler = LoopProfiler.for_scheduler()
+
+        assert not profiler.enabled
+        assert isinstance(profiler.phase("phase"), nullcontext)
+        assert isinstance(profiler.dag("dag_id"), nullcontext)
+
+    @conf_vars({("profiling", "scheduler_loop_profiling"): "true"})
+    def test_enabled_from_config(self):
+        assert LoopProfiler.for_scheduler().enabled
+
+    def test_nested_phases_count_statements(self):
+        engine = create_engine("sqlite://")
+        profiler = LoopProfiler("test")
+        profiler.attach(engine)
+        try:
+            profiler.start_loop()
+            with engine.connect() as conn:
+                with profiler.phase("outer"):
+                    conn.execute(text("SELECT 1"))
+                    with profiler.phase("inner"):
+                        conn.execute(text("SELECT 1"))
+                        conn.execute(text("SELECT 1"))
+                    with profiler.dag("dag_id"):
+                        conn.execute(text("SELECT 1"))
+        finally:
+            profiler.detach()
+
+        assert profiler.phases.keys() == {"outer", "outer.inner"}
+        assert profiler.phases["outer"].statements == 4
+        assert profiler.phases["outer.inner"].statements == 2
+        assert profiler.dags["dag_id"].statements == 1
+        assert profiler.loop.statements == 4
+
+    def test_statements_of_other_threads_are_ignored(self):
+        engine = create_engine("sqlite://")
+        profiler = LoopProfiler("test")
+        profiler.attach(engine)
+
+        def run_query():
+            with engine.connect() as conn:
+                conn.execute(text("SELECT 1"))
+
+        try:
+            profiler.start_loop()
+            with profiler.phase("phase"):
+                thread = threading.Thread(target=run_query)
+                thread.start()
+                thread.join()
+        finally:
+            profiler.detach()
+
+        assert profiler.phases["phase"].statements == 0
+
+    def test_start_loop_resets_costs(self):
+        profiler = LoopProfiler("test")
+        with profiler.phase("phase"), profiler.dag("dag_id"):
+            pass
+
+        profiler.start_loop()
+
+        assert profiler.phases == {}
+        assert profiler.dags == {}
+
+    @mock.patch("airflow.utils.loop_profiler.Stats")
+    @mock.patch("airflow.utils.loop_profiler.log")
+    def test_end_loop(self, mock_log, mock_stats):
+        profiler = LoopProfiler("test", slow_loop_threshold=3600)
+        profiler.start_loop()
+        with profiler.phase("phase"):
+            pass
+        profiler.end_loop()
+
+        mock_stats.timing.assert_called_once_with("test.duration", mock.ANY, tags={"phase": "phase"})
+        mock_stats.incr.assert_any_call("test.queries", 0, tags={"phase": "phase"})
+        mock_stats.incr.assert_any_call("test.rows", 0, tags={"phase": "phase"})
+        mock_log.warning.assert_not_called()
+
+        profiler.slow_loop_threshold = 0
+        profiler.end_loop()
+        mock_log.warning.assert_called_once()
+
+    def test_format_breakdown_lists_most_expensive_dags(self):
+        profiler = LoopProfiler("test", top_dags=1)
+        profiler.start_loop()
+        with profiler.phase("phase"):
+            with profiler.dag("cheap"):
+                pass
+            with profiler.dag("expensive"):
+                profiler.dags["expensive"].duration = 10
+
+        breakdown = profiler.format_breakdown()
+
+        assert "phase" in breakdown
+        assert "expensive" in breakdown
+        assert "cheap" not in breakdown
+
+
+class TestStackSampler:
+    def test_sample_and_flush(self, tmp_path):
+        sampler = StackSampler(str(tmp_path), "test", thread_id=threading.get_ident())
+
+        sampler.sample()
+        sampler.sample()
+        path = sampler.flush()
+
+        assert path is not None
+        with open(path) as f:
+            lines = f.read().splitlines()
+        assert len(lines) == 1
+        stack, count = lines[0].rsplit(" ", 1)
+        assert count == "2"
+        assert stack.split(";")[-1].startswith("sample (")
+        # Nothing new to write
+        assert sampler.flush() is None
+
+    def test_toggle(self, tmp_path):
+        sampler = StackSampler(str(tmp_path / "samples"), "test", interval=0.001)
+
+        sampler.toggle()
+        assert sampler.running
+        sampler.toggle()
+
+        assert not sampler.running
+        assert len(list((tmp_path / "samples").iterdir())) <= 1
+
+    @conf_vars({("profiling", "stack_sampling_output_dir"): "/tmp/samples"})
+    def test_for_component(self):
+        sampler = StackSampler.for_component("scheduler")
+
+        assert sampler.output_dir == "/tmp/samples"
+        assert sampler.name == "scheduler"
+        assert sampler.thread_id == threading.main_thread().ident
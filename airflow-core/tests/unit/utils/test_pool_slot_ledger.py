@@ -0,0 +1,181 @@
+#
+# Licensed to the Apache Software Foundation (ASF) under one
+# or more contributor license agreements.  See the NOTICE file
+# distributed with this work for additional information
+# regarding copyright ownership.  The ASF licenses this file
+# to you under the Apache License, Version 2.0 (the
+# "License"); you may not use this file except in compliance
+# with the License.  You may obtain a copy of the License at
+#
+#   http://www.apache.org/licenses/LICENSE-2.0
+#
+# Unless required by applicable law or agreed to in writing,
+# software distributed under the License is distributed on an
+# "AS IS" BASIS, WITHOUT WARRANTIES OR CONDITIONS OF ANY
+# KIND, either express or implied.  See the License for the
+# specific language governing permissions and limitations
+# under the License.
+from __future__ import annotations
+
+from unittest import mock
+
+import pendulum
+import pytest
+from sqlalchemy import bindparam, select, text, update
+
+from airflow.models.pool import Pool, PoolSlotUsage
+from airflow.models.taskinstance import TaskInstance
+from airflow.providers.standard.operators.empty import EmptyOperator
+from airflow.utils import pool_slot_ledger
+from airflow.utils.pool_slot_ledger import (
+    reconcile_pool_slot_usage,
+    track_pool_slot_usage,
+    untrack_pool_slot_usage,
+)
+from airflow.utils.state import State
+
+from tests_common.test_utils.config import conf_vars
+from tests_common.test_utils.db import clear_db_dags, clear_db_pools, clear_db_runs
+
+pytestmark = pytest.mark.db_test
+
+DEFAULT_DATE = pendulum.datetime(2016, 1, 1, tz="UTC")
+
+
+def ledger(session) -> dict[tuple[str, str], int]:
+    rows = session.execute(select(PoolSlotUsage.pool, PoolSlotUsage.state, PoolSlotUsage.slots))
+    return {(pool, state): slots for pool, state, slots in rows if slots}
+
+
+class TestPoolSlotLedger:
+    @pytest.fixture(autouse=True)
+    def setup_ledger(self, session):
+        clear_db_dags()
+        clear_db_runs()
+        clear_db_pools()
+        with conf_vars({("scheduler", "use_pool_slot_ledger"): "true"}):
+            track_pool_slot_usage()
+            reconcile_pool_slot_usage(session)
+            session.add(Pool(pool="test_pool", slots=5, include_deferred=False))
+            session.commit()
+            yield
+            untrack_pool_slot_usage()
+        clear_db_dags()
+        clear_db_runs()
+        clear_db_pools()
+
+    @pytest.fixture
+    def tis(self, dag_maker, session):
+        with dag_maker(dag_id="test_pool_slot_ledger", start_date=DEFAULT_DATE, session=session):
+            EmptyOperator(task_id="op1", pool="test_pool", pool_slots=2)
+            EmptyOperator(task_id="op2", pool="test_pool")
+            EmptyOperator(task_id="op3", pool="test_pool")
+        dr = dag_maker.create_dagrun(session=session)
+        session.commit()
+        return sorted(dr.get_task_instances(session=session), key=lambda ti: ti.task_id)
+
+    def test_orm_changes_are_counted(self, tis, session):
+        tis[0].state = State.RUNNING
+        tis[1].state = State.QUEUED
+        tis[2].state = State.DEFERRED
+        session.commit()
+
+        assert ledger(session) == {
+            ("test_pool", State.RUNNING): 2,
+            ("test_pool", State.QUEUED): 1,
+            ("test_pool", State.DEFERRED): 1,
+        }
+        assert Pool.slots_stats(session=session)["test_pool"] == {
+            "total": 5,
+            "running": 2,
+            "queued": 1,
+            "deferred": 1,
+            "scheduled": 0,
+            "open": 2,
+        }
+        assert reconcile_pool_slot_usage(session) == 0
+
+    def test_orm_changes_of_unloaded_columns_are_counted(self, tis, session):
+        tis[0].state = State.QUEUED
+        tis[1].state = State.QUEUED
+        session.commit()
+        session.expire(tis[0], ["pool", "state", "pool_slots"])
+        session.expire(tis[1], ["state"])
+        tis[0].state = State.RUNNING
+        session.delete(tis[1])
+        session.commit()
+
+        assert ledger(session) == {("test_pool", State.RUNNING): 2}
+        assert reconcile_pool_slot_usage(session) == 0
+
+    def test_update_statements_are_counted(self, tis, session):
+        session.execute(
+            update(TaskInstance)
+            .where(TaskInstance.task_id.in_(["op1", "op2"]))
+            .values(state=State.QUEUED)
+            .execution_options(synchronize_session=False)
+        )
+        session.commit()
+        session.execute(
+            update(TaskInstance)
+            .where(TaskInstance.task_id == "op1")
+            .values(state=State.RUNNING, pool=Pool.DEFAULT_POOL_NAME)
+            .execution_options(synchronize_session=False)
+        )
+        session.commit()
+
+        assert ledger(session) == {
+            ("test_pool", State.QUEUED): 1,
+            (Pool.DEFAULT_POOL_NAME, State.RUNNING): 2,
+        }
+        assert reconcile_pool_slot_usage(session) == 0
+
+    def test_bulk_update_statements_are_counted(self, tis, session):
+        session.execute(
+            update(TaskInstance)
+            .where(TaskInstance.task_id == bindparam("b_task_id"))
+            .values(state=bindparam("b_state"))
+            .execution_options(synchronize_session=False),
+            [
+                {"b_task_id": "op1", "b_state": State.RUNNING},
+                {"b_task_id": "op2", "b_state": State.QUEUED},
+            ],
+        )
+        session.commit()
+
+        assert ledger(session) == {("test_pool", State.RUNNING): 2, ("test_pool", State.QUEUED): 1}
+        assert reconcile_pool_slot_usage(session) == 0
+
+    def test_rolled_back_changes_are_not_counted(self, tis, session):
+        tis[0].state = State.RUNNING
+        session.flush()
+        session.rollback()
+
+        assert ledger(session) == {}
+
+    def test_reconcile_fixes_drift(self, tis, session):
+        # Not seen by the ORM session
+        session.execute(text("UPDATE task_instance SET state = 'running' WHERE task_id = 'op1'"))
+        session.commit()
+
+        assert reconcile_pool_slot_usage(session) == 2
+        session.commit()
+
+        assert ledger(session) == {("test_pool", State.RUNNING): 2}
+        assert reconcile_pool_slot_usage(session) == 0
+
+    def test_reconcile_leaves_counts_changed_meanwhile(self, tis, session):
+        session.execute(text("UPDATE task_instance SET state = 'running' WHERE task_id = 'op1'"))
+        session.commit()
+        # As if another transaction had added to the count while the task instances were summed
+        changed = {**pool_slot_ledger._read_ledger(session), ("test_pool", State.RUNNING): 1}
+        with mock.patch.object(
+            pool_slot_ledger,
+            "_read_ledger",
+            side_effect=[changed, pool_slot_ledger._read_ledger(session)],
+        ):
+            assert reconcile_pool_slot_usage(session) == 0
+        session.commit()
+
+        assert ledger(session) == {}
+        assert reconcile_pool_slot_usage(session) == 2
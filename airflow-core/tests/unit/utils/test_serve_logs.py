@@ -115,6 +115,26 @@ class TestServeLogs:
         assert response.text == LOG_DATA
         assert response.status_code == 200
 
+    def test_should_serve_file_from_offset(self, client: TestClient, jwt_generator):
+        response = client.get(
+            "/log/sample.log",
+            headers={
+                "Authorization": jwt_generator.generate({"filename": "sample.log"}),
+                "Range": "bytes=16-",
+            },
+        )
+        assert response.text == LOG_DATA[16:]
+        assert response.status_code == 206
+
+        response = client.get(
+            "/log/sample.log",
+            headers={
+                "Authorization": jwt_generator.generate({"filename": "sample.log"}),
+                "Range": f"bytes={len(LOG_DATA)}-",
+            },
+        )
+        assert response.status_code == 416
+
     def test_forbidden_different_logname(self, client: TestClient, jwt_generator):
         response = client.get(
             "/log/sample.log",
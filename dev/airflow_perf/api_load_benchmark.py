@@ -0,0 +1,94 @@
+#!/usr/bin/env python3
+# Licensed to the Apache Software Foundation (ASF) under one
+# or more contributor license agreements.  See the NOTICE file
+# distributed with this work for additional information
+# regarding copyright ownership.  The ASF licenses this file
+# to you under the Apache License, Version 2.0 (the
+# "License"); you may not use this file except in compliance
+# with the License.  You may obtain a copy of the License at
+#
+#   http://www.apache.org/licenses/LICENSE-2.0
+#
+# Unless required by applicable law or agreed to in writing,
+# software distributed under the License is distributed on an
+# "AS IS" BASIS, WITHOUT WARRANTIES OR CONDITIONS OF ANY
+# KIND, either express or implied.  See the License for the
+# specific language governing permissions and limitations
+# under the License.
+from __future__ import annotations
+
+import asyncio
+import statistics
+import time
+
+import httpx
+import rich_click as click
+
+DEFAULT_PATHS = [
+    "/api/v2/dags/~/dagRuns?limit=100",
+    "/api/v2/dags/~/dagRuns/~/taskInstances?limit=100",
+]
+
+
+def percentile(latencies: list[float], percent: float) -> float:
+    latencies = sorted(latencies)
+    return latencies[min(len(latencies) - 1, int(len(latencies) * percent / 100))]
+
+
+async def worker(
+    client: httpx.AsyncClient, path: str, deadline: float, latencies: list[float], errors: list[int]
+):
+    while time.monotonic() < deadline:
+        start = time.perf_counter()
+        response = await client.get(path)
+        latencies.append(time.perf_counter() - start)
+        if response.status_code != 200:
+            errors.append(response.status_code)
+
+
+async def run(
+    url: str, token: str, path: str, concurrency: int, duration: float
+) -> tuple[list[float], list[int]]:
+    latencies: list[float] = []
+    errors: list[int] = []
+    limits = httpx.Limits(max_connections=concurrency, max_keepalive_connections=concurrency)
+    async with httpx.AsyncClient(
+        base_url=url, headers={"Authorization": f"Bearer {token}"}, limits=limits, timeout=60
+    ) as client:
+        deadline = time.monotonic() + duration
+        await asyncio.gather(*(worker(client, path, deadline, latencies, errors) for _ in range(concurrency)))
+    return latencies, errors
+
+
+@click.command()
+@click.option("--url", default="http://localhost:8080", help="URL of the API server")
+@click.option("--token", envvar="AIRFLOW_API_TOKEN", required=True, help="JWT token of the requests")
+@click.option("--path", "paths", multiple=True, default=DEFAULT_PATHS, help="paths requested, repeatable")
+@click.option("--concurrency", default=50, help="number of requests in flight at all times")
+@click.option("--duration", default=30.0, help="seconds each path is requested for")
+@click.option("--warmup", default=5.0, help="seconds each path is requested for before measuring")
+def main(url, token, paths, concurrency, duration, warmup):
+    """
+    Load an API server with concurrent requests, and report its throughput and latencies.
+
+    Start the API server with a fixed number of workers (``airflow api-server --workers N``) against a
+    database with representative data, run the benchmark, then repeat with the other version of the code to
+    compare. Each path is requested by ``--concurrency`` clients at once, each sending a new request as soon
+    as it gets a response.
+    """
+    for path in paths:
+        if warmup:
+            asyncio.run(run(url, token, path, concurrency, warmup))
+        latencies, errors = asyncio.run(run(url, token, path, concurrency, duration))
+        if not latencies:
+            raise click.ClickException(f"No response from {url}{path}")
+        click.echo(
+            f"{path}: {len(latencies) / duration:,.1f} requests/s, "
+            f"p50 {statistics.median(latencies) * 1000:.1f}ms, "
+            f"p99 {percentile(latencies, 99) * 1000:.1f}ms, "
+            f"{len(errors)} errors"
+        )
+
+
+if __name__ == "__main__":
+    main()
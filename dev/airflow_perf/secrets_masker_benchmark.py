@@ -0,0 +1,107 @@
+#!/usr/bin/env python3
+# Licensed to the Apache Software Foundation (ASF) under one
+# or more contributor license agreements.  See the NOTICE file
+# distributed with this work for additional information
+# regarding copyright ownership.  The ASF licenses this file
+# to you under the Apache License, Version 2.0 (the
+# "License"); you may not use this file except in compliance
+# with the License.  You may obtain a copy of the License at
+#
+#   http://www.apache.org/licenses/LICENSE-2.0
+#
+# Unless required by applicable law or agreed to in writing,
+# software distributed under the License is distributed on an
+# "AS IS" BASIS, WITHOUT WARRANTIES OR CONDITIONS OF ANY
+# KIND, either express or implied.  See the License for the
+# specific language governing permissions and limitations
+# under the License.
+from __future__ import annotations
+
+import random
+import statistics
+import string
+import time
+
+import rich_click as click
+
+from airflow._shared.secrets_masker.replacers import REPLACER_CLASSES
+from airflow._shared.secrets_masker.secrets_masker import SecretsMasker
+
+LOG_TEMPLATES = [
+    "[{ts}] {{taskinstance.py:1234}} INFO - Marking task as SUCCESS. dag_id=example, task_id=task_{n}",
+    "[{ts}] {{base.py:84}} INFO - Retrieving connection 'conn_{n}'",
+    "[{ts}] {{http.py:175}} INFO - Sending 'GET' to url: https://api.example.com/v1/items?page={n}",
+    "[{ts}] {{subprocess.py:93}} INFO - Output: processed {n} rows in 0.{n}s",
+    "[{ts}] {{sql.py:512}} INFO - Running statement: SELECT * FROM table_{n} WHERE id > {n}",
+    "[{ts}] {{connection.py:301}} INFO - Connecting with token {secret}",
+]
+
+
+def make_secrets(rng: random.Random, count: int) -> list[str]:
+    alphabet = string.ascii_letters + string.digits
+    prefixes = ["", "sk-", "ghp_", "xoxb-", "AKIA"]
+    return [rng.choice(prefixes) + "".join(rng.choices(alphabet, k=rng.randint(12, 40))) for _ in range(count)]
+
+
+def make_log_lines(rng: random.Random, secrets: list[str], count: int, leak_ratio: float) -> list[str]:
+    lines = []
+    for n in range(count):
+        if rng.random() < leak_ratio:
+            template = LOG_TEMPLATES[-1]
+        else:
+            template = rng.choice(LOG_TEMPLATES[:-1])
+        lines.append(template.format(ts=f"2025-01-01T00:00:{n % 60:02}", n=n, secret=rng.choice(secrets)))
+    return lines
+
+
+def run(engine: str, secrets: list[str], lines: list[str]) -> tuple[float, float, str]:
+    masker = SecretsMasker()
+    masker.masking_engine = engine
+    start = time.perf_counter()
+    for secret in secrets:
+        masker.add_mask(secret)
+        # A log line after each new mask, like a task fetching its connections one by one
+        masker.redact(lines[0])
+    add_time = time.perf_counter() - start
+
+    start = time.perf_counter()
+    redacted = [masker.redact(line) for line in lines]
+    redact_time = time.perf_counter() - start
+    return add_time, redact_time, "\n".join(redacted)
+
+
+@click.command()
+@click.option("--num-secrets", default=300, help="number of secrets to mask")
+@click.option("--num-lines", default=20_000, help="number of log lines to redact")
+@click.option("--leak-ratio", default=0.01, help="ratio of log lines containing a secret")
+@click.option("--repeat", default=3, help="number of times to run test, to reduce variance")
+@click.option("--seed", default=0, help="seed of the generated secrets and log lines")
+def main(num_secrets, num_lines, leak_ratio, repeat, seed):
+    """
+    Compare the secret masking engines on generated task logs.
+
+    For each engine, time adding the secrets (redacting a line after each one) and redacting the log lines.
+    """
+    rng = random.Random(seed)
+    secrets = make_secrets(rng, num_secrets)
+    lines = make_log_lines(rng, secrets, num_lines, leak_ratio)
+
+    outputs = {}
+    for engine in REPLACER_CLASSES:
+        add_times, redact_times = [], []
+        for _ in range(repeat):
+            add_time, redact_time, outputs[engine] = run(engine, secrets, lines)
+            add_times.append(add_time)
+            redact_times.append(redact_time)
+        click.echo(
+            f"{engine:>6}: add {statistics.mean(add_times):.3f}s, "
+            f"redact {statistics.mean(redact_times):.3f}s (+- {statistics.pstdev(redact_times):.3f}s), "
+            f"{num_lines / statistics.mean(redact_times):,.0f} lines/s"
+        )
+
+    if len(set(outputs.values())) != 1:
+        raise click.ClickException("The engines redacted the log lines differently")
+
+
+if __name__ == "__main__":
+    main()
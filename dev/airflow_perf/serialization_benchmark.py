@@ -0,0 +1,100 @@
+#!/usr/bin/env python3
+# Licensed to the Apache Software Foundation (ASF) under one
+# or more contributor license agreements.  See the NOTICE file
+# distributed with this work for additional information
+# regarding copyright ownership.  The ASF licenses this file
+# to you under the Apache License, Version 2.0 (the
+# "License"); you may not use this file except in compliance
+# with the License.  You may obtain a copy of the License at
+#
+#   http://www.apache.org/licenses/LICENSE-2.0
+#
+# Unless required by applicable law or agreed to in writing,
+# software distributed under the License is distributed on an
+# "AS IS" BASIS, WITHOUT WARRANTIES OR CONDITIONS OF ANY
+# KIND, either express or implied.  See the License for the
+# specific language governing permissions and limitations
+# under the License.
+from __future__ import annotations
+
+import os
+import statistics
+import time
+from datetime import datetime, timedelta
+from functools import partial
+
+import jsonschema
+import rich_click as click
+
+from airflow.providers.standard.operators.bash import BashOperator
+from airflow.sdk import DAG, TaskGroup, chain
+from airflow.serialization.json_schema import load_dag_schema, load_dag_schema_dict
+from airflow.serialization.serialized_objects import DagSerialization
+
+SAMPLE_RATE_ENV = "AIRFLOW__CORE__SERIALIZED_DAG_SCHEMA_VALIDATION_SAMPLE_RATE"
+
+
+def make_dag(num_tasks: int, group_size: int) -> DAG:
+    with DAG(
+        "serialization_benchmark",
+        schedule=timedelta(hours=1),
+        start_date=datetime(2025, 1, 1),
+        default_args={"retries": 2, "retry_delay": timedelta(minutes=5)},
+    ) as dag:
+        groups = []
+        for group_index in range(0, num_tasks, group_size):
+            with TaskGroup(f"group_{group_index // group_size}") as group:
+                chain(
+                    *(
+                        BashOperator(task_id=f"task_{n}", bash_command=f"echo {n}", env={"N": str(n)})
+                        for n in range(group_index, min(group_index + group_size, num_tasks))
+                    )
+                )
+            groups.append(group)
+        chain(*groups)
+    return dag
+
+
+def timed(function, repeat: int) -> tuple[float, float]:
+    durations = []
+    for _ in range(repeat):
+        start = time.perf_counter()
+        function()
+        durations.append(time.perf_counter() - start)
+    return statistics.mean(durations), statistics.pstdev(durations)
+
+
+@click.command()
+@click.option("--num-tasks", default=2000, help="number of tasks of the DAG")
+@click.option("--group-size", default=50, help="number of tasks of each task group")
+@click.option("--repeat", default=5, help="number of times to run test, to reduce variance")
+def main(num_tasks, group_size, repeat):
+    """
+    Measure the time spent validating the serialized DAG against its JSON schema.
+
+    A DAG of chained task groups is serialized, then validated by the generic ``jsonschema`` validator and
+    by the compiled one used by ``DagSerialization``. Serializing it with and without validation shows the
+    share of validation in the serialization time of the DAG processor.
+    """
+    dag = make_dag(num_tasks, group_size)
+    os.environ[SAMPLE_RATE_ENV] = "0"
+    serialized = DagSerialization.to_dict(dag)
+
+    validators = {
+        "jsonschema": jsonschema.Draft7Validator(load_dag_schema_dict()),
+        "compiled": load_dag_schema(),
+    }
+    for name, validator in validators.items():
+        mean, stdev = timed(partial(validator.validate, serialized), repeat)
+        click.echo(f"{name:>10} validation: {mean * 1000:.1f}ms (+- {stdev * 1000:.1f}ms)")
+
+    for sample_rate in ("1.0", "0"):
+        os.environ[SAMPLE_RATE_ENV] = sample_rate
+        mean, stdev = timed(partial(DagSerialization.to_dict, dag), repeat)
+        click.echo(
+            f"serialization, sample rate {sample_rate}: {mean * 1000:.1f}ms (+- {stdev * 1000:.1f}ms)"
+        )
+
+
+if __name__ == "__main__":
+    main()
@@ -22,6 +22,7 @@ import re
 import traceback
 from collections import Counter
 from contextlib import contextmanager
+from functools import cached_property
 from typing import TYPE_CHECKING, NamedTuple
 
 from sqlalchemy import event
@@ -114,16 +115,26 @@ class CountQueries:
         if self.session:
             event.listen(self.session, "do_orm_execute", self.after_cursor_execute)
         else:
-            event.listen(airflow.settings.engine, "after_cursor_execute", self.after_cursor_execute)
+            for engine in self._engines:
+                event.listen(engine, "after_cursor_execute", self.after_cursor_execute)
         return self.result
 
     def __exit__(self, type_, value, tb):
         if self.session:
             event.remove(self.session, "do_orm_execute", self.after_cursor_execute)
         else:
-            event.remove(airflow.settings.engine, "after_cursor_execute", self.after_cursor_execute)
+            for engine in self._engines:
+                event.remove(engine, "after_cursor_execute", self.after_cursor_execute)
         log.debug("Queries count: %d", sum(self.result.values()))
 
+    @cached_property
+    def _engines(self) -> list:
+        """The engines of the sync and async sessions, whose queries are counted together."""
+        engines = [airflow.settings.engine]
+        if async_engine := getattr(airflow.settings, "async_engine", None):
+            engines.append(async_engine.sync_engine)
+        return engines
+
     def after_cursor_execute(self, *args, **kwargs):
         stack = QueriesTraceInfo.from_traceback(traceback.extract_stack())
         if not self.stacklevel_from_module:
@@ -336,6 +336,10 @@ def clear_db_serialized_dags():
 def clear_db_pools():
     with create_session() as session:
         session.execute(delete(Pool))
+        if AIRFLOW_V_3_2_PLUS:
+            from airflow.models.pool import PoolSlotUsage
+
+            session.execute(delete(PoolSlotUsage))
         add_default_pool_if_not_exists(session)
 
 
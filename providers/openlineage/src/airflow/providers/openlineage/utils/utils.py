@@ -1552,8 +1552,11 @@ class OpenLineageRedactor(SecretsMasker):
     @classmethod
     def from_masker(cls, other: SecretsMasker) -> OpenLineageRedactor:
         instance = cls()
-        instance.patterns = other.patterns
-        instance.replacer = other.replacer
+        instance.patterns = set(other.patterns)
+        # Since Airflow 3.2 the replacer is updated in place, so it is copied for the masks added to this
+        # instance not to be added to ``other``; before, it was an immutable compiled pattern.
+        replacer = other.replacer
+        instance.replacer = replacer.copy() if hasattr(replacer, "copy") else replacer
         for attr in ["sensitive_variables_fields", "min_length_to_mask", "secret_mask_adapter"]:
             if hasattr(other, attr):
                 setattr(instance, attr, getattr(other, attr))
@@ -299,6 +299,18 @@ def test_redact_with_exclusions(monkeypatch):
     assert redacted_nested == NestedMixined("***", NestedMixined("passwd", None))
 
 
+@pytest.mark.enable_redact
+def test_redactor_masks_are_not_added_to_original_masker():
+    sm = SecretsMasker()
+    sm.add_mask("first_secret")
+    redactor = OpenLineageRedactor.from_masker(sm)
+
+    redactor.add_mask("second_secret")
+
+    assert redactor.redact("first_secret second_secret") == "*** ***"
+    assert sm.redact("first_secret second_secret") == "*** second_secret"
+
+
 def test_get_fully_qualified_class_name():
     from airflow.providers.openlineage.plugins.adapter import OpenLineageAdapter
 
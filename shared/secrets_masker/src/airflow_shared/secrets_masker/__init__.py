@@ -16,6 +16,7 @@
 # under the License.
 from __future__ import annotations
 
+from .replacers import RegexReplacer, SecretsReplacer, TrieReplacer
 from .secrets_masker import (
     DEFAULT_SENSITIVE_FIELDS,
     Redactable,
@@ -44,4 +45,7 @@ __all__ = [
     "DEFAULT_SENSITIVE_FIELDS",
     "Redactable",
     "Redacted",
+    "SecretsReplacer",
+    "RegexReplacer",
+    "TrieReplacer",
 ]
@@ -0,0 +1,161 @@
+# Licensed to the Apache Software Foundation (ASF) under one
+# or more contributor license agreements.  See the NOTICE file
+# distributed with this work for additional information
+# regarding copyright ownership.  The ASF licenses this file
+# to you under the Apache License, Version 2.0 (the
+# "License"); you may not use this file except in compliance
+# with the License.  You may obtain a copy of the License at
+#
+#   http://www.apache.org/licenses/LICENSE-2.0
+#
+# Unless required by applicable law or agreed to in writing,
+# software distributed under the License is distributed on an
+# "AS IS" BASIS, WITHOUT WARRANTIES OR CONDITIONS OF ANY
+# KIND, either express or implied.  See the License for the
+# specific language governing permissions and limitations
+# under the License.
+"""Engines replacing the occurrences of a set of secrets in strings."""
+
+from __future__ import annotations
+
+import re
+from abc import ABC, abstractmethod
+from collections.abc import Callable
+from re import Match, Pattern
+from typing import Any
+
+# Marks a trie node at which a secret ends. Characters are never empty, so it cannot clash with a child.
+_END = ""
+
+Replacement = str | Callable[[Match[str]], str]
+
+
+class SecretsReplacer(ABC):
+    """
+    Replace the occurrences of a growing set of secrets in strings.
+
+    Secrets can be added at any time; ``sub`` has the same signature as :meth:`re.Pattern.sub` so that the
+    replacer can be used wherever a compiled pattern of the secrets was used before.
+    """
+
+    def __init__(self) -> None:
+        self._secrets: set[str] = set()
+        self._first_chars: set[str] = set()
+        self._compiled: Pattern | None = None
+
+    def __len__(self) -> int:
+        return len(self._secrets)
+
+    def __contains__(self, secret: object) -> bool:
+        return secret in self._secrets
+
+    def add(self, secret: str) -> bool:
+        """Add a secret to replace, returning whether it was not known yet."""
+        if not secret or secret in self._secrets:
+            return False
+        self._secrets.add(secret)
+        self._first_chars.add(secret[0])
+        self._insert(secret)
+        # Compiled again on the next substitution, so adding many secrets in a row compiles only once
+        self._compiled = None
+        return True
+
+    def copy(self) -> SecretsReplacer:
+        """Return a replacer of the same secrets, to which secrets can be added independently of this one."""
+        replacer = type(self)()
+        for secret in self._secrets:
+            replacer.add(secret)
+        # Compiled patterns are immutable, so the copy can use this one until a secret is added to it
+        replacer._compiled = self._compiled
+        return replacer
+
+    def sub(self, repl: Replacement, string: str, count: int = 0) -> str:
+        """Replace the occurrences of the secrets in ``string`` by ``repl``."""
+        # Fast path: no secret can start anywhere in the string
+        if self._first_chars.isdisjoint(string):
+            return string
+        if self._compiled is None:
+            self._compiled = re.compile(self._build_pattern())
+        return self._compiled.sub(repl, string, count)
+
+    @property
+    def pattern(self) -> str:
+        """The regular expression the secrets are currently matched with."""
+        return self._build_pattern()
+
+    def _insert(self, secret: str) -> None:
+        """Update the engine specific structures for a new secret."""
+
+    @abstractmethod
+    def _build_pattern(self) -> str:
+        """Return a regular expression matching any of the secrets."""
+
+
+class RegexReplacer(SecretsReplacer):
+    """
+    Match the secrets with a regular expression alternating between all of them.
+
+    The expression is tried secret by secret at every position of a string, so its cost grows with the
+    number of secrets. Longer secrets are tried first, for a secret containing another to be masked whole.
+    """
+
+    def _build_pattern(self) -> str:
+        return "|".join(re.escape(s) for s in sorted(self._secrets, key=lambda s: (-len(s), s)))
+
+
+class TrieReplacer(SecretsReplacer):
+    """
+    Match the secrets with a regular expression compiled from a trie of them.
+
+    Secrets sharing a prefix share a branch of the trie, and at any position of a string at most one child
+    of a node can match, so the expression scans strings in time independent of the number of secrets. The
+    longest secret starting at a position is the one replaced.
+    """
+
+    def __init__(self) -> None:
+        super().__init__()
+        self._trie: dict[str, Any] = {}
+        # Expressions of the subtries, by node id. Nodes are never removed, so their ids are not reused.
+        self._node_patterns: dict[int, str] = {}
+
+    def _insert(self, secret: str) -> None:
+        node = self._trie
+        self._node_patterns.pop(id(node), None)
+        for char in secret:
+            node = node.setdefault(char, {})
+            self._node_patterns.pop(id(node), None)
+        node[_END] = True
+
+    def _build_pattern(self) -> str:
+        return _trie_to_pattern(self._trie, self._node_patterns)
+
+
+def _trie_to_pattern(node: dict[str, Any], node_patterns: dict[int, str]) -> str:
+    """Return a regular expression matching the secrets of a trie, longest first."""
+    if (pattern := node_patterns.get(id(node))) is not None:
+        return pattern
+    start = node
+    # Runs of single-child nodes are emitted as one literal, so only branching nodes recurse -- secrets can
+    # be thousands of characters long (private keys, certificates), far more than the recursion limit.
+    literal = []
+    while len(node) == 1 and _END not in node:
+        ((char, node),) = node.items()
+        literal.append(char)
+    prefix = re.escape("".join(literal))
+    alternatives = [
+        re.escape(char) + _trie_to_pattern(child, node_patterns) for char, child in node.items() if char
+    ]
+    if not alternatives:
+        pattern = prefix
+    else:
+        # Greedy: the children are tried before stopping at a secret ending here
+        pattern = f"{prefix}(?:{'|'.join(alternatives)}){'?' if _END in node else ''}"
+    node_patterns[id(start)] = pattern
+    return pattern
+
+
+#: The engines ``SecretsMasker.masking_engine`` can be set to.
+REPLACER_CLASSES: dict[str, type[SecretsReplacer]] = {
+    "regex": RegexReplacer,
+    "trie": TrieReplacer,
+}
@@ -35,6 +35,8 @@ from typing import TYPE_CHECKING, Any, Protocol, TextIO, TypeAlias, TypeVar, ove
 # not used in the code. This is because Pydantic uses type at runtime to validate the types of the fields.
 from pydantic import JsonValue  # noqa: TC002
 
+from .replacers import REPLACER_CLASSES, SecretsReplacer
+
 if TYPE_CHECKING:
     from typing import TypeGuard
 
@@ -181,10 +183,15 @@ def _get_v1_env_var_type_cached() -> type:
         return type("V1EnvVar", (), {})
 
 
+def _unescape(pattern: str) -> str:
+    """Return the string that ``re.escape`` turned into ``pattern``."""
+    return re.sub(r"\\(.)", r"\1", pattern, flags=re.DOTALL)
+
+
 class SecretsMasker(logging.Filter):
     """Redact secrets from logs."""
 
-    replacer: Pattern | None = None
+    replacer: SecretsReplacer | Pattern | None = None
     patterns: set[str]
 
     ALREADY_FILTERED_FLAG = "__SecretsMasker_filtered"
@@ -194,6 +201,7 @@ class SecretsMasker(logging.Filter):
 
     min_length_to_mask = 5
     secret_mask_adapter = None
+    masking_engine = "trie"
 
     def __init__(self):
         super().__init__()
@@ -582,7 +590,7 @@ class SecretsMasker(logging.Filter):
                     SecretsMasker._has_warned_short_secret = True
                 return
 
-            new_mask = False
+            new_secrets = []
             for s in self._adaptations(secret):
                 if s:
                     if len(s) < min_length:
@@ -594,14 +602,27 @@ class SecretsMasker(logging.Filter):
                     pattern = re.escape(s)
                     if pattern not in self.patterns and (not name or self.should_hide_value_for_key(name)):
                         self.patterns.add(pattern)
-                        new_mask = True
-            if new_mask:
-                self.replacer = re.compile("|".join(self.patterns))
+                        new_secrets.append(s)
+            if new_secrets:
+                self._add_to_replacer(new_secrets)
 
         elif isinstance(secret, collections.abc.Iterable):
             for v in secret:
                 self.add_mask(v, name)
 
+    def _add_to_replacer(self, secrets: list[str]) -> None:
+        replacer_class = REPLACER_CLASSES[self.masking_engine]
+        if isinstance(self.replacer, replacer_class):
+            for secret in secrets:
+                self.replacer.add(secret)
+            return
+        # The replacer was copied from another masker, or built before the engine was configured: build one
+        # from all the patterns so far, the new ones included.
+        replacer = replacer_class()
+        for pattern in self.patterns:
+            replacer.add(_unescape(pattern))
+        self.replacer = replacer
+
     def reset_masker(self):
         """Reset the patterns and the replacer in the masker instance."""
         self.patterns = set()
@@ -21,6 +21,8 @@ import inspect
 import logging
 import logging.config
 import os
+import random
+import re
 import sys
 import textwrap
 from enum import Enum
@@ -29,6 +31,7 @@ from unittest.mock import patch
 
 import pytest
 
+from airflow_shared.secrets_masker.replacers import REPLACER_CLASSES, RegexReplacer, TrieReplacer
 from airflow_shared.secrets_masker.secrets_masker import (
     DEFAULT_SENSITIVE_FIELDS,
     RedactedIO,
@@ -1111,6 +1114,87 @@ class TestEdgeCases:
         assert " and " in redacted
 
 
+class TestSecretsReplacers:
+    @pytest.mark.parametrize("replacer_class", [RegexReplacer, TrieReplacer])
+    def test_sub(self, replacer_class):
+        replacer = replacer_class()
+        for secret in ["abcde", "abcdef", "abxyz", "a.b*c", "x" * 5000]:
+            assert replacer.add(secret)
+        assert not replacer.add("abcde")
+        assert len(replacer) == 5
+
+        # The longest secret starting at a position is masked
+        assert replacer.sub("***", "abcdefg abcd abxyz a.b*c a.bbc") == "***g abcd *** *** a.bbc"
+        assert replacer.sub("***", "x" * 5001) == "***x"
+
+    @pytest.mark.parametrize("replacer_class", [RegexReplacer, TrieReplacer])
+    def test_sub_skips_strings_without_candidate(self, replacer_class):
+        replacer = replacer_class()
+        assert replacer.sub("***", "anything") == "anything"
+
+        replacer.add("secret")
+        with patch("re.compile") as mock_compile:
+            assert replacer.sub("***", "nothing to find") == "nothing to find"
+        mock_compile.assert_not_called()
+
+    @pytest.mark.parametrize("replacer_class", [RegexReplacer, TrieReplacer])
+    def test_copy(self, replacer_class):
+        replacer = replacer_class()
+        replacer.add("first_secret")
+        replacer.sub("***", "first_secret")
+
+        copied = replacer.copy()
+        copied.add("second_secret")
+        replacer.add("third_secret")
+
+        assert type(copied) is replacer_class
+        assert copied.sub("***", "first_secret second_secret third_secret") == "*** *** third_secret"
+        assert replacer.sub("***", "first_secret second_secret third_secret") == "*** second_secret ***"
+
+    def test_compiles_once_after_adding(self):
+        replacer = TrieReplacer()
+        for i in range(100):
+            replacer.add(f"secret{i:03}")
+        with patch("re.compile", wraps=re.compile) as mock_compile:
+            replacer.sub("***", "a secret042 b")
+            replacer.sub("***", "a secret043 b")
+        assert mock_compile.call_count == 1
+
+    def test_trie_matches_like_regex(self):
+        rng = random.Random(42)
+        for _ in range(200):
+            trie, regex = TrieReplacer(), RegexReplacer()
+            for _ in range(10):
+                secret = "".join(rng.choices("ab.*\n", k=rng.randint(1, 6)))
+                trie.add(secret)
+                regex.add(secret)
+            text = "".join(rng.choices("ab.*\nc", k=50))
+            assert trie.sub("***", text) == regex.sub("***", text)
+
+    @pytest.mark.parametrize("masking_engine", ["regex", "trie"])
+    def test_masking_engine(self, masking_engine):
+        secrets_masker = SecretsMasker()
+        configure_secrets_masker_for_test(secrets_masker)
+        secrets_masker.masking_engine = masking_engine
+
+        secrets_masker.add_mask("first_secret")
+        secrets_masker.add_mask("second_secret")
+
+        assert type(secrets_masker.replacer) is REPLACER_CLASSES[masking_engine]
+        assert secrets_masker.redact("first_secret second_secret") == "*** ***"
+
+    def test_replacer_rebuilt_from_patterns(self):
+        secrets_masker = SecretsMasker()
+        configure_secrets_masker_for_test(secrets_masker)
+        secrets_masker.patterns = {re.escape("copied.secret")}
+        secrets_masker.replacer = re.compile(re.escape("copied.secret"))
+
+        secrets_masker.add_mask("new*secret")
+
+        assert isinstance(secrets_masker.replacer, TrieReplacer)
+        assert secrets_masker.redact("copied.secret new*secret copiedXsecret") == "*** *** copiedXsecret"
+
+
 class TestDirectMethodCalls:
     def test_redact_all_directly(self):
         secrets_masker = SecretsMasker()
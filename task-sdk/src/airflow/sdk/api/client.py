@@ -17,9 +17,12 @@
 
 from __future__ import annotations
 
+import importlib.util
 import logging
+import os
 import ssl
 import sys
+import threading
 import uuid
 from functools import cache
 from http import HTTPStatus
@@ -59,6 +62,8 @@ from airflow.sdk.api.datamodels._generated import (
     TerminalStateNonSuccess,
     TIDeferredStatePayload,
     TIEnterRunningPayload,
+    TIFinalizePayload,
+    TIFinalXCom,
     TIHeartbeatInfo,
     TIRescheduleStatePayload,
     TIRetryStatePayload,
@@ -257,6 +262,19 @@ class TaskInstanceOperations:
         # Create a reschedule state payload from msg
         self.client.patch(f"task-instances/{id}/state", content=body.model_dump_json())
 
+    def finalize(
+        self,
+        id: uuid.UUID,
+        state_update: TISuccessStatePayload | TIRetryStatePayload | TITerminalStatePayload,
+        rendered_fields: dict[str, Any] | None = None,
+        xcoms: list[TIFinalXCom] | None = None,
+    ) -> None:
+        """Tell the API server the final state of this TI, with the XComs and RTIF not sent yet."""
+        body = TIFinalizePayload(
+            state_update=state_update, rendered_fields=rendered_fields, xcoms=xcoms or []
+        )
+        self.client.patch(f"task-instances/{id}/finalize", content=body.model_dump_json())
+
     def heartbeat(self, id: uuid.UUID, pid: int):
         body = TIHeartbeatInfo(pid=pid, hostname=get_hostname())
         self.client.put(f"task-instances/{id}/heartbeat", content=body.model_dump_json())
@@ -885,6 +903,67 @@ API_CLIENT_SSL_CERT = conf.get("api", "client_ssl_cert", fallback=None)
 API_CLIENT_SSL_KEY = conf.get("api", "client_ssl_key", fallback=None)
 
 
+class _SharedTransport(httpx.HTTPTransport):
+    """
+    Transport whose pool of connections is shared by the clients of all the tasks of a worker process.
+
+    Clients close their transport when they are closed, but the pool outlives them: closing it is a no-op.
+    """
+
+    def close(self) -> None:
+        pass
+
+
+_shared_transport: _SharedTransport | None = None
+_shared_transport_lock = threading.Lock()
+
+
+def get_shared_transport() -> httpx.BaseTransport:
+    """
+    Get the transport to the Execution API server shared by the tasks supervised by this process.
+
+    Its connections are kept alive between requests and between tasks, and multiplexed over HTTP/2 if
+    ``[workers] execution_api_http2`` is enabled and the ``h2`` package installed.
+    """
+    global _shared_transport
+
+    with _shared_transport_lock:
+        if _shared_transport is None:
+            http2 = conf.getboolean("workers", "execution_api_http2", fallback=False)
+            if http2 and importlib.util.find_spec("h2") is None:
+                log.warning("HTTP/2 needs the h2 package, install httpx[http2]; using HTTP/1.1 instead")
+                http2 = False
+            cert = None
+            if API_CLIENT_SSL_CERT or API_CLIENT_SSL_KEY:
+                if not (API_CLIENT_SSL_CERT and API_CLIENT_SSL_KEY):
+                    raise ValueError("Both client_ssl_cert and client_ssl_key must be set.")
+                cert = (API_CLIENT_SSL_CERT, API_CLIENT_SSL_KEY)
+            _shared_transport = _SharedTransport(
+                verify=Client._get_ssl_context_cached(certifi.where(), API_SSL_CERT_PATH),
+                cert=cert,
+                http2=http2,
+                limits=httpx.Limits(
+                    max_connections=conf.getint("workers", "execution_api_max_connections", fallback=100),
+                    max_keepalive_connections=conf.getint(
+                        "workers", "execution_api_max_keepalive_connections", fallback=20
+                    ),
+                ),
+            )
+        return _shared_transport
+
+
+def _forget_shared_transport() -> None:
+    # The connections of the parent process must not be used by a forked process, but neither closed
+    global _shared_transport, _shared_transport_lock
+
+    _shared_transport = None
+    _shared_transport_lock = threading.Lock()
+
+
+if hasattr(os, "register_at_fork"):
+    os.register_at_fork(after_in_child=_forget_shared_transport)
+
+
 def _should_retry_api_request(exception: BaseException) -> bool:
     """Determine if an API request should be retried based on the exception type."""
     if isinstance(exception, httpx.HTTPStatusError):
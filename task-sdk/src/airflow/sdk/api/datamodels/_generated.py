@@ -223,6 +223,19 @@ class TIEnterRunningPayload(BaseModel):
     start_date: Annotated[AwareDatetime, Field(title="Start Date")]
 
 
+class TIFinalXCom(BaseModel):
+    """
+    Schema for an XCom pushed by a TaskInstance, sent along with its final state.
+    """
+
+    model_config = ConfigDict(
+        extra="forbid",
+    )
+    key: Annotated[str, Field(min_length=1, title="Key")]
+    value: JsonValue
+    mapped_length: Annotated[int | None, Field(title="Mapped Length")] = None
+
+
 class TIHeartbeatInfo(BaseModel):
     """
     Schema for TaskInstance heartbeat endpoint.
@@ -564,6 +577,29 @@ class TITerminalStatePayload(BaseModel):
     rendered_map_index: Annotated[str | None, Field(title="Rendered Map Index")] = None
 
 
+class TIFinalizePayload(BaseModel):
+    """
+    Schema for recording the final state of a TaskInstance with the results it pushed last.
+
+    The XComs, rendered fields and state are all stored in one transaction.
+    """
+
+    model_config = ConfigDict(
+        extra="forbid",
+    )
+    state_update: Annotated[
+        TITerminalStatePayload
+        | TISuccessStatePayload
+        | TITargetStatePayload
+        | TIDeferredStatePayload
+        | TIRescheduleStatePayload
+        | TIRetryStatePayload,
+        Field(title="State Update"),
+    ]
+    rendered_fields: Annotated[dict[str, JsonValue] | None, Field(title="Rendered Fields")] = None
+    xcoms: Annotated[list[TIFinalXCom] | None, Field(title="Xcoms")] = None
+
+
 class AssetEventDagRunReference(BaseModel):
     """
     Schema for AssetEvent model used in DagRun.
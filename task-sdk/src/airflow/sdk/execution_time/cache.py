@@ -17,31 +17,162 @@
 # under the License.
 from __future__ import annotations
 
+import atexit
 import datetime
-import multiprocessing
+import hashlib
+import logging
+import os
+import sqlite3
+import stat
+import tempfile
+import threading
+import time
 
-from airflow.sdk import timezone
+from airflow.sdk._shared.observability.metrics.stats import Stats
 from airflow.sdk.configuration import conf
 
+log = logging.getLogger(__name__)
+
+
+def _shared_memory_dir() -> str:
+    """Return a directory backed by memory if the host has one, the temporary directory otherwise."""
+    if os.path.isdir("/dev/shm") and os.access("/dev/shm", os.W_OK):
+        return "/dev/shm"
+    return tempfile.gettempdir()
+
+
+def _check_private(st: os.stat_result, path: str) -> None:
+    if st.st_uid != os.getuid() or st.st_mode & 0o077:
+        raise PermissionError(f"{path} must be owned by the current user and only accessible by them")
+
+
+def _private_shared_memory_dir() -> str:
+    """
+    Return a directory only accessible by the current user, in the shared memory directory.
+
+    The stores and the journal files SQLite creates next to them have predictable names, so they are kept
+    out of the world-writable shared memory directory, where other users could plant files or symlinks.
+    """
+    directory = os.path.join(_shared_memory_dir(), f"airflow-{os.getuid()}")
+    try:
+        os.mkdir(directory, 0o700)
+    except FileExistsError:
+        pass
+    st = os.lstat(directory)
+    if not stat.S_ISDIR(st.st_mode):
+        raise PermissionError(f"{directory} must be a directory")
+    _check_private(st, directory)
+    return directory
+
+
+class SharedSecretStore:
+    """
+    Key-value store shared by the processes of a host, without a server process.
+
+    Entries are kept in a SQLite database in shared memory (``/dev/shm`` where available), which each
+    process opens and reads through ``mmap``. Values are encrypted with the Fernet key, if one is configured,
+    and the database is in a directory only accessible by its owner. Values which cannot be decrypted, after
+    a rotation of the Fernet key, are treated as absent.
+
+    :param path: the database file
+    """
+
+    def __init__(self, path: str):
+        self.path = path
+        self._conn: sqlite3.Connection | None = None
+        self._pid: int | None = None
+        self._lock = threading.Lock()
+
+    @classmethod
+    def create(cls, name: str | None = None) -> SharedSecretStore:
+        """Return a store in the shared memory directory, in a new file unless ``name`` is given."""
+        directory = _private_shared_memory_dir()
+        if name is None:
+            fd, path = tempfile.mkstemp(prefix="airflow-secrets-", suffix=".db", dir=directory)
+        else:
+            path = os.path.join(directory, name)
+            fd = os.open(path, os.O_RDWR | os.O_CREAT | os.O_NOFOLLOW, 0o600)
+        try:
+            _check_private(os.fstat(fd), path)
+        finally:
+            os.close(fd)
+        return cls(path)
+
+    def _connect(self) -> sqlite3.Connection:
+        # A connection must not be used across a fork, so each process opens its own
+        if self._conn is None or self._pid != os.getpid():
+            conn = sqlite3.connect(self.path, timeout=5, isolation_level=None, check_same_thread=False)
+            conn.execute("PRAGMA journal_mode=WAL")
+            conn.execute("PRAGMA synchronous=OFF")
+            conn.execute("PRAGMA mmap_size=67108864")
+            conn.execute(
+                "CREATE TABLE IF NOT EXISTS secret (key TEXT PRIMARY KEY, value BLOB, saved_at REAL NOT NULL)"
+            )
+            self._conn, self._pid = conn, os.getpid()
+        return self._conn
+
+    def get(self, key: str) -> tuple[str | None, float] | None:
+        """Return the value saved for ``key`` and the (epoch) time it was saved at, or None if absent."""
+        with self._lock:
+            row = self._connect().execute("SELECT value, saved_at FROM secret WHERE key = ?", (key,)).fetchone()
+        if row is None:
+            return None
+        value, saved_at = row
+        if value is not None:
+            from cryptography.fernet import InvalidToken
+
+            from airflow.sdk.crypto import get_fernet
+
+            try:
+                value = get_fernet().decrypt(value).decode("utf-8")
+            except InvalidToken:
+                return None
+        return value, saved_at
+
+    def set(self, key: str, value: str | None) -> None:
+        if value is not None:
+            from airflow.sdk.crypto import get_fernet
+
+            value = get_fernet().encrypt(value.encode("utf-8"))
+        with self._lock:
+            self._connect().execute(
+                "INSERT OR REPLACE INTO secret (key, value, saved_at) VALUES (?, ?, ?)", (key, value, time.time())
+            )
+
+    def delete(self, key: str) -> None:
+        with self._lock:
+            self._connect().execute("DELETE FROM secret WHERE key = ?", (key,))
+
+    def delete_matching(self, prefix: str, suffix: str) -> None:
+        """Delete the keys starting with ``prefix`` and ending with ``suffix``."""
+        with self._lock:
+            self._connect().execute(
+                "DELETE FROM secret WHERE substr(key, 1, ?) = ? AND substr(key, -?) = ?",
+                (len(prefix), prefix, len(suffix), suffix),
+            )
+
+    def remove(self) -> None:
+        """Close the store and delete its files."""
+        with self._lock:
+            if self._conn is not None and self._pid == os.getpid():
+                self._conn.close()
+            self._conn = None
+            for suffix in ("", "-wal", "-shm"):
+                try:
+                    os.remove(self.path + suffix)
+                except FileNotFoundError:
+                    pass
+
 
 class SecretCache:
     """A static class to manage the global secret cache."""
 
-    __manager: multiprocessing.managers.SyncManager | None = None
-    _cache: dict[str, _CacheValue] | None = None
+    _cache: SharedSecretStore | None = None
     _ttl: datetime.timedelta
 
     class NotPresentException(Exception):
         """Raised when a key is not present in the cache."""
 
-    class _CacheValue:
-        def __init__(self, value: str | None) -> None:
-            self.value = value
-            self.date = timezone.utcnow()
-
-        def is_expired(self, ttl: datetime.timedelta) -> bool:
-            return timezone.utcnow() - self.date > ttl
-
     _VARIABLE_PREFIX = "__v_"
     _CONNECTION_PREFIX = "__c_"
     _TEAM_PATTERN = "_{}_"
@@ -51,24 +182,26 @@ class SecretCache:
         """
         Initialize the cache, provided the configuration allows it.
 
-        Safe to call several times.
+        Safe to call several times. The processes forked afterwards share the cache.
         """
         if cls._cache is not None:
             return
         use_cache = conf.getboolean(section="secrets", key="use_cache", fallback=False)
         if not use_cache:
             return
-        if cls.__manager is None:
-            # it is not really necessary to save the manager, but doing so allows to reuse it between tests,
-            # making them run a lot faster because this operation takes ~300ms each time
-            cls.__manager = multiprocessing.Manager()
-        cls._cache = cls.__manager.dict()
+        store = SharedSecretStore.create()
+        creator_pid = os.getpid()
+        # Only the process that created the store removes it; its forks just close their connection
+        atexit.register(lambda: store.remove() if os.getpid() == creator_pid else None)
+        cls._cache = store
         ttl_seconds = conf.getint(section="secrets", key="cache_ttl_seconds", fallback=15 * 60)
         cls._ttl = datetime.timedelta(seconds=ttl_seconds)
 
     @classmethod
     def reset(cls):
         """Use for test purposes only."""
+        if cls._cache is not None:
+            cls._cache.remove()
         cls._cache = None
 
     @classmethod
@@ -108,9 +241,14 @@ class SecretCache:
 
         team = cls._TEAM_PATTERN.format(team_name) if team_name else ""
 
-        val = cls._cache.get(f"{prefix}{team}{key}")
-        if val and not val.is_expired(cls._ttl):
-            return val.value
+        kind = "variable" if prefix == cls._VARIABLE_PREFIX else "connection"
+        entry = cls._cache.get(f"{prefix}{team}{key}")
+        if entry is not None:
+            value, saved_at = entry
+            if time.time() - saved_at <= cls._ttl.total_seconds():
+                Stats.incr("secrets_cache.hits", tags={"kind": kind})
+                return value
+        Stats.incr("secrets_cache.misses", tags={"kind": kind})
         raise cls.NotPresentException
 
     @classmethod
@@ -130,12 +268,77 @@ class SecretCache:
     def _save(cls, key: str, value: str | None, prefix: str, team_name: str | None = None):
         if cls._cache is not None:
             team = cls._TEAM_PATTERN.format(team_name) if team_name else ""
-            cls._cache[f"{prefix}{team}{key}"] = cls._CacheValue(value)
+            cls._cache.set(f"{prefix}{team}{key}", value)
 
     @classmethod
     def invalidate_variable(cls, key: str, team_name: str | None = None):
         """Invalidate (actually removes) the value stored in the cache for that Variable."""
         if cls._cache is not None:
             team = cls._TEAM_PATTERN.format(team_name) if team_name else ""
-            # second arg ensures no exception if key is absent
-            cls._cache.pop(f"{cls._VARIABLE_PREFIX}{team}{key}", None)
+            cls._cache.delete(f"{cls._VARIABLE_PREFIX}{team}{key}")
+
+
+class SupervisorSecretCache:
+    """
+    Cache of the connections and variables that task supervisors fetch from the Execution API.
+
+    It is shared by all the supervisors of a host talking to the same API server. Entries expire after
+    ``[secrets] cache_ttl_seconds``, and lookups of missing connections and variables are remembered for
+    ``[secrets] negative_cache_ttl_seconds``. Variables set or deleted through a supervisor are evicted.
+
+    Entries are scoped, so that tasks only share what the API server would return to all of them.
+
+    :param store: where the entries are kept
+    :param ttl: seconds an entry stays valid
+    :param negative_ttl: seconds the absence of a connection or variable is remembered
+    """
+
+    def __init__(self, store: SharedSecretStore, ttl: float, negative_ttl: float):
+        self.store = store
+        self.ttl = ttl
+        self.negative_ttl = negative_ttl
+
+    @classmethod
+    def from_config(cls, server: str) -> SupervisorSecretCache | None:
+        """Return the cache of the supervisors of this host talking to ``server``, if it is enabled."""
+        if not conf.getboolean("secrets", "use_supervisor_cache", fallback=False):
+            return None
+        from airflow.sdk.crypto import get_fernet
+
+        if not get_fernet().is_encrypted:
+            log.warning(
+                "[secrets] use_supervisor_cache is ignored, as no [core] fernet_key is configured to "
+                "encrypt the cached connections and variables."
+            )
+            return None
+        server_hash = hashlib.sha256(server.encode("utf-8")).hexdigest()[:16]
+        store = SharedSecretStore.create(name=f"airflow-supervisor-secrets-{os.getuid()}-{server_hash}.db")
+        return cls(
+            store,
+            ttl=conf.getint("secrets", "cache_ttl_seconds", fallback=15 * 60),
+            negative_ttl=conf.getint("secrets", "negative_cache_ttl_seconds", fallback=60),
+        )
+
+    def get(self, kind: str, scope: str, key: str) -> tuple[bool, str | None]:
+        """
+        Look up an entry.
+
+        :return: whether a valid entry was found, and its value, None meaning that the connection or
+            variable does not exist
+        """
+        entry = self.store.get(f"{kind}:{scope}:{key}")
+        if entry is not None:
+            value, saved_at = entry
+            if time.time() - saved_at <= (self.ttl if value is not None else self.negative_ttl):
+                Stats.incr("secrets_cache.hits", tags={"kind": kind})
+                return True, value
+        Stats.incr("secrets_cache.misses", tags={"kind": kind})
+        return False, None
+
+    def save(self, kind: str, scope: str, key: str, value: str | None) -> None:
+        """Save an entry; a None value records that the connection or variable does not exist."""
+        self.store.set(f"{kind}:{scope}:{key}", value)
+
+    def invalidate(self, kind: str, key: str) -> None:
+        """Evict an entry from all the scopes."""
+        self.store.delete_matching(f"{kind}:", f":{key}")
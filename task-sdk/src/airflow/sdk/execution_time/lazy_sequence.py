@@ -39,26 +39,48 @@ _XComWrapper = collections.namedtuple("_XComWrapper", "value")
 log = structlog.get_logger(logger_name=__name__)
 
 
+# Iterators fetch values in windows, starting small so short loops (or a ``break``
+# after a few items) stay cheap, and doubling up to the maximum on each fetch.
+_ITER_MIN_PAGE_SIZE = 16
+_ITER_MAX_PAGE_SIZE = 1024
+
+
 @attrs.define
 class LazyXComIterator(Iterator[T]):
     seq: LazyXComSequence[T]
     index: int = 0
     dir: Literal[1, -1] = 1
+    _buffer: collections.deque[T] = attrs.field(init=False, factory=collections.deque)
+    _page_size: int = attrs.field(init=False, default=_ITER_MIN_PAGE_SIZE)
+    _exhausted: bool = attrs.field(init=False, default=False)
 
     def __next__(self) -> T:
-        if self.index < 0:
-            # When iterating backwards, avoid extra HTTP request
+        if not self._buffer:
+            self._fetch_window()
+        if not self._buffer:
             raise StopIteration()
-        try:
-            val = self.seq[self.index]
-        except IndexError:
-            raise StopIteration from None
         self.index += self.dir
-        return val
+        return self._buffer.popleft()
 
     def __iter__(self) -> Iterator[T]:
         return self
 
+    def _fetch_window(self) -> None:
+        """Read ahead the next window of values with a single slice request."""
+        if self._exhausted or self.index < 0:
+            # When iterating backwards, avoid extra HTTP request
+            return
+        if self.dir == 1:
+            window = slice(self.index, self.index + self._page_size)
+        else:
+            stop = self.index - self._page_size
+            window = slice(self.index, stop if stop >= 0 else None, -1)
+        values = self.seq[window]
+        if len(values) < self._page_size:
+            self._exhausted = True
+        self._buffer.extend(values)
+        self._page_size = min(self._page_size * 2, _ITER_MAX_PAGE_SIZE)
+
 
 @attrs.define
 class LazyXComSequence(Sequence[T]):
@@ -36,7 +36,7 @@ from contextlib import contextmanager, suppress
 from datetime import datetime, timezone
 from http import HTTPStatus
 from socket import socket, socketpair
-from typing import TYPE_CHECKING, BinaryIO, ClassVar, NoReturn, TextIO, cast
+from typing import TYPE_CHECKING, Any, BinaryIO, ClassVar, NoReturn, TextIO, cast
 from urllib.parse import urlparse
 from uuid import UUID
 
@@ -48,19 +48,25 @@ import structlog
 from pydantic import BaseModel, TypeAdapter
 
 from airflow.sdk._shared.logging.structlog import reconfigure_logger
-from airflow.sdk.api.client import Client, ServerResponseError
+from airflow.sdk.api.client import Client, ServerResponseError, get_shared_transport
 from airflow.sdk.api.datamodels._generated import (
     AssetResponse,
     ConnectionResponse,
     TaskInstance,
     TaskInstanceState,
     TaskStatesResponse,
+    TerminalStateNonSuccess,
+    TIFinalXCom,
+    TIRetryStatePayload,
+    TISuccessStatePayload,
+    TITerminalStatePayload,
     VariableResponse,
     XComSequenceIndexResponse,
 )
 from airflow.sdk.configuration import conf
 from airflow.sdk.exceptions import ErrorType
 from airflow.sdk.execution_time import comms
+from airflow.sdk.execution_time.cache import SupervisorSecretCache
 from airflow.sdk.execution_time.comms import (
     AssetEventsResult,
     AssetResult,
@@ -983,6 +989,21 @@ class ActivitySubprocess(WatchedSubprocess):
     _task_end_time_monotonic: float | None = attrs.field(default=None, init=False)
     _rendered_map_index: str | None = attrs.field(default=None, init=False)
 
+    _secret_cache: SupervisorSecretCache | None = attrs.field(default=None, init=False)
+    # Connections and variables are only shared with tasks of the same bundle, which have the same team
+    _secret_cache_scope: str = attrs.field(default="", init=False)
+
+    _batch_final_state: bool = attrs.field(
+        factory=lambda: conf.getboolean("workers", "execution_api_batch_final_state", fallback=False),
+        init=False,
+    )
+    """Whether the final state of the task is sent in one request with the last XComs and rendered fields."""
+    _pending_xcoms: list[SetXCom] = attrs.field(factory=list, init=False)
+    _pending_rendered_fields: dict[str, Any] | None = attrs.field(default=None, init=False)
+    _pending_state_update: TISuccessStatePayload | TIRetryStatePayload | None = attrs.field(
+        default=None, init=False
+    )
+
     decoder: ClassVar[TypeAdapter[ToSupervisor]] = TypeAdapter(ToSupervisor)
 
     ti: RuntimeTI | None = None
@@ -1021,6 +1042,8 @@ class ActivitySubprocess(WatchedSubprocess):
     ) -> None:
         """Send startup message to the subprocess."""
         self.ti = ti  # type: ignore[assignment]
+        self._secret_cache = SupervisorSecretCache.from_config(str(self.client.base_url))
+        self._secret_cache_scope = bundle_info.name
         start_date = datetime.now(tz=timezone.utc)
         try:
             # We've forked, but the task won't start doing anything until we send it the StartupDetails
@@ -1078,7 +1101,9 @@ class ActivitySubprocess(WatchedSubprocess):
         # update the state of the TaskInstance to reflect the final state of the process.
         # For states like `deferred`, `up_for_reschedule`, the process will exit with 0, but the state will be updated
         # by the subprocess in the `handle_requests` method.
-        if self.final_state not in STATES_SENT_DIRECTLY:
+        if self._batch_final_state:
+            self._send_final_state()
+        elif self.final_state not in STATES_SENT_DIRECTLY:
             self.client.task_instances.finish(
                 id=self.id,
                 state=self.final_state,
@@ -1086,6 +1111,68 @@ class ActivitySubprocess(WatchedSubprocess):
                 rendered_map_index=self._rendered_map_index,
             )
 
+    def _send_final_state(self):
+        """Send the final state of the TI with the XComs and rendered fields held back, in one request."""
+        state_update: TISuccessStatePayload | TIRetryStatePayload | TITerminalStatePayload | None
+        if self.final_state not in STATES_SENT_DIRECTLY:
+            state_update = TITerminalStatePayload(
+                state=TerminalStateNonSuccess(self.final_state),
+                end_date=datetime.now(tz=timezone.utc),
+                rendered_map_index=self._rendered_map_index,
+            )
+        else:
+            state_update = self._pending_state_update
+        if state_update is None:
+            self._flush_pending_xcoms()
+            if self._pending_rendered_fields is not None:
+                self.client.task_instances.set_rtif(self.id, self._pending_rendered_fields)
+            return
+        self.client.task_instances.finalize(
+            self.id,
+            state_update,
+            rendered_fields=self._pending_rendered_fields,
+            xcoms=[
+                TIFinalXCom(key=xcom.key, value=xcom.value, mapped_length=xcom.mapped_length)
+                for xcom in self._pending_xcoms
+            ],
+        )
+        self._pending_xcoms = []
+        self._pending_rendered_fields = None
+        self._pending_state_update = None
+
+    def _hold_for_final_state(self, msg: ToSupervisor) -> bool:
+        """
+        Hold back a message to send it with the final state of the TI, returning whether it was.
+
+        The XComs the task pushes for itself are held until any other request, which could read them; the
+        rendered fields are only held once the task has ended, before that the UI should show them.
+        """
+        if isinstance(msg, SetXCom) and self.ti is not None:
+            # No map index is the same as -1 for the API server
+            map_index = -1 if msg.map_index is None else msg.map_index
+            if (msg.dag_id, msg.run_id, msg.task_id, map_index) == (
+                self.ti.dag_id,
+                self.ti.run_id,
+                self.ti.task_id,
+                self.ti.map_index,
+            ):
+                self._pending_xcoms.append(msg)
+                return True
+        elif isinstance(msg, SetRenderedFields) and self._terminal_state is not None:
+            self._pending_rendered_fields = msg.rendered_fields
+            return True
+        elif isinstance(msg, (SucceedTask, RetryTask, TaskState)):
+            return False
+        self._flush_pending_xcoms()
+        return False
+
+    def _flush_pending_xcoms(self):
+        for msg in self._pending_xcoms:
+            self.client.xcoms.set(
+                msg.dag_id, msg.run_id, msg.task_id, msg.key, msg.value, msg.map_index, msg.mapped_length
+            )
+        self._pending_xcoms = []
+
     def _upload_logs(self):
         """
         Upload all log files found to the remote storage.
@@ -1245,11 +1332,44 @@ class ActivitySubprocess(WatchedSubprocess):
 
         return TaskInstanceState.FAILED
 
+    def _get_connection(self, conn_id: str) -> ConnectionResponse | ErrorResponse:
+        if not (cache := self._secret_cache):
+            return self.client.connections.get(conn_id)
+        found, cached = cache.get("connection", self._secret_cache_scope, conn_id)
+        if found:
+            if cached is None:
+                return ErrorResponse(error=ErrorType.CONNECTION_NOT_FOUND, detail={"conn_id": conn_id})
+            return ConnectionResponse.model_validate_json(cached)
+        conn = self.client.connections.get(conn_id)
+        if isinstance(conn, ConnectionResponse):
+            cache.save("connection", self._secret_cache_scope, conn_id, conn.model_dump_json())
+        elif conn.error == ErrorType.CONNECTION_NOT_FOUND:
+            cache.save("connection", self._secret_cache_scope, conn_id, None)
+        return conn
+
+    def _get_variable(self, key: str) -> VariableResponse | ErrorResponse:
+        if not (cache := self._secret_cache):
+            return self.client.variables.get(key)
+        found, cached = cache.get("variable", self._secret_cache_scope, key)
+        if found:
+            if cached is None:
+                return ErrorResponse(error=ErrorType.VARIABLE_NOT_FOUND, detail={"key": key})
+            return VariableResponse.model_validate_json(cached)
+        var = self.client.variables.get(key)
+        if isinstance(var, VariableResponse):
+            cache.save("variable", self._secret_cache_scope, key, var.model_dump_json())
+        elif var.error == ErrorType.VARIABLE_NOT_FOUND:
+            cache.save("variable", self._secret_cache_scope, key, None)
+        return var
+
     def _handle_request(self, msg: ToSupervisor, log: FilteringBoundLogger, req_id: int):
         if isinstance(msg, MaskSecret):
             log.debug("Received message from task runner (body omitted)", msg=type(msg))
         else:
             log.debug("Received message from task runner", msg=msg)
+        if self._batch_final_state and self._hold_for_final_state(msg):
+            self.send_msg(None, request_id=req_id, error=None)
+            return
         resp: BaseModel | None = None
         dump_opts = {}
         if isinstance(msg, TaskState):
@@ -1260,24 +1380,37 @@ class ActivitySubprocess(WatchedSubprocess):
             self._terminal_state = msg.state
             self._task_end_time_monotonic = time.monotonic()
             self._rendered_map_index = msg.rendered_map_index
-            self.client.task_instances.succeed(
-                id=self.id,
-                when=msg.end_date,
-                task_outlets=msg.task_outlets,
-                outlet_events=msg.outlet_events,
-                rendered_map_index=self._rendered_map_index,
-            )
+            if self._batch_final_state:
+                self._pending_state_update = TISuccessStatePayload(
+                    end_date=msg.end_date,
+                    task_outlets=msg.task_outlets,
+                    outlet_events=msg.outlet_events,
+                    rendered_map_index=self._rendered_map_index,
+                )
+            else:
+                self.client.task_instances.succeed(
+                    id=self.id,
+                    when=msg.end_date,
+                    task_outlets=msg.task_outlets,
+                    outlet_events=msg.outlet_events,
+                    rendered_map_index=self._rendered_map_index,
+                )
         elif isinstance(msg, RetryTask):
             self._terminal_state = msg.state
             self._task_end_time_monotonic = time.monotonic()
             self._rendered_map_index = msg.rendered_map_index
-            self.client.task_instances.retry(
-                id=self.id,
-                end_date=msg.end_date,
-                rendered_map_index=self._rendered_map_index,
-            )
+            if self._batch_final_state:
+                self._pending_state_update = TIRetryStatePayload(
+                    end_date=msg.end_date, rendered_map_index=self._rendered_map_index
+                )
+            else:
+                self.client.task_instances.retry(
+                    id=self.id,
+                    end_date=msg.end_date,
+                    rendered_map_index=self._rendered_map_index,
+                )
         elif isinstance(msg, GetConnection):
-            conn = self.client.connections.get(msg.conn_id)
+            conn = self._get_connection(msg.conn_id)
             if isinstance(conn, ConnectionResponse):
                 if conn.password:
                     mask_secret(conn.password)
@@ -1289,7 +1422,7 @@ class ActivitySubprocess(WatchedSubprocess):
             else:
                 resp = conn
         elif isinstance(msg, GetVariable):
-            var = self.client.variables.get(msg.key)
+            var = self._get_variable(msg.key)
             if isinstance(var, VariableResponse):
                 if var.value:
                     mask_secret(var.value, var.key)
@@ -1343,6 +1476,8 @@ class ActivitySubprocess(WatchedSubprocess):
             self.client.xcoms.delete(msg.dag_id, msg.run_id, msg.task_id, msg.key, msg.map_index)
         elif isinstance(msg, PutVariable):
             self.client.variables.set(msg.key, msg.value, msg.description)
+            if self._secret_cache:
+                self._secret_cache.invalidate("variable", msg.key)
         elif isinstance(msg, SetRenderedFields):
             self.client.task_instances.set_rtif(self.id, msg.rendered_fields)
         elif isinstance(msg, SetRenderedMapIndex):
@@ -1452,6 +1587,8 @@ class ActivitySubprocess(WatchedSubprocess):
             )
         elif isinstance(msg, DeleteVariable):
             resp = self.client.variables.delete(msg.key)
+            if self._secret_cache:
+                self._secret_cache.invalidate("variable", msg.key)
         elif isinstance(msg, ValidateInletsAndOutlets):
             inactive_assets_resp = self.client.task_instances.validate_inlets_and_outlets(msg.ti_id)
             resp = InactiveAssetsResult.from_inactive_assets_response(inactive_assets_resp)
@@ -2064,8 +2201,12 @@ def supervise(
 
     close_client = False
     if not client:
-        limits = httpx.Limits(max_keepalive_connections=1, max_connections=10)
-        client = Client(base_url=server or "", limits=limits, dry_run=dry_run, token=token)
+        if not dry_run and conf.getboolean("workers", "execution_api_share_connections", fallback=True):
+            # Keep the connections of the previous tasks of this process alive, rather than opening new ones
+            client = Client(base_url=server or "", transport=get_shared_transport(), token=token)
+        else:
+            limits = httpx.Limits(max_keepalive_connections=1, max_connections=10)
+            client = Client(base_url=server or "", limits=limits, dry_run=dry_run, token=token)
         close_client = True
         log.debug("Connecting to execution API server", server=server)
 
@@ -17,7 +17,8 @@
 # under the License.
 from __future__ import annotations
 
-from typing import TYPE_CHECKING
+from functools import cache
+from typing import TYPE_CHECKING, Any
 
 from airflow.sdk.module_loading import qualname
 
@@ -29,28 +30,68 @@ deserializers = serializers
 
 if TYPE_CHECKING:
     import pandas as pd
+    import pyarrow as pa
 
+    from airflow.sdk import ObjectStoragePath
     from airflow.sdk.serde import U
 
-__version__ = 1
+__version__ = 2
+
+# Protocols of the paths that are files on the local disk, and can be memory-mapped
+_LOCAL_PROTOCOLS = ("", "file", "local")
+
+
+@cache
+def _get_spill_path() -> ObjectStoragePath | None:
+    from airflow.sdk import ObjectStoragePath
+    from airflow.sdk.configuration import conf
+
+    path = conf.get("core", "xcom_dataframe_spill_path", fallback="")
+    return ObjectStoragePath(path) if path else None
+
+
+@cache
+def _get_inline_threshold() -> int:
+    from airflow.sdk.configuration import conf
+
+    return conf.getint("core", "xcom_dataframe_inline_threshold", fallback=1024 * 1024)
 
 
 def serialize(o: object) -> tuple[U, str, int, bool]:
     import pandas as pd
     import pyarrow as pa
-    from pyarrow import parquet as pq
 
     if not isinstance(o, pd.DataFrame):
         return "", "", 0, False
 
-    # for now, we *always* serialize into in memory
-    # until we have a generic backend that manages
-    # sinks
+    # DataFrames are written in the Arrow IPC file format, which can be read back without decoding.
+    # Small ones are kept inline, compressed; larger ones are streamed uncompressed to the spill path, so
+    # they can be memory-mapped, and only their path is kept.
     table = pa.Table.from_pandas(o)
-    buf = pa.BufferOutputStream()
-    pq.write_table(table, buf, compression="snappy")
+    spill_path = _get_spill_path()
+    if spill_path is not None and table.nbytes > _get_inline_threshold():
+        import uuid
+
+        path = spill_path / f"{uuid.uuid4()}.arrow"
+        with path.open("wb") as f:
+            _write_ipc(table, f)
+        data: dict[str, Any] = {"path": str(path), "conn_id": path.conn_id}
+    else:
+        import base64
+
+        sink = pa.BufferOutputStream()
+        compression = "zstd" if pa.Codec.is_available("zstd") else None
+        _write_ipc(table, sink, pa.ipc.IpcWriteOptions(compression=compression))
+        data = {"data": base64.b64encode(sink.getvalue()).decode("ascii")}
+
+    return data, qualname(o), __version__, True
+
+
+def _write_ipc(table: pa.Table, sink: Any, options: pa.ipc.IpcWriteOptions | None = None) -> None:
+    import pyarrow as pa
 
-    return buf.getvalue().hex().decode("utf-8"), qualname(o), __version__, True
+    with pa.ipc.new_file(sink, table.schema, options=options) as writer:
+        writer.write_table(table)
 
 
 def deserialize(cls: type, version: int, data: object) -> pd.DataFrame:
@@ -62,6 +103,39 @@ def deserialize(cls: type, version: int, data: object) -> pd.DataFrame:
     if cls is not pd.DataFrame:
         raise TypeError(f"do not know how to deserialize {qualname(cls)}")
 
+    if version == 1:
+        return _deserialize_parquet(cls, data)
+
+    if not isinstance(data, dict):
+        raise TypeError(f"serialized {qualname(cls)} has wrong data type {type(data)}")
+
+    import pyarrow as pa
+
+    if "path" in data:
+        from airflow.sdk import ObjectStoragePath
+
+        path = ObjectStoragePath(data["path"], conn_id=data.get("conn_id"))
+        if path.protocol in _LOCAL_PROTOCOLS:
+            # The columns are read from the mapped file, without copying them to memory first. The
+            # buffers of the columns keep the mapping alive once the file is closed.
+            with pa.memory_map(path.path) as source:
+                return _read_ipc(source)
+        return _read_ipc(pa.py_buffer(path.read_bytes()))
+
+    import base64
+
+    return _read_ipc(pa.py_buffer(base64.b64decode(data["data"])))
+
+
+def _read_ipc(source: Any) -> pd.DataFrame:
+    import pyarrow as pa
+
+    # split_blocks lets columns without nulls share the buffers of the Arrow table instead of being
+    # consolidated into copies
+    return pa.ipc.open_file(source).read_all().to_pandas(split_blocks=True)
+
+
+def _deserialize_parquet(cls: type, data: object) -> pd.DataFrame:
     if not isinstance(data, str):
         raise TypeError(f"serialized {qualname(cls)} has wrong data type {type(data)}")
 
@@ -32,7 +32,8 @@ from task_sdk import make_client, make_client_w_dry_run, make_client_w_responses
 from uuid6 import uuid7
 
 from airflow.sdk import timezone
-from airflow.sdk.api.client import Client, RemoteValidationError, ServerResponseError
+from airflow.sdk.api import client as client_module
+from airflow.sdk.api.client import Client, RemoteValidationError, ServerResponseError, get_shared_transport
 from airflow.sdk.api.datamodels._generated import (
     AssetEventsResponse,
     AssetResponse,
@@ -43,6 +44,8 @@ from airflow.sdk.api.datamodels._generated import (
     HITLDetailResponse,
     HITLUser,
     TerminalTIState,
+    TIFinalXCom,
+    TISuccessStatePayload,
     VariableResponse,
     XComResponse,
 )
@@ -57,6 +60,8 @@ from airflow.sdk.execution_time.comms import (
     TaskRescheduleStartDate,
 )
 
+from tests_common.test_utils.config import conf_vars
+
 if TYPE_CHECKING:
     from time_machine import TimeMachineFixture
 
@@ -453,6 +458,30 @@ class TestTaskInstanceOperations:
             ti_id, end_date=timezone.parse("2024-10-31T12:00:00Z"), rendered_map_index="test"
         )
 
+    def test_task_instance_finalize(self):
+        ti_id = uuid6.uuid7()
+
+        def handle_request(request: httpx.Request) -> httpx.Response:
+            if request.url.path == f"/task-instances/{ti_id}/finalize":
+                assert request.method == "PATCH"
+                actual_body = json.loads(request.read())
+                assert actual_body["state_update"]["state"] == "success"
+                assert actual_body["state_update"]["end_date"] == "2024-10-31T12:00:00Z"
+                assert actual_body["rendered_fields"] == {"field1": "rendered"}
+                assert actual_body["xcoms"] == [
+                    {"key": "return_value", "value": '"result"', "mapped_length": None}
+                ]
+                return httpx.Response(status_code=204)
+            return httpx.Response(status_code=400, json={"detail": "Bad Request"})
+
+        client = make_client(transport=httpx.MockTransport(handle_request))
+        client.task_instances.finalize(
+            ti_id,
+            TISuccessStatePayload(end_date=timezone.parse("2024-10-31T12:00:00Z")),
+            rendered_fields={"field1": "rendered"},
+            xcoms=[TIFinalXCom(key="return_value", value='"result"')],
+        )
+
     @pytest.mark.parametrize(
         "rendered_fields",
         [
@@ -1566,3 +1595,43 @@ class TestSSLContextCaching:
         assert ctx1 is not ctx2
         assert info.misses == 2
         assert info.currsize == 2
+
+
+class TestSharedTransport:
+    @pytest.fixture(autouse=True)
+    def reset_shared_transport(self):
+        client_module._forget_shared_transport()
+        yield
+        client_module._forget_shared_transport()
+
+    def test_shared_between_clients_and_not_closed_by_them(self):
+        transport = get_shared_transport()
+
+        with mock.patch.object(httpx.HTTPTransport, "close") as mock_close:
+            Client(base_url="http://127.0.0.1:1", token="", transport=transport).close()
+
+        mock_close.assert_not_called()
+        assert get_shared_transport() is transport
+
+    @conf_vars(
+        {
+            ("workers", "execution_api_http2"): "true",
+            ("workers", "execution_api_max_connections"): "7",
+        }
+    )
+    def test_http2_without_h2_falls_back_to_http1(self):
+        with (
+            mock.patch("importlib.util.find_spec", return_value=None),
+            mock.patch.object(client_module, "_SharedTransport") as mock_transport,
+        ):
+            get_shared_transport()
+
+        assert mock_transport.call_args.kwargs["http2"] is False
+        assert mock_transport.call_args.kwargs["limits"].max_connections == 7
+
+    def test_forgotten_after_fork(self):
+        transport = get_shared_transport()
+
+        client_module._forget_shared_transport()
+
+        assert get_shared_transport() is not transport
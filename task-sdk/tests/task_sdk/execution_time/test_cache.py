@@ -18,10 +18,16 @@ from __future__ import annotations
 
 import datetime
 import multiprocessing
+import os
+import sqlite3
+import stat
 
 import pytest
+from cryptography.fernet import Fernet
 
 from airflow.sdk import SecretCache
+from airflow.sdk.crypto import get_fernet
+from airflow.sdk.execution_time.cache import SharedSecretStore, SupervisorSecretCache
 
 from tests_common.test_utils.config import conf_vars
 
@@ -174,3 +180,110 @@ class TestSecretCache:
 
         with pytest.raises(SecretCache.NotPresentException):
             SecretCache.get_connection_uri("key")
+
+
+class TestSupervisorSecretCache:
+    @pytest.fixture
+    def cache(self):
+        store = SharedSecretStore.create()
+        yield SupervisorSecretCache(store, ttl=60, negative_ttl=60)
+        store.remove()
+
+    @pytest.fixture
+    def fernet_key(self):
+        with conf_vars({("core", "FERNET_KEY"): Fernet.generate_key().decode()}):
+            get_fernet.cache_clear()
+            yield
+        get_fernet.cache_clear()
+
+    def test_disabled_by_default(self):
+        assert SupervisorSecretCache.from_config("http://localhost:8080/execution/") is None
+
+    @conf_vars({("secrets", "use_supervisor_cache"): "true", ("core", "FERNET_KEY"): ""})
+    def test_disabled_without_fernet_key(self):
+        get_fernet.cache_clear()
+        assert SupervisorSecretCache.from_config("http://localhost:8080/execution/") is None
+        get_fernet.cache_clear()
+
+    @pytest.mark.usefixtures("fernet_key")
+    @conf_vars({("secrets", "use_supervisor_cache"): "true", ("secrets", "cache_ttl_seconds"): "30"})
+    def test_shared_by_supervisors_of_same_server(self):
+        cache = SupervisorSecretCache.from_config("http://localhost:8080/execution/")
+        try:
+            assert cache.ttl == 30
+            cache.save("variable", "bundle", "key", "value")
+            other = SupervisorSecretCache.from_config("http://localhost:8080/execution/")
+            assert other.get("variable", "bundle", "key") == (True, "value")
+            elsewhere = SupervisorSecretCache.from_config("http://other:8080/execution/")
+            assert elsewhere.get("variable", "bundle", "key") == (False, None)
+            elsewhere.store.remove()
+        finally:
+            cache.store.remove()
+
+    @pytest.mark.usefixtures("fernet_key")
+    def test_values_are_encrypted(self, cache):
+        cache.save("connection", "bundle", "conn", '{"password": "hunter2"}')
+
+        # Read through SQLite, as the row may still only be in the write-ahead log
+        with sqlite3.connect(cache.store.path) as conn:
+            (stored,) = conn.execute("SELECT value FROM secret").fetchone()
+        assert b"hunter2" not in stored
+        assert cache.get("connection", "bundle", "conn") == (True, '{"password": "hunter2"}')
+
+    def test_values_encrypted_with_other_key_are_missing(self, cache):
+        with conf_vars({("core", "FERNET_KEY"): Fernet.generate_key().decode()}):
+            get_fernet.cache_clear()
+            cache.save("connection", "bundle", "conn", '{"password": "hunter2"}')
+        with conf_vars({("core", "FERNET_KEY"): Fernet.generate_key().decode()}):
+            get_fernet.cache_clear()
+            assert cache.get("connection", "bundle", "conn") == (False, None)
+        get_fernet.cache_clear()
+
+    def test_store_is_private(self, cache):
+        directory = os.path.dirname(cache.store.path)
+
+        assert stat.S_IMODE(os.stat(directory).st_mode) == 0o700
+        assert stat.S_IMODE(os.stat(cache.store.path).st_mode) == 0o600
+
+    def test_refuses_store_accessible_by_others(self):
+        store = SharedSecretStore.create(name="test-airflow-store.db")
+        try:
+            os.chmod(store.path, 0o644)
+            with pytest.raises(PermissionError):
+                SharedSecretStore.create(name="test-airflow-store.db")
+        finally:
+            store.remove()
+
+    def test_scopes_are_independent(self, cache):
+        cache.save("variable", "bundle1", "key", "value")
+
+        assert cache.get("variable", "bundle1", "key") == (True, "value")
+        assert cache.get("variable", "bundle2", "key") == (False, None)
+        assert cache.get("connection", "bundle1", "key") == (False, None)
+
+    def test_negative_entries(self, cache):
+        cache.save("variable", "bundle", "missing", None)
+
+        assert cache.get("variable", "bundle", "missing") == (True, None)
+
+        cache.negative_ttl = -1
+        assert cache.get("variable", "bundle", "missing") == (False, None)
+
+    def test_expiration(self, cache):
+        cache.save("variable", "bundle", "key", "value")
+        cache.ttl = -1
+
+        assert cache.get("variable", "bundle", "key") == (False, None)
+
+    def test_invalidate_evicts_all_scopes(self, cache):
+        cache.save("variable", "bundle1", "key", "value")
+        cache.save("variable", "bundle2", "key", "value")
+        cache.save("variable", "bundle1", "other_key", "value")
+        cache.save("connection", "bundle1", "key", "value")
+
+        cache.invalidate("variable", "key")
+
+        assert cache.get("variable", "bundle1", "key") == (False, None)
+        assert cache.get("variable", "bundle2", "key") == (False, None)
+        assert cache.get("variable", "bundle1", "other_key") == (True, "value")
+        assert cache.get("connection", "bundle1", "key") == (True, "value")
@@ -76,35 +76,48 @@ def test_len(mock_supervisor_comms, lazy_sequence):
 def test_iter(mock_supervisor_comms, lazy_sequence):
     it = iter(lazy_sequence)
 
-    mock_supervisor_comms.send.side_effect = [
-        XComSequenceIndexResult(root="f"),
-        ErrorResponse(error=ErrorType.XCOM_NOT_FOUND, detail={"oops": "sorry!"}),
-    ]
+    mock_supervisor_comms.send.side_effect = [XComSequenceSliceResult(root=["f"])]
     assert list(it) == ["f"]
-    mock_supervisor_comms.send.assert_has_calls(
-        [
-            call(
-                msg=GetXComSequenceItem(
-                    key=BaseXCom.XCOM_RETURN_KEY,
-                    dag_id="dag",
-                    task_id="task",
-                    run_id="run",
-                    offset=0,
-                ),
-            ),
-            call(
-                msg=GetXComSequenceItem(
-                    key=BaseXCom.XCOM_RETURN_KEY,
-                    dag_id="dag",
-                    task_id="task",
-                    run_id="run",
-                    offset=1,
-                ),
-            ),
-        ]
+    mock_supervisor_comms.send.assert_called_once_with(
+        GetXComSequenceSlice(
+            key=BaseXCom.XCOM_RETURN_KEY,
+            dag_id="dag",
+            task_id="task",
+            run_id="run",
+            start=0,
+            stop=16,
+            step=None,
+        ),
     )
 
 
+def test_iter_reads_ahead_in_growing_windows(mock_supervisor_comms, lazy_sequence):
+    values = list(range(40))
+    mock_supervisor_comms.send.side_effect = [
+        XComSequenceSliceResult(root=values[:16]),
+        XComSequenceSliceResult(root=values[16:48]),
+    ]
+    assert list(lazy_sequence) == values
+    assert [(c.args[0].start, c.args[0].stop) for c in mock_supervisor_comms.send.call_args_list] == [
+        (0, 16),
+        (16, 48),
+    ]
+
+
+def test_iter_requests_next_window_after_full_window(mock_supervisor_comms, lazy_sequence):
+    # A full window does not tell whether more values follow, so the next window is requested; the
+    # iteration stops after a short (here empty) one.
+    mock_supervisor_comms.send.side_effect = [
+        XComSequenceSliceResult(root=list(range(16))),
+        XComSequenceSliceResult(root=[]),
+    ]
+    assert list(lazy_sequence) == list(range(16))
+    assert [(c.args[0].start, c.args[0].stop) for c in mock_supervisor_comms.send.call_args_list] == [
+        (0, 16),
+        (16, 48),
+    ]
+
+
 def test_getitem_index(mock_supervisor_comms, lazy_sequence):
     mock_supervisor_comms.send.return_value = XComSequenceIndexResult(root="f")
     assert lazy_sequence[4] == "f"
@@ -62,6 +62,10 @@ from airflow.sdk.api.datamodels._generated import (
     PreviousTIResponse,
     TaskInstance,
     TaskInstanceState,
+    TIFinalXCom,
+    TIRetryStatePayload,
+    TISuccessStatePayload,
+    TITerminalStatePayload,
 )
 from airflow.sdk.exceptions import AirflowRuntimeError, ErrorType
 from airflow.sdk.execution_time import task_runner
@@ -2670,6 +2674,117 @@ class TestHandleRequest:
         }
 
 
+class TestBatchedFinalState:
+    @pytest.fixture
+    def watched_subprocess(self, mocker):
+        read_end, write_end = socket.socketpair()
+        with conf_vars({("workers", "execution_api_batch_final_state"): "true"}):
+            subprocess = ActivitySubprocess(
+                process_log=mocker.MagicMock(),
+                id=TI_ID,
+                pid=12345,
+                stdin=write_end,
+                client=mocker.Mock(),
+                process=mocker.Mock(),
+            )
+        subprocess.ti = mocker.Mock(dag_id="test_dag", run_id="test_run", task_id="test_task", map_index=-1)
+        yield subprocess
+        read_end.close()
+        write_end.close()
+
+    @staticmethod
+    def send(watched_subprocess, *messages):
+        for msg in messages:
+            watched_subprocess._handle_request(msg, log=mock.Mock(), req_id=1)
+
+    def test_disabled_by_default(self, mocker):
+        subprocess = ActivitySubprocess(
+            process_log=mocker.MagicMock(),
+            id=TI_ID,
+            pid=12345,
+            stdin=mocker.Mock(),
+            client=mocker.Mock(),
+            process=mocker.Mock(),
+        )
+
+        assert not subprocess._batch_final_state
+
+    def test_success_sent_with_xcoms_and_rendered_fields(self, watched_subprocess):
+        end_date = timezone.parse("2024-10-31T12:00:00Z")
+        self.send(
+            watched_subprocess,
+            SetRenderedFields(rendered_fields={"field": "before"}),
+            SetXCom(dag_id="test_dag", run_id="test_run", task_id="test_task", key="return_value", value="1"),
+            SucceedTask(end_date=end_date),
+            SetXCom(dag_id="test_dag", run_id="test_run", task_id="test_task", key="link", value='"url"'),
+            SetRenderedFields(rendered_fields={"field": "after"}),
+        )
+        client = watched_subprocess.client
+        client.task_instances.set_rtif.assert_called_once_with(TI_ID, {"field": "before"})
+        client.task_instances.succeed.assert_not_called()
+        client.xcoms.set.assert_not_called()
+
+        watched_subprocess._exit_code = 0
+        watched_subprocess.update_task_state_if_needed()
+
+        client.task_instances.finalize.assert_called_once_with(
+            TI_ID,
+            TISuccessStatePayload(end_date=end_date),
+            rendered_fields={"field": "after"},
+            xcoms=[TIFinalXCom(key="return_value", value="1"), TIFinalXCom(key="link", value='"url"')],
+        )
+        client.task_instances.finish.assert_not_called()
+
+    def test_xcoms_flushed_before_other_requests(self, watched_subprocess):
+        xcom = SetXCom(dag_id="test_dag", run_id="test_run", task_id="test_task", key="key", value="1")
+        delete = DeleteXCom(dag_id="test_dag", run_id="test_run", task_id="test_task", key="key")
+        self.send(watched_subprocess, xcom, delete)
+
+        assert watched_subprocess.client.xcoms.mock_calls == [
+            mock.call.set("test_dag", "test_run", "test_task", "key", "1", None, None),
+            mock.call.delete("test_dag", "test_run", "test_task", "key", None),
+        ]
+        assert watched_subprocess._pending_xcoms == []
+
+    def test_xcoms_of_other_tasks_not_held(self, watched_subprocess):
+        self.send(
+            watched_subprocess,
+            SetXCom(dag_id="test_dag", run_id="test_run", task_id="other_task", key="key", value="1"),
+        )
+
+        watched_subprocess.client.xcoms.set.assert_called_once()
+
+    def test_failure_sent_with_xcoms(self, watched_subprocess, time_machine):
+        time_machine.move_to(timezone.datetime(2024, 10, 31), tick=False)
+        self.send(
+            watched_subprocess,
+            SetXCom(dag_id="test_dag", run_id="test_run", task_id="test_task", key="key", value="1"),
+            TaskState(state=TaskInstanceState.FAILED, end_date=timezone.datetime(2024, 10, 31)),
+        )
+
+        watched_subprocess._exit_code = 0
+        watched_subprocess.update_task_state_if_needed()
+
+        watched_subprocess.client.task_instances.finalize.assert_called_once_with(
+            TI_ID,
+            TITerminalStatePayload(state=TaskInstanceState.FAILED, end_date=timezone.datetime(2024, 10, 31)),
+            rendered_fields=None,
+            xcoms=[TIFinalXCom(key="key", value="1")],
+        )
+
+    def test_retry_held_until_exit(self, watched_subprocess):
+        end_date = timezone.parse("2024-10-31T12:00:00Z")
+        self.send(watched_subprocess, RetryTask(end_date=end_date))
+        watched_subprocess.client.task_instances.retry.assert_not_called()
+
+        watched_subprocess._exit_code = 0
+        watched_subprocess.update_task_state_if_needed()
+
+        watched_subprocess.client.task_instances.finalize.assert_called_once_with(
+            TI_ID, TIRetryStatePayload(end_date=end_date), rendered_fields=None, xcoms=[]
+        )
+
+
 class TestSetSupervisorComms:
     class DummyComms:
         pass
@@ -268,10 +268,57 @@ class TestSerializers:
 
         assert serialize(123) == ("", "", 0, False)
 
+    @pytest.mark.parametrize(("threshold", "spilled"), [("0", True), ("1000000", False)])
+    def test_pandas_spill(self, tmp_path, threshold, spilled):
+        from airflow.sdk.serde.serializers import pandas as pandas_serializer
+
+        i = pd.DataFrame(data={"col1": [1, 2], "col2": ["a", "b"]})
+        with conf_vars(
+            {
+                ("core", "xcom_dataframe_spill_path"): f"file://{tmp_path}",
+                ("core", "xcom_dataframe_inline_threshold"): threshold,
+            }
+        ):
+            pandas_serializer._get_spill_path.cache_clear()
+            pandas_serializer._get_inline_threshold.cache_clear()
+            try:
+                data, _, version, is_serialized = pandas_serializer.serialize(i)
+            finally:
+                pandas_serializer._get_spill_path.cache_clear()
+                pandas_serializer._get_inline_threshold.cache_clear()
+
+        assert is_serialized
+        assert ("path" in data) is spilled
+        assert len(list(tmp_path.iterdir())) == int(spilled)
+        assert i.equals(pandas_serializer.deserialize(pd.DataFrame, version, data))
+
+    def test_pandas_inline_compressed(self):
+        import pyarrow as pa
+
+        from airflow.sdk.serde.serializers import pandas as pandas_serializer
+
+        i = pd.DataFrame(data={"col1": ["a repeated value"] * 10_000})
+        data, _, version, _ = pandas_serializer.serialize(i)
+
+        assert len(data["data"]) < pa.Table.from_pandas(i).nbytes / 10
+        assert i.equals(pandas_serializer.deserialize(pd.DataFrame, version, data))
+
+    def test_pandas_deserialize_parquet(self):
+        import pyarrow as pa
+        from pyarrow import parquet as pq
+
+        from airflow.sdk.serde.serializers.pandas import deserialize
+
+        i = pd.DataFrame(data={"col1": [1, 2], "col2": [3, 4]})
+        buf = pa.BufferOutputStream()
+        pq.write_table(pa.Table.from_pandas(i), buf, compression="snappy")
+
+        assert i.equals(deserialize(pd.DataFrame, 1, buf.getvalue().hex().decode("utf-8")))
+
     @pytest.mark.parametrize(
         ("klass", "version", "data", "msg"),
         [
-            (pd.DataFrame, 999, "", r"serialized 999 of pandas.core.frame.DataFrame > 1"),  # version too new
+            (pd.DataFrame, 999, "", r"serialized 999 of pandas.core.frame.DataFrame > 2"),  # version too new
             (
                 pd.DataFrame,
                 1,